@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# C13B0 — Buffered Audit Log
+# Shared JSONL writer for the domain carts (CART018–CART041) and
+# log_server.py, instead of one open / write / close per event.
+#
+# - events are encoded when they are logged and kept in a bounded
+#   in-memory buffer; a writer thread per log flushes it every
+#   FLUSH_EVERY seconds, a full buffer is flushed by the caller
+# - a flush is one write() of every buffered line on an O_APPEND handle,
+#   so batches from several processes never interleave inside a line
+# - rotation: the file is renamed to <path>.<UTC stamp> when it passes
+#   max_bytes or when it was last written in an earlier rotate_every
+#   period (one day by default); keep=N prunes all but the N newest
+# - a process that finds its file rotated by another reopens the path
+# - every log is flushed at exit, so short CLI runs lose nothing (also in
+#   multiprocessing children, which skip atexit); a killed process loses
+#   at most FLUSH_EVERY seconds of events
+# - artifact(): the per-event JSON files of log_server become records of a
+#   rolling segment log (artifacts/<name>.jsonl), or stay files, or are
+#   switched off, per C13B0_ARTIFACTS=segment|file|off
+#
+# Usage:
+#   audit = open_log(AUDIT).audit          # audit({"action": ...})
+#   stream = open_log(STREAM, max_bytes=None, rotate_every=None)
+#   stream.write({"kind": ...}); stream.flush()
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+BUFFER = 4096                   # buffered events before the caller flushes
+FLUSH_EVERY = 1.0               # seconds between background flushes
+MAX_BYTES = 16 << 20
+ROTATE_EVERY = 86400
+SEGMENT_BYTES = 8 << 20
+ARTIFACTS = os.environ.get("C13B0_ARTIFACTS", "segment")
+
+
+def now():
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+
+
+class AuditLog:
+    def __init__(self, path, max_bytes=MAX_BYTES, rotate_every=ROTATE_EVERY, keep=None,
+                 buffer=BUFFER, flush_every=FLUSH_EVERY):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.rotate_every = rotate_every
+        self.keep = keep
+        self.flush_every = flush_every
+        self._capacity = buffer
+        self._fd = None
+        self._closed = False
+        self._reset()
+
+    def _reset(self):
+        # fresh buffer, locks and writer (also in a forked child, where the
+        # parent's buffered lines are the parent's to write)
+        self._lines = deque()
+        self._cond = threading.Condition()
+        self._io = threading.Lock()
+        self._writer = None
+
+    # -- events --------------------------------------------------------
+
+    def write(self, obj):
+        line = json.dumps(obj) + "\n"
+        with self._cond:
+            self._lines.append(line)
+            full = len(self._lines) >= self._capacity
+            if self._writer is None and not self._closed:
+                _exit_hook()
+                self._writer = threading.Thread(target=self._run, daemon=True, name="c13b0-audit")
+                self._writer.start()
+        if full:
+            self.flush()
+
+    def audit(self, entry):
+        # the carts' audit(): a copy of `entry` stamped with "t"
+        entry = dict(entry)
+        entry["t"] = now()
+        self.write(entry)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait(self.flush_every)
+                if self._closed:
+                    return
+            self.flush()
+
+    def flush(self):
+        with self._io:
+            with self._cond:
+                if not self._lines:
+                    return
+                lines, self._lines = self._lines, deque()
+            data = "".join(lines).encode("utf-8")
+            self._prepare(len(data))
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view):]
+
+    def close(self):
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        with self._io:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    # -- files ---------------------------------------------------------
+
+    def _open(self):
+        if self._fd is not None:
+            os.close(self._fd)
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _stale(self):
+        # our handle no longer points at self.path (rotated elsewhere)
+        try:
+            return os.stat(self.path).st_ino != os.fstat(self._fd).st_ino
+        except OSError:
+            return True
+
+    def _due(self, st, incoming):
+        if not st.st_size:
+            return False
+        if self.max_bytes and st.st_size + incoming > self.max_bytes:
+            return True
+        if self.rotate_every:
+            return int(st.st_mtime // self.rotate_every) != int(time.time() // self.rotate_every)
+        return False
+
+    def _prepare(self, incoming):
+        # open / reopen / rotate before appending `incoming` bytes
+        if self._fd is None or self._stale():
+            self._open()
+        if not (self.max_bytes or self.rotate_every):
+            return
+        if not self._due(os.fstat(self._fd), incoming):
+            return
+        with open(self.path + ".lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            if self._stale():
+                self._open()
+            if self._due(os.fstat(self._fd), incoming):
+                self._rotate()
+                self._open()
+
+    def _rotate(self):
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        target = f"{self.path}.{stamp}"
+        n = 1
+        while os.path.exists(target):
+            n += 1
+            target = f"{self.path}.{stamp}-{n}"
+        os.rename(self.path, target)
+        if self.keep is not None:
+            for old in self.rotated()[:-self.keep or None]:
+                os.remove(old)
+
+    def rotated(self):
+        # rotated files of this log, oldest first
+        parent = os.path.dirname(self.path) or "."
+        prefix = os.path.basename(self.path) + "."
+        names = [n for n in os.listdir(parent) if n.startswith(prefix) and n[len(prefix):len(prefix) + 1].isdigit()]
+        return [os.path.join(parent, n) for n in sorted(names)]
+
+
+_logs = {}
+_logs_lock = threading.Lock()
+
+
+def open_log(path, **options):
+    # one AuditLog (and one writer thread) per file per process
+    key = os.path.abspath(path)
+    with _logs_lock:
+        if key not in _logs:
+            _logs[key] = AuditLog(path, **options)
+        return _logs[key]
+
+
+_hooked_pid = None
+
+
+@atexit.register
+def flush_all():
+    for log in list(_logs.values()):
+        try:
+            log.flush()
+        except OSError:
+            pass
+
+
+def _exit_hook():
+    # multiprocessing children end in os._exit() after running its
+    # finalizers, not atexit; register one on the first write per process
+    global _hooked_pid
+    if _hooked_pid != os.getpid():
+        _hooked_pid = os.getpid()
+        mp_util = sys.modules.get("multiprocessing.util")
+        if mp_util is not None:
+            mp_util.Finalize(None, flush_all, exitpriority=10)
+
+
+def _after_fork():
+    global _logs_lock
+    _logs_lock = threading.Lock()
+    for log in _logs.values():
+        log._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
+
+
+def artifact(art_dir, segment, name, obj, mode=None):
+    # a per-event artifact: a record {"name", "t", "artifact"} of the
+    # rolling segment log <art_dir>/<segment>.jsonl ("segment"), a
+    # standalone <art_dir>/<name>.json ("file"), or nothing ("off").
+    # -> the file path, "<segment log>#<name>", or None
+    mode = mode or ARTIFACTS
+    if mode == "off":
+        return None
+    if mode == "file":
+        path = os.path.join(art_dir, f"{name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2)
+        return path
+    path = os.path.join(art_dir, f"{segment}.jsonl")
+    open_log(path, max_bytes=SEGMENT_BYTES, rotate_every=None).write(
+        {"name": name, "t": now(), "artifact": obj})
+    return f"{path}#{name}"
+
+
+def find_artifact(path, name):
+    # latest record `name` of a segment log and its rotated files
+    log = open_log(path, max_bytes=SEGMENT_BYTES, rotate_every=None)
+    log.flush()
+    for seg in [path] + log.rotated()[::-1]:
+        found = None
+        try:
+            with open(seg, "r", encoding="utf-8") as f:
+                for line in f:
+                    if f'"name": {json.dumps(name)}' in line:
+                        rec = json.loads(line)
+                        if rec.get("name") == name:
+                            found = rec["artifact"]
+        except OSError:
+            continue
+        if found is not None:
+            return found
+    return None
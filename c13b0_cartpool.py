@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# C13B0 — Warm Cart Pool
+# Runs cart scripts in long-lived worker processes instead of forking a
+# fresh interpreter per cart per cycle (CART505, CART509, CART510, CART605).
+#
+# - each worker imports a cart module once and calls its main() again on
+#   every cycle; a cart is re-imported only when its file changes
+# - per-cart timeout: a hung worker is killed and replaced; `timeouts`
+#   overrides it per script (None = no limit, e.g. for CART507, which
+#   drives whole pipeline rebuilds)
+# - crash isolation: exceptions and sys.exit() are reported per cart, a
+#   worker that dies outright is replaced, the daemon keeps going
+# - cached_json() keeps parsed shared inputs between cycles, keyed by
+#   (size, mtime) so edits are picked up immediately; the result is shared
+#   and read-only, callers copy what they change
+#
+# Usage:
+#   with CartPool(timeout=120) as pool:
+#       for res in pool.run_all(["cart501_autonomous_kernel.py", ...]):
+#           if not res.ok: print(res.script, res.status, res.error)
+
+import importlib.util
+import json
+import multiprocessing
+import os
+import queue
+import random
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+TIMEOUT = 300
+
+_json_cache = {}
+
+
+def cached_json(path, default=None):
+    # Parsed JSON reused while the file is unchanged. The same object is
+    # returned on every hit: treat it as read-only, or a change leaks into
+    # the next cycle.
+    if not os.path.exists(path):
+        return default
+    st = os.stat(path)
+    key = (st.st_size, st.st_mtime_ns)
+    hit = _json_cache.get(path)
+    if hit is None or hit[0] != key:
+        with open(path, "r") as f:
+            hit = (key, json.load(f))
+        _json_cache[path] = hit
+    return hit[1]
+
+
+class CartResult:
+    def __init__(self, script, status, seconds, error=None):
+        self.script = script
+        self.status = status        # ok / error / timeout / crashed
+        self.seconds = seconds
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.status == "ok"
+
+
+# ---------- worker side ----------
+
+def _load(modules, script):
+    path = os.path.abspath(script)
+    mtime = os.stat(path).st_mtime_ns
+    hit = modules.get(path)
+    if hit and hit[0] == mtime:
+        return hit[1]
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    modules[path] = (mtime, module)
+    return module
+
+
+def _worker(conn):
+    random.seed()   # forked workers must not share one random stream
+    modules = {}
+    while True:
+        try:
+            script = conn.recv()
+        except EOFError:
+            return
+        if script is None:
+            return
+        try:
+            _load(modules, script).main()
+            reply = ("ok", None)
+        except SystemExit as e:
+            code = e.code
+            reply = ("ok", None) if code in (None, 0) else ("error", f"exit status {code}")
+        except BaseException:
+            reply = ("error", traceback.format_exc())
+        conn.send(reply)
+
+
+# ---------- parent side ----------
+
+class _Worker:
+    def __init__(self, ctx):
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(target=_worker, args=(child,), daemon=True)
+        self.proc.start()
+        child.close()
+
+    def kill(self):
+        if self.proc.is_alive():
+            self.proc.kill()
+        self.proc.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.proc.join(1)
+        self.kill()
+
+
+class CartPool:
+    def __init__(self, workers=1, timeout=TIMEOUT, timeouts=None):
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self.ctx = multiprocessing.get_context("fork" if hasattr(os, "fork") else "spawn")
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._all = []
+        for _ in range(max(1, workers)):
+            self._idle.put(self._spawn())
+
+    def _spawn(self):
+        w = _Worker(self.ctx)
+        with self._lock:
+            self._all.append(w)
+        return w
+
+    def _retire(self, w):
+        w.kill()
+        with self._lock:
+            self._all.remove(w)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            workers = list(self._all)
+            self._all = []
+        for w in workers:
+            w.stop()
+
+    def run(self, script, timeout=None):
+        if timeout is None:
+            timeout = self.timeouts.get(script, self.timeout)
+        w = self._idle.get()
+        start = time.time()
+        try:
+            w.conn.send(script)
+            if not w.conn.poll(timeout):
+                self._retire(w)
+                w = self._spawn()
+                return CartResult(script, "timeout", time.time() - start, f"no result after {timeout}s")
+            status, error = w.conn.recv()
+            return CartResult(script, status, time.time() - start, error)
+        except (EOFError, OSError):
+            code = w.proc.exitcode
+            self._retire(w)
+            w = self._spawn()
+            return CartResult(script, "crashed", time.time() - start, f"worker exited ({code})")
+        finally:
+            self._idle.put(w)
+
+    def run_all(self, scripts, timeout=None):
+        # In order, one after another: later carts read what earlier ones wrote
+        return [self.run(s, timeout) for s in scripts]
+
+    def run_parallel(self, scripts, timeout=None):
+        # Independent carts side by side, as many at once as there are workers
+        with ThreadPoolExecutor(max_workers=self._idle.qsize() or 1) as ex:
+            return list(ex.map(lambda s: self.run(s, timeout), scripts))
+
+
+def report(tag, results):
+    total = sum(r.seconds for r in results)
+    for r in results:
+        if not r.ok:
+            lines = (r.error or "").strip().splitlines()
+            print(f"[{tag}] {r.script} {r.status}: {lines[-1] if lines else ''}")
+    print(f"[{tag}] Cycle complete: {sum(r.ok for r in results)}/{len(results)} ok in {total:.2f}s")
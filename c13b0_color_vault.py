@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+# C13B0 — Color Memory Vault
+# Keyed term store behind the color maps (CART Q, R, S, T).
+#
+#   C13B0_COLOR_VAULT/terms.jsonl      [term, {source: value, ...}] per line,
+#                                      appended; the last line of a term wins
+#   C13B0_COLOR_VAULT/index.json       term → offset, per-source signatures
+#   C13B0_COLOR_VAULT/sources/<map>    compact copy of each map's term view
+#
+# - a map's term view is the map itself for dicts, {str(x): 1} for lists
+# - update(maps) re-reads only maps whose (size, mtime) changed, diffs the
+#   new term view against that map's copy and appends just the terms whose
+#   field changed
+# - get(term) is one dict lookup plus one seek; a map that disappears
+#   takes its fields with it
+# - the legacy JSON views (C13B0_COLOR_MEMORY.json, C13B0_COLOR_OUTPUT.json)
+#   are exported on demand and only rewritten when one of their maps
+#   changed or the file was touched; a view that is also one of its own
+#   maps (CART Q's memory) is taken back in right after it is written
+# - exported views hold the same terms and values as the old carts' full
+#   merge, but keys come in vault order (first time a term was seen, a
+#   term dropped and added again goes last), not map-by-map order; after
+#   incremental updates the files are equal as JSON, not byte for byte
+# - the log is compacted when more than half of it is superseded lines
+#
+# Usage:
+#   vault = open_vault()
+#   vault.update(["C13B0_COLOR_MAP.json", ...])
+#   vault.get("quantum")              # → {"C13B0_COLOR_MAP.json": "purple", ...}
+#   vault.export_merge("C13B0_COLOR_OUTPUT.json", maps, first_wins=True)
+
+import json
+import os
+
+VAULT = "C13B0_COLOR_VAULT"
+VERSION = 1
+_MISSING = object()
+
+
+def _encode(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def term_view(data):
+    if isinstance(data, dict):
+        return data
+    if isinstance(data, list):
+        return {str(x): 1 for x in data}
+    return None
+
+
+def collect(obj, out):
+    # every key and string value, at any depth (CART T's term set)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            out.add(str(k))
+            collect(v, out)
+    elif isinstance(obj, list):
+        for item in obj:
+            collect(item, out)
+    elif isinstance(obj, str):
+        out.add(obj)
+    return out
+
+
+def _write_json(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+class ColorVault:
+    def __init__(self, root=VAULT):
+        self.root = root
+        self.log_path = os.path.join(root, "terms.jsonl")
+        self.index_path = os.path.join(root, "index.json")
+        self.snap_dir = os.path.join(root, "sources")
+        os.makedirs(self.snap_dir, exist_ok=True)
+        self._load()
+
+    # -- state ---------------------------------------------------------
+
+    def _load(self):
+        state = None
+        try:
+            with open(self.index_path, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if not state or state.get("version") != VERSION:
+            # no usable index: start over, every map is re-read on update()
+            state = {"version": VERSION, "log_size": 0, "dead": 0, "generation": 0,
+                     "terms": {}, "sources": {}, "normalized": {}, "exports": {}}
+            open(self.log_path, "wb").close()
+            for name in os.listdir(self.snap_dir):
+                os.remove(os.path.join(self.snap_dir, name))
+        self.state = state
+        self.terms = state["terms"]
+        self.sources = state["sources"]
+        self._replay()
+
+    def _replay(self):
+        # lines appended after the last saved index (interrupted update)
+        size = os.path.getsize(self.log_path)
+        pos = self.state["log_size"]
+        if pos == size:
+            return
+        if pos > size:
+            pos = 0
+            self.terms.clear()
+        with open(self.log_path, "r+b") as log:
+            log.seek(pos)
+            for line in log:
+                if not line.endswith(b"\n"):
+                    break
+                term, rec = json.loads(line)
+                self._point(term, pos if rec else None)
+                pos += len(line)
+            log.truncate(pos)
+        self.state["log_size"] = pos
+
+    def _point(self, term, offset):
+        if term in self.terms:
+            self.state["dead"] += 1
+        if offset is None:
+            self.terms.pop(term, None)
+        else:
+            self.terms[term] = offset
+
+    def _save(self):
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp, self.index_path)
+
+    def _snap_path(self, name):
+        return os.path.join(self.snap_dir, name.replace(os.sep, "__"))
+
+    # -- reads ---------------------------------------------------------
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __contains__(self, term):
+        return term in self.terms
+
+    def get(self, term, default=None):
+        offset = self.terms.get(term)
+        if offset is None:
+            return default
+        with open(self.log_path, "rb") as log:
+            return self._read(log, offset)
+
+    def _read(self, log, offset):
+        log.seek(offset)
+        return json.loads(log.readline())[1]
+
+    def value(self, term, source, default=None):
+        return (self.get(term) or {}).get(source, default)
+
+    def records(self):
+        # (term, {source: value}) for every live term, in first-seen order
+        live = {}
+        with open(self.log_path, "rb") as log:
+            pos = 0
+            for line in log:
+                term, rec = json.loads(line)
+                if self.terms.get(term) == pos:
+                    live[term] = rec
+                pos += len(line)
+        for term in self.terms:
+            yield term, live[term]
+
+    def present(self, names):
+        return [n for n in names if n in self.sources]
+
+    def shape(self, name):
+        return self.sources.get(name, {}).get("shape")
+
+    # -- writes --------------------------------------------------------
+
+    def update(self, names):
+        # -> {"changed": [maps re-read], "terms": terms rewritten}
+        changed = []
+        dirty = False
+        self._pending = {}          # term → record written during this update
+        with open(self.log_path, "ab") as log, open(self.log_path, "rb") as reader:
+            for name in names:
+                sig = _stat(name)
+                meta = self.sources.get(name)
+                if sig is None:
+                    if meta:
+                        self._ingest(name, None, log, reader)
+                        dirty = True
+                    continue
+                if meta and meta["sig"] == sig:
+                    continue
+                self._ingest(name, sig, log, reader)
+                changed.append(name)
+            self.state["log_size"] = log.tell()
+        written = len(self._pending)
+        self._pending = {}
+        if changed or dirty:
+            if self.state["dead"] > max(1024, len(self.terms)):
+                self.compact()
+            self._save()
+        return {"changed": changed, "terms": written}
+
+    def _bump(self):
+        self.state["generation"] += 1
+        return self.state["generation"]
+
+    def _ingest(self, name, sig, log, reader):
+        # sig None: the map is gone, drop its fields
+        raw = None
+        if sig is not None:
+            try:
+                with open(name, "r") as f:
+                    raw = json.load(f)
+            except (OSError, ValueError):
+                pass
+        view = term_view(raw) or {}
+        snap = self._snap_path(name)
+        old = {}
+        if name in self.sources and os.path.exists(snap):
+            with open(snap, "r") as f:
+                old = json.load(f)
+
+        for term, v in view.items():
+            if old.get(term, _MISSING) != v:
+                self._set(log, reader, term, name, v)
+        for term in old:
+            if term not in view:
+                self._set(log, reader, term, name, _MISSING)
+
+        if sig is None:
+            if os.path.exists(snap):
+                os.remove(snap)
+            del self.sources[name]
+            self._bump()
+            return
+        with open(snap + ".tmp", "w") as f:
+            json.dump(view, f, separators=(",", ":"))
+        os.replace(snap + ".tmp", snap)
+        strings = collect(raw, set()).difference(view) if raw is not None else set()
+        self.sources[name] = {"sig": sig,
+                              "shape": type(raw).__name__ if raw is not None else "invalid",
+                              "strings": sorted(strings), "generation": self._bump()}
+
+    def _set(self, log, reader, term, source, value):
+        rec = self._pending.get(term)
+        if rec is None:
+            offset = self.terms.get(term)
+            rec = {} if offset is None else self._read(reader, offset)
+        if value is _MISSING:
+            rec.pop(source, None)
+        else:
+            rec[source] = value
+        self._pending[term] = rec
+        offset = log.tell()
+        log.write(_encode([term, rec]))
+        self._point(term, offset if rec else None)
+
+    def compact(self):
+        # rewrite the log with one line per live term
+        tmp = self.log_path + ".tmp"
+        terms = {}
+        with open(tmp, "wb") as out:
+            for term, rec in self.records():
+                terms[term] = out.tell()
+                out.write(_encode([term, rec]))
+            size = out.tell()
+        os.replace(tmp, self.log_path)
+        self.terms.clear()
+        self.terms.update(terms)
+        self.state.update(log_size=size, dead=0)
+        self._save()
+        return len(terms)
+
+    # -- CART S ----------------------------------------------------------
+
+    def normalized(self, name):
+        # True when `name` is unchanged since mark_normalized()
+        sig = _stat(name)
+        return sig is not None and self.state["normalized"].get(name) == sig
+
+    def mark_normalized(self, name):
+        self.state["normalized"][name] = _stat(name)
+        self._save()
+
+    # -- legacy views --------------------------------------------------
+
+    def _fresh(self, path, key):
+        saved = self.state["exports"].get(path)
+        return saved is not None and saved["key"] == key and saved["file"] == _stat(path)
+
+    def _exported(self, path, key):
+        self.state["exports"][path] = {"key": key, "file": _stat(path)}
+        self._save()
+
+    def _export_key(self, kind, names):
+        return [kind] + [[n, self.sources.get(n, {}).get("generation")] for n in names]
+
+    def _merge_names(self, names, dicts_only):
+        return [n for n in names if n in self.sources and
+                (not dicts_only or self.sources[n]["shape"] == "dict")]
+
+    def export_merge(self, path, names, first_wins=False, dicts_only=False):
+        # {term: value} over the maps in `names` order: the first (CART R) or
+        # last (CART Q) map holding a term wins. -> terms written, or None
+        # when the file is up to date.
+        wanted = names
+        names = self._merge_names(wanted, dicts_only)
+        key = self._export_key(["merge", first_wins, dicts_only], names)
+        if self._fresh(path, key):
+            return None
+        order = names if first_wins else names[::-1]
+        merged = {}
+        for term, rec in self.records():
+            for n in order:
+                v = rec.get(n, _MISSING)
+                if v is not _MISSING:
+                    merged[term] = v
+                    break
+        _write_json(path, merged)
+        if path in wanted:
+            # the view is one of its own maps: take it in, and key the export
+            # on it too, even on the first write
+            self.update([path])
+            key = self._export_key(["merge", first_wins, dicts_only], self._merge_names(wanted, dicts_only))
+        self._exported(path, key)
+        return len(merged)
+
+    def export_unified(self, path, names, fields):
+        # CART T: every term of the maps in `names` → {field: value or default}
+        # with fields = [(field, map, default), ...]. -> as export_merge().
+        names = self.present(names)
+        key = self._export_key(["unified", [list(f) for f in fields]], names)
+        if self._fresh(path, key):
+            return None
+        wanted = set(names)
+        dict_maps = {m for _, m, _ in fields if self.shape(m) == "dict" and m in wanted}
+        unified = {}
+        for term, rec in self.records():
+            if wanted.intersection(rec):
+                unified[term] = rec
+        for n in names:
+            for s in self.sources[n]["strings"]:
+                unified.setdefault(s, None)
+        out = {}
+        for term in sorted(unified):
+            rec = unified[term] or {}
+            out[term] = {f: rec.get(m, d) if m in dict_maps else d for f, m, d in fields}
+        _write_json(path, out)
+        self._exported(path, key)
+        return len(out)
+
+
+def open_vault(root=VAULT):
+    return ColorVault(root)
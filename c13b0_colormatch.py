@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# C13B0 — Compiled Color Matcher
+# Shared keyword → color matching for the colorizing carts
+# (cartB, cartE, cartO, cart_index_reader).
+#
+# A rule table ([(keyword, color), ...] in priority order) is compiled once
+# per process into a flat, de-duplicated keyword list:
+#
+# - first(): color of the highest-priority keyword found in the input (the
+#   carts' "first rule that matches" semantics); stops at the first hit
+#   instead of testing every color × keyword
+# - any(): whether any keyword occurs, again stopping at the first hit
+# - mode="exact": whole-term rules collapse into one dict lookup
+# - term results are LRU-cached; file-sized inputs go through first_in(),
+#   which lowercases once and is not cached
+#
+# Each keyword test is a C substring search over the lowercased input.
+# For tables of this size that beats one combined regex or an automaton
+# driven from Python (both measured 1.5–5× slower on the cartB terms and
+# on multi-MB file text).
+#
+# Usage:
+#   m = compile_rules(rules_from_colors(COLOR_RULES), default="yellow")
+#   m.first("Quantum_Data")          # → "purple"
+
+from functools import lru_cache
+
+CACHE_SIZE = 1 << 16
+
+
+def rules_from_colors(color_rules):
+    # {"purple": ["hydrogen", ...], ...} → [("hydrogen", "purple"), ...]
+    return [(kw, color) for color, keywords in color_rules.items() for kw in keywords]
+
+
+def rules_from_keywords(keyword_map):
+    # {"hydrogen": "green", ...} → [("hydrogen", "green"), ...]
+    return list(keyword_map.items())
+
+
+def rules_from_sets(term_sets):
+    # [({"quantum", ...}, "blue"), ...] → [("quantum", "blue"), ...]
+    return [(t, color) for terms, color in term_sets for t in sorted(terms)]
+
+
+class Matcher:
+    def __init__(self, rules, default=None, mode="substring", cache_size=CACHE_SIZE):
+        if mode not in ("substring", "exact"):
+            raise ValueError(f"[C13B0] Unknown match mode: {mode}")
+        self.default = default
+        self.mode = mode
+        # a keyword listed twice keeps its first (highest-priority) rule
+        self.table = {}
+        for kw, color in rules:
+            self.table.setdefault(kw.lower(), color)
+        self.keywords = tuple(self.table.items())
+        self.first = lru_cache(maxsize=cache_size)(self._first)
+        self.any = lru_cache(maxsize=cache_size)(self._any)
+
+    def _best(self, text):
+        if self.mode == "exact":
+            return self.table.get(text, self.default)
+        for kw, color in self.keywords:
+            if kw in text:
+                return color
+        return self.default
+
+    def _first(self, term):
+        return self._best(term.lower())
+
+    def first_in(self, text):
+        # uncached variant for large inputs (file contents)
+        return self._best(text.lower())
+
+    def _any(self, term):
+        t = term.lower()
+        if self.mode == "exact":
+            return t in self.table
+        for kw, _ in self.keywords:
+            if kw in t:
+                return True
+        return False
+
+    def scanner(self):
+        # first_in() for text read in pieces (see c13b0_file_index)
+        return _Scanner(self)
+
+    def colorize(self, terms):
+        return {t: self.first(t) for t in terms}
+
+    def cache_info(self):
+        return self.first.cache_info()
+
+
+class _Scanner:
+    # Keeps the last (longest keyword - 1) characters of each piece, so a
+    # keyword split across two pieces is still found; once a keyword has
+    # matched, only higher-priority ones are tested
+    def __init__(self, matcher):
+        if matcher.mode != "substring":
+            raise ValueError("[C13B0] Streaming scan needs a substring matcher")
+        self.keywords = matcher.keywords
+        self.default = matcher.default
+        self.keep = max((len(kw) for kw, _ in self.keywords), default=1) - 1
+        self.best = len(self.keywords)
+        self.tail = ""
+
+    def feed(self, piece):
+        if not self.best:
+            return
+        window = self.tail + piece.lower()
+        for i in range(self.best):
+            if self.keywords[i][0] in window:
+                self.best = i
+                break
+        self.tail = window[-self.keep:] if self.keep else ""
+
+    def result(self):
+        return self.keywords[self.best][1] if self.best < len(self.keywords) else self.default
+
+
+_compiled = {}
+
+
+def compile_rules(rules, default=None, mode="substring"):
+    # one Matcher (and one cache) per distinct rule table in this process
+    key = (tuple(rules), default, mode)
+    m = _compiled.get(key)
+    if m is None:
+        m = _compiled[key] = Matcher(rules, default, mode)
+    return m
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# C13B0 — DNA Block Store
+# Streaming storage for CART038 (genetics substrate blocks) and CART039
+# (DNA engine bricks / packets), instead of one JSON store that every
+# call reloads and rewrites.
+#
+# BlockStore — data/substrate_blocks_v2/
+#   blocks.bin   one record per chunk, appended:
+#                header (chunk id, first block id, count, created, tag
+#                length), tag, the chunk's characters as UTF-32, the
+#                bases packed 2 bits each (a block's 4 bases = 1 byte) and
+#                the chunk's SHA-256
+#   blocks.idx   (first block id, count, chunk id, offset) per chunk,
+#                fixed width, so a block id is a binary search with
+#                pread() and one read of its character
+#
+# - encode streams the text in chunk-sized pieces: UTF-32 bytes, a
+#   translate() for the packed bases and one hash per chunk
+# - a record past the last index entry (interrupted append) is cut off by
+#   the next writer; writers hold an flock
+# - blocks() rebuilds the legacy block dicts, hashes included, for exports
+#
+# RecordLog — <name>.jsonl + <name>.jsonl.idx
+#   JSON records appended with an "id\toffset" line per record; get(id)
+#   is one dict lookup and one seek, the last record of an id wins
+#
+# Usage:
+#   blocks = BlockStore(os.path.join(DATA, "substrate_blocks_v2"))
+#   chunks = blocks.append_text(text, 8, "research", next_block_id, next_chunk_id)
+#   blocks.chars([1, 2, 3])            # → {1: "h", 2: "e", 3: "l"}
+
+import calendar
+import hashlib
+import json
+import os
+import struct
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+BASES = ["A", "C", "G", "T"]
+MAGIC = b"DNA2"
+HEADER = struct.Struct("<4sQQQqH")      # magic, chunk id, first id, count, created, tag length
+ENTRY = struct.Struct("<QQQQ")          # first id, count, chunk id, offset
+DIGEST = 32
+# low byte of a code point → its 4 bases (ord % 4 rotated), 2 bits each
+PACK = bytes(sum(((v + j) % 4) << (6 - 2 * j) for j in range(4)) for v in [b & 3 for b in range(256)])
+
+
+def unpack(byte):
+    return [BASES[(byte >> (6 - 2 * j)) & 3] for j in range(4)]
+
+
+def block_hash(ch, bases, tag, chunk_id):
+    # the legacy per-block hash (sha256 of the sorted-key JSON)
+    obj = {"char": ch, "bases": bases, "tag": tag, "chunk": chunk_id}
+    return hashlib.sha256(json.dumps(obj, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _iso(ts):
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts))
+
+
+class BlockStore:
+    def __init__(self, root):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.bin_path = os.path.join(root, "blocks.bin")
+        self.idx_path = os.path.join(root, "blocks.idx")
+        for p in (self.bin_path, self.idx_path):
+            if not os.path.exists(p):
+                open(p, "ab").close()
+
+    # -- index ---------------------------------------------------------
+
+    def __len__(self):
+        # number of chunks
+        return os.path.getsize(self.idx_path) // ENTRY.size
+
+    def _entry(self, fd, i):
+        return ENTRY.unpack(os.pread(fd, ENTRY.size, i * ENTRY.size))
+
+    def entries(self, start=0):
+        # (first id, count, chunk id, offset) from chunk number `start` on
+        with open(self.idx_path, "rb") as f:
+            f.seek(start * ENTRY.size)
+            while True:
+                buf = f.read(ENTRY.size * 4096)
+                if len(buf) < ENTRY.size:
+                    return
+                for k in range(0, len(buf) - len(buf) % ENTRY.size, ENTRY.size):
+                    yield ENTRY.unpack_from(buf, k)
+
+    def _find(self, fd, n, block_id):
+        # chunk entry holding block_id, or None
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(fd, mid)[0] <= block_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == 0:
+            return None
+        e = self._entry(fd, lo - 1)
+        return e if block_id < e[0] + e[1] else None
+
+    def next_ids(self):
+        # (next block id, next chunk id) after the last chunk, or (1, 1)
+        n = len(self)
+        if not n:
+            return 1, 1
+        with open(self.idx_path, "rb") as f:
+            first, count, chunk_id, _ = self._entry(f.fileno(), n - 1)
+        return first + count, chunk_id + 1
+
+    def stats(self):
+        blocks = chunks = 0
+        for _, count, _, _ in self.entries():
+            blocks += count
+            chunks += 1
+        return {"blocks": blocks, "chunks": chunks}
+
+    # -- records -------------------------------------------------------
+
+    def _header(self, fd, offset):
+        magic, chunk_id, first, count, created, tag_len = HEADER.unpack(os.pread(fd, HEADER.size, offset))
+        if magic != MAGIC:
+            raise ValueError(f"[C13B0] Bad block record at {offset} in {self.bin_path}")
+        tag = os.pread(fd, tag_len, offset + HEADER.size).decode("utf-8")
+        return {"chunk_id": chunk_id, "first": first, "count": count, "created": created, "tag": tag,
+                "data": offset + HEADER.size + tag_len}
+
+    def chunks(self, body=True, start=0):
+        # every chunk from chunk number `start` on, in id order (records
+        # are contiguous, so this is one sequential read)
+        n = len(self) - start
+        if n <= 0:
+            return
+        first = next(self.entries(start))
+        with open(self.bin_path, "rb") as b:
+            b.seek(first[3])
+            for _ in range(n):
+                offset = b.tell()
+                magic, chunk_id, first_id, count, created, tag_len = HEADER.unpack(b.read(HEADER.size))
+                if magic != MAGIC:
+                    raise ValueError(f"[C13B0] Bad block record at {offset} in {self.bin_path}")
+                h = {"chunk_id": chunk_id, "first": first_id, "count": count, "created": created,
+                     "tag": b.read(tag_len).decode("utf-8"), "data": offset + HEADER.size + tag_len}
+                if body:
+                    raw = b.read(5 * count + DIGEST)
+                    h["text"] = raw[:4 * count].decode("utf-32-le")
+                    h["packed"] = raw[4 * count:5 * count]
+                    h["sha256"] = raw[5 * count:].hex()
+                else:
+                    b.seek(5 * count + DIGEST, os.SEEK_CUR)
+                yield h
+
+    def exists(self, block_id):
+        with open(self.idx_path, "rb") as f:
+            return self._find(f.fileno(), len(self), block_id) is not None
+
+    def chars(self, block_ids):
+        # {block id: character} for the ids that exist
+        out = {}
+        n = len(self)
+        headers = {}
+        with open(self.idx_path, "rb") as i, open(self.bin_path, "rb") as b:
+            for bid in sorted(set(block_ids)):
+                e = self._find(i.fileno(), n, bid)
+                if e is None:
+                    continue
+                first, _, _, offset = e
+                h = headers.get(offset)
+                if h is None:
+                    h = headers[offset] = self._header(b.fileno(), offset)
+                out[bid] = os.pread(b.fileno(), 4, h["data"] + 4 * (bid - first)).decode("utf-32-le")
+        return out
+
+    def blocks(self):
+        # legacy block dicts {id, char, bases, tag, chunk_id, hash}, in id order
+        for h in self.chunks():
+            for k, ch in enumerate(h["text"]):
+                bases = unpack(h["packed"][k])
+                yield {"id": h["first"] + k, "char": ch, "bases": bases, "tag": h["tag"],
+                       "chunk_id": h["chunk_id"], "hash": block_hash(ch, bases, h["tag"], h["chunk_id"])}
+
+    def legacy_chunks(self):
+        for h in self.chunks(body=False):
+            yield {"chunk_id": h["chunk_id"], "block_ids": list(range(h["first"], h["first"] + h["count"])),
+                   "tag": h["tag"], "created": _iso(h["created"])}
+
+    # -- writes --------------------------------------------------------
+
+    def _lock(self):
+        lock = open(os.path.join(self.root, ".lock"), "a")
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock
+
+    def _repair(self):
+        # drop a torn index entry and any record bytes it does not cover
+        size = os.path.getsize(self.idx_path)
+        if size % ENTRY.size:
+            os.truncate(self.idx_path, size - size % ENTRY.size)
+        n = len(self)
+        end = 0
+        if n:
+            with open(self.idx_path, "rb") as i, open(self.bin_path, "rb") as b:
+                _, count, _, offset = self._entry(i.fileno(), n - 1)
+                h = self._header(b.fileno(), offset)
+                end = h["data"] + 5 * count + DIGEST
+        if os.path.getsize(self.bin_path) > end:
+            os.truncate(self.bin_path, end)
+
+    def _record(self, chunk_id, first, text, tag, created):
+        raw = text.encode("utf-32-le")
+        packed = raw[0::4].translate(PACK)
+        tag_b = tag.encode("utf-8")
+        sha = hashlib.sha256(tag_b)
+        sha.update(struct.pack("<Q", chunk_id))
+        sha.update(raw)
+        sha.update(packed)
+        return b"".join((HEADER.pack(MAGIC, chunk_id, first, len(text), created, len(tag_b)),
+                         tag_b, raw, packed, sha.digest()))
+
+    def append_text(self, text, chunk_size, tag, next_block_id=1, next_chunk_id=1):
+        # Encodes `text` as blocks of one character, chunk_size per chunk.
+        # Ids continue from the given counters or the store, whichever is
+        # higher. -> (chunks [{chunk_id, first, count}], next block id,
+        # next chunk id)
+        chunk_size = max(1, chunk_size)
+        with self._lock():
+            self._repair()
+            store_block, store_chunk = self.next_ids()
+            block_id = max(next_block_id, store_block)
+            chunk_id = max(next_chunk_id, store_chunk)
+            made = []
+            created = int(time.time())
+            with open(self.bin_path, "ab") as b, open(self.idx_path, "ab") as i:
+                offset = b.tell()
+                entries = []
+                for start in range(0, len(text), chunk_size):
+                    piece = text[start:start + chunk_size]
+                    rec = self._record(chunk_id, block_id, piece, tag, created)
+                    b.write(rec)
+                    entries.append(ENTRY.pack(block_id, len(piece), chunk_id, offset))
+                    made.append({"chunk_id": chunk_id, "first": block_id, "count": len(piece)})
+                    offset += len(rec)
+                    block_id += len(piece)
+                    chunk_id += 1
+                    if len(entries) >= 4096:
+                        b.flush()
+                        i.write(b"".join(entries))
+                        entries = []
+                b.flush()
+                i.write(b"".join(entries))
+        # as the old encoder: a full (or no) last chunk leaves the chunk
+        # counter one further on
+        if not made or made[-1]["count"] == chunk_size:
+            chunk_id += 1
+        return made, block_id, chunk_id
+
+    def import_legacy(self, blocks, chunks):
+        # old JSON store lists → records; each chunk's blocks in id order
+        by_id = {b["id"]: b for b in blocks}
+        placed = set()
+        with self._lock(), open(self.bin_path, "ab") as b, open(self.idx_path, "ab") as i:
+            offset = b.tell()
+            for c in sorted(chunks, key=lambda c: min(c["block_ids"] or [0])):
+                ids = sorted(x for x in c["block_ids"] if x in by_id)
+                # split at gaps: a record holds consecutive ids
+                runs = []
+                for x in ids:
+                    if runs and x == runs[-1][-1] + 1:
+                        runs[-1].append(x)
+                    else:
+                        runs.append([x])
+                created = _parse_iso(c.get("created"))
+                for run in runs:
+                    text = "".join(by_id[x]["char"] for x in run)
+                    rec = self._record(c["chunk_id"], run[0], text, c.get("tag") or "", created)
+                    b.write(rec)
+                    i.write(ENTRY.pack(run[0], len(run), c["chunk_id"], offset))
+                    offset += len(rec)
+                    placed.update(run)
+            b.flush()
+        return len(placed)
+
+
+def _parse_iso(s):
+    try:
+        return calendar.timegm(time.strptime(s, "%Y-%m-%dT%H:%M:%S"))
+    except (TypeError, ValueError):
+        return int(time.time())
+
+
+class RecordLog:
+    def __init__(self, path):
+        self.path = path
+        self.idx_path = path + ".idx"
+        self.index = {}
+        for p in (path, self.idx_path):
+            if not os.path.exists(p):
+                open(p, "ab").close()
+        with open(self.idx_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.endswith("\n"):
+                    key, _, offset = line.rstrip("\n").rpartition("\t")
+                    self.index[key] = int(offset)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def get(self, key, default=None):
+        offset = self.index.get(key)
+        if offset is None:
+            return default
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def append(self, records, key="id"):
+        # records: iterable of dicts; indexed by rec[key] when key is set
+        lines = []
+        idx = []
+        with open(self.path + ".lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                for rec in records:
+                    line = json.dumps(rec, ensure_ascii=False).encode("utf-8") + b"\n"
+                    lines.append(line)
+                    if key is not None:
+                        idx.append(f"{rec[key]}\t{offset}\n")
+                        self.index[str(rec[key])] = offset
+                    offset += len(line)
+                f.write(b"".join(lines))
+            if idx:
+                with open(self.idx_path, "a", encoding="utf-8") as f:
+                    f.write("".join(idx))
+        return len(lines)
+
+    def __iter__(self):
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.endswith(b"\n"):
+                    yield json.loads(line)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# C13B0 — Fused RUO Feature Extractor
+# One streaming pass over the RUO store computes every per-RUO feature of
+# CART221 (historical tags), CART222 (materials), CART223 (geometry),
+# CART224 (sci-fi mappings) and CART226 (entropy).
+#
+# - the term tables of the four mappers are compiled into one lookup
+#   table: each term is looked up once, not once per cart
+# - shards run on the c13b0_shards process pool
+# - results go into a columnar table, one file per column, rows in store
+#   order:
+#
+#     C13B0_FEATURES/meta.json         store + table signature, row count
+#     C13B0_FEATURES/hash.jsonl        research_hash per row
+#     C13B0_FEATURES/history.jsonl     historical tags   (CART221)
+#     C13B0_FEATURES/material.jsonl    matched materials (CART222)
+#     C13B0_FEATURES/geometry.jsonl    equations         (CART223)
+#     C13B0_FEATURES/scifi.jsonl       science domains   (CART224)
+#     C13B0_FEATURES/entropy.f64       float64 entropy   (CART226)
+#
+# - each legacy JSON is derived from the hash column plus the columns its
+#   cart needs (derive(cart)); the table is rebuilt only when the store or
+#   one of the carts changes, so the five carts share a single scan
+# - tag / equation / domain lists are in first-match order (the carts used
+#   list(set(...)), whose order changed from run to run)
+#
+# CLI:
+#   python c13b0_features.py [--workers N] [--force]    # build + all five JSONs
+
+import importlib
+import json
+import os
+import shutil
+import struct
+import sys
+import time
+
+import c13b0_ruo_store as ruo_store
+import c13b0_shards as shards
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+RUO_STORE = "CART217_RUO_STORE.json"
+TABLE = "C13B0_FEATURES"
+F64 = struct.Struct("<d")
+
+CARTS = {
+    "cart221": ("cart221_historical_context_vectorizer", ["history"]),
+    "cart222": ("cart222_material_science_vectorizer", ["material"]),
+    "cart223": ("cart223_geometry_expansion_engine", ["geometry"]),
+    "cart224": ("cart224_scifi_science_mapper", ["scifi"]),
+    "cart226": ("cart226_entropy_scorer", ["entropy"]),
+}
+JSON_COLUMNS = ["hash", "history", "material", "geometry", "scifi"]
+COLUMNS = JSON_COLUMNS + ["entropy"]
+
+
+def _module(cart):
+    return importlib.import_module(CARTS[cart][0])
+
+
+def column_path(name, table=TABLE):
+    return os.path.join(table, name + (".f64" if name == "entropy" else ".jsonl"))
+
+
+# ---------- compiled lookup ----------
+
+_compiled = None
+
+
+def compile_table():
+    # term → (historical tag | None, is material, equations, science domains)
+    global _compiled
+    if _compiled is None:
+        hist = _module("cart221").HISTORICAL_MAP
+        mat = _module("cart222").MATERIAL_DOMAINS
+        geo = _module("cart223").GEOMETRY_EQ
+        sci = _module("cart224").SCIFI_MAP
+        table = {}
+        for t in set(hist) | set(mat) | set(geo) | set(sci):
+            table[t] = (hist.get(t), t in mat, tuple(geo.get(t, ())), tuple(sci.get(t, ())))
+        _compiled = (table, _module("cart226").entropy_calc)
+    return _compiled
+
+
+def extract(r):
+    table, entropy_calc = compile_table()
+    hist, mat, geo, sci = {}, {}, {}, {}
+    for t in r["terms"]:
+        hit = table.get(t)
+        if hit is None:
+            continue
+        tag, is_mat, eqs, doms = hit
+        if tag is not None:
+            hist[tag] = None
+        if is_mat:
+            mat[t] = None
+        for e in eqs:
+            geo[e] = None
+        for d in doms:
+            sci[d] = None
+    return {"hash": r["research_hash"], "history": list(hist), "material": list(mat),
+            "geometry": list(geo), "scifi": list(sci), "entropy": entropy_calc(r)}
+
+
+# ---------- build ----------
+
+def signature(json_path=RUO_STORE):
+    with ruo_store.open_store(json_path) as store:
+        sig = {"store": shards.store_signature(store)}
+    files = [__file__] + [_module(c).__file__ for c in CARTS]
+    sig["code"] = {os.path.basename(p): [os.stat(p).st_size, os.stat(p).st_mtime_ns] for p in files}
+    return sig
+
+
+def _load_meta(table=TABLE):
+    try:
+        with open(os.path.join(table, "meta.json"), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def fresh(json_path=RUO_STORE, table=TABLE):
+    meta = _load_meta(table)
+    return bool(meta) and meta.get("signature") == signature(json_path) and \
+        all(os.path.exists(column_path(c, table)) for c in COLUMNS)
+
+
+def _extract_shard(task):
+    shard, parts_dir = task
+    files = {c: open(os.path.join(parts_dir, f"{c}.{shard['id']:05d}"), "wb") for c in COLUMNS}
+    count = 0
+    try:
+        for r in shards.iter_shard(shard):
+            row = extract(r)
+            for c in JSON_COLUMNS:
+                files[c].write(json.dumps(row[c], ensure_ascii=False).encode("utf-8") + b"\n")
+            files["entropy"].write(F64.pack(row["entropy"]))
+            count += 1
+    finally:
+        for f in files.values():
+            f.close()
+    return count
+
+
+def build(json_path=RUO_STORE, table=TABLE, workers=None, verbose=True):
+    for cart in CARTS:
+        _module(cart)       # the carts own the tables; fail early if one is missing
+    sig = signature(json_path)
+    plan = shards.plan(json_path)
+    tmp = table + ".tmp"
+    parts_dir = table + ".parts"
+    for d in (tmp, parts_dir):
+        shutil.rmtree(d, ignore_errors=True)
+        os.makedirs(d)
+    try:
+        tasks = [(s, parts_dir) for s in plan]
+        rows = sum(shards.execute(_extract_shard, tasks, plan, workers, "features", verbose))
+        for c in COLUMNS:
+            with open(column_path(c, tmp), "wb") as out:
+                for s in plan:
+                    part = os.path.join(parts_dir, f"{c}.{s['id']:05d}")
+                    with open(part, "rb") as src:
+                        shutil.copyfileobj(src, out, 1 << 20)
+                    os.remove(part)
+        with open(os.path.join(tmp, "meta.json"), "w") as f:
+            json.dump({"signature": sig, "rows": rows, "columns": COLUMNS,
+                       "built": int(time.time())}, f, indent=4)
+        old = table + ".old"
+        shutil.rmtree(old, ignore_errors=True)
+        if os.path.exists(table):
+            os.replace(table, old)
+        os.replace(tmp, table)
+        shutil.rmtree(old, ignore_errors=True)
+    finally:
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        shutil.rmtree(tmp, ignore_errors=True)
+    return rows
+
+
+def ensure(json_path=RUO_STORE, table=TABLE, workers=None, force=False, verbose=True):
+    # Build unless fresh. Carts running side by side (pipeline jobs) wait
+    # on one lock, so only the first of them scans the store.
+    if not force and fresh(json_path, table):
+        return False
+    with open(table + ".lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        if not force and fresh(json_path, table):
+            return False
+        build(json_path, table, workers, verbose)
+        return True
+
+
+# ---------- reads ----------
+
+def _read_jsonl(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _read_f64(path):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(F64.size * 8192), b""):
+            for (v,) in F64.iter_unpack(chunk):
+                yield v
+
+
+def read_column(name, table=TABLE):
+    path = column_path(name, table)
+    return _read_f64(path) if name == "entropy" else _read_jsonl(path)
+
+
+def rows(columns, table=TABLE):
+    # (research_hash, {column: value}) in store order
+    readers = [read_column(c, table) for c in columns]
+    for h, *values in zip(read_column("hash", table), *readers):
+        yield h, dict(zip(columns, values))
+
+
+def derive(cart, output=None, json_path=RUO_STORE, table=TABLE, workers=None):
+    # Write the cart's legacy JSON ({research_hash: value}) from the table
+    ensure(json_path, table, workers)
+    mod = _module(cart)
+    columns = CARTS[cart][1]
+    pairs = ((h, mod.from_features(f)) for h, f in rows(columns, table))
+    return shards.write_keyed_json(pairs, output or mod.OUTPUT)
+
+
+def main():
+    args = sys.argv[1:]
+    workers = shards.workers_arg(args)
+    built = ensure(workers=workers, force="--force" in args)
+    print(f"[C13B0] Feature table {'built' if built else 'up to date'} → {TABLE}")
+    for cart in CARTS:
+        n = derive(cart)
+        print(f"[C13B0] {cart}: {n} RUOs → {_module(cart).OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# C13B0 — Shared Fetch Engine
+# Concurrent, rate-limited HTTP GETs for the scraper carts
+# (CART203, CART210–CART215, CART A).
+#
+# - one pooled requests.Session shared by every worker thread
+# - per-host concurrency limit + token-bucket rate limit
+# - retries with exponential backoff (honours Retry-After)
+# - on-disk response cache keyed by URL, revalidated with
+#   ETag / Last-Modified so unchanged pages come back as 304s
+#
+# Usage:
+#   with Fetcher() as fetcher:
+#       for res in fetcher.fetch_all(urls):   # results in input order
+#           if res.ok: ... res.text ...
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CACHE_DIR = "C13B0_FETCH_CACHE"
+USER_AGENT = "C13B0-Infinity-Fetcher/1.0"
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.stamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.stamp) * self.rate)
+                self.stamp = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class FetchResult:
+    def __init__(self, url, status_code=None, content=b"", headers=None,
+                 encoding=None, from_cache=False, error=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = encoding or "utf-8"
+        self.from_cache = from_cache
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None and self.status_code is not None and self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+
+class FetchCache:
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + ".json", base + ".body"
+
+    def load(self, url):
+        meta_path, body_path = self._paths(url)
+        if not (os.path.exists(meta_path) and os.path.exists(body_path)):
+            return None
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return meta, body
+
+    def store(self, url, res):
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        meta = {
+            "url": url,
+            "status": res.status_code,
+            "etag": res.headers.get("ETag"),
+            "last_modified": res.headers.get("Last-Modified"),
+            "encoding": res.encoding,
+            "stored": time.time()
+        }
+        tmp = body_path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(res.content)
+        os.replace(tmp, body_path)
+        tmp = meta_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, meta_path)
+
+    def validators(self, meta):
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+
+class Fetcher:
+    def __init__(self, max_workers=16, per_host=4, rate=2.0, burst=4,
+                 retries=3, backoff=0.5, timeout=10, cache_dir=CACHE_DIR,
+                 max_age=None, session=None):
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_age = max_age
+        self.cache = FetchCache(cache_dir) if cache_dir else None
+
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.setdefault("User-Agent", USER_AGENT)
+
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._pool.shutdown(wait=True)
+        self.session.close()
+
+    def _host(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._hosts_lock:
+            if host not in self._hosts:
+                self._hosts[host] = (threading.BoundedSemaphore(self.per_host),
+                                     TokenBucket(self.rate, self.burst))
+            return self._hosts[host]
+
+    def get(self, url):
+        cached = self.cache.load(url) if self.cache else None
+        if cached and self.max_age is not None:
+            meta, body = cached
+            if time.time() - meta.get("stored", 0) < self.max_age:
+                return FetchResult(url, meta["status"], body, encoding=meta.get("encoding"),
+                                   from_cache=True)
+
+        headers = self.cache.validators(cached[0]) if cached else {}
+        limit, bucket = self._host(url)
+        error = None
+
+        for attempt in range(self.retries + 1):
+            bucket.acquire()
+            try:
+                with limit:
+                    r = self.session.get(url, headers=headers, timeout=self.timeout)
+            except requests.RequestException as err:
+                error = err
+                r = None
+
+            if r is not None and r.status_code == 304 and cached:
+                meta, body = cached
+                return FetchResult(url, meta["status"], body, dict(r.headers),
+                                   meta.get("encoding"), from_cache=True)
+
+            if r is not None and r.status_code not in RETRY_STATUS:
+                res = FetchResult(url, r.status_code, r.content, dict(r.headers),
+                                  r.encoding or r.apparent_encoding)
+                if self.cache and r.status_code == 200:
+                    self.cache.store(url, res)
+                return res
+
+            if attempt == self.retries:
+                break
+            time.sleep(self._delay(attempt, r))
+
+        if r is not None:
+            return FetchResult(url, r.status_code, r.content, dict(r.headers), r.encoding)
+        return FetchResult(url, error=error)
+
+    def _delay(self, attempt, r):
+        if r is not None:
+            retry_after = r.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return self.backoff * (2 ** attempt) * (0.5 + random.random())
+
+    def fetch_all(self, urls):
+        # Results are yielded in input order; `urls` may be a lazy iterable,
+        # at most 2 × max_workers requests are in flight or buffered.
+        window = deque()
+        for url in urls:
+            window.append(self._pool.submit(self.get, url))
+            if len(window) >= self.max_workers * 2:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# C13B0 — Incremental File Index
+# Persistent index of the research tree (~/o) for cart_index_reader.
+#
+# - every .txt / .json file is keyed by path and identified by
+#   (size, mtime_ns, inode); a rescan re-reads only files whose identity
+#   changed, reuses the stored entry for the rest and drops vanished paths
+# - changed files are read in CHUNK-sized pieces (never one f.read()):
+#   each piece feeds the SHA-1, the streaming color scanner and the preview
+# - with more than a handful of changed files they are indexed on a
+#   process pool
+# - the index is rewritten atomically; the last scan's delta (added /
+#   changed / removed paths) goes to .c13b0_file_index.delta.json
+# - both are dot files, outside the C13B0_*.json maps CARTQ merges into
+#   the color memory; an old C13B0_FILE_INDEX.json is moved on first use
+#
+# An entry:
+#   {"size", "mtime_ns", "ino", "skip", "color", "value", "preview"}
+# "skip" marks files that are empty (whitespace only) or unreadable.
+# Colors come from the caller's keyword → color map; a different map
+# invalidates the whole index.
+#
+# Usage (cart_index_reader):
+#   files, delta = file_index.update(ROOT, COLOR_MAP, "white", workers=N)
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import c13b0_colormatch as colormatch
+
+INDEX = ".c13b0_file_index.json"
+OLD_INDEX = "C13B0_FILE_INDEX.json"
+CHUNK = 1 << 20             # characters per read
+PREVIEW = 250
+PARALLEL_MIN = 8            # fewer changed files than this are indexed inline
+EXTENSIONS = (".txt", ".json")
+VERSION = 1
+
+
+def delta_path(index=INDEX):
+    return os.path.splitext(index)[0] + ".delta.json"
+
+
+def matcher(rules):
+    # rules: (color_map, default color)
+    color_map, default = rules
+    return colormatch.compile_rules(colormatch.rules_from_keywords(color_map), default)
+
+
+def value_of(digest):
+    # SHA-1 hex → Infinity Value
+    return int(digest[:6], 16) % 5000 + 500
+
+
+def walk(root, skip=()):
+    # (path, stat) for every indexed file, in os.walk(root) order
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    dirs = []
+    with it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                dirs.append(entry)
+            elif entry.name.endswith(EXTENSIONS) and entry.path not in skip:
+                try:
+                    yield entry.path, entry.stat()
+                except OSError:
+                    continue
+    for d in dirs:
+        if not d.is_symlink():
+            yield from walk(d.path, skip)
+
+
+def identity(st):
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def index_file(path, rules):
+    # One streamed pass: same color, value and preview as reading the
+    # whole file as text and scanning / hashing it
+    scan = matcher(rules).scanner()
+    sha = hashlib.sha1()
+    head = []
+    head_len = 0
+    blank = True
+    try:
+        with open(path, "r", errors="ignore") as f:
+            for piece in iter(lambda: f.read(CHUNK), ""):
+                sha.update(piece.encode())
+                scan.feed(piece)
+                if blank and piece.strip():
+                    blank = False
+                if head_len < PREVIEW:
+                    head.append(piece[:PREVIEW - head_len])
+                    head_len += len(head[-1])
+    except OSError:
+        return {"skip": True}
+    if blank:
+        return {"skip": True}
+    return {"skip": False, "color": scan.result(), "value": value_of(sha.hexdigest()),
+            "preview": "".join(head).replace("\n", " ")}
+
+
+def _index_batch(task):
+    paths, rules = task
+    return [index_file(p, rules) for p in paths]
+
+
+def _signature(root, rules):
+    color_map, default = rules
+    return {"version": VERSION, "root": root, "rules": [[[k, c] for k, c in color_map.items()], default]}
+
+
+def load(root, rules, index=INDEX):
+    # stored entries, or {} when the index was built for another root / map
+    if index == INDEX and os.path.exists(OLD_INDEX):
+        if not os.path.exists(index):
+            os.replace(OLD_INDEX, index)
+        for old in (OLD_INDEX, delta_path(OLD_INDEX)):
+            if os.path.exists(old):
+                os.remove(old)
+    try:
+        with open(index, "r") as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if saved.get("signature") != _signature(root, rules):
+        return {}
+    return saved.get("files", {})
+
+
+def _save(files, root, rules, index):
+    tmp = index + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"signature": _signature(root, rules), "updated": int(time.time()),
+                   "files": files}, f)
+    os.replace(tmp, index)
+
+
+def _index_all(paths, rules, workers):
+    if workers <= 1 or len(paths) < PARALLEL_MIN:
+        return [index_file(p, rules) for p in paths]
+    per = max(1, min(256, len(paths) // (workers * 4)))
+    tasks = [(paths[i:i + per], rules) for i in range(0, len(paths), per)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return [e for batch in pool.map(_index_batch, tasks) for e in batch]
+
+
+def update(root, color_map, default, index=INDEX, workers=None, full=False):
+    # -> (files, delta); files is {path: entry} in walk order
+    root = os.path.abspath(os.path.expanduser(root))
+    rules = (color_map, default)
+    old = {} if full else load(root, rules, index)
+    skip = {os.path.abspath(index), os.path.abspath(index + ".tmp"), os.path.abspath(delta_path(index))}
+
+    files = {}
+    todo = []
+    delta = {"added": [], "changed": [], "removed": [], "unchanged": 0}
+    for path, st in walk(root, skip):
+        ident = identity(st)
+        prev = old.get(path)
+        if prev is not None and [prev["size"], prev["mtime_ns"], prev["ino"]] == ident:
+            files[path] = prev
+            delta["unchanged"] += 1
+            continue
+        files[path] = dict(zip(("size", "mtime_ns", "ino"), ident))
+        todo.append(path)
+        delta["changed" if prev is not None else "added"].append(path)
+    delta["removed"] = [p for p in old if p not in files]
+
+    workers = workers or os.cpu_count() or 1
+    for path, entry in zip(todo, _index_all(todo, rules, workers)):
+        files[path].update(entry)
+
+    if todo or delta["removed"] or not os.path.exists(index):
+        _save(files, root, rules, index)
+    with open(delta_path(index), "w") as f:
+        json.dump(dict(delta, root=root, timestamp=int(time.time())), f, indent=2)
+    return files, delta
+
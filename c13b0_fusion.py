@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# C13B0 — Lazy Fusion Engine
+# Shared combination engine for CART205–CART208.
+#
+# - Combinations are generated lazily, never materialized as a list.
+# - Full enumerations go to NDJSON shards with a resumable cursor, so a
+#   long run (CART208) can be stopped and continued where it left off.
+# - Top-k selection uses a bounded heap. For the summed-length scores
+#   used by the fusion carts, best_combinations() walks combinations in
+#   score order directly, so the best N never require a full enumeration.
+# - color_clusters() does the same for the color-fusion carts (CART H, I,
+#   J): terms are grouped by color, only color mixes that can fuse to a
+#   given color are enumerated, and each (size, color) keeps its k most
+#   cohesive clusters. One task per (size, color), on a process pool.
+#
+# Layout of a shard directory:
+#   <OUTDIR>/shard_00000.ndjson   one fusion record per line
+#   <OUTDIR>/cursor.json          last combination written + byte offsets
+
+import hashlib
+import heapq
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+SHARD_SIZE = 100000
+CURSOR = "cursor.json"
+
+
+def terms_signature(terms):
+    return hashlib.sha256("\n".join(terms).encode("utf-8")).hexdigest()
+
+
+def combinations_from(n, r, after=None):
+    # Index tuples in itertools.combinations order, starting after `after`
+    if r > n or r <= 0:
+        return
+    if after is None:
+        idx = list(range(r))
+    else:
+        idx = list(after)
+        if not _advance(idx, n):
+            return
+    while True:
+        yield tuple(idx)
+        if not _advance(idx, n):
+            return
+
+
+def _advance(idx, n):
+    r = len(idx)
+    i = r - 1
+    while i >= 0 and idx[i] == i + n - r:
+        i -= 1
+    if i < 0:
+        return False
+    idx[i] += 1
+    for j in range(i + 1, r):
+        idx[j] = idx[j - 1] + 1
+    return True
+
+
+def iter_fusions(terms, depths, cursor=None):
+    # Yields (depth, index_tuple, combo) lazily across every requested depth
+    depths = list(depths)
+    start_depth = cursor["depth"] if cursor else None
+    for r in depths:
+        if start_depth is not None and r < start_depth:
+            continue
+        after = cursor["last"] if cursor and r == start_depth else None
+        for idx in combinations_from(len(terms), r, after):
+            yield r, idx, tuple(terms[i] for i in idx)
+
+
+def top_k(records, k, key):
+    # Bounded-heap top-k over any record stream, best first
+    heap = []
+    for n, rec in enumerate(records):
+        item = (key(rec), -n, rec)
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+    return [rec for _, _, rec in sorted(heap, key=lambda x: x[:2], reverse=True)]
+
+
+def best_combinations(terms, depth, k, weight=len):
+    # The k highest-scoring `depth`-combinations, where a combination's score
+    # is the sum of weight(term). Best-first search over index tuples of the
+    # weight-sorted terms, so the cost is O(k · depth · log k) regardless of
+    # how many combinations exist. Combos keep their dictionary order.
+    n = len(terms)
+    if depth > n or depth <= 0 or k <= 0:
+        return []
+    order = sorted(range(n), key=lambda i: (-weight(terms[i]), i))
+    w = [weight(terms[i]) for i in order]
+
+    start = tuple(range(depth))
+    heap = [(-sum(w[i] for i in start), start)]
+    seen = {start}
+    out = []
+    while heap and len(out) < k:
+        neg, state = heapq.heappop(heap)
+        combo = tuple(terms[i] for i in sorted(order[j] for j in state))
+        out.append((-neg, combo))
+        for pos in range(depth):
+            nxt = state[pos] + 1
+            limit = state[pos + 1] if pos + 1 < depth else n
+            if nxt >= limit:
+                continue
+            succ = state[:pos] + (nxt,) + state[pos + 1:]
+            if succ not in seen:
+                seen.add(succ)
+                heapq.heappush(heap, (neg + w[state[pos]] - w[nxt], succ))
+    return out
+
+
+# ---------- color clusters ----------
+
+def _precedence(order, fallback, colors):
+    for c in order:
+        if c in colors:
+            return c
+    return colors[0] if fallback is None else fallback
+
+
+def fuse_precedence(order, fallback=None):
+    # first color of `order` among the members, else `fallback`
+    # (None: the first member's color)
+    return partial(_precedence, tuple(order), fallback)
+
+
+def fuse_dominant(colors):
+    # most frequent color, ties to the one seen first; None when no member
+    # has a color
+    score = {}
+    for c in colors:
+        if c:
+            score[c] = score.get(c, 0) + 1
+    return max(score, key=score.get) if score else None
+
+
+def _mixes(classes, depth, fuse):
+    # every feasible color mix of `depth` members: (counts per class,
+    # colors it can fuse to in some member order)
+    keys = list(classes)
+    for picked in itertools.combinations_with_replacement(range(len(keys)), depth):
+        counts = {}
+        for i in picked:
+            counts[i] = counts.get(i, 0) + 1
+        if any(len(classes[keys[i]]) < a for i, a in counts.items()):
+            continue
+        colors = [keys[i] for i in picked]
+        fused = {fuse(list(p)) for p in set(itertools.permutations(colors))}
+        fused.discard(None)
+        if fused:
+            yield counts, fused
+
+
+def _pick(groups):
+    # lazy product of combinations(indices, count) over the groups
+    if not groups:
+        yield ()
+        return
+    (indices, count), rest = groups[0], groups[1:]
+    for part in itertools.combinations(indices, count):
+        for tail in _pick(rest):
+            yield part + tail
+
+
+def _classes(colors):
+    classes = {}
+    for i, c in enumerate(colors):
+        classes.setdefault(c, []).append(i)
+    return classes
+
+
+def _cluster_task(task):
+    # -> [(score, index tuple)] for one (depth, color), best first. `mixes`
+    # come in score order, so the walk stops after k clusters.
+    colors, target, k, fuse, mixes = task
+    groups_of = list(_classes(colors).values())
+    out = []
+    for score, counts in mixes:
+        for picked in _pick([(groups_of[i], a) for i, a in counts]):
+            idx = tuple(sorted(picked))
+            if fuse([colors[i] for i in idx]) != target:
+                continue        # mix can fuse to target, but not in this order
+            out.append((score, idx))
+            if len(out) >= k:
+                return out
+    return out
+
+
+def color_clusters(terms, color_of, depths, k, fuse, workers=None):
+    # -> {(depth, color): [(score, combo), ...]}, best first, at most k each.
+    # A key is only present if at least one cluster fuses to that color.
+    # color_of(term) may return None for uncolored terms; fuse(colors)
+    # gets the member colors in term order. A cluster's score is how many
+    # of its members carry the fused color.
+    colors = [color_of(t) for t in terms]
+    classes = _classes(colors)
+    keys = list(classes)
+    tasks = []
+    for depth in depths:
+        if depth > len(terms):
+            continue
+        by_target = {}
+        for counts, fused in _mixes(classes, depth, fuse):
+            for t in fused:
+                score = counts.get(keys.index(t), 0) if t in classes else 0
+                by_target.setdefault(t, []).append((score, sorted(counts.items())))
+        for t in sorted(by_target, key=str):
+            mixes = sorted(by_target[t], key=lambda m: -m[0])   # stable: mix order on ties
+            tasks.append(((depth, t), (colors, t, k, fuse, mixes)))
+    workers = min(workers or os.cpu_count() or 1, max(1, len(tasks)))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_cluster_task, [t for _, t in tasks]))
+    else:
+        results = [_cluster_task(t) for _, t in tasks]
+    # a mix can fuse to a color in some member orders only, so tasks may come back empty
+    return {key: [(score, tuple(terms[i] for i in idx)) for score, idx in found]
+            for (key, _), found in zip(tasks, results) if found}
+
+
+# ---------- NDJSON shards ----------
+
+def _shard_path(out_dir, num):
+    return os.path.join(out_dir, f"shard_{num:05d}.ndjson")
+
+
+def load_cursor(out_dir):
+    path = os.path.join(out_dir, CURSOR)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_cursor(out_dir, cursor):
+    path = os.path.join(out_dir, CURSOR)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(cursor, f, indent=4)
+    os.replace(tmp, path)
+
+
+def write_fusion_shards(terms, depths, make_record, out_dir,
+                        shard_size=SHARD_SIZE, max_records=None):
+    # Streams every combination into NDJSON shards. Resumes from cursor.json
+    # when the term list is unchanged; starts over when it changed. With
+    # max_records the run stops early and the next run continues from there.
+    os.makedirs(out_dir, exist_ok=True)
+    sig = terms_signature(terms)
+    cursor = load_cursor(out_dir)
+
+    if cursor and (cursor.get("terms_sig") != sig or cursor.get("depths") != list(depths)):
+        for name in os.listdir(out_dir):
+            if name.startswith("shard_") or name == CURSOR:
+                os.remove(os.path.join(out_dir, name))
+        cursor = None
+
+    if cursor and cursor.get("done"):
+        return cursor
+
+    if cursor is None:
+        cursor = {"terms_sig": sig, "depths": list(depths), "depth": None, "last": None,
+                  "emitted": 0, "shard": 0, "shard_lines": 0, "shard_bytes": 0, "done": False}
+
+    shard = cursor["shard"]
+    lines = cursor["shard_lines"]
+    out = open(_shard_path(out_dir, shard), "ab")
+    # drop anything written after the last saved cursor (interrupted run)
+    out.truncate(cursor["shard_bytes"])
+    out.seek(cursor["shard_bytes"])
+
+    resume = {"depth": cursor["depth"], "last": cursor["last"]} if cursor["last"] else None
+    written = 0
+    finished = True
+
+    try:
+        for r, idx, combo in iter_fusions(terms, depths, resume):
+            if max_records is not None and written >= max_records:
+                finished = False
+                break
+            if lines >= shard_size:
+                out.close()
+                shard += 1
+                lines = 0
+                out = open(_shard_path(out_dir, shard), "wb")
+            out.write(json.dumps(make_record(combo)).encode("utf-8") + b"\n")
+            lines += 1
+            written += 1
+            cursor.update(depth=r, last=list(idx), emitted=cursor["emitted"] + 1)
+            if written % shard_size == 0:
+                out.flush()
+                cursor.update(shard=shard, shard_lines=lines, shard_bytes=out.tell())
+                save_cursor(out_dir, cursor)
+    finally:
+        out.flush()
+        cursor.update(shard=shard, shard_lines=lines, shard_bytes=out.tell())
+        out.close()
+
+    cursor["done"] = finished
+    save_cursor(out_dir, cursor)
+    cursor["written"] = written
+    return cursor
+
+
+def iter_shard_records(out_dir):
+    if not os.path.isdir(out_dir):
+        return
+    for name in sorted(os.listdir(out_dir)):
+        if not (name.startswith("shard_") and name.endswith(".ndjson")):
+            continue
+        with open(os.path.join(out_dir, name), "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def write_top(path, records):
+    with open(path, "w") as f:
+        json.dump(records, f, indent=4)
+
+
+def iter_top_queries(sources, per_source):
+    # Best `per_source` queries from each fusion stage, lazily. A source is
+    # (top_json_path, shard_dir, score_key); the ranked top file is used when
+    # present, otherwise the shards are streamed through a bounded heap.
+    for top_path, shard_dir, score_key in sources:
+        if os.path.exists(top_path):
+            with open(top_path, "r") as f:
+                ranked = json.load(f)
+        else:
+            ranked = top_k(iter_shard_records(shard_dir), per_source,
+                           key=lambda e: e.get(score_key, 0))
+        for e in ranked[:per_source]:
+            yield e.get("query") or " ".join(e.get("terms", []))
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# C13B0 — Append-Log History Store
+# Shared backing for the ever-growing history files
+# (CART426 lineage, CART427 versions, CART504 watchdog, CART601 / CART603
+# evolution snapshots, CART823 world ledger).
+#
+#   <NAME>.jsonl     one compact JSON record per line, appended in O(1)
+#   <NAME>.jsonlidx  fixed-size [f64 ts][u64 offset][u32 flags] per record
+#   <NAME>.jsonllock flock() taken by appends, repairs and rewrites
+#
+# - "latest" reads touch only the last index record (plus, for state logs,
+#   the deltas back to the nearest snapshot)
+# - time-range reads bisect the index (timestamps are non-decreasing)
+# - state logs (state_key="state") store a full snapshot every
+#   `snapshot_every` records and top-level key deltas in between
+# - a torn last line from an interrupted append is repaired on open
+# - logs opened with keep=N hold the newest N entries: append() compacts
+#   once the superseded entries exceed COMPACT_RATIO * N
+# - the old JSON file is imported once on first use, and the JSON view
+#   can be exported again on demand (export_json, optionally only the
+#   newest entries)
+#
+# Usage:
+#   log = open_log("CART426_LINEAGE.json")      # → CART426_LINEAGE.jsonl
+#   log.append({"timestamp": ..., ...})
+#   log.latest(); log.range(t0, t1); log.export_json(keep=1000)
+
+import json
+import os
+import struct
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+IDX = struct.Struct("<dQI")
+FULL = 1
+SNAPSHOT_EVERY = 32
+COMPACT_RATIO = 0.5
+
+
+def _encode(rec):
+    return json.dumps(rec, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def log_paths(json_path):
+    base = os.path.splitext(json_path)[0]
+    return base + ".jsonl", base + ".jsonlidx"
+
+
+def _tmp(path):
+    return f"{path}.{os.getpid()}.tmp"
+
+
+def _delta(prev, cur):
+    if not (isinstance(prev, dict) and isinstance(cur, dict)):
+        return None
+    changed = {k: v for k, v in cur.items() if k not in prev or prev[k] != v}
+    removed = [k for k in prev if k not in cur]
+    return {"set": changed, "del": removed}
+
+
+def _apply(state, delta):
+    state = dict(state)
+    for k in delta["del"]:
+        state.pop(k, None)
+    state.update(delta["set"])
+    return state
+
+
+class HistoryLog:
+    def __init__(self, json_path, key=None, state_key=None, ts_key="timestamp",
+                 snapshot_every=SNAPSHOT_EVERY, keep=None):
+        # key: the list's key in the JSON view ({"history": [...]}), or
+        # None when the view is a bare list; keep: entries to retain
+        self.json_path = json_path
+        self.key = key
+        self.state_key = state_key
+        self.ts_key = ts_key
+        self.snapshot_every = snapshot_every
+        self.keep = keep
+        self.log_path, self.index_path = log_paths(json_path)
+        self.lock_path = self.log_path + "lock"
+        self._lock_fd = None
+        self._lock_depth = 0
+        self._last_state = None
+        self._state_at = None
+        with self._locked():
+            if not os.path.exists(self.log_path):
+                self._import_legacy()
+            self._recover()
+
+    # -- maintenance ---------------------------------------------------
+
+    @contextmanager
+    def _locked(self, shared=False):
+        # exclusive across processes; re-entrant within this log. Readers
+        # take it shared just to open the log and index of one generation
+        if shared and self._lock_depth == 0:
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_SH)
+                yield
+            finally:
+                os.close(fd)
+            return
+        if self._lock_depth == 0:
+            self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl is not None:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            if self._lock_depth == 0:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    def _import_legacy(self):
+        entries = []
+        if os.path.exists(self.json_path):
+            with open(self.json_path, "r") as f:
+                view = json.load(f)
+            entries = view.get(self.key, []) if self.key else view
+        self._rewrite(entries)
+
+    def _rewrite(self, entries):
+        tmp_log = _tmp(self.log_path)
+        tmp_idx = _tmp(self.index_path)
+        prev = None
+        with open(tmp_log, "wb") as log, open(tmp_idx, "wb") as idx:
+            for n, entry in enumerate(entries):
+                line, flags, prev = self._record(entry, prev, n)
+                idx.write(IDX.pack(self._ts(entry), log.tell(), flags))
+                log.write(line)
+        os.replace(tmp_log, self.log_path)
+        os.replace(tmp_idx, self.index_path)
+        self._last_state = prev
+        self._state_at = len(entries)
+
+    def _recover(self):
+        # index and log are appended separately; make them agree again
+        if not os.path.exists(self.index_path):
+            open(self.index_path, "wb").close()
+        size = os.path.getsize(self.log_path)
+        count = os.path.getsize(self.index_path) // IDX.size
+        start = 0
+        if count:
+            with open(self.index_path, "rb") as idx:
+                _, offset, _ = self._index_at(idx, count - 1)
+            if offset >= size:
+                count, start = 0, 0
+            else:
+                with open(self.log_path, "rb") as log:
+                    log.seek(offset)
+                    start = offset + len(log.readline())
+        if count * IDX.size == os.path.getsize(self.index_path) and start >= size:
+            return
+        self._index_from(count, start)
+
+    def _index_from(self, count, start):
+        with open(self.index_path, "r+b") as idx, open(self.log_path, "r+b") as log:
+            idx.truncate(count * IDX.size)
+            idx.seek(0, os.SEEK_END)
+            log.seek(start)
+            pos = start
+            for line in log:
+                if not line.endswith(b"\n"):
+                    break
+                rec = json.loads(line)
+                idx.write(IDX.pack(rec.get("ts", 0.0), pos, FULL if "full" in rec or "delta" not in rec else 0))
+                pos += len(line)
+            log.truncate(pos)
+
+    def compact(self, keep=None):
+        # Rewrite with fresh snapshots (and only the last `keep` entries)
+        keep = self.keep if keep is None else keep
+        with self._locked():
+            entries = list(self) if keep is None else self.tail(keep)
+            self._rewrite(entries)
+        return len(entries)
+
+    def _due(self, n):
+        # superseded entries past the ratio that makes a rewrite worth it
+        return self.keep is not None and n - self.keep > max(1, self.keep * COMPACT_RATIO)
+
+    # -- encoding ------------------------------------------------------
+
+    def _ts(self, entry):
+        ts = entry.get(self.ts_key) if isinstance(entry, dict) else None
+        return float(ts) if isinstance(ts, (int, float)) else time.time()
+
+    def _record(self, entry, prev_state, n):
+        # -> (line, flags, state)
+        rec = {"ts": self._ts(entry)}
+        if not self.state_key or not isinstance(entry, dict) or self.state_key not in entry:
+            rec["e"] = entry
+            return _encode(rec), FULL, prev_state
+        state = entry[self.state_key]
+        rec["e"] = {k: v for k, v in entry.items() if k != self.state_key}
+        delta = None if n % self.snapshot_every == 0 else _delta(prev_state, state)
+        if delta is None:
+            rec["full"] = state
+            return _encode(rec), FULL, state
+        rec["delta"] = delta
+        return _encode(rec), 0, state
+
+    def _decode(self, rec, state):
+        # -> (entry, state)
+        entry = rec["e"]
+        if "full" in rec:
+            state = rec["full"]
+        elif "delta" in rec:
+            state = _apply(state or {}, rec["delta"])
+        else:
+            return entry, state
+        entry = dict(entry)
+        entry[self.state_key] = state
+        return entry, state
+
+    # -- reads ---------------------------------------------------------
+
+    def __len__(self):
+        return os.path.getsize(self.index_path) // IDX.size
+
+    def _index_at(self, idx, n):
+        idx.seek(n * IDX.size)
+        return IDX.unpack(idx.read(IDX.size))
+
+    def _iter_from(self, n, stop=None):
+        # entries n.. (n may start inside a delta chain)
+        with self._locked(shared=True):
+            idx = open(self.index_path, "rb")
+            log = open(self.log_path, "rb")
+        with idx, log:
+            # lines past the index are still being appended
+            count = os.fstat(idx.fileno()).st_size // IDX.size
+            stop = count if stop is None else min(stop, count)
+            if n >= stop:
+                return
+            first = n
+            while first > 0 and not self._index_at(idx, first)[2] & FULL:
+                first -= 1
+            _, offset, _ = self._index_at(idx, first)
+            state = None
+            log.seek(offset)
+            for i, line in enumerate(log, first):
+                if i >= stop:
+                    return
+                entry, state = self._decode(json.loads(line), state)
+                if i >= n:
+                    yield entry
+
+    def __iter__(self):
+        return self._iter_from(0)
+
+    def latest(self, default=None):
+        n = len(self)
+        if not n:
+            return default
+        return next(self._iter_from(n - 1), default)
+
+    def tail(self, k):
+        return list(self._iter_from(max(0, len(self) - k)))
+
+    def _bisect(self, idx, ts):
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._index_at(idx, mid)[0] < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def range(self, start=None, end=None):
+        # entries with start <= ts < end
+        with open(self.index_path, "rb") as idx:
+            lo = 0 if start is None else self._bisect(idx, start)
+            hi = None if end is None else self._bisect(idx, end)
+        if hi is not None and hi <= lo:
+            return iter(())
+        return self._iter_from(lo, hi)
+
+    # -- writes --------------------------------------------------------
+
+    def append(self, entry):
+        with self._locked():
+            n = len(self)
+            if self._state_at != n:
+                # another process appended since our last write
+                self._last_state = None
+            prev = None
+            if self.state_key and n % self.snapshot_every:
+                if self._last_state is None:
+                    last = self.latest()
+                    self._last_state = last.get(self.state_key) if isinstance(last, dict) else None
+                prev = self._last_state
+            line, flags, state = self._record(entry, prev, n if prev is not None else 0)
+            with open(self.log_path, "ab") as log:
+                offset = log.tell()
+                log.write(line)
+            with open(self.index_path, "ab") as idx:
+                idx.write(IDX.pack(json.loads(line)["ts"], offset, flags))
+            self._last_state = state
+            self._state_at = n + 1
+            if self._due(n + 1):
+                self.compact()
+        return n
+
+    def export_json(self, path=None, extra=None, keep=None):
+        # Write the classic JSON view, one entry at a time (only the newest
+        # `keep` entries if given)
+        path = path or self.json_path
+        tmp = _tmp(path)
+        entries = self if keep is None else self._iter_from(max(0, len(self) - keep))
+        empty = True
+        with open(tmp, "w") as f:
+            if self.key:
+                f.write("{\n")
+                for k, v in (extra or {}).items():
+                    f.write(f"    {json.dumps(k)}: {json.dumps(v)},\n")
+                f.write(f"    {json.dumps(self.key)}: [")
+            else:
+                f.write("[")
+            for entry in entries:
+                f.write("\n" if empty else ",\n")
+                f.write(json.dumps(entry, indent=4))
+                empty = False
+            f.write("]\n" if empty else "\n]\n")
+            if self.key:
+                f.write("}\n")
+        os.replace(tmp, path)
+        return path
+
+
+def open_log(json_path, key=None, state_key=None, ts_key="timestamp", keep=None):
+    return HistoryLog(json_path, key=key, state_key=state_key, ts_key=ts_key, keep=keep)
+
+
+if __name__ == "__main__":
+    # c13b0_history.py VIEW.json [--key history] [--state-key state] [--export | --compact]
+    args = sys.argv[1:]
+    if not args:
+        print("usage: c13b0_history.py VIEW.json [--key K] [--state-key K] [--export | --compact]")
+        sys.exit(1)
+
+    def opt(name):
+        return args[args.index(name) + 1] if name in args else None
+
+    log = open_log(args[0], key=opt("--key"), state_key=opt("--state-key"))
+    if "--compact" in args:
+        print(f"[C13B0] Compacted {log.log_path}: {log.compact()} entries")
+    if "--export" in args:
+        print(f"[C13B0] Exported {log.export_json()}")
+    print(f"[C13B0] {log.log_path}: {len(log)} entries")
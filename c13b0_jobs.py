@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# C13B0 — Cart Job Queue
+# Asynchronous cart runs for server.py.
+#
+# - submit() returns a Job at once; a bounded set of worker threads runs
+#   the carts as subprocesses, at most `per_cart` at a time per cart
+# - an identical run (same cart, same args) already queued or running is
+#   returned instead of starting a second one
+# - output is captured line by line while the cart runs: poll it with
+#   job.snapshot(since) or follow it with job.follow(since)
+# - the cart id → filename map is built once and rescanned only when an
+#   unknown id is asked for
+# - finished jobs are kept for the last MAX_FINISHED runs
+#
+# Usage:
+#   jobs = JobQueue(workers=4)
+#   job, created = jobs.submit("301")
+#   for line in job.follow(): print(line, end="")
+
+import itertools
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+
+WORKERS = 4
+PER_CART = 1
+TIMEOUT = 30
+MAX_FINISHED = 200
+MAX_LINES = 10000           # output lines kept per job; older ones are dropped
+
+
+def scan_carts(root="."):
+    # {cart id: filename}; "cart301_ruo_summarizer.py" → "301"
+    carts = {}
+    for name in sorted(os.listdir(root)):
+        if name.startswith("cart") and name.endswith(".py") and "_" in name:
+            carts.setdefault(name[4:name.index("_")], name)
+    return carts
+
+
+class Job:
+    def __init__(self, cart, script, args):
+        self.id = uuid.uuid4().hex[:12]
+        self.cart = cart
+        self.script = script
+        self.args = list(args)
+        self.status = "queued"      # queued / running / ok / error / timeout
+        self.returncode = None
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.lines = deque(maxlen=MAX_LINES)
+        self.dropped = 0            # lines pushed out of `lines`
+        self._cond = threading.Condition()
+
+    @property
+    def done(self):
+        return self.status not in ("queued", "running")
+
+    def _append(self, line):
+        with self._cond:
+            if len(self.lines) == self.lines.maxlen:
+                self.dropped += 1
+            self.lines.append(line)
+            self._cond.notify_all()
+
+    def _finish(self, status, returncode=None, error=None):
+        with self._cond:
+            self.status = status
+            self.returncode = returncode
+            self.error = error
+            self.finished = time.time()
+            self._cond.notify_all()
+
+    def _since(self, since):
+        start = max(0, since - self.dropped)
+        return list(itertools.islice(self.lines, start, None)), self.dropped + len(self.lines)
+
+    def snapshot(self, since=0):
+        # status plus output lines from line number `since` on
+        with self._cond:
+            lines, total = self._since(since)
+            return dict(self.info(), output="".join(lines), next=total)
+
+    def info(self):
+        return {"id": self.id, "cart": self.cart, "script": self.script, "args": self.args,
+                "status": self.status, "returncode": self.returncode, "error": self.error,
+                "created": self.created, "started": self.started, "finished": self.finished}
+
+    def follow(self, since=0, heartbeat=15.0):
+        # Yields output lines as they arrive (None on an idle heartbeat),
+        # until the job is done
+        while True:
+            with self._cond:
+                lines, total = self._since(since)
+                if not lines and not self.done:
+                    self._cond.wait(heartbeat)
+                    lines, total = self._since(since)
+                finished = self.done
+            since = total
+            if lines:
+                yield from lines
+            elif not finished:
+                yield None
+            if finished and not lines:
+                return
+
+    def wait(self, timeout=None):
+        with self._cond:
+            return self._cond.wait_for(lambda: self.done, timeout)
+
+
+class JobQueue:
+    def __init__(self, workers=WORKERS, per_cart=PER_CART, timeout=TIMEOUT, root="."):
+        self.per_cart = per_cart
+        self.timeout = timeout
+        self.root = root
+        self.carts = scan_carts(root)
+        self.jobs = OrderedDict()           # id → Job, oldest first
+        self._pending = deque()
+        self._running = {}                  # cart → running count
+        self._inflight = {}                 # (cart, args) → Job
+        self._lock = threading.Condition()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._worker, daemon=True, name=f"c13b0-job-{n}")
+                         for n in range(workers)]
+        for t in self._threads:
+            t.start()
+
+    # -- lookup ------------------------------------------------------------
+
+    def script(self, cart):
+        with self._lock:
+            if cart not in self.carts:
+                self.carts = scan_carts(self.root)
+            return self.carts.get(cart)
+
+    def get(self, job_id):
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def list(self):
+        with self._lock:
+            return [j.info() for j in self.jobs.values()]
+
+    # -- submit ------------------------------------------------------------
+
+    def submit(self, cart, args=()):
+        # -> (job, created); raises KeyError for an unknown cart
+        script = self.script(cart)
+        if script is None:
+            raise KeyError(cart)
+        key = (cart, tuple(args))
+        with self._lock:
+            job = self._inflight.get(key)
+            if job is not None and not job.done:
+                return job, False
+            job = Job(cart, script, args)
+            self.jobs[job.id] = job
+            self._inflight[key] = job
+            self._pending.append(job)
+            self._prune()
+            self._lock.notify_all()
+        return job, True
+
+    def _prune(self):
+        finished = [j for j in self.jobs.values() if j.done]
+        for j in finished[:max(0, len(finished) - MAX_FINISHED)]:
+            del self.jobs[j.id]
+
+    # -- workers -------------------------------------------------------------
+
+    def _next(self):
+        # first queued job whose cart has a free slot
+        for job in self._pending:
+            if self._running.get(job.cart, 0) < self.per_cart:
+                self._pending.remove(job)
+                self._running[job.cart] = self._running.get(job.cart, 0) + 1
+                return job
+        return None
+
+    def _worker(self):
+        while True:
+            with self._lock:
+                job = self._next()
+                while job is None and not self._closed:
+                    self._lock.wait()
+                    job = self._next()
+                if job is None:
+                    return
+            try:
+                self._run(job)
+            finally:
+                with self._lock:
+                    self._running[job.cart] -= 1
+                    # a newer job for the same cart may already own the key
+                    key = (job.cart, tuple(job.args))
+                    if self._inflight.get(key) is job:
+                        del self._inflight[key]
+                    self._lock.notify_all()
+
+    def _run(self, job):
+        with job._cond:
+            job.started = time.time()
+            job.status = "running"
+        try:
+            proc = subprocess.Popen([sys.executable, "-u", job.script] + job.args, cwd=self.root,
+                                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    text=True, errors="replace", bufsize=1)
+        except OSError as e:
+            job._finish("error", error=str(e))
+            return
+        expired = threading.Event()
+
+        def kill():
+            expired.set()
+            proc.kill()
+
+        timer = threading.Timer(self.timeout, kill) if self.timeout else None
+        if timer:
+            timer.start()
+        try:
+            for line in proc.stdout:
+                job._append(line)
+            rc = proc.wait()
+        finally:
+            if timer:
+                timer.cancel()
+            proc.stdout.close()
+        if expired.is_set():
+            job._finish("timeout", rc, f"Timed out after {self.timeout}s")
+        elif rc:
+            job._finish("error", rc)
+        else:
+            job._finish("ok", rc)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# C13B0 — Wallet Ledger
+# Shared INF ledger for rogers_backend.py and the wallet carts
+# (CART801, CART803, CART805, CART809, CART900).
+#
+#   CART805_WALLET.jsonl        one transaction per line, append-only:
+#                               {"n", "t", "u", "k", "a", "b"[, "r"]}
+#                               (seq, time, user, kind, signed amount,
+#                               user's balance after it, reason)
+#   CART805_WALLET.jsonl.snap   balances + log offset, every SNAPSHOT_EVERY
+#   CART805_WALLET.jsonl.lock   flock() taken by every writer
+#
+# - balances live in memory, keyed by user; a read only parses lines that
+#   other processes appended since the last read, so it is O(1) when
+#   nothing changed
+# - earn() / spend() are queued to one committer thread per process, which
+#   writes whole batches under the lock: catch up, check every spend
+#   against the current balance, one write() and one fsync() per batch
+# - a torn last line from a crashed writer is cut off by the next writer
+# - CART805_WALLET.json, the old read-modify-write file, is imported once
+#   and is now an export ({"balance", "history"} for the default user,
+#   last HISTORY_VIEW transactions); see export_json()
+#
+# Usage:
+#   ledger = open_ledger()
+#   res = ledger.spend(5, user="alice", reason="app unlock")
+#   if not res.ok: ... res.balance ...
+
+import json
+import math
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+LEDGER = "CART805_WALLET.jsonl"
+WALLET = "CART805_WALLET.json"
+DEFAULT_USER = "default"
+BATCH_MAX = 512
+SNAPSHOT_EVERY = 10000
+HISTORY_VIEW = 1000
+TAIL_BLOCK = 1 << 16
+
+
+class LedgerError(Exception):
+    pass
+
+
+class TxResult:
+    def __init__(self, ok, user, kind, amount, balance, seq=None, error=None):
+        self.ok = ok
+        self.user = user
+        self.kind = kind
+        self.amount = amount
+        self.balance = balance
+        self.seq = seq
+        self.error = error
+
+    def to_dict(self):
+        return {"ok": self.ok, "user": self.user, "kind": self.kind, "amount": self.amount,
+                "balance": self.balance, "seq": self.seq, "error": self.error}
+
+
+class _Tx:
+    def __init__(self, user, kind, amount, spend, reason, ts):
+        self.user = user
+        self.kind = kind
+        self.amount = amount
+        self.spend = spend
+        self.reason = reason
+        self.ts = ts
+        self.result = None
+        self.done = threading.Event()
+
+
+def _check_amount(amount):
+    # inf / nan (valid JSON to Python's parser) would poison a balance for good
+    if isinstance(amount, bool) or not isinstance(amount, (int, float)) \
+            or not math.isfinite(amount) or amount <= 0:
+        raise ValueError(f"[C13B0] Invalid amount: {amount!r}")
+    return amount
+
+
+def _encode(rec):
+    return json.dumps(rec, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class Ledger:
+    def __init__(self, path=LEDGER, legacy=WALLET, durable=True):
+        self.path = path
+        self.snap_path = path + ".snap"
+        self.durable = durable
+        self.balances = {}
+        self.seq = 0
+        self.offset = 0
+        self._since_snap = 0
+        self._mutex = threading.Lock()
+        self._queue = queue.Queue()
+        self._committer = None
+        self._lock_fd = os.open(path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+        with self._locked():
+            if not os.path.exists(path):
+                self._import_legacy(legacy)
+        self._fd = os.open(path, os.O_RDWR | os.O_APPEND)
+        self._load_snapshot()
+        with self._mutex:
+            self._catch_up()
+
+    # -- files ---------------------------------------------------------
+
+    @contextmanager
+    def _locked(self):
+        if fcntl is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _import_legacy(self, legacy):
+        # The old wallet becomes its history plus one opening entry that
+        # makes the sum match its balance
+        wallet = {}
+        if legacy and os.path.exists(legacy):
+            try:
+                with open(legacy, "r") as f:
+                    wallet = json.load(f)
+            except (OSError, ValueError):
+                wallet = {}
+        history = [h for h in wallet.get("history", []) if isinstance(h, dict)
+                   and isinstance(h.get("amount"), (int, float)) and not isinstance(h.get("amount"), bool)]
+        balance = wallet.get("balance", 0)
+        if not isinstance(balance, (int, float)):
+            balance = 0
+        lines = []
+        running = balance - sum(h["amount"] for h in history)
+        n = 0
+        if history or balance:
+            n += 1
+            lines.append(_encode({"n": n, "t": history[0].get("time", time.time()) if history else time.time(),
+                                  "u": DEFAULT_USER, "k": "opening", "a": running, "b": running}))
+        for h in history:
+            n += 1
+            running += h["amount"]
+            lines.append(_encode({"n": n, "t": h.get("time", 0), "u": DEFAULT_USER,
+                                  "k": h.get("type", "import"), "a": h["amount"], "b": running}))
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def _load_snapshot(self):
+        try:
+            with open(self.snap_path, "r") as f:
+                snap = json.load(f)
+        except (OSError, ValueError):
+            return
+        if snap.get("offset", 0) <= os.fstat(self._fd).st_size:
+            self.balances = snap["balances"]
+            self.seq = snap["seq"]
+            self.offset = snap["offset"]
+
+    def _save_snapshot(self):
+        tmp = self.snap_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"offset": self.offset, "seq": self.seq, "balances": self.balances}, f)
+        os.replace(tmp, self.snap_path)
+        self._since_snap = 0
+
+    def _catch_up(self, repair=False):
+        # apply lines appended since self.offset (caller holds _mutex);
+        # with repair (and the file lock held) a torn tail is truncated
+        size = os.fstat(self._fd).st_size
+        if size <= self.offset:
+            return
+        data = os.pread(self._fd, size - self.offset, self.offset)
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            rec = json.loads(line)
+            self.balances[rec["u"]] = rec["b"]
+            self.seq = rec["n"]
+            self._since_snap += 1
+        self.offset += end
+        if repair and end < len(data):
+            os.truncate(self.path, self.offset)
+
+    # -- reads ---------------------------------------------------------
+
+    def balance(self, user=DEFAULT_USER):
+        with self._mutex:
+            self._catch_up()
+            return self.balances.get(user, 0)
+
+    def users(self):
+        with self._mutex:
+            self._catch_up()
+            return dict(self.balances)
+
+    def tail(self, n, user=DEFAULT_USER):
+        # last n transactions of `user`, oldest first, reading backwards
+        # from the end of the log
+        out = []
+        with self._mutex:
+            self._catch_up()
+            pos = self.offset
+        rest = b""
+        while pos > 0 and len(out) < n:
+            start = max(0, pos - TAIL_BLOCK)
+            chunk = os.pread(self._fd, pos - start, start) + rest
+            lines = chunk.split(b"\n")
+            rest = lines[0] if start > 0 else b""
+            for line in reversed(lines[1:] if start > 0 else lines):
+                if line:
+                    rec = json.loads(line)
+                    if rec["u"] == user:
+                        out.append(rec)
+                        if len(out) >= n:
+                            break
+            pos = start
+        return out[::-1]
+
+    def history(self, n=10, user=DEFAULT_USER):
+        # legacy wallet entries: {"time", "type", "amount"}
+        return [{"time": r["t"], "type": r["k"], "amount": r["a"]} for r in self.tail(n, user)]
+
+    # -- writes --------------------------------------------------------
+
+    def earn(self, amount, user=DEFAULT_USER, kind="earn", reason=None, ts=None):
+        return self._submit(_Tx(user, kind, _check_amount(amount), False, reason, ts))
+
+    def spend(self, amount, user=DEFAULT_USER, kind="spend", reason=None, ts=None):
+        # ok=False (and nothing written) when the balance is too low
+        return self._submit(_Tx(user, kind, _check_amount(amount), True, reason, ts))
+
+    def _submit(self, tx):
+        if self._committer is None:
+            with self._mutex:
+                if self._committer is None:
+                    self._committer = threading.Thread(target=self._commit_loop, daemon=True,
+                                                       name="c13b0-ledger")
+                    self._committer.start()
+        self._queue.put(tx)
+        tx.done.wait()
+        if isinstance(tx.result, Exception):
+            raise LedgerError(f"[C13B0] Ledger commit failed: {tx.result}") from tx.result
+        return tx.result
+
+    def _commit_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < BATCH_MAX:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._commit(batch)
+            except Exception as e:
+                for tx in batch:
+                    tx.result = e
+            for tx in batch:
+                tx.done.set()
+
+    def _commit(self, batch):
+        with self._locked(), self._mutex:
+            self._catch_up(repair=True)
+            balances = self.balances
+            undo = {}
+            seq = self.seq
+            lines = []
+            for tx in batch:
+                current = balances.get(tx.user, 0)
+                if tx.spend and current < tx.amount:
+                    tx.result = TxResult(False, tx.user, tx.kind, tx.amount, current,
+                                         error="Insufficient tokens")
+                    continue
+                seq += 1
+                delta = -tx.amount if tx.spend else tx.amount
+                undo.setdefault(tx.user, tx.user in balances and current)
+                balances[tx.user] = current + delta
+                rec = {"n": seq, "t": tx.ts if tx.ts is not None else time.time(), "u": tx.user,
+                       "k": tx.kind, "a": delta, "b": balances[tx.user]}
+                if tx.reason is not None:
+                    rec["r"] = tx.reason
+                lines.append(_encode(rec))
+                tx.result = TxResult(True, tx.user, tx.kind, tx.amount, balances[tx.user], seq)
+            if not lines:
+                return
+            data = b"".join(lines)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(self._fd, view):]
+                if self.durable:
+                    os.fsync(self._fd)
+            except OSError:
+                # nothing of this batch counts
+                os.ftruncate(self._fd, self.offset)
+                for user, prev in undo.items():
+                    if prev is False:
+                        balances.pop(user, None)
+                    else:
+                        balances[user] = prev
+                raise
+            self.seq = seq
+            self.offset += len(data)
+            self._since_snap += len(lines)
+            if self._since_snap >= SNAPSHOT_EVERY:
+                self._save_snapshot()
+
+    # -- legacy view ---------------------------------------------------
+
+    def export_json(self, path=WALLET, user=DEFAULT_USER, keep=HISTORY_VIEW):
+        view = {"balance": self.balance(user), "history": self.history(keep, user)}
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(view, f, indent=4)
+        os.replace(tmp, path)
+        return view
+
+    def close(self):
+        os.close(self._fd)
+        os.close(self._lock_fd)
+
+
+_ledgers = {}
+
+
+def open_ledger(path=LEDGER, legacy=WALLET, durable=True):
+    # one Ledger (and one committer thread) per log per process
+    key = os.path.abspath(path)
+    if key not in _ledgers:
+        _ledgers[key] = Ledger(path, legacy, durable)
+    return _ledgers[key]
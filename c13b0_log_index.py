@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# C13B0 — Log Stream Index
+# Tail reads and indexed queries over log_server's data/log_stream.jsonl,
+# in time proportional to the lines returned, not to the stream's length.
+#
+#   data/log_stream.idx/state.json     stream offset indexed so far (+ inode)
+#   data/log_stream.idx/all.off        offset of every line (uint64 array)
+#   data/log_stream.idx/<field>/<key>.off
+#                                      offsets of the lines with that user,
+#                                      channel or token_id
+#
+# - tail(path, n) reads the file backwards in TAIL_BLOCK pieces
+# - StreamIndex.refresh() indexes only the lines appended since the last
+#   refresh (complete lines only); every query refreshes first
+# - query(user=, channel=, token_id=, since=, until=, limit=) walks the
+#   smallest matching posting list from its end, so the newest hits come
+#   first and it stops after `limit`; a time range is two binary searches
+#   on that list ("t" is an ISO string and the stream is in time order)
+# - a stream that shrank or was replaced is re-indexed from the start;
+#   postings past the saved offset (an interrupted refresh) are cut off
+#
+# Usage:
+#   idx = StreamIndex(STREAM)
+#   idx.query(user="Kris", limit=50)       # oldest first
+#   tail(STREAM, 200)
+
+import json
+import os
+import shutil
+from array import array
+from urllib.parse import quote
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+TAIL_BLOCK = 1 << 16
+FIELDS = ("user", "channel", "token_id")
+ITEM = array("Q").itemsize
+
+
+def tail(path, n):
+    # last n JSON lines of `path`, oldest first
+    out = []
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return out
+    try:
+        pos = os.fstat(fd).st_size
+        rest = b""
+        while pos > 0 and len(out) < n:
+            start = max(0, pos - TAIL_BLOCK)
+            chunk = os.pread(fd, pos - start, start) + rest
+            lines = chunk.split(b"\n")
+            rest = lines.pop(0) if start > 0 else b""
+            for line in reversed(lines):
+                if line.strip():
+                    out.append(json.loads(line))
+                    if len(out) >= n:
+                        break
+            pos = start
+    finally:
+        os.close(fd)
+    return out[::-1]
+
+
+class StreamIndex:
+    def __init__(self, stream, root=None):
+        self.stream = stream
+        self.root = root or os.path.splitext(stream)[0] + ".idx"
+        self.state_path = os.path.join(self.root, "state.json")
+        os.makedirs(self.root, exist_ok=True)
+        self._lock_path = os.path.join(self.root, ".lock")
+
+    # -- files ---------------------------------------------------------
+
+    def _posting(self, field, key):
+        if field is None:
+            return os.path.join(self.root, "all.off")
+        return os.path.join(self.root, field, quote(str(key), safe="")[:200] + ".off")
+
+    def _state(self):
+        try:
+            with open(self.state_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"offset": 0, "ino": None}
+
+    def _save_state(self, state):
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_path)
+
+    def _append(self, path, offsets, start):
+        # append `offsets`, first cutting entries >= start left behind by
+        # an interrupted refresh
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "ab+") as f:
+            size = f.seek(0, os.SEEK_END)
+            keep = size - size % ITEM
+            while keep:
+                f.seek(keep - ITEM)
+                last = array("Q", f.read(ITEM))[0]
+                if last < start:
+                    break
+                keep -= ITEM
+            if keep != size:
+                f.truncate(keep)
+            array("Q", offsets).tofile(f)
+
+    # -- indexing ------------------------------------------------------
+
+    def refresh(self):
+        # -> number of lines indexed
+        try:
+            st = os.stat(self.stream)
+        except OSError:
+            return 0
+        with open(self._lock_path, "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            state = self._state()
+            if state["ino"] != st.st_ino or state["offset"] > st.st_size:
+                self._reset()
+                state = {"offset": 0, "ino": st.st_ino}
+            if state["offset"] == st.st_size:
+                return 0
+            start = state["offset"]
+            postings = {}
+            every = []
+            pos = start
+            with open(self.stream, "rb") as f:
+                f.seek(start)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    if line.strip():
+                        rec = json.loads(line)
+                        every.append(pos)
+                        for field in FIELDS:
+                            if rec.get(field) is not None:
+                                postings.setdefault(self._posting(field, rec[field]), []).append(pos)
+                    pos += len(line)
+            self._append(self._posting(None, None), every, start)
+            for path, offsets in postings.items():
+                self._append(path, offsets, start)
+            state["offset"] = pos
+            self._save_state(state)
+            return len(every)
+
+    def _reset(self):
+        for name in os.listdir(self.root):
+            p = os.path.join(self.root, name)
+            if os.path.isdir(p):
+                shutil.rmtree(p)
+            elif name != ".lock":
+                os.remove(p)
+
+    # -- queries -------------------------------------------------------
+
+    def _read(self, f, offset):
+        f.seek(offset)
+        return json.loads(f.readline())
+
+    def _offsets(self, path):
+        # postings as (fd, count) for positional reads from the end
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None, 0
+        return fd, os.fstat(fd).st_size // ITEM
+
+    def _at(self, fd, i):
+        return array("Q", os.pread(fd, ITEM, i * ITEM))[0]
+
+    def _search(self, fd, count, f, t):
+        # first position whose line has "t" >= t (postings are in stream,
+        # hence time, order)
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._read(f, self._at(fd, mid)).get("t", "") < t:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def query(self, user=None, channel=None, token_id=None, since=None, until=None, limit=200):
+        # matching stream lines, newest `limit` of them, oldest first;
+        # since / until are "t" prefixes, both inclusive
+        self.refresh()
+        keys = [(field, value) for field, value in zip(FIELDS, (user, channel, token_id)) if value is not None]
+        best = None
+        for field, value in keys:
+            fd, count = self._offsets(self._posting(field, value))
+            if fd is None:
+                if best is not None:
+                    os.close(best[0])
+                return []
+            if best is None or count < best[1]:
+                if best is not None:
+                    os.close(best[0])
+                best = (fd, count)
+            else:
+                os.close(fd)
+        if best is None:
+            best = self._offsets(self._posting(None, None))
+            if best[0] is None:
+                return []
+        fd, count = best
+        out = []
+        try:
+            with open(self.stream, "rb") as f:
+                lo = self._search(fd, count, f, since) if since is not None else 0
+                hi = self._search(fd, count, f, until + "\uffff") if until is not None else count
+                for i in range(hi - 1, lo - 1, -1):
+                    rec = self._read(f, self._at(fd, i))
+                    if all(str(rec.get(k)) == str(v) for k, v in keys):
+                        out.append(rec)
+                        if len(out) >= limit:
+                            break
+        finally:
+            os.close(fd)
+        return out[::-1]
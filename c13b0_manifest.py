@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# C13B0 — Stage Output Manifest
+# research_hash → produced files, for every CART3xx stage, so CART330 can
+# assemble bundles without listing every stage directory once per RUO.
+#
+# - built with one directory scan (or one archive listing, for stages
+#   written with `c13b0_writers.py --archive`) per stage
+# - cached next to the stage as <STAGE>.files.json, keyed by the
+#   directory / archive signature; rebuilt when files are added or removed
+# - a file belongs to the hash its name starts with: "<rh>.md",
+#   "<rh>_thread.md", ...
+#
+# place() puts a stage file into a bundle as a hardlink, falling back to
+# a reflink (FICLONE) and only then to a copy.
+
+import json
+import os
+import shutil
+import zipfile
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+FICLONE = 0x40049409
+
+
+def manifest_path(stage):
+    return stage + ".files.json"
+
+
+def archive_of(stage):
+    return stage + ".zip"
+
+
+def source(stage):
+    # ("dir" | "zip" | "file", path), or None when the stage produced nothing.
+    # When a stage exists both ways, the newer output wins.
+    found = []
+    if os.path.isdir(stage):
+        found.append(("dir", stage))
+    if os.path.isfile(archive_of(stage)):
+        found.append(("zip", archive_of(stage)))
+    if not found:
+        return ("file", stage) if os.path.isfile(stage) else None
+    return max(found, key=lambda s: os.stat(s[1]).st_mtime_ns)
+
+
+def _signature(kind, path):
+    st = os.stat(path)
+    return [kind, st.st_size if kind == "zip" else 0, st.st_mtime_ns]
+
+
+def hash_key(name):
+    base = os.path.basename(name)
+    for sep in ("_", "."):
+        base = base.split(sep, 1)[0]
+    return base
+
+
+def scan(kind, path):
+    if kind == "dir":
+        with os.scandir(path) as it:
+            names = [e.name for e in it if e.is_file()]
+    else:
+        with zipfile.ZipFile(path) as zf:
+            names = [n for n in zf.namelist() if not n.endswith("/")]
+    files = {}
+    for name in sorted(names):
+        if name.endswith(".md"):
+            files.setdefault(hash_key(name), []).append(name)
+    return files
+
+
+def load(stage):
+    # -> (kind, path, {rh: [names]}); single-file stages map to {}
+    src = source(stage)
+    if src is None:
+        return None, None, {}
+    kind, path = src
+    if kind == "file":
+        return kind, path, {}
+    sig = _signature(kind, path)
+    cache = manifest_path(stage)
+    if os.path.exists(cache):
+        try:
+            with open(cache, "r") as f:
+                saved = json.load(f)
+            if saved.get("signature") == sig:
+                return kind, path, saved["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+    files = scan(kind, path)
+    tmp = cache + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump({"signature": sig, "files": files}, f)
+    os.replace(tmp, cache)
+    return kind, path, files
+
+
+def _reflink(src, dst):
+    if fcntl is None:
+        return False
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            return True
+        except OSError:
+            return False
+
+
+def place(src, dst):
+    # -> "kept" | "linked" | "cloned" | "copied"
+    try:
+        if os.path.samefile(src, dst):
+            return "kept"
+    except FileNotFoundError:
+        pass
+    tmp = dst + ".tmp"
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    try:
+        os.link(src, tmp)
+        how = "linked"
+    except OSError:
+        if _reflink(src, tmp):
+            how = "cloned"
+        else:
+            shutil.copyfile(src, tmp)
+            how = "copied"
+    os.replace(tmp, dst)
+    return how
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+# C13B0 — Incremental Pipeline Runner
+# Runs the 2xx / 3xx / 4xx research carts as a dependency DAG.
+#
+# Every stage declares the files / directories it reads and writes.
+# Edges come from matching outputs to inputs (CART204 → CART205 → CART210,
+# CART217 → CART226 → CART227 → CART228, ...). Before a stage runs, its
+# script and inputs are hashed; if the fingerprint matches the last
+# successful run and its outputs still exist, the stage is skipped.
+# Independent branches run in parallel, one cart process per core.
+#
+# File hashes are cached by (size, mtime) in .c13b0_pipeline_state.json so
+# unchanged inputs are never re-read. It is a dot file because CARTQ merges
+# every C13B0_*.json in the folder into the color memory; an old
+# C13B0_PIPELINE_STATE.json is moved there on first use. The RUO store
+# index is brought up to date once, before any stage starts, so parallel
+# stages only read it.
+#
+# CLI:
+#   python c13b0_pipeline.py                    # everything
+#   python c13b0_pipeline.py cart227 cart330    # these + their upstream
+#   python c13b0_pipeline.py --force --jobs 4
+#   python c13b0_pipeline.py --dry-run
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import c13b0_ruo_store as ruo_store
+
+STATE = ".c13b0_pipeline_state.json"
+OLD_STATE = "C13B0_PIPELINE_STATE.json"
+RUO = "CART217_RUO_STORE.json"
+
+# id: (script, inputs, outputs[, after])
+# `after` lists stages that must run first without a data dependency
+# (e.g. CART410 wipes the ZIP structure the 411–414 carts fill in).
+STAGES = {
+    "cart201": ("cart201_import_search_terms.py", ["search_terms_250.txt"], ["CART201_SEARCH_TERMS.json"]),
+    "cart202": ("cart202_import_equations.py", ["equations_250.txt"], ["CART202_EQUATIONS.json"]),
+    "cart203": ("cart203_import_websites.py", ["websites_250.txt"], ["CART203_VALIDATED_SITES.json"]),
+    "cart204": ("cart204_master_dictionary.py",
+                ["CART201_SEARCH_TERMS.json", "CART202_EQUATIONS.json", "CART203_VALIDATED_SITES.json"],
+                ["CART204_MASTER_DICTIONARY.json"]),
+    "cart205": ("cart205_pair_fusion.py", ["CART204_MASTER_DICTIONARY.json"],
+                ["CART205_PAIR_FUSION", "CART205_PAIR_FUSION_TOP.json"]),
+    "cart206": ("cart206_trio_fusion.py", ["CART204_MASTER_DICTIONARY.json"],
+                ["CART206_TRIO_FUSION", "CART206_TRIO_FUSION_TOP.json"]),
+    "cart207": ("cart207_quad_fusion.py", ["CART204_MASTER_DICTIONARY.json"],
+                ["CART207_QUAD_FUSION", "CART207_QUAD_FUSION_TOP.json"]),
+    "cart208": ("cart208_omni_fusion.py", ["CART204_MASTER_DICTIONARY.json"],
+                ["CART208_OMNI_FUSION", "CART208_OMNI_FUSION_TOP.json"]),
+    "cart209": ("cart209_cross_domain_engine.py", ["CART204_MASTER_DICTIONARY.json"], ["CART209_CROSS_DOMAIN.json"]),
+    "cart210": ("cart210_arxiv_scraper.py",
+                ["CART205_PAIR_FUSION_TOP.json", "CART206_TRIO_FUSION_TOP.json",
+                 "CART207_QUAD_FUSION_TOP.json", "CART208_OMNI_FUSION_TOP.json"],
+                ["CART210_ARXIV_RAW.json"]),
+    "cart211": ("cart211_science_scraper.py", ["CART203_VALIDATED_SITES.json"], ["CART211_SCIENCE_SCRAPE.json"]),
+    "cart212": ("cart212_medical_scraper.py", ["CART203_VALIDATED_SITES.json"], ["CART212_MEDICAL_SCRAPE.json"]),
+    "cart213": ("cart213_tech_ai_scraper.py", ["CART203_VALIDATED_SITES.json"], ["CART213_TECH_AI_SCRAPE.json"]),
+    "cart214": ("cart214_ancient_text_scraper.py", ["CART203_VALIDATED_SITES.json"], ["CART214_ANCIENT_SCRAPE.json"]),
+    "cart215": ("cart215_materials_scraper.py", ["CART203_VALIDATED_SITES.json"], ["CART215_MATERIALS_SCRAPE.json"]),
+    "cart218": ("cart218_grand_master_builder.py", [RUO], ["research_block.json"]),
+    "cart219": ("cart219_grand_master_zip.py", ["research_block.json"], ["research_block.zip"]),
+    "cart220": ("cart220_scientific_vectorizer.py", [RUO], ["CART220_VECTORS.npy", "CART220_VECTORS.index.json"]),
+    "cart221": ("cart221_historical_context_vectorizer.py", [RUO], ["CART221_HISTORICAL_CONTEXT.json"]),
+    "cart222": ("cart222_material_science_vectorizer.py", [RUO], ["CART222_MATERIAL_SCIENCE.json"]),
+    "cart223": ("cart223_geometry_expansion_engine.py", [RUO], ["CART223_GEOMETRY_EXPANSION.json"]),
+    "cart224": ("cart224_scifi_science_mapper.py", [RUO], ["CART224_SCIFI_MAP.json"]),
+    "cart225": ("cart225_equation_domain_mapper.py", ["CART202_EQUATIONS.json"], ["CART225_EQ_DOMAIN_MAP.json"]),
+    "cart226": ("cart226_entropy_scorer.py", [RUO], ["CART226_ENTROPY.json"]),
+    "cart227": ("cart227_semantic_graph_builder.py", [RUO, "CART226_ENTROPY.json"], ["CART227_SEMANTIC_GRAPH.json"]),
+    "cart228": ("cart228_crossover_weight_calibrator.py", [RUO, "CART227_SEMANTIC_GRAPH.json"],
+                ["CART228_CALIBRATED_RUOS.json"]),
+    "cart229": ("cart229_infinity_seed_generator.py", ["research_block.json", "CART220_VECTORS.npy"],
+                ["CART229_INFINITY_SEED.json"]),
+    "cart230": ("cart230_ruo_finalizer_freeze.py",
+                ["research_block.json", "CART228_CALIBRATED_RUOS.json", "CART229_INFINITY_SEED.json"],
+                ["CART230_FINAL_BLOCK.json"]),
+
+    "cart301": ("cart301_ruo_summarizer.py", [RUO], ["CART301_SUMMARIES"]),
+    "cart302": ("cart302_research_threader.py", [RUO, "CART220_VECTORS.npy"], ["CART302_THREADS"]),
+    "cart303": ("cart303_research_weaver.py",
+                [RUO, "CART226_ENTROPY.json", "CART221_HISTORICAL_CONTEXT.json", "CART222_MATERIAL_SCIENCE.json",
+                 "CART223_GEOMETRY_EXPANSION.json", "CART224_SCIFI_MAP.json"],
+                ["CART303_WEAVES"]),
+    "cart304": ("cart304_short_paper_writer.py", [RUO, "CART226_ENTROPY.json"], ["CART304_SHORT_PAPERS"]),
+    "cart305": ("cart305_long_paper_writer.py", [RUO], ["CART305_LONG_PAPERS"]),
+    "cart306": ("cart306_color_mode_transformer.py", [RUO], ["CART306_COLOR_MODE"]),
+    "cart307": ("cart307_crossover_expansion_writer.py", [RUO], ["CART307_CROSSOVER_EXPANSIONS"]),
+    "cart308": ("cart308_semantic_graph_analyzer.py", ["CART227_SEMANTIC_GRAPH.json"], ["CART308_GRAPH_ANALYSIS.md"]),
+    "cart309": ("cart309_multi_ruo_synthesizer.py", [RUO, "CART220_VECTORS.npy"], ["CART309_SYNTHESIS"]),
+    "cart310": ("cart310_scientific_justification_builder.py", [RUO, "CART223_GEOMETRY_EXPANSION.json"],
+                ["CART310_JUSTIFICATIONS"]),
+    "cart311": ("cart311_evidence_based_writer.py", [RUO], ["CART311_EVIDENCE_PAPERS"]),
+    "cart312": ("cart312_narrative_science_writer.py", [RUO], ["CART312_NARRATIVE"]),
+    "cart313": ("cart313_historical_lens_writer.py", [RUO, "CART221_HISTORICAL_CONTEXT.json"], ["CART313_HISTORICAL"]),
+    "cart314": ("cart314_material_science_lens_writer.py", [RUO, "CART222_MATERIAL_SCIENCE.json"], ["CART314_MATERIAL"]),
+    "cart315": ("cart315_geometry_lens_writer.py", [RUO, "CART223_GEOMETRY_EXPANSION.json"], ["CART315_GEOMETRY"]),
+    "cart316": ("cart316_scifi_reality_writer.py", [RUO, "CART224_SCIFI_MAP.json"], ["CART316_SCIFI_REALITY"]),
+    "cart317": ("cart317_domain_bridge_builder.py", [RUO, "CART227_SEMANTIC_GRAPH.json"], ["CART317_DOMAIN_BRIDGES"]),
+    "cart318": ("cart318_rl_style_improver.py", ["CART301_SUMMARIES"], ["CART318_IMPROVED"]),
+    "cart319": ("cart319_multi_perspective_writer.py", [RUO], ["CART319_MULTIPERSPECTIVE"]),
+    "cart320": ("cart320_infinity_vector_writer.py", [RUO, "CART229_INFINITY_SEED.json"], ["CART320_VECTOR_WRITING"]),
+    "cart321": ("cart321_telemetry_pattern_writer.py", [RUO], ["CART321_TELEMETRY"]),
+    "cart322": ("cart322_scientific_calendar_planner.py", [RUO], ["CART322_CALENDAR"]),
+    "cart323": ("cart323_hypothesis_generator.py", [RUO], ["CART323_HYPOTHESES"]),
+    "cart324": ("cart324_experimental_path_planner.py", [RUO], ["CART324_EXPERIMENTS"]),
+    "cart325": ("cart325_resource_planner.py", [RUO], ["CART325_RESOURCES"]),
+    "cart326": ("cart326_longform_multi_ruo.py", [RUO], ["CART326_LONGFORM"]),
+    "cart327": ("cart327_crossover_matrix_writer.py", [RUO], ["CART327_MATRIX"]),
+    "cart328": ("cart328_graph_narrative_writer.py", ["CART227_SEMANTIC_GRAPH.json"], ["CART328_GRAPH_NARRATIVE.md"]),
+    "cart329": ("cart329_ruo_enhancement_describer.py", [RUO], ["CART329_ENHANCEMENTS"]),
+    "cart330": ("cart330_full_research_bundle_writer.py",
+                [RUO, "CART301_SUMMARIES", "CART302_THREADS", "CART303_WEAVES", "CART304_SHORT_PAPERS",
+                 "CART305_LONG_PAPERS", "CART306_COLOR_MODE", "CART307_CROSSOVER_EXPANSIONS",
+                 "CART308_GRAPH_ANALYSIS.md", "CART309_SYNTHESIS", "CART310_JUSTIFICATIONS",
+                 "CART311_EVIDENCE_PAPERS", "CART312_NARRATIVE", "CART313_HISTORICAL", "CART314_MATERIAL",
+                 "CART315_GEOMETRY", "CART316_SCIFI_REALITY", "CART317_DOMAIN_BRIDGES", "CART318_IMPROVED",
+                 "CART319_MULTIPERSPECTIVE", "CART320_VECTOR_WRITING"],
+                ["CART330_BUNDLES"]),
+
+    "cart403": ("cart403_batch_distributor.py", [RUO], ["CART403_BATCHES"]),
+    "cart405": ("cart405_color_category_router.py",
+                ["CART229_INFINITY_SEED.json", "CART404_MASTERHASH_MANIFEST.json"], ["CART405_ROUTER.json"]),
+    "cart406": ("cart406_masterzip_staging.py", ["CART404_MASTERHASH_MANIFEST.json"], ["CART406_STAGING"]),
+    "cart408": ("cart408_masterzip_builder.py", ["CART406_STAGING"], ["CART408_MASTERZIPS"]),
+    "cart409": ("cart409_masterzip_indexer.py", ["CART404_MASTERHASH_MANIFEST.json", "CART405_ROUTER.json"],
+                ["CART409_MASTERZIP_INDEX.md"]),
+    "cart410": ("cart410_batch_zip_prep.py", [], ["CART410_ZIPSTRUCT"]),
+    "cart411": ("cart411_masterzip_router.py", ["CART405_ROUTER.json", "CART408_MASTERZIPS"],
+                ["CART410_ZIPSTRUCT/color"], ["cart410"]),
+    "cart412": ("cart412_masterzip_copy_layers.py", ["CART402_GROWTH"],
+                ["CART410_ZIPSTRUCT/research", "CART410_ZIPSTRUCT/links",
+                 "CART410_ZIPSTRUCT/research_plus_links", "CART410_ZIPSTRUCT/crossover"], ["cart410"]),
+    "cart413": ("cart413_category_index_builder.py", ["CART405_ROUTER.json"], ["CART410_ZIPSTRUCT/index"], ["cart410"]),
+    "cart414": ("cart414_color_interface_builder.py", ["CART405_ROUTER.json"], ["CART410_ZIPSTRUCT/color"],
+                ["cart410", "cart411"]),
+    "cart415": ("cart415_grand_master_zip.py", ["CART410_ZIPSTRUCT"], ["grand_master.zip"]),
+    "cart424": ("cart424_token_metadata_builder.py", ["grand_master.zip", "CART405_ROUTER.json"], ["INFINITY_TOKEN.json"]),
+    "cart425": ("cart425_token_signature_engine.py", ["INFINITY_TOKEN.json"], ["INFINITY_TOKEN_SIGNATURE.txt"]),
+    "cart426": ("cart426_token_lineage_recorder.py", ["INFINITY_TOKEN.json"], ["CART426_LINEAGE.jsonl"]),
+    "cart427": ("cart427_token_version_history.py", ["INFINITY_TOKEN.json"], ["CART427_VERSION_HISTORY.jsonl"]),
+    "cart428": ("cart428_token_register.py", ["INFINITY_TOKEN.json"], ["CART428_TOKEN_REGISTER.json"]),
+    "cart429": ("cart429_token_vault.py",
+                ["INFINITY_TOKEN.json", "INFINITY_TOKEN_SIGNATURE.txt", "CART426_LINEAGE.jsonl",
+                 "CART427_VERSION_HISTORY.jsonl", "CART428_TOKEN_REGISTER.json"],
+                ["CART429_VAULT"]),
+    "cart430": ("cart430_token_exporter.py", ["CART429_VAULT", "grand_master.zip"], ["infinity_token_export.zip"]),
+}
+
+# CART330 also bundles stages written as archives (`c13b0_writers.py --archive`);
+# <OUTDIR>.zip is then an output of the stage that owns OUTDIR
+ARCHIVED = [p for p in STAGES["cart330"][1] if p.startswith("CART3") and "." not in p]
+STAGES["cart330"][1].extend([p + ".zip" for p in ARCHIVED])
+
+
+def stage(sid):
+    spec = STAGES[sid]
+    script, inputs, outputs = spec[:3]
+    after = spec[3] if len(spec) > 3 else []
+    return script, inputs, outputs, after
+
+
+def outputs(sid):
+    # declared outputs plus the archive a writer stage may produce instead
+    outs = stage(sid)[2]
+    return outs + [o + ".zip" for o in outs if o in ARCHIVED]
+
+
+def _covers(output, path):
+    # an output directory covers everything inside it, and vice versa
+    return output == path or path.startswith(output + "/") or output.startswith(path + "/")
+
+
+def dependencies(sid):
+    _, inputs, _, after = stage(sid)
+    deps = set(after)
+    for other in STAGES:
+        if other == sid:
+            continue
+        if any(_covers(o, i) for o in outputs(other) for i in inputs):
+            deps.add(other)
+    return deps
+
+
+def build_graph(targets=None):
+    graph = {sid: dependencies(sid) for sid in STAGES}
+    if not targets:
+        return graph
+    keep = set()
+    todo = list(targets)
+    while todo:
+        sid = todo.pop()
+        if sid in keep:
+            continue
+        if sid not in graph:
+            raise KeyError(f"[C13B0] Unknown pipeline stage: {sid}")
+        keep.add(sid)
+        todo.extend(graph[sid])
+    return {sid: graph[sid] & keep for sid in keep}
+
+
+def sources():
+    # Inputs no stage produces: the artifacts worth watching for changes
+    produced = [o for sid in STAGES for o in outputs(sid)]
+    found = []
+    for sid in STAGES:
+        for i in stage(sid)[1]:
+            if i not in found and not any(_covers(o, i) for o in produced):
+                found.append(i)
+    return found
+
+
+def downstream(changed_paths):
+    # Stages that read any of the given paths, plus everything after them
+    hit = {sid for sid in STAGES
+           if any(_covers(i, p) for i in stage(sid)[1] for p in changed_paths)}
+    graph = build_graph()
+    grew = True
+    while grew:
+        grew = False
+        for sid, deps in graph.items():
+            if sid not in hit and deps & hit:
+                hit.add(sid)
+                grew = True
+    return hit
+
+
+# ---------- Content hashing ----------
+
+class Hasher:
+    def __init__(self, cache):
+        self.cache = cache
+
+    def file(self, path):
+        st = os.stat(path)
+        key = [st.st_size, st.st_mtime_ns]
+        hit = self.cache.get(path)
+        if hit and hit[:2] == key:
+            return hit[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        self.cache[path] = key + [digest]
+        return digest
+
+    def path(self, path):
+        if os.path.isfile(path):
+            return self.file(path)
+        if not os.path.isdir(path):
+            return "missing"
+        h = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                fp = os.path.join(root, name)
+                h.update(os.path.relpath(fp, path).encode("utf-8"))
+                h.update(self.file(fp).encode("ascii"))
+        return h.hexdigest()
+
+    def fingerprint(self, sid):
+        script, inputs, _, _ = stage(sid)
+        own = outputs(sid)
+        h = hashlib.sha256()
+        h.update(self.path(script).encode("ascii"))
+        for i in inputs:
+            if any(_covers(o, i) for o in own):
+                continue
+            h.update(i.encode("utf-8"))
+            h.update(self.path(i).encode("ascii"))
+        return h.hexdigest()
+
+
+def load_state(path=STATE):
+    if path == STATE and not os.path.exists(path) and os.path.exists(OLD_STATE):
+        os.replace(OLD_STATE, path)
+    if not os.path.exists(path):
+        return {"files": {}, "stages": {}}
+    with open(path, "r") as f:
+        state = json.load(f)
+    state.setdefault("files", {})
+    state.setdefault("stages", {})
+    return state
+
+
+def save_state(state, path=STATE):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f, indent=4)
+    os.replace(tmp, path)
+
+
+# ---------- Execution ----------
+
+def run_stage(sid):
+    script = stage(sid)[0]
+    start = time.time()
+    proc = subprocess.run([sys.executable, script], capture_output=True, text=True)
+    return proc.returncode, proc.stdout + proc.stderr, time.time() - start
+
+
+def run(targets=None, jobs=None, force=False, dry_run=False, runner=run_stage, verbose=True):
+    graph = build_graph(targets)
+    state = load_state()
+    hasher = Hasher(state["files"])
+    jobs = jobs or os.cpu_count() or 1
+    if not dry_run and ruo_store.exists(RUO) and any(RUO in stage(sid)[1] for sid in graph):
+        # rebuild a stale index here, not in every stage process at once
+        ruo_store.open_store(RUO).close()
+
+    status = {}
+    timing = {}
+    pending = set(graph)
+    running = {}
+    wall = time.time()
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for sid in sorted(pending):
+                deps = graph[sid]
+                if not all(d in status for d in deps):
+                    continue
+                pending.discard(sid)
+
+                if any(status[d] in ("failed", "blocked") for d in deps):
+                    status[sid] = "blocked"
+                    continue
+
+                script, _, outputs, after = stage(sid)
+                if not os.path.exists(script):
+                    status[sid] = "missing"
+                    continue
+
+                fp = hasher.fingerprint(sid)
+                prev = state["stages"].get(sid, {})
+                fresh = (
+                    not force
+                    and prev.get("fingerprint") == fp
+                    and all(os.path.exists(o) for o in outputs)
+                    and not any(status.get(a) == "ran" for a in after)
+                    and not (dry_run and any(status[d] == "ran" for d in deps))
+                )
+                if fresh:
+                    status[sid] = "skipped"
+                    continue
+                if dry_run:
+                    status[sid] = "ran"
+                    timing[sid] = 0.0
+                    continue
+
+                running[pool.submit(runner, sid)] = (sid, fp)
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                sid, fp = running.pop(fut)
+                code, output, seconds = fut.result()
+                timing[sid] = seconds
+                if verbose and output.strip():
+                    for line in output.rstrip().splitlines():
+                        print(f"  [{sid}] {line}")
+                if code == 0:
+                    status[sid] = "ran"
+                    state["stages"][sid] = {"fingerprint": fp, "seconds": round(seconds, 3),
+                                            "finished": int(time.time())}
+                else:
+                    status[sid] = "failed"
+                    state["stages"].pop(sid, None)
+                # saved per stage, so an interrupted run keeps what it finished
+                save_state(state)
+
+    if not dry_run:
+        save_state(state)
+
+    report = {"status": status, "timing": timing, "wall": time.time() - wall}
+    if verbose:
+        print_report(report)
+    return report
+
+
+def print_report(report):
+    status, timing = report["status"], report["timing"]
+    print("[C13B0] Pipeline report")
+    print(f"  {'stage':<10} {'status':<8} {'seconds':>9}")
+    for sid in sorted(status):
+        secs = f"{timing[sid]:.2f}" if sid in timing else "-"
+        print(f"  {sid:<10} {status[sid]:<8} {secs:>9}")
+    counts = {}
+    for s in status.values():
+        counts[s] = counts.get(s, 0) + 1
+    summary = ", ".join(f"{v} {k}" for k, v in sorted(counts.items()))
+    print(f"  total: {summary}; cpu {sum(timing.values()):.2f}s, wall {report['wall']:.2f}s")
+
+
+def main():
+    args = sys.argv[1:]
+    force = "--force" in args
+    dry_run = "--dry-run" in args
+    jobs = None
+    if "--jobs" in args:
+        jobs = int(args[args.index("--jobs") + 1])
+    targets = [a for i, a in enumerate(args)
+               if not a.startswith("--") and (i == 0 or args[i - 1] != "--jobs")]
+    report = run(targets or None, jobs=jobs, force=force, dry_run=dry_run)
+    if any(s == "failed" for s in report["status"].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
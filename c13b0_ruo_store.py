@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# C13B0 — Indexed RUO Store
+# Shared, append-only record store for CART217_RUO_STORE.json.
+#
+# The JSON list stays the canonical input. On first use it is streamed
+# (constant memory) into a binary record file next to it:
+#
+#   CART217_RUO_STORE.ruo      magic + [u32 length][compact JSON] records
+#   CART217_RUO_STORE.ruoidx   [u16 keylen][u64 offset][u32 length][key] entries
+#   CART217_RUO_STORE.ruometa  source size/mtime, record count
+#   CART217_RUO_STORE.ruolock  flock() taken by rebuilds and appends
+#
+# Records are read lazily through mmap. Lookups by research_hash only
+# touch the index and the requested records; full scans never hold more
+# than one record in memory. The store is rebuilt automatically whenever
+# the JSON source changes; when several processes open a stale store at
+# once, the first one rebuilds it under the lock and the others find the
+# fresh meta once they get the lock.
+#
+# Usage from a cart:
+#   import c13b0_ruo_store as ruo_store
+#   for r in ruo_store.iter_ruos(RUO_STORE): ...
+#   with ruo_store.open_store(RUO_STORE) as store: store.get(rh)
+
+import json
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+RUO_STORE = "CART217_RUO_STORE.json"
+
+MAGIC = b"RUO1"
+REC_HEAD = struct.Struct("<I")
+IDX_HEAD = struct.Struct("<HQI")
+READ_CHUNK = 1 << 20
+
+
+def store_paths(json_path=RUO_STORE):
+    base = os.path.splitext(json_path)[0]
+    return base + ".ruo", base + ".ruoidx", base + ".ruometa"
+
+
+def _tmp(path):
+    # per-process temporary name, so concurrent writers never share one
+    return f"{path}.{os.getpid()}.tmp"
+
+
+def exists(json_path=RUO_STORE):
+    return os.path.exists(json_path) or os.path.exists(store_paths(json_path)[0])
+
+
+def _source_sig(json_path):
+    st = os.stat(json_path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def iter_json_array(path, chunk_size=READ_CHUNK):
+    # Stream the elements of a top-level JSON array without loading the file
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf = f.read(chunk_size)
+        pos = 0
+        eof = False
+
+        def fill(buf, pos):
+            more = f.read(chunk_size)
+            return buf[pos:] + more, 0, not more
+
+        # skip to the opening bracket
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            buf, pos, eof = fill(buf, pos)
+        if pos >= len(buf):
+            return
+        if buf[pos] != "[":
+            raise ValueError(f"[C13B0] {path} is not a JSON list")
+        pos += 1
+
+        while True:
+            while pos < len(buf) and (buf[pos].isspace() or buf[pos] == ","):
+                pos += 1
+            if pos >= len(buf):
+                if eof:
+                    raise ValueError(f"[C13B0] {path} ended inside the list")
+                buf, pos, eof = fill(buf, pos)
+                continue
+            if buf[pos] == "]":
+                return
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                buf, pos, eof = fill(buf, pos)
+                continue
+            # a number at the very end of the buffer may be truncated
+            if end == len(buf) and not eof:
+                buf, pos, eof = fill(buf, pos)
+                continue
+            yield obj
+            pos = end
+
+
+def _encode(ruo):
+    return json.dumps(ruo, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class RUOStore:
+    def __init__(self, json_path=RUO_STORE):
+        self.json_path = json_path
+        self.data_path, self.index_path, self.meta_path = store_paths(json_path)
+        self._fh = None
+        self._mm = None
+        self._index = None
+        self.meta = {}
+        self.lock_path = os.path.splitext(json_path)[0] + ".ruolock"
+        self._lock_fd = None
+        self._lock_depth = 0
+        self.sync()
+
+    # -- lifecycle -----------------------------------------------------
+
+    @contextmanager
+    def _locked(self):
+        # exclusive across processes; re-entrant within this store
+        if self._lock_depth == 0:
+            self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            if fcntl is not None:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            if self._lock_depth == 0:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    def _read_meta(self):
+        if not (os.path.exists(self.meta_path) and os.path.exists(self.data_path)):
+            return {}
+        try:
+            with open(self.meta_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _stale(self, meta):
+        if os.path.exists(self.json_path):
+            return meta.get("source") != _source_sig(self.json_path)
+        return not meta
+
+    def sync(self):
+        self.close()
+        meta = self._read_meta()
+        if self._stale(meta):
+            with self._locked():
+                # another process may have rebuilt it while we waited
+                meta = self._read_meta()
+                if self._stale(meta):
+                    meta = self.rebuild() if os.path.exists(self.json_path) else self._write_empty()
+        self.meta = meta
+        return self
+
+    def rebuild(self):
+        with self._locked():
+            return self._rebuild()
+
+    def _rebuild(self):
+        tmp_data = _tmp(self.data_path)
+        tmp_index = _tmp(self.index_path)
+        source = _source_sig(self.json_path)
+        count = 0
+        dupes = 0
+        seen = set()
+
+        with open(tmp_data, "wb") as data, open(tmp_index, "wb") as index:
+            data.write(MAGIC)
+            offset = len(MAGIC)
+            for ruo in iter_json_array(self.json_path):
+                key = str(ruo.get("research_hash", count)) if isinstance(ruo, dict) else str(count)
+                blob = _encode(ruo)
+                data.write(REC_HEAD.pack(len(blob)))
+                data.write(blob)
+                kb = key.encode("utf-8")
+                index.write(IDX_HEAD.pack(len(kb), offset, len(blob)))
+                index.write(kb)
+                offset += REC_HEAD.size + len(blob)
+                count += 1
+                if key in seen:
+                    dupes += 1
+                seen.add(key)
+
+        os.replace(tmp_data, self.data_path)
+        os.replace(tmp_index, self.index_path)
+        meta = {"source": source, "count": count, "dupes": dupes}
+        self._write_meta(meta)
+        return meta
+
+    def _write_empty(self):
+        with self._locked():
+            tmp = _tmp(self.data_path)
+            with open(tmp, "wb") as f:
+                f.write(MAGIC)
+            os.replace(tmp, self.data_path)
+            open(self.index_path, "wb").close()
+            meta = {"source": None, "count": 0, "dupes": 0}
+            self._write_meta(meta)
+            return meta
+
+    def _write_meta(self, meta):
+        with self._locked():
+            tmp = _tmp(self.meta_path)
+            with open(tmp, "w") as f:
+                json.dump(meta, f, indent=4)
+            os.replace(tmp, self.meta_path)
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -- low level -----------------------------------------------------
+
+    def _map(self):
+        if self._mm is None:
+            fh = open(self.data_path, "rb")
+            if os.fstat(fh.fileno()).st_size <= len(MAGIC):
+                fh.close()
+                return None
+            self._fh = fh
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._mm[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"[C13B0] {self.data_path} is not an RUO store")
+        return self._mm
+
+    def _load_index(self):
+        if self._index is None:
+            index = {}
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+            pos = 0
+            while pos < len(raw):
+                klen, offset, length = IDX_HEAD.unpack_from(raw, pos)
+                pos += IDX_HEAD.size
+                key = raw[pos:pos + klen].decode("utf-8")
+                pos += klen
+                index[key] = (offset, length)
+            self._index = index
+        return self._index
+
+    def _read(self, offset, length):
+        mm = self._map()
+        start = offset + REC_HEAD.size
+        return json.loads(mm[start:start + length])
+
+    def _scan(self, start=None, stop=None):
+        mm = self._map()
+        if mm is None:
+            return
+        pos = len(MAGIC) if start is None else start
+        end = len(mm) if stop is None else min(stop, len(mm))
+        while pos < end:
+            (length,) = REC_HEAD.unpack_from(mm, pos)
+            yield pos, length
+            pos += REC_HEAD.size + length
+
+    # -- public API ----------------------------------------------------
+
+    def __len__(self):
+        return self.meta.get("count", 0) - self.meta.get("dupes", 0)
+
+    def __contains__(self, research_hash):
+        return research_hash in self._load_index()
+
+    def __iter__(self):
+        return self.iter()
+
+    def iter(self, start=None, stop=None):
+        # when a hash was appended twice only the latest record is live.
+        # start / stop: record-aligned byte range, see shards()
+        index = self._load_index() if self.meta.get("dupes") else None
+        for offset, length in self._scan(start, stop):
+            rec = self._read(offset, length)
+            if index is not None:
+                key = str(rec.get("research_hash")) if isinstance(rec, dict) else None
+                if key in index and index[key][0] != offset:
+                    continue
+            yield rec
+
+    def shards(self, size=10000):
+        # [(start, stop), ...] byte ranges of about `size` records each, for
+        # handing one slice of the store to each worker process
+        starts = [offset for n, (offset, _) in enumerate(self._scan()) if n % size == 0]
+        return [(s, starts[i + 1] if i + 1 < len(starts) else None) for i, s in enumerate(starts)]
+
+    def hashes(self):
+        return list(self._load_index())
+
+    def get(self, research_hash, default=None):
+        loc = self._load_index().get(research_hash)
+        if loc is None:
+            return default
+        return self._read(*loc)
+
+    def get_many(self, hashes):
+        index = self._load_index()
+        # read in file order so mmap pages are touched sequentially
+        locs = sorted((index[h], h) for h in set(hashes) if h in index)
+        return {h: self._read(*loc) for loc, h in locs}
+
+    def append(self, ruo):
+        key = str(ruo["research_hash"])
+        index = self._load_index()
+        blob = _encode(ruo)
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+            self._fh.close()
+            self._fh = None
+        with self._locked():
+            with open(self.data_path, "ab") as data:
+                offset = data.tell()
+                data.write(REC_HEAD.pack(len(blob)))
+                data.write(blob)
+            kb = key.encode("utf-8")
+            with open(self.index_path, "ab") as f:
+                f.write(IDX_HEAD.pack(len(kb), offset, len(blob)))
+                f.write(kb)
+            if key in index:
+                self.meta["dupes"] = self.meta.get("dupes", 0) + 1
+            index[key] = (offset, len(blob))
+            self.meta["count"] = self.meta.get("count", 0) + 1
+            self._write_meta(self.meta)
+        return offset
+
+    def export_json(self, path=None):
+        # Write the live records back out as a JSON list, one record at a time
+        path = path or self.json_path
+        tmp = _tmp(path)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("[\n")
+            first = True
+            for rec in self.iter():
+                if not first:
+                    f.write(",\n")
+                f.write(json.dumps(rec, ensure_ascii=False))
+                first = False
+            f.write("\n]\n")
+        os.replace(tmp, path)
+        if path == self.json_path:
+            self.meta["source"] = _source_sig(path)
+            self._write_meta(self.meta)
+        return path
+
+
+def open_store(json_path=RUO_STORE):
+    return RUOStore(json_path)
+
+
+def iter_ruos(json_path=RUO_STORE):
+    with open_store(json_path) as store:
+        yield from store.iter()
+
+
+def iter_batches(json_path=RUO_STORE, size=10000):
+    batch = []
+    for r in iter_ruos(json_path):
+        batch.append(r)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def load_ruos(json_path=RUO_STORE):
+    # For carts that genuinely need the whole list (slicing, pairwise work)
+    return list(iter_ruos(json_path))
+
+
+def count_ruos(json_path=RUO_STORE):
+    if not exists(json_path):
+        return 0
+    with open_store(json_path) as store:
+        return len(store)
+
+
+if __name__ == "__main__":
+    import sys
+    path = sys.argv[1] if len(sys.argv) > 1 else RUO_STORE
+    with open_store(path) as store:
+        print(f"[C13B0] RUO store {store.data_path}: {len(store)} records")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# C13B0 — Sharded RUO Execution
+# Runs per-RUO carts over shards of the RUO store on a process pool.
+#
+# - shards are the CART403 batches: when CART403_BATCHES/index.json matches
+#   the current store, each worker reads one batch file; otherwise the
+#   store is cut into the same record-aligned byte ranges on the fly
+# - execute() runs one task per shard and yields the results in shard
+#   order, reporting per-shard RUO counts and timing as it goes
+# - write_keyed_json() streams (research_hash, value) pairs into exactly
+#   the file a sequential json.dump(indent=4) of the dict would write
+# - users: c13b0_writers (CART3xx), c13b0_features (CART221–CART226),
+#   CART403
+#
+# Usage:
+#   for result in shards.execute(fn, tasks, shards.plan(), workers): ...
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import c13b0_ruo_store as ruo_store
+
+RUO_STORE = "CART217_RUO_STORE.json"
+BATCHES = "CART403_BATCHES"
+SHARD_SIZE = 10000
+
+
+def batch_index_path(batches=BATCHES):
+    return os.path.join(batches, "index.json")
+
+
+def store_signature(store):
+    # changes when the JSON source is rebuilt or a record is appended
+    return {"source": store.meta.get("source"), "count": store.meta.get("count", 0)}
+
+
+def plan(json_path=RUO_STORE, size=SHARD_SIZE, batches=BATCHES):
+    # -> [{"id", "count", "batch" | "range"}, ...] in store order
+    with ruo_store.open_store(json_path) as store:
+        index = _load_index(batches) if batches else None
+        if index and index.get("store") == store_signature(store) and \
+                (size is None or index.get("size") == size) and \
+                all(os.path.exists(os.path.join(batches, b["file"])) for b in index["batches"]):
+            return [{"id": n, "count": b["count"], "batch": os.path.join(batches, b["file"])}
+                    for n, b in enumerate(index["batches"])]
+        size = size or SHARD_SIZE
+        ranges = store.shards(size)
+        records = store.meta.get("count", 0)
+    out = []
+    for n, (start, stop) in enumerate(ranges):
+        count = min(size, records - n * size)
+        out.append({"id": n, "count": count, "range": (json_path, start, stop)})
+    return out
+
+
+def _load_index(batches):
+    path = batch_index_path(batches)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def iter_shard(shard):
+    if "batch" in shard:
+        with open(shard["batch"], "r") as f:
+            yield from json.load(f)
+        return
+    json_path, start, stop = shard["range"]
+    with ruo_store.open_store(json_path) as store:
+        yield from store.iter(start, stop)
+
+
+def workers_arg(argv, default=None):
+    # --workers N
+    if "--workers" in argv:
+        return int(argv[argv.index("--workers") + 1])
+    return default
+
+
+# ---------- execution ----------
+
+def _timed(job):
+    fn, task = job
+    start = time.time()
+    result = fn(task)
+    return time.time() - start, result
+
+
+def execute(fn, tasks, shards, workers=None, label="shards", verbose=True):
+    # fn(task) runs in a worker (module-level, so it pickles by reference).
+    # Yields fn's results in shard order.
+    workers = min(workers or os.cpu_count() or 1, max(1, len(tasks)))
+    jobs = [(fn, t) for t in tasks]
+    start = time.time()
+    busy = 0.0
+    done = 0
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        results = pool.map(_timed, jobs) if pool else map(_timed, jobs)
+        for n, (seconds, result) in enumerate(results):
+            busy += seconds
+            done += shards[n]["count"]
+            if verbose:
+                print(f"[C13B0] {label} shard {n + 1}/{len(tasks)}: "
+                      f"{shards[n]['count']} RUOs in {seconds:.2f}s")
+            yield result
+    finally:
+        if pool:
+            pool.shutdown()
+    if verbose and tasks:
+        wall = time.time() - start
+        rate = done / wall if wall > 0 else 0.0
+        print(f"[C13B0] {label}: {done} RUOs, {len(tasks)} shards, {workers} workers, "
+              f"{wall:.2f}s wall, {busy:.2f}s in shards ({rate:.0f} RUOs/s)")
+
+
+# ---------- output ----------
+
+def write_keyed_json(pairs, output):
+    # (key, value) pairs → the same bytes json.dump(dict(pairs), f, indent=4)
+    # would write, without building the dict; keys must not repeat
+    tmp = output + ".tmp"
+    n = 0
+    with open(tmp, "w") as f:
+        f.write("{")
+        for key, value in pairs:
+            f.write(",\n    " if n else "\n    ")
+            f.write(json.dumps(key) + ": " + json.dumps(value, indent=4).replace("\n", "\n    "))
+            n += 1
+        f.write("\n}" if n else "}")
+    os.replace(tmp, output)
+    return n
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# C13B0 — RUO Similarity Search
+# Top-k cosine neighbours over the CART220 vector store.
+#
+# - small stores: exact search, queries batched into one matrix multiply
+#   per block of rows
+# - large stores: IVF index (k-means coarse quantizer, inverted lists);
+#   a query only scans the `nprobe` closest lists
+# - add() inserts new vectors incrementally (assigned to their nearest
+#   list, no retraining); rebuild() retrains from scratch
+# - rows are read straight from the memory-mapped store
+# - the IVF index and the per-row inverse norms are cached next to the
+#   vectors (CART220_VECTORS.ivf.npz, CART220_VECTORS.norms.npy) and
+#   rebuilt when the vector file changes, so opening an index does not
+#   touch every row
+#
+# Needs NumPy. Carts check available() and keep their old behaviour
+# without it.
+#
+# Usage:
+#   index = open_index()                      # CART220_VECTORS.npy
+#   index.neighbours(research_hash, k=5)      # [(hash, score), ...]
+#   index.search(query_vectors, k=5)
+#
+# CLI:
+#   python c13b0_similarity.py <research_hash> [--k 10] [--exact]
+
+import os
+import sys
+
+import c13b0_vectors as vectors
+
+np = vectors.np
+
+VECTORS = "CART220_VECTORS.npy"
+EXACT_LIMIT = 20000     # below this many rows, brute force is faster
+BLOCK = 65536           # rows per matrix-multiply block
+NPROBE = 8
+KMEANS_ITERS = 10
+KMEANS_SAMPLE = 50000
+
+
+def available(npy_path=VECTORS):
+    return np is not None and vectors.exists(npy_path)
+
+
+def _inv_norms(m):
+    out = np.empty(len(m), dtype=np.float32)
+    for s in range(0, len(m), BLOCK):
+        n = np.linalg.norm(np.asarray(m[s:s + BLOCK], dtype=np.float32), axis=1)
+        n[n == 0] = 1.0
+        out[s:s + BLOCK] = 1.0 / n
+    return out
+
+
+def _normalize(m):
+    m = np.asarray(m, dtype=np.float32)
+    norms = np.linalg.norm(m, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return m / norms
+
+
+def _top_k(scores, k):
+    # per-row indices of the k largest scores, best first
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return np.zeros((scores.shape[0], 0), dtype=np.int64)
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, part, axis=1), axis=1)
+    return np.take_along_axis(part, order, axis=1)
+
+
+def kmeans(data, nlist, iters=KMEANS_ITERS, seed=0):
+    # spherical k-means on unit vectors; returns unit centroids
+    rng = np.random.default_rng(seed)
+    if len(data) > KMEANS_SAMPLE:
+        data = data[np.sort(rng.choice(len(data), KMEANS_SAMPLE, replace=False))]
+    data = _normalize(data)
+    centroids = data[rng.choice(len(data), nlist, replace=False)].copy()
+    for _ in range(iters):
+        assign = np.argmax(data @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, data)
+        empty = ~sums.any(axis=1)
+        sums[empty] = centroids[empty]
+        centroids = _normalize(sums)
+    return centroids
+
+
+class SimilarityIndex:
+    def __init__(self, hashes, matrix, exact=None, nlist=None, nprobe=NPROBE, inv_norm=None):
+        if np is None:
+            raise ImportError("[C13B0] Similarity search needs numpy")
+        self.hashes = list(hashes)
+        self.rows = {h: i for i, h in enumerate(self.hashes)}
+        # rows stay as stored (possibly an mmap); cosine uses 1 / norm per row
+        self.matrix = matrix
+        self.inv_norm = _inv_norms(matrix) if inv_norm is None else inv_norm
+        self.exact = len(self.hashes) <= EXACT_LIMIT if exact is None else exact
+        self.nprobe = nprobe
+        self.centroids = None
+        self.lists = None
+        if not self.exact:
+            self.rebuild(nlist)
+
+    # -- IVF -----------------------------------------------------------
+
+    def rebuild(self, nlist=None):
+        n = len(self.hashes)
+        nlist = nlist or max(1, int(np.sqrt(n)))
+        self.centroids = kmeans(self.matrix, min(nlist, n))
+        assign = self._assign(self.matrix)
+        self._set_lists(assign)
+        return self
+
+    def _assign(self, rows):
+        out = np.empty(len(rows), dtype=np.int32)
+        for s in range(0, len(rows), BLOCK):
+            block = _normalize(rows[s:s + BLOCK])
+            out[s:s + BLOCK] = np.argmax(block @ self.centroids.T, axis=1)
+        return out
+
+    def _set_lists(self, assign):
+        self.assign = assign
+        order = np.argsort(assign, kind="stable")
+        bounds = np.searchsorted(assign[order], np.arange(len(self.centroids) + 1))
+        self.lists = [order[bounds[c]:bounds[c + 1]] for c in range(len(self.centroids))]
+
+    def save(self, path):
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, centroids=self.centroids, assign=self.assign)
+        os.replace(tmp, path)
+
+    def load(self, path):
+        data = np.load(path)
+        if len(data["assign"]) != len(self.hashes):
+            return False
+        self.centroids = data["centroids"]
+        self._set_lists(data["assign"])
+        self.exact = False
+        return True
+
+    # -- updates -------------------------------------------------------
+
+    def add(self, hashes, rows):
+        rows = np.atleast_2d(np.asarray(rows, dtype=np.float32))
+        start = len(self.hashes)
+        for n, h in enumerate(hashes):
+            self.rows[h] = start + n
+        self.hashes.extend(hashes)
+        self.matrix = np.vstack([self.matrix, rows]) if start else rows
+        self.inv_norm = np.concatenate([self.inv_norm, _inv_norms(rows)])
+        if self.centroids is not None:
+            self._set_lists(np.concatenate([self.assign, self._assign(rows)]))
+        elif not self.exact or len(self.hashes) > EXACT_LIMIT:
+            self.exact = False
+            self.rebuild()
+
+    # -- queries -------------------------------------------------------
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def search(self, queries, k=10, exclude=None):
+        # queries: (m, dims) → [[(hash, score), ...], ...] best first.
+        # exclude: optional per-query row index to leave out (the query itself)
+        q = _normalize(np.atleast_2d(queries))
+        extra = 1 if exclude is not None else 0
+        if self.exact:
+            idx, scores = self._search_exact(q, k + extra)
+        else:
+            idx, scores = self._search_ivf(q, k + extra)
+        out = []
+        for qi in range(len(q)):
+            hits = []
+            for i, s in zip(idx[qi], scores[qi]):
+                if i < 0 or (exclude is not None and i == exclude[qi]):
+                    continue
+                hits.append((self.hashes[i], float(s)))
+            out.append(hits[:k])
+        return out
+
+    def _search_exact(self, q, k):
+        best_i = np.full((len(q), 0), -1, dtype=np.int64)
+        best_s = np.full((len(q), 0), -np.inf, dtype=np.float32)
+        for s in range(0, len(self.hashes), BLOCK):
+            scores = (q @ np.asarray(self.matrix[s:s + BLOCK]).T) * self.inv_norm[s:s + BLOCK]
+            top = _top_k(scores, k)
+            cand_s = np.concatenate([best_s, np.take_along_axis(scores, top, axis=1)], axis=1)
+            cand_i = np.concatenate([best_i, top + s], axis=1)
+            keep = _top_k(cand_s, k)
+            best_s = np.take_along_axis(cand_s, keep, axis=1)
+            best_i = np.take_along_axis(cand_i, keep, axis=1)
+        return best_i, best_s
+
+    def _search_ivf(self, q, k):
+        probes = _top_k(q @ self.centroids.T, self.nprobe)
+        idx = np.full((len(q), k), -1, dtype=np.int64)
+        out = np.full((len(q), k), -np.inf, dtype=np.float32)
+        for qi in range(len(q)):
+            cand = np.concatenate([self.lists[c] for c in probes[qi]])
+            if not len(cand):
+                continue
+            cand.sort()
+            scores = (self.matrix[cand] @ q[qi]) * self.inv_norm[cand]
+            top = _top_k(scores[None, :], k)[0]
+            idx[qi, :len(top)] = cand[top]
+            out[qi, :len(top)] = scores[top]
+        return idx, out
+
+    def neighbours(self, research_hash, k=10):
+        i = self.rows.get(research_hash)
+        if i is None:
+            return []
+        return self.search(self.matrix[i], k, exclude=[i])[0]
+
+    def neighbours_many(self, hashes, k=10):
+        known = [h for h in hashes if h in self.rows]
+        rows = [self.rows[h] for h in known]
+        found = {}
+        for s in range(0, len(rows), 1024):
+            part = rows[s:s + 1024]
+            for h, hits in zip(known[s:s + 1024], self.search(self.matrix[part], k, exclude=part)):
+                found[h] = hits
+        return {h: found.get(h, []) for h in hashes}
+
+
+def index_path(npy_path=VECTORS):
+    return os.path.splitext(npy_path)[0] + ".ivf.npz"
+
+
+def norms_path(npy_path=VECTORS):
+    return os.path.splitext(npy_path)[0] + ".norms.npy"
+
+
+def _cached_norms(npy_path, matrix):
+    cache = norms_path(npy_path)
+    if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(npy_path):
+        inv = np.load(cache, mmap_mode="r")
+        if len(inv) == len(matrix):
+            return inv
+    inv = _inv_norms(matrix)
+    tmp = f"{cache}.{os.getpid()}.tmp.npy"
+    np.save(tmp, inv)
+    os.replace(tmp, cache)
+    return inv
+
+
+def open_index(npy_path=VECTORS, exact=None):
+    store = vectors.open_vectors(npy_path)   # kept open: rows stay memory-mapped
+    hashes, matrix = store.hashes, store.matrix
+    exact = len(hashes) <= EXACT_LIMIT if exact is None else exact
+    index = SimilarityIndex(hashes, matrix, exact=True, inv_norm=_cached_norms(npy_path, matrix))
+    if exact:
+        return index
+    cache = index_path(npy_path)
+    fresh = os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(npy_path)
+    if not (fresh and index.load(cache)):
+        index.rebuild().save(cache)
+    index.exact = False
+    return index
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if not args:
+        print("usage: c13b0_similarity.py <research_hash> [--k 10] [--exact]")
+        sys.exit(1)
+    k = int(args[args.index("--k") + 1]) if "--k" in args else 10
+    index = open_index(exact=True if "--exact" in args else None)
+    for h, score in index.neighbours(args[0], k):
+        print(f"{score:.4f}  {h}")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# C13B0 — Float32 Vector Store
+# Binary replacement for the per-RUO JSON float lists of CART220.
+#
+#   CART220_VECTORS.npy         float32 (N, dims) matrix, standard .npy
+#   CART220_VECTORS.index.json  dims, count and the research_hash of each row
+#
+# The matrix is written batch by batch (never held whole in memory) and
+# read through mmap: get(rh) returns a zero-copy row view. NumPy is used
+# when installed; without it rows come back as memoryview slices and the
+# vectors are generated in pure Python.
+#
+# pseudo_vectors() derives each row from the RUO hash with a counter-based
+# generator (SplitMix64 over (seed, column)), so a whole batch is one
+# vectorized expression instead of a random.seed() loop per RUO.
+
+import ast
+import json
+import mmap
+import os
+import struct
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DIMS = 2048
+NPY_MAGIC = b"\x93NUMPY\x01\x00"
+
+GOLDEN = 0x9E3779B97F4A7C15
+MIX1 = 0xBF58476D1CE4E5B9
+MIX2 = 0x94D049BB133111EB
+MASK64 = (1 << 64) - 1
+
+
+def index_path(npy_path):
+    return os.path.splitext(npy_path)[0] + ".index.json"
+
+
+def exists(npy_path):
+    return os.path.exists(npy_path) and os.path.exists(index_path(npy_path))
+
+
+def hash_seed(research_hash):
+    return int(research_hash[:16], 16) if research_hash else 0
+
+
+# ---------- generation ----------
+
+def _pseudo_row_py(seed, dims):
+    out = array("f")
+    for i in range(1, dims + 1):
+        z = (seed + i * GOLDEN) & MASK64
+        z = ((z ^ (z >> 30)) * MIX1) & MASK64
+        z = ((z ^ (z >> 27)) * MIX2) & MASK64
+        z ^= z >> 31
+        out.append((z >> 40) / 16777216.0)
+    return out
+
+
+def pseudo_vectors(seeds, dims=DIMS):
+    # (len(seeds), dims) float32 in [0, 1), one deterministic row per seed
+    if np is None:
+        return [_pseudo_row_py(s, dims) for s in seeds]
+    s = np.asarray(seeds, dtype=np.uint64)[:, None]
+    i = np.arange(1, dims + 1, dtype=np.uint64)[None, :]
+    with np.errstate(over="ignore"):
+        z = s + i * np.uint64(GOLDEN)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(MIX1)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(MIX2)
+    z ^= z >> np.uint64(31)
+    return (z >> np.uint64(40)).astype(np.float32) * np.float32(1.0 / 16777216.0)
+
+
+# ---------- .npy writing ----------
+
+def _npy_header(count, dims):
+    head = "{'descr': '<f4', 'fortran_order': False, 'shape': (%d, %d), }" % (count, dims)
+    pad = 64 - (len(NPY_MAGIC) + 2 + len(head) + 1) % 64
+    head = head + " " * (pad % 64) + "\n"
+    return NPY_MAGIC + struct.pack("<H", len(head)) + head.encode("latin1")
+
+
+def write_vectors(npy_path, batches, count, dims=DIMS):
+    # batches: iterable of (hashes, rows). `count` must be the total number
+    # of rows; it goes into the .npy header before any row is written.
+    hashes = []
+    tmp = npy_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_npy_header(count, dims))
+        for batch_hashes, rows in batches:
+            if np is not None and isinstance(rows, np.ndarray):
+                f.write(np.ascontiguousarray(rows, dtype="<f4").tobytes())
+            else:
+                for row in rows:
+                    f.write(row.tobytes())
+            hashes.extend(batch_hashes)
+    if len(hashes) != count:
+        os.remove(tmp)
+        raise ValueError(f"[C13B0] Expected {count} vectors, got {len(hashes)}")
+    os.replace(tmp, npy_path)
+
+    itmp = index_path(npy_path) + ".tmp"
+    with open(itmp, "w") as f:
+        json.dump({"dims": dims, "count": count, "hashes": hashes}, f)
+    os.replace(itmp, index_path(npy_path))
+    return count
+
+
+# ---------- reading ----------
+
+class VectorStore:
+    def __init__(self, npy_path):
+        self.path = npy_path
+        with open(index_path(npy_path), "r") as f:
+            meta = json.load(f)
+        self.dims = meta["dims"]
+        self.hashes = meta["hashes"]
+        self.rows = {h: i for i, h in enumerate(self.hashes)}
+        self._fh = None
+        self._mm = None
+        if np is not None:
+            self.matrix = np.load(npy_path, mmap_mode="r") if self.hashes else \
+                np.zeros((0, self.dims), dtype=np.float32)
+        else:
+            self.matrix = self._map_py()
+
+    def _map_py(self):
+        self._fh = open(self.path, "rb")
+        head = self._fh.read(len(NPY_MAGIC) + 2)
+        (hlen,) = struct.unpack("<H", head[-2:])
+        info = ast.literal_eval(self._fh.read(hlen).decode("latin1"))
+        if info["descr"] != "<f4":
+            raise ValueError(f"[C13B0] {self.path} is not a float32 matrix")
+        offset = len(head) + hlen
+        if not self.hashes:
+            return memoryview(array("f"))
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        return self._view[offset:].cast("f")
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def __contains__(self, research_hash):
+        return research_hash in self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if np is None and self._mm is not None:
+            self.matrix.release()
+            self._view.release()
+            self._mm.close()
+            self._mm = None
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        self.matrix = None
+
+    def row(self, i):
+        if np is not None:
+            return self.matrix[i]
+        return self.matrix[i * self.dims:(i + 1) * self.dims]
+
+    def get(self, research_hash, default=None):
+        i = self.rows.get(research_hash)
+        return default if i is None else self.row(i)
+
+    def items(self):
+        for i, h in enumerate(self.hashes):
+            yield h, self.row(i)
+
+
+def open_vectors(npy_path):
+    return VectorStore(npy_path)
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# C13B0 — Artifact Change Watcher
+# Turns file changes into fine-grained events for the autonomy loop
+# (CART502 → CART503 → CART507).
+#
+# - Linux: inotify (via libc) wakes the watcher as soon as a watched
+#   artifact is written; elsewhere it falls back to stat polling
+# - what changed is always decided by comparing stat snapshots
+#   (size / mtime / file count), so a missed or spurious wakeup is harmless
+# - bursts are debounced: a file still being written (mtime younger than
+#   the debounce window) is reported on a later pass, and several events
+#   for one path are coalesced into one
+# - only writes to a watched path wake the watcher: the names in each
+#   inotify event are matched against the watched files and directories,
+#   so the watcher's own state / queue files (and any other file next to
+#   a watched one) never trigger a pass
+# - the first run seeds the snapshot from the tree as it is, instead of
+#   reporting every source as created; the state is saved only on change
+#
+# Events are queued in CART502_EVENTS.json until CART503 consumes them:
+#   {"type": "changed", "path": ..., "kind": "created|modified|deleted",
+#    "size": ..., "prev_size": ..., "mtime": ..., "timestamp": ...}
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import time
+
+EVENTS = "CART502_EVENTS.json"
+STATE = "CART502_WATCH_STATE.json"
+DEBOUNCE = 2.0
+
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM |
+              IN_MOVED_TO | IN_CREATE | IN_DELETE)
+EVENT = struct.Struct("iIII")
+
+
+def stat_path(path):
+    # [size, mtime_ns, files] for a file or a whole directory tree
+    if os.path.isfile(path):
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns, 1]
+    if not os.path.isdir(path):
+        return None
+    size = 0
+    newest = os.stat(path).st_mtime_ns
+    files = 0
+    for root, dirs, names in os.walk(path):
+        for name in names:
+            try:
+                st = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            size += st.st_size
+            newest = max(newest, st.st_mtime_ns)
+            files += 1
+    return [size, newest, files]
+
+
+def snapshot(paths):
+    return {p: stat_path(p) for p in paths}
+
+
+def diff(old, new, debounce=0.0, now=None):
+    # Returns (events, settled): settled is `new` with still-settling paths
+    # kept at their old state, so they are reported once writing stops
+    now = time.time() if now is None else now
+    events = []
+    settled = dict(new)
+    for path, cur in new.items():
+        prev = old.get(path)
+        if cur == prev:
+            continue
+        if cur is not None and now - cur[1] / 1e9 < debounce:
+            settled[path] = prev
+            continue
+        kind = "deleted" if cur is None else "created" if prev is None else "modified"
+        events.append({
+            "type": "changed",
+            "path": path,
+            "kind": kind,
+            "size": cur[0] if cur else 0,
+            "prev_size": prev[0] if prev else 0,
+            "files": cur[2] if cur else 0,
+            "mtime": cur[1] / 1e9 if cur else None,
+            "timestamp": int(now)
+        })
+    return events, settled
+
+
+def coalesce(events):
+    # One event per path: the first kind wins for created/deleted pairs,
+    # the latest state wins for everything else
+    merged = {}
+    for e in events:
+        prev = merged.get(e["path"])
+        if prev is None:
+            merged[e["path"]] = dict(e)
+            continue
+        kind = prev["kind"]
+        if kind == "created" and e["kind"] == "deleted":
+            del merged[e["path"]]
+            continue
+        if kind == "deleted" and e["kind"] != "deleted":
+            kind = "modified"
+        elif kind != "created":
+            kind = e["kind"]
+        prev_size = prev["prev_size"]
+        merged[e["path"]] = dict(e, kind=kind, prev_size=prev_size)
+    return list(merged.values())
+
+
+# ---------- event queue ----------
+
+def _load(path, default):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _save(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=4)
+    os.replace(tmp, path)
+
+
+def push_events(events, path=EVENTS):
+    # Events not yet consumed by CART503 are merged with the new ones
+    if not events:
+        return _load(path, [])
+    queued = coalesce(_load(path, []) + events)
+    _save(path, queued)
+    return queued
+
+
+def take_events(path=EVENTS):
+    events = _load(path, [])
+    if events:
+        _save(path, [])
+    return events
+
+
+# ---------- inotify ----------
+
+class _Inotify:
+    def __init__(self):
+        name = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(name, use_errno=True)
+        self._add = libc.inotify_add_watch
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+
+    def watch_dir(self, path):
+        path = os.path.abspath(path)
+        if path in self.dirs or not os.path.isdir(path):
+            return
+        wd = self._add(self.fd, path.encode("utf-8"), WATCH_MASK)
+        if wd >= 0:
+            self.dirs[path] = wd
+
+    def wait(self, timeout):
+        # -> paths named by the queued events ([] on timeout); None stands
+        # for "unknown" (queue overflow), i.e. anything may have changed
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        names = {wd: path for path, wd in self.dirs.items()}
+        touched = []
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            pos = 0
+            while pos + EVENT.size <= len(buf):
+                wd, mask, _, length = EVENT.unpack_from(buf, pos)
+                name = buf[pos + EVENT.size:pos + EVENT.size + length].rstrip(b"\0")
+                pos += EVENT.size + length
+                if mask & IN_Q_OVERFLOW:
+                    touched.append(None)
+                elif wd in names:
+                    touched.append(os.path.join(names[wd], os.fsdecode(name)))
+        return touched
+
+    def close(self):
+        os.close(self.fd)
+
+
+class Watcher:
+    def __init__(self, paths, debounce=DEBOUNCE, state=STATE, use_inotify=True, events=EVENTS):
+        self.paths = list(paths)
+        self.debounce = debounce
+        self.state_path = state
+        saved = _load(state, {}) if state else {}
+        # paths the state has never seen start from how they are now
+        self.last = {p: saved[p] if p in saved else stat_path(p) for p in self.paths}
+        self.saved = saved
+        self.unsettled = False
+        self.stopped = False
+        self._own = {os.path.abspath(f) + ext for f in (state, events) if f for ext in ("", ".tmp")}
+        self._files = {os.path.abspath(p) for p in self.paths if not os.path.isdir(p)}
+        self._dirs = [os.path.abspath(p) for p in self.paths if os.path.isdir(p)]
+        self.inotify = None
+        if use_inotify:
+            try:
+                self.inotify = _Inotify()
+            except (OSError, AttributeError, TypeError):
+                self.inotify = None
+        if self.inotify:
+            for p in self.paths:
+                self.inotify.watch_dir(p if os.path.isdir(p) else os.path.dirname(p) or ".")
+        self._save()
+
+    @property
+    def mode(self):
+        return "inotify" if self.inotify else "poll"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.stopped = True
+        if self.inotify:
+            self.inotify.close()
+            self.inotify = None
+
+    def stop(self):
+        # ends watch() after its current wait
+        self.stopped = True
+
+    def _save(self):
+        if self.state_path and self.last != self.saved:
+            _save(self.state_path, self.last)
+            self.saved = dict(self.last)
+
+    def poll(self):
+        # One pass: events since the last settled snapshot
+        current = snapshot(self.paths)
+        events, self.last = diff(self.last, current, self.debounce)
+        self.unsettled = self.last != current
+        self._save()
+        return events
+
+    def _watched(self, path):
+        if path is None:
+            return True
+        path = os.path.abspath(path)
+        if path in self._own:
+            return False
+        if path in self._files:
+            return True
+        return any(path == d or path.startswith(d + os.sep) for d in self._dirs)
+
+    def wait(self, timeout):
+        # -> True if a watched path may have changed
+        if self.inotify:
+            for p in self.paths:
+                if os.path.isdir(p):
+                    self.inotify.watch_dir(p)
+            deadline = time.monotonic() + timeout
+            while True:
+                touched = self.inotify.wait(max(0.0, deadline - time.monotonic()))
+                if any(self._watched(p) for p in touched):
+                    return True
+                if not touched or time.monotonic() >= deadline:
+                    return False
+        time.sleep(timeout)
+        return True
+
+    def watch(self, callback, interval=300):
+        # Blocks; calls callback(events) once per quiet burst. In poll mode
+        # the tree is re-checked every `debounce` seconds, with inotify
+        # the watcher sleeps until a watched path is written (or `interval`).
+        # A burst is over once a pass finds nothing new and nothing still
+        # settling.
+        pending = []
+        while not self.stopped:
+            busy = pending or self.unsettled or not self.inotify
+            tick = self.debounce if busy else interval
+            self.wait(tick)
+            if self.stopped:
+                break
+            fresh = self.poll()
+            if fresh:
+                pending.extend(fresh)
+                continue
+            if pending and not self.unsettled:
+                callback(coalesce(pending))
+                pending = []
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# C13B0 — Single-Pass Writer Engine
+# Renders the per-RUO Markdown of the CART3xx writer carts in one scan of
+# the RUO store, instead of one full scan (and one file per RUO) per cart.
+#
+# - a writer cart exposes OUTDIR, load_context() (checks its inputs and
+#   loads its side files once) and render(ruo, ctx) → Markdown text
+# - the store is split into shards (the CART403 batches, see
+#   c13b0_shards.py); each worker process streams its shard once and fans
+#   every record out to all selected writers
+# - directory mode (default): rendered files are buffered and written in
+#   batches, one write() per file
+# - archive mode: one <OUTDIR>.zip per stage instead of a file per RUO;
+#   members are compressed in the workers and appended by the parent, in
+#   store order
+# - CART302 (neighbour batches), CART308 (single report), CART309 (groups)
+#   and CART318 (reads CART301 output) keep their own loops
+#
+# CLI:
+#   python c13b0_writers.py                             # every writer
+#   python c13b0_writers.py cart301 cart304 --workers 4
+#   python c13b0_writers.py --archive [--zip-mode deflate|store|zstd]
+
+import importlib
+import os
+import sys
+import time
+
+import c13b0_shards as shards
+import c13b0_zip as zip_engine
+
+RUO_STORE = "CART217_RUO_STORE.json"
+FLUSH_BYTES = 4 << 20       # directory mode: buffered bytes per stage before a flush
+
+WRITERS = {
+    "cart301": "cart301_ruo_summarizer",
+    "cart303": "cart303_research_weaver",
+    "cart304": "cart304_short_paper_writer",
+    "cart305": "cart305_long_paper_writer",
+    "cart306": "cart306_color_mode_transformer",
+    "cart307": "cart307_crossover_expansion_writer",
+    "cart310": "cart310_scientific_justification_builder",
+    "cart311": "cart311_evidence_based_writer",
+    "cart312": "cart312_narrative_science_writer",
+    "cart313": "cart313_historical_lens_writer",
+    "cart314": "cart314_material_science_lens_writer",
+    "cart315": "cart315_geometry_lens_writer",
+    "cart316": "cart316_scifi_reality_writer",
+    "cart317": "cart317_domain_bridge_builder",
+    "cart319": "cart319_multi_perspective_writer",
+    "cart320": "cart320_infinity_vector_writer",
+}
+
+# per process: forked workers inherit what the parent already loaded
+_modules = {}
+_contexts = {}
+
+
+def writer(cart):
+    if cart not in WRITERS:
+        raise ValueError(f"[C13B0] Unknown writer: {cart}")
+    mod = _modules.get(cart)
+    if mod is None:
+        mod = _modules[cart] = importlib.import_module(WRITERS[cart])
+    return mod
+
+
+def context(cart):
+    if cart not in _contexts:
+        _contexts[cart] = writer(cart).load_context()
+    return _contexts[cart]
+
+
+def archive_path(cart):
+    return writer(cart).OUTDIR + ".zip"
+
+
+class _DirSink:
+    def __init__(self, outdir):
+        self.outdir = outdir
+        self.pending = []
+        self.size = 0
+
+    def add(self, name, data):
+        self.pending.append((name, data))
+        self.size += len(data)
+        if self.size >= FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        for name, data in self.pending:
+            fd = os.open(os.path.join(self.outdir, name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+        self.pending = []
+        self.size = 0
+
+
+def _render_shard(task):
+    # Worker: one pass over the shard for every writer. Directory mode
+    # writes here; archive mode returns compressed members.
+    shard, carts, archive, mode, level = task
+    sinks = {} if archive else {c: _DirSink(writer(c).OUTDIR) for c in carts}
+    packed = {c: [] for c in carts} if archive else {}
+    renderers = [(c, writer(c).render, context(c)) for c in carts]
+    count = 0
+    for r in shards.iter_shard(shard):
+        name = f"{r['research_hash']}.md"
+        for c, render, ctx in renderers:
+            data = render(r, ctx).encode("utf-8")
+            if archive:
+                packed[c].append((name, len(data)) + zip_engine.compress_bytes(data, mode, level))
+            else:
+                sinks[c].add(name, data)
+        count += 1
+    for sink in sinks.values():
+        sink.flush()
+    return count, packed
+
+
+def run(carts=None, archive=False, mode="deflate", level=None, workers=None,
+        json_path=RUO_STORE, size=None, strict=True, verbose=True):
+    # strict: a writer with missing inputs raises; otherwise it is skipped
+    # and reported in the result
+    carts = list(carts or WRITERS)
+    ready = []
+    skipped = {}
+    for c in carts:
+        try:
+            context(c)
+        except FileNotFoundError as e:
+            if strict:
+                raise
+            skipped[c] = str(e)
+            continue
+        ready.append(c)
+
+    start = time.time()
+    plan = shards.plan(json_path, size) if ready else []
+    tasks = [(s, ready, archive, mode, level) for s in plan]
+
+    archives = {}
+    if archive:
+        archives = {c: zip_engine.ArchiveWriter(archive_path(c), mode, level) for c in ready}
+    else:
+        for c in ready:
+            os.makedirs(writer(c).OUTDIR, exist_ok=True)
+
+    workers = min(workers or os.cpu_count() or 1, max(1, len(tasks)))
+    count = 0
+    try:
+        for n, packed in shards.execute(_render_shard, tasks, plan, workers, "writers", verbose):
+            count += n
+            for c, members in packed.items():
+                for m in members:
+                    archives[c].add_compressed(*m)
+    except BaseException:
+        for a in archives.values():
+            a.abort()
+        raise
+    for a in archives.values():
+        a.close()
+
+    return {"ruos": count, "writers": ready, "skipped": skipped, "shards": len(tasks),
+            "workers": workers, "archive": archive, "seconds": time.time() - start}
+
+
+def main():
+    args = sys.argv[1:]
+
+    def opt(name):
+        return args[args.index(name) + 1] if name in args else None
+
+    values = {opt("--workers"), opt("--zip-mode")}
+    carts = [a for a in args if not a.startswith("--") and a not in values]
+    workers = int(opt("--workers")) if "--workers" in args else None
+    result = run(carts or None, archive="--archive" in args, mode=zip_engine.zip_mode(args),
+                 workers=workers, strict=bool(carts))
+
+    for c, reason in sorted(result["skipped"].items()):
+        print(f"[C13B0] {c} skipped: {reason}")
+    where = "archives" if result["archive"] else "directories"
+    print(f"[C13B0] {len(result['writers'])} writers × {result['ruos']} RUOs → {where} "
+          f"({result['shards']} shards, {result['workers']} workers, {result['seconds']:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
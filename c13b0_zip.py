@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# C13B0 — Parallel ZIP Build Engine
+# Shared archive builder for CART408 (master ZIPs), CART415 (grand master)
+# and CART430 (token export).
+#
+# - members are hashed and compressed in a process pool, one task per file
+# - compressed streams are kept in a content-addressed cache
+#   (C13B0_ZIP_CACHE/<sha[:2]>/<sha>.<mode>-<level>), so a file deflated
+#   once is never deflated again — not by the next run, and not by the
+#   next cart that packs the same bytes into a bigger archive
+# - archives (.zip, .gz, ...) and other already-compressed members are
+#   stored, never recompressed when nesting archives
+# - each archive keeps a manifest; when no member changed (size / mtime)
+#   the rebuild is a no-op
+# - modes: "deflate" (default), "store", "zstd" (needs the zstandard
+#   package; zstd members are method 93 and need a zstd-aware unzip)
+#
+# The archive itself is written directly (local headers, central
+# directory, ZIP64 records when needed) so cached streams can be copied
+# in as-is. ArchiveWriter uses the same writer for generated content
+# (the CART3xx writer stages, see c13b0_writers.py).
+
+import hashlib
+import json
+import os
+import shutil
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CACHE_DIR = "C13B0_ZIP_CACHE"
+CHUNK = 1 << 20
+
+STORED = 0
+DEFLATED = 8
+ZSTD = 93
+METHODS = {"store": STORED, "deflate": DEFLATED, "zstd": ZSTD}
+DEFAULT_LEVEL = {"store": 0, "deflate": 6, "zstd": 3}
+
+# never worth compressing again
+PRECOMPRESSED = {".zip", ".gz", ".tgz", ".bz2", ".xz", ".zst", ".7z", ".rar",
+                 ".png", ".jpg", ".jpeg", ".gif", ".webp", ".mp3", ".mp4", ".pdf"}
+
+LOCAL_HEAD = struct.Struct("<IHHHHHIIIHH")
+CENTRAL_HEAD = struct.Struct("<IHHHHHHIIIHHHHHII")
+END_RECORD = struct.Struct("<IHHHHIIH")
+ZIP64_END = struct.Struct("<IQHHIIQQQQ")
+ZIP64_LOCATOR = struct.Struct("<IIQI")
+MAX32 = 0xFFFFFFFF
+MAX16 = 0xFFFF
+
+
+def tree_members(src, prefix=""):
+    # (path, arcname) for every file under src, in a stable order
+    members = []
+    for root, dirs, files in os.walk(src):
+        dirs.sort()
+        for name in sorted(files):
+            fp = os.path.join(root, name)
+            members.append((fp, prefix + os.path.relpath(fp, src).replace(os.sep, "/")))
+    return members
+
+
+def _blob_path(cache_dir, sha, mode, level):
+    return os.path.join(cache_dir, sha[:2], f"{sha}.{mode}-{level}")
+
+
+def _hash_file(path):
+    h = hashlib.sha256()
+    crc = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK), b""):
+            h.update(chunk)
+            crc = zlib.crc32(chunk, crc)
+    return h.hexdigest(), crc
+
+
+def _compressor(mode, level):
+    if mode == "deflate":
+        return zlib.compressobj(level, zlib.DEFLATED, -15)
+    if mode == "zstd":
+        return zstandard.ZstdCompressor(level=level).compressobj()
+    raise ValueError(f"[C13B0] Unknown zip mode: {mode}")
+
+
+def _prepare(task):
+    # Worker: hash the file and, when its stream is not cached yet,
+    # compress it into the cache. Returns member metadata only.
+    path, known, mode, level, cache_dir = task
+    if known:
+        sha, crc = known
+    else:
+        sha, crc = _hash_file(path)
+    size = os.path.getsize(path)
+    method = METHODS[mode]
+
+    if mode == "store" or os.path.splitext(path)[1].lower() in PRECOMPRESSED:
+        return {"sha": sha, "crc": crc, "method": STORED, "csize": size, "compressed": False}
+
+    blob = _blob_path(cache_dir, sha, mode, level)
+    if os.path.exists(blob):
+        csize = os.path.getsize(blob)
+        if csize == 0:
+            return {"sha": sha, "crc": crc, "method": STORED, "csize": size, "compressed": False}
+        return {"sha": sha, "crc": crc, "method": method, "csize": csize, "compressed": False}
+
+    os.makedirs(os.path.dirname(blob), exist_ok=True)
+    tmp = f"{blob}.{os.getpid()}.tmp"
+    comp = _compressor(mode, level)
+    with open(path, "rb") as src, open(tmp, "wb") as out:
+        for chunk in iter(lambda: src.read(CHUNK), b""):
+            out.write(comp.compress(chunk))
+        out.write(comp.flush())
+    csize = os.path.getsize(tmp)
+    if csize >= size:
+        # incompressible: store it, and remember that so it is not retried
+        os.remove(tmp)
+        open(blob, "wb").close()
+        return {"sha": sha, "crc": crc, "method": STORED, "csize": size, "compressed": True}
+    os.replace(tmp, blob)
+    return {"sha": sha, "crc": crc, "method": method, "csize": csize, "compressed": True}
+
+
+# ---------- archive writer ----------
+
+def _dos_time(mtime):
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (1 << 5) | 1
+    return ((t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+            ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday)
+
+
+def _write_local(out, m):
+    name = m["arc"].encode("utf-8")
+    size, csize = m["size"], m["csize"]
+    zip64 = size >= MAX32 or csize >= MAX32
+    extra = struct.pack("<HHQQ", 1, 16, size, csize) if zip64 else b""
+    dtime, ddate = _dos_time(m["mtime_ns"] / 1e9)
+    offset = out.tell()
+    out.write(LOCAL_HEAD.pack(
+        0x04034B50, 45 if zip64 else 20, 0x800, m["method"], dtime, ddate,
+        m["crc"] & MAX32, MAX32 if zip64 else csize, MAX32 if zip64 else size,
+        len(name), len(extra)))
+    out.write(name)
+    out.write(extra)
+    return offset
+
+
+def _write_member(out, m, cache_dir, mode, level):
+    offset = _write_local(out, m)
+    if m["method"] == STORED:
+        src_path = m["path"]
+    else:
+        src_path = _blob_path(cache_dir, m["sha"], mode, level)
+    with open(src_path, "rb") as src:
+        shutil.copyfileobj(src, out, CHUNK)
+    return offset
+
+
+def _central_entry(m, offset):
+    name = m["arc"].encode("utf-8")
+    size, csize = m["size"], m["csize"]
+    fields = []
+    if size >= MAX32:
+        fields.append(size)
+    if csize >= MAX32:
+        fields.append(csize)
+    if offset >= MAX32:
+        fields.append(offset)
+    extra = struct.pack("<HH", 1, 8 * len(fields)) + struct.pack(f"<{len(fields)}Q", *fields) if fields else b""
+    dtime, ddate = _dos_time(m["mtime_ns"] / 1e9)
+    version = 45 if fields else 20
+    return CENTRAL_HEAD.pack(
+        0x02014B50, (3 << 8) | version, version, 0x800, m["method"], dtime, ddate,
+        m["crc"] & MAX32, min(csize, MAX32), min(size, MAX32),
+        len(name), len(extra), 0, 0, 0, (m["st_mode"] & 0xFFFF) << 16, min(offset, MAX32)
+    ) + name + extra
+
+
+def _write_central(out, members, offsets):
+    cd_start = out.tell()
+    for m, off in zip(members, offsets):
+        out.write(_central_entry(m, off))
+    cd_size = out.tell() - cd_start
+    count = len(members)
+    if count >= MAX16 or cd_start >= MAX32 or cd_size >= MAX32:
+        z64 = out.tell()
+        out.write(ZIP64_END.pack(0x06064B50, 44, (3 << 8) | 45, 45, 0, 0,
+                                 count, count, cd_size, cd_start))
+        out.write(ZIP64_LOCATOR.pack(0x07064B50, 0, z64, 1))
+    out.write(END_RECORD.pack(0x06054B50, 0, 0, min(count, MAX16), min(count, MAX16),
+                              min(cd_size, MAX32), min(cd_start, MAX32), 0))
+
+
+def _write_archive(out_path, members, cache_dir, mode, level):
+    tmp = out_path + ".tmp"
+    with open(tmp, "wb") as out:
+        offsets = [_write_member(out, m, cache_dir, mode, level) for m in members]
+        _write_central(out, members, offsets)
+    os.replace(tmp, out_path)
+
+
+# ---------- in-memory members ----------
+
+def compress_bytes(data, mode="deflate", level=None):
+    # -> (method, crc, payload); safe to call in worker processes
+    level = DEFAULT_LEVEL[mode] if level is None else level
+    crc = zlib.crc32(data)
+    if mode != "store":
+        comp = _compressor(mode, level)
+        payload = comp.compress(data) + comp.flush()
+        if len(payload) < len(data):
+            return METHODS[mode], crc, payload
+    return STORED, crc, data
+
+
+class ArchiveWriter:
+    # Streams generated members (no source file, no cache) into one archive.
+    # Members compressed elsewhere (compress_bytes in a worker) are added
+    # with add_compressed; the file is moved into place on close().
+    def __init__(self, out_path, mode="deflate", level=None):
+        if mode not in METHODS:
+            raise ValueError(f"[C13B0] Unknown zip mode: {mode}")
+        if mode == "zstd" and zstandard is None:
+            raise ImportError("[C13B0] zstd mode needs the zstandard package")
+        self.out_path = out_path
+        self.mode = mode
+        self.level = DEFAULT_LEVEL[mode] if level is None else level
+        self.members = []
+        self.offsets = []
+        self.mtime_ns = time.time_ns()
+        self._tmp = out_path + ".tmp"
+        self._out = open(self._tmp, "wb")
+
+    def add(self, arc, data):
+        self.add_compressed(arc, len(data), *compress_bytes(data, self.mode, self.level))
+
+    def add_compressed(self, arc, size, method, crc, payload):
+        m = {"arc": arc, "size": size, "csize": len(payload), "method": method, "crc": crc,
+             "mtime_ns": self.mtime_ns, "st_mode": 0o100644}
+        self.offsets.append(_write_local(self._out, m))
+        self._out.write(payload)
+        self.members.append(m)
+
+    def __len__(self):
+        return len(self.members)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def close(self):
+        if self._out is None:
+            return
+        _write_central(self._out, self.members, self.offsets)
+        self._out.close()
+        self._out = None
+        os.replace(self._tmp, self.out_path)
+
+    def abort(self):
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+            os.remove(self._tmp)
+
+
+# ---------- builds ----------
+
+def _manifest_path(out_path):
+    return out_path + ".manifest.json"
+
+
+def _load_manifest(out_path):
+    path = _manifest_path(out_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _archive_sig(out_path):
+    st = os.stat(out_path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def build_many(jobs, mode="deflate", level=None, workers=None, cache_dir=CACHE_DIR):
+    # jobs: [(out_path, [(path, arcname), ...]), ...]. Every member of every
+    # archive goes through one process pool, then each archive is written.
+    if mode not in METHODS:
+        raise ValueError(f"[C13B0] Unknown zip mode: {mode}")
+    if mode == "zstd" and zstandard is None:
+        raise ImportError("[C13B0] zstd mode needs the zstandard package")
+    level = DEFAULT_LEVEL[mode] if level is None else level
+
+    plans = []
+    tasks = {}
+    for out_path, pairs in jobs:
+        old = _load_manifest(out_path)
+        known = {}
+        if old and old.get("mode") == mode and old.get("level") == level:
+            known = {m["path"]: m for m in old["members"]}
+
+        members = []
+        for path, arc in pairs:
+            st = os.stat(path)
+            m = {"path": path, "arc": arc, "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                 "st_mode": st.st_mode}
+            prev = known.get(path)
+            if prev and prev["size"] == m["size"] and prev["mtime_ns"] == m["mtime_ns"]:
+                m["known"] = (prev["sha"], prev["crc"])
+            members.append(m)
+            if path not in tasks:
+                tasks[path] = (path, m.get("known"), mode, level, cache_dir)
+
+        fresh = (
+            old is not None
+            and os.path.exists(out_path)
+            and old.get("archive") == _archive_sig(out_path)
+            and [(m["path"], m["arc"]) for m in old["members"]] == [(m["path"], m["arc"]) for m in members]
+            and all("known" in m for m in members)
+        )
+        plans.append((out_path, members, fresh))
+
+    needed = sorted({m["path"] for _, members, fresh in plans if not fresh for m in members})
+    # members with a known hash only need a cache lookup; the rest are
+    # hashed (and compressed on a cache miss) in the pool
+    results = {p: _prepare(tasks[p]) for p in needed if tasks[p][1]}
+    todo = [p for p in needed if p not in results]
+    if todo:
+        if len(todo) == 1 or workers == 1:
+            results.update((p, _prepare(tasks[p])) for p in todo)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunk = max(1, len(todo) // ((workers or os.cpu_count() or 1) * 8))
+                results.update(zip(todo, pool.map(_prepare, [tasks[p] for p in todo], chunksize=chunk)))
+
+    summary = {"archives": 0, "skipped": 0, "members": 0, "compressed": 0}
+    for out_path, members, fresh in plans:
+        if fresh:
+            summary["skipped"] += 1
+            continue
+        for m in members:
+            m.pop("known", None)
+            m.update(results[m["path"]])
+            summary["compressed"] += m.pop("compressed")
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        _write_archive(out_path, members, cache_dir, mode, level)
+        manifest = {"mode": mode, "level": level, "archive": _archive_sig(out_path),
+                    "members": members}
+        tmp = _manifest_path(out_path) + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, _manifest_path(out_path))
+        summary["archives"] += 1
+        summary["members"] += len(members)
+    return summary
+
+
+def build_zip(out_path, members, mode="deflate", level=None, workers=None, cache_dir=CACHE_DIR):
+    return build_many([(out_path, members)], mode, level, workers, cache_dir)
+
+
+def zip_mode(argv, default="deflate"):
+    # --zip-mode store|deflate|zstd
+    if "--zip-mode" in argv:
+        return argv[argv.index("--zip-mode") + 1]
+    return default
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("usage: c13b0_zip.py OUT.zip SRC_DIR [--zip-mode store|deflate|zstd]")
+        sys.exit(1)
+    stats = build_zip(sys.argv[1], tree_members(sys.argv[2]), zip_mode(sys.argv))
+    print(f"[C13B0] {sys.argv[1]}: {stats}")
@@ -19,6 +19,8 @@ CLI:
 
 import sys, os, json, time, hashlib
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART = os.path.join(ROOT, "artifacts")
@@ -30,9 +32,7 @@ INDEX = os.path.join(DATA, "ziphash_index.json")
 
 DEFAULT_INDEX = {"tokens": {}}
 
-def audit(entry: dict):
-    entry = dict(entry); entry["t"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-    with open(AUDIT, "a", encoding="utf-8") as f: f.write(json.dumps(entry) + "\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load_index() -> dict:
     if not os.path.exists(INDEX): return DEFAULT_INDEX.copy()
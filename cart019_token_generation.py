@@ -19,6 +19,8 @@ CLI:
 
 import sys, os, json, time
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART = os.path.join(ROOT, "artifacts")
@@ -32,9 +34,7 @@ UPLOADS = os.path.join(DATA, "uploads.json")
 DEFAULT_WALLETS = {"users": {}}
 DEFAULT_UPLOADS = {"items": []}
 
-def audit(entry: dict):
-    entry = dict(entry); entry["t"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-    with open(AUDIT, "a", encoding="utf-8") as f: f.write(json.dumps(entry) + "\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load_wallets() -> dict:
     if not os.path.exists(WALLET): return DEFAULT_WALLETS.copy()
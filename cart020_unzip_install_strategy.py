@@ -14,6 +14,8 @@ CLI:
 
 import sys, os, json, time
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART = os.path.join(ROOT, "artifacts")
@@ -25,9 +27,7 @@ MANIFEST = os.path.join(ART, "index_manifest.json")
 
 DEFAULT_MANIFEST = {"items": []}
 
-def audit(entry: dict):
-    entry = dict(entry); entry["t"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-    with open(AUDIT, "a", encoding="utf-8") as f: f.write(json.dumps(entry) + "\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load_manifest() -> dict:
     if not os.path.exists(MANIFEST): return DEFAULT_MANIFEST.copy()
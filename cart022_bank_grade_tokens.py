@@ -16,6 +16,8 @@ CLI:
 
 import sys, os, json, time, hashlib
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART = os.path.join(ROOT, "artifacts")
@@ -28,9 +30,7 @@ VAULTS = os.path.join(DATA, "vaults_index.json")
 
 DEFAULT_VAULTS = {"vaults": {}}
 
-def audit(entry: dict):
-    entry = dict(entry); entry["t"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-    with open(AUDIT, "a", encoding="utf-8") as f: f.write(json.dumps(entry) + "\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load(path: str, default: dict) -> dict:
     if not os.path.exists(path): return default.copy()
@@ -15,6 +15,8 @@ Core concepts:
 - Transmission T(E) from Green’s function: T(E) = Tr[Γ_L G^r Γ_R G^a]
 - Landauer conductance: G = (2e^2/h) * T(E_F)
 - Current under small bias: I ≈ G * V (linear response), or finite-bias integral with Fermi weights
+- With NumPy installed, T(E) for a whole energy grid comes from one batched recursive
+  Green's function pass (the device is nearest-neighbour); without it, the pure-Python path is used
 
 Artifacts:
 - JSON files under artifacts/ with spectra, conductance, and I–V estimates
@@ -30,6 +32,13 @@ CLI:
 import sys, os, json, time, math
 from typing import Dict, Any, List, Tuple
 
+import c13b0_audit as audit_log
+
+try:
+    import numpy as np
+except ImportError:  # pure-Python path below still works
+    np = None
+
 # ---------- Paths ----------
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
@@ -44,11 +53,7 @@ H_PLANCK = 6.62607015e-34   # J*s
 HBAR = H_PLANCK / (2.0 * math.pi)
 G0 = 2.0 * (E_CHARGE**2) / H_PLANCK  # Quantum of conductance (≈ 7.748e-5 S)
 
-def audit(entry: Dict[str, Any]) -> None:
-    entry = dict(entry)
-    entry["t"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-    with open(AUDIT, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def save_artifact(name: str, obj: Dict[str, Any]) -> str:
     path = os.path.join(ART, f"{name}.json")
@@ -180,7 +185,7 @@ def greens_function(E: float, H, SigmaL, SigmaR, eta: float) -> List[List[comple
       η → thermal/environmental decoherence; higher spreads resonances and reduces peak T(E).
     """
     N = len(H)
-    M = mat_scalar_add(eye(N), complex(E, eta))
+    M = mat_scalar_add(zeros(N), complex(E, eta))
     M = mat_sub(M, H)
     M = mat_sub(M, SigmaL)
     M = mat_sub(M, SigmaR)
@@ -198,12 +203,84 @@ def transmission(E: float, H, SigmaL, SigmaR, eta: float) -> float:
     T = mat_trace(Tmat)
     return float(T.real)
 
+# ---------- Array backend (NumPy, batched over energies) ----------
+def _diag(A) -> List[complex]:
+    return [A[i][i] for i in range(len(A))]
+
+def _is_tridiagonal(H) -> bool:
+    n = len(H)
+    for i in range(n):
+        row = H[i]
+        for j in range(n):
+            if abs(i - j) > 1 and row[j] != 0:
+                return False
+    return True
+
+def _only_corner(S, k: int) -> bool:
+    n = len(S)
+    return all(S[i][j] == 0 for i in range(n) for j in range(n) if not (i == j == k))
+
+def transmission_rgf(Es, H, SigmaL, SigmaR, eta: float):
+    """
+    Recursive Green's function for a nearest-neighbour device contacted at
+    its two ends. Only G^r_{1N} is needed since Γ_L, Γ_R live on the first
+    and last site:  T(E) = Γ_L,11 Γ_R,NN |G^r_{1N}(E)|^2.
+    Each recursion step is one vectorized operation over the whole energy grid.
+    """
+    N = len(H)
+    z = np.asarray(Es, dtype=float) + 1j * eta
+    onsite = np.array(_diag(H), dtype=complex) + np.array(_diag(SigmaL), dtype=complex) + np.array(_diag(SigmaR), dtype=complex)
+    hop = np.array([H[i][i+1] for i in range(N-1)], dtype=complex)
+    hop_back = np.array([H[i+1][i] for i in range(N-1)], dtype=complex)
+
+    # left-connected diagonal g_kk and corner g_1k, swept site by site
+    g_kk = 1.0 / (z - onsite[0])
+    g_1k = g_kk
+    for k in range(1, N):
+        g_kk = 1.0 / (z - onsite[k] - hop_back[k-1] * g_kk * hop[k-1])
+        g_1k = g_1k * hop[k-1] * g_kk
+
+    gL = (1j * (SigmaL[0][0] - SigmaL[0][0].conjugate())).real
+    gR = (1j * (SigmaR[N-1][N-1] - SigmaR[N-1][N-1].conjugate())).real
+    return gL * gR * np.abs(g_1k) ** 2
+
+def transmission_dense(Es, H, SigmaL, SigmaR, eta: float):
+    """
+    General fallback for non-tridiagonal devices: one batched solve over the
+    stacked (E + iη)I - H - Σ matrices.
+    """
+    N = len(H)
+    Hm = np.array(H, dtype=complex)
+    SL = np.array(SigmaL, dtype=complex)
+    SR = np.array(SigmaR, dtype=complex)
+    GL = 1j * (SL - SL.conj().T)
+    GR = 1j * (SR - SR.conj().T)
+    z = np.asarray(Es, dtype=float) + 1j * eta
+    M = z[:, None, None] * np.eye(N) - (Hm + SL + SR)
+    Gr = np.linalg.inv(M)
+    Ga = np.conj(np.transpose(Gr, (0, 2, 1)))
+    return np.einsum("ij,ejk,kl,eli->e", GL, Gr, GR, Ga).real
+
+def transmission_grid(Es: List[float], H, SigmaL, SigmaR, eta: float) -> List[float]:
+    """
+    T(E) for every energy in Es. Uses the NumPy backend when available and
+    the pure-Python Gauss–Jordan path otherwise.
+    """
+    if np is None or not Es:
+        return [transmission(E, H, SigmaL, SigmaR, eta) for E in Es]
+    N = len(H)
+    if _is_tridiagonal(H) and _only_corner(SigmaL, 0) and _only_corner(SigmaR, N-1):
+        T = transmission_rgf(Es, H, SigmaL, SigmaR, eta)
+    else:
+        T = transmission_dense(Es, H, SigmaL, SigmaR, eta)
+    return [float(x) for x in T]
+
 # ---------- Conductance and I–V ----------
 def conductance_at_ef(EF: float, H, SigmaL, SigmaR, eta: float) -> float:
     """
     G = G0 * T(EF)
     """
-    Tef = transmission(EF, H, SigmaL, SigmaR, eta)
+    Tef = transmission_grid([EF], H, SigmaL, SigmaR, eta)[0]
     return G0 * Tef
 
 def iv_linear(EF: float, H, SigmaL, SigmaR, eta: float, Vlist: List[float]) -> List[Dict[str, float]]:
@@ -218,7 +295,8 @@ def iv_linear(EF: float, H, SigmaL, SigmaR, eta: float, Vlist: List[float]) -> L
 # ---------- Spectrum ----------
 def spectrum(Emin: float, Emax: float, steps: int, H, SigmaL, SigmaR, eta: float) -> List[Dict[str, float]]:
     Es = [Emin + i*(Emax - Emin)/(steps - 1) for i in range(steps)]
-    rows = [{"E": round(E,6), "T": max(0.0, transmission(E, H, SigmaL, SigmaR, eta))} for E in Es]
+    Ts = transmission_grid(Es, H, SigmaL, SigmaR, eta)
+    rows = [{"E": round(E,6), "T": max(0.0, T)} for E, T in zip(Es, Ts)]
     return rows
 
 # ---------- Sensitivity sweep ----------
@@ -305,7 +383,7 @@ def cmd_sweep(args, kv):
         if a == "--vals" and i+1 < len(args): vals = [float(x) for x in args[i+1].split(",")]
     if not param or not vals:
         print(json.dumps({"error": "Provide --param and --vals"}, indent=2)); return
-    base = {k: float(v) if k not in ("N","steps","Vsteps") else int(v) for k,v in kv.items()}
+    base = {k: float(v) if k not in ("N","steps","Vsteps") else int(v) for k,v in kv.items() if k not in ("param","vals")}
     rows = sweep_param(param, vals, base)
     art = {"base": base, "param": param, "rows": rows, "physical": annotate_physical(base)}
     path = save_artifact(f"qt_sweep_{param}_{int(time.time())}", art)
@@ -24,6 +24,8 @@ CLI:
 import os, sys, json, time
 from typing import Dict, Any, List
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART = os.path.join(ROOT, "artifacts")
@@ -45,11 +47,7 @@ DEFAULT_VISIBILITY = {"paths": {"artifacts": ART, "data": DATA, "logs": LOGS}, "
 def now_iso() -> str:
     return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
 
-def audit(entry: Dict[str, Any]) -> None:
-    entry = dict(entry)
-    entry["t"] = now_iso()
-    with open(AUDIT, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load(path: str, default: Dict[str, Any]) -> Dict[str, Any]:
     if not os.path.exists(path): return default.copy()
@@ -19,6 +19,8 @@ CLI:
 
 import sys, os, json, time
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART = os.path.join(ROOT, "artifacts")
@@ -27,9 +29,7 @@ os.makedirs(LOGS, exist_ok=True); os.makedirs(ART, exist_ok=True); os.makedirs(D
 
 AUDIT = os.path.join(LOGS, "aox_devices_audit.jsonl")
 
-def audit(entry: dict):
-    entry = dict(entry); entry["t"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-    with open(AUDIT, "a", encoding="utf-8") as f: f.write(json.dumps(entry) + "\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def save_artifact(name: str, obj: dict) -> str:
     p = os.path.join(ART, f"{name}.json")
@@ -22,6 +22,8 @@ CLI:
 
 import sys, os, json, time, random
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART  = os.path.join(ROOT, "artifacts")
@@ -40,9 +42,7 @@ DEFAULT_DB = {
 # ---------- Utilities ----------
 def now_iso(): return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
 
-def audit(entry: dict):
-    entry = dict(entry); entry["t"] = now_iso()
-    with open(AUDIT, "a", encoding="utf-8") as f: f.write(json.dumps(entry) + "\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load_db() -> dict:
     if not os.path.exists(FACTORY_DB): return DEFAULT_DB.copy()
@@ -17,6 +17,8 @@ CLI:
 
 import sys, os, json, time
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs"); os.makedirs(LOGS, exist_ok=True)
 ART = os.path.join(ROOT, "artifacts"); os.makedirs(ART, exist_ok=True)
@@ -28,9 +30,7 @@ DEFAULT = {"machines": []}
 
 CAP_LENSES = ["compute","storage","network","safety","provenance","governance","energy","ecosystem"]
 
-def audit(e): 
-    e=dict(e); e["t"]=time.strftime("%Y-%m-%dT%H:%M:%S",time.gmtime())
-    with open(AUDIT,"a",encoding="utf-8") as f: f.write(json.dumps(e)+"\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load(): 
     if not os.path.exists(REG): return DEFAULT.copy()
@@ -17,14 +17,15 @@ CLI:
 
 import sys, os, json, time
 
+import c13b0_audit as audit_log
+
 ROOT=os.path.dirname(os.path.abspath(__file__))
 LOGS=os.path.join(ROOT,"logs"); os.makedirs(LOGS,exist_ok=True)
 ART=os.path.join(ROOT,"artifacts"); os.makedirs(ART,exist_ok=True)
 
 AUDIT=os.path.join(LOGS,"superchem_fireproof_audit.jsonl")
 
-def audit(e): e=dict(e); e["t"]=time.strftime("%Y-%m-%dT%H:%M:%S",time.gmtime()); 
-with open(AUDIT,"a",encoding="utf-8") as f: f.write(json.dumps(e)+"\n")
+audit = audit_log.open_log(AUDIT).audit
 
 ELEMENTS=[
     {"symbol":"C","name":"Carbon","EN":2.55,"MP_C":3823,"notes":"versatile"},
@@ -24,6 +24,8 @@ CLI:
 
 import sys, os, json, time
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART  = os.path.join(ROOT, "artifacts")
@@ -35,9 +37,7 @@ MISSIONS = os.path.join(DATA, "drones_missions.json")
 DEFAULT_MISSIONS = {"missions": {}}
 
 def now(): return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-def audit(entry: dict): 
-    entry=dict(entry); entry["t"]=now()
-    with open(AUDIT, "a", encoding="utf-8") as f: f.write(json.dumps(entry)+"\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load_missions():
     if not os.path.exists(MISSIONS): return DEFAULT_MISSIONS.copy()
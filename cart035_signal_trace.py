@@ -23,6 +23,8 @@ CLI:
 
 import sys, os, json, time
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART  = os.path.join(ROOT, "artifacts")
@@ -34,8 +36,7 @@ TRACES = os.path.join(DATA, "signal_traces.json")
 DEFAULT_TRACES = {"traces": {}}
 
 def now(): return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-def audit(e): e=dict(e); e["t"]=now(); 
-with open(AUDIT,"a",encoding="utf-8") as f: f.write(json.dumps(e)+"\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load():
     if not os.path.exists(TRACES): return DEFAULT_TRACES.copy()
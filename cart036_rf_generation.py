@@ -22,6 +22,8 @@ CLI:
 
 import sys, os, json, time, math, random
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART  = os.path.join(ROOT, "artifacts")
@@ -30,8 +32,7 @@ os.makedirs(LOGS, exist_ok=True); os.makedirs(ART, exist_ok=True)
 AUDIT = os.path.join(LOGS, "rf_generation_audit.jsonl")
 
 def now(): return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-def audit(e): e=dict(e); e["t"]=now(); 
-with open(AUDIT,"a",encoding="utf-8") as f: f.write(json.dumps(e)+"\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def save_artifact(name,obj):
     p=os.path.join(ART,f"{name}.json")
@@ -22,6 +22,8 @@ CLI:
 
 import sys, os, json, time, random
 
+import c13b0_audit as audit_log
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART  = os.path.join(ROOT, "artifacts")
@@ -33,8 +35,7 @@ BANK  = os.path.join(DATA, "neuromorphic_bank.json")
 DEFAULT_BANK = {"features": [], "temporal": [], "graphs": []}
 
 def now(): return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-def audit(e): e=dict(e); e["t"]=now(); 
-with open(AUDIT,"a",encoding="utf-8") as f: f.write(json.dumps(e)+"\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load_bank():
     if not os.path.exists(BANK): return DEFAULT_BANK.copy()
@@ -10,6 +10,8 @@ Core improvements:
 - Crosslinks to carts 034 (drones), 035 (signal trace), 036 (RF generation), 037 (neuromorphic), 039 (crosslinker).
 - Dream journal planner mapped to tokens with safe, creative narratives.
 - Index and search across blocks, routes, tags, and manifests.
+- Blocks live in an append-only block file (c13b0_dna_store.py): 2-bit packed
+  bases, one hash per chunk, decode and route checks seek by block id.
 - Health checks and export pack for SPA consumption.
 
 CLI:
@@ -29,6 +31,9 @@ CLI:
 
 import sys, os, json, time, hashlib, random
 
+import c13b0_audit as audit_log
+import c13b0_dna_store as dna_store
+
 # Paths
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
@@ -39,13 +44,14 @@ os.makedirs(LOGS, exist_ok=True); os.makedirs(ART, exist_ok=True); os.makedirs(D
 # Files
 AUDIT      = os.path.join(LOGS, "genetics_substrate_v2_audit.jsonl")
 STORE      = os.path.join(DATA, "substrate_store_v2.json")
+BLOCK_DIR  = os.path.join(DATA, "substrate_blocks_v2")
 INDEX      = os.path.join(DATA, "substrate_index_v2.json")
 MANIFESTS  = os.path.join(DATA, "substrate_manifests_v2.json")
 
 # Defaults
+# blocks ({id, bases[4], char, tag, chunk_id, hash}) and chunks (groups of
+# block ids) are in BLOCK_DIR; the JSON store keeps routes, catalog, counters
 DEFAULT_STORE = {
-    "blocks": [],         # list of {id, bases[4], char, tag, chunk_id, hash}
-    "chunks": [],         # group of block ids for logical chunking
     "routes": [],         # list of {tag, block_id, created}
     "substrates": [       # catalog
         {"key":"glass","desc":"Stable optical-grade storage metaphor","scores":{"stability":0.9,"flexibility":0.3,"compute":0.4}},
@@ -57,9 +63,10 @@ DEFAULT_STORE = {
 }
 
 DEFAULT_INDEX = {
-    "blocks_by_tag": {},  # tag -> [block_id]
+    "blocks_by_tag": {},  # tag -> [[first_block_id, last_block_id], ...]
     "tags": [],           # all tags
-    "search_cache": {}    # q -> results
+    "search_cache": {},   # q -> {tags, blocks: hit count}
+    "indexed_chunks": 0   # chunks of BLOCK_DIR already in blocks_by_tag
 }
 
 DEFAULT_MANIFESTS = {
@@ -67,13 +74,18 @@ DEFAULT_MANIFESTS = {
 }
 
 BASES = ["A","C","G","T"]
+_blocks = None
+
+def block_store() -> dna_store.BlockStore:
+    # opened on first use, so importing the cart creates no block files
+    global _blocks
+    if _blocks is None: _blocks = dna_store.BlockStore(BLOCK_DIR)
+    return _blocks
 
 # Utilities
 def now(): return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
 
-def audit(entry: dict):
-    entry = dict(entry); entry["t"] = now()
-    with open(AUDIT, "a", encoding="utf-8") as f: f.write(json.dumps(entry) + "\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def load(path: str, default: dict) -> dict:
     if not os.path.exists(path): return default.copy()
@@ -90,6 +102,15 @@ def save_artifact(name: str, obj: dict) -> str:
     with open(p, "w", encoding="utf-8") as f: json.dump(obj, f, indent=2)
     return p
 
+def load_store() -> dict:
+    store = load(STORE, DEFAULT_STORE)
+    if "blocks" in store or "chunks" in store:
+        # older layout: move the block and chunk lists to BLOCK_DIR once
+        blocks = store.pop("blocks", []); chunks = store.pop("chunks", [])
+        if not len(block_store()): block_store().import_legacy(blocks, chunks)
+        save(STORE, store)
+    return store
+
 def sha256_obj(obj: dict) -> str:
     return hashlib.sha256(json.dumps(obj, sort_keys=True).encode("utf-8")).hexdigest()
 
@@ -100,42 +121,19 @@ def encode_text(text: str, chunk_size: int, tag: str) -> dict:
     - Each char -> base quad derived from ord%4 rotated.
     - Blocks grouped into chunks to ease retrieval.
     """
-    store = load(STORE, DEFAULT_STORE)
-    blocks = []; chunks = []
-    chunk_id = store["next_chunk_id"]
-    current_chunk = {"chunk_id": chunk_id, "block_ids": [], "tag": tag, "created": now()}
-    for ch in text:
-        v = (ord(ch) % 4)
-        bases = [BASES[(v+j)%4] for j in range(4)]
-        blk = {"id": store["next_block_id"], "char": ch, "bases": bases, "tag": tag, "chunk_id": chunk_id}
-        blk["hash"] = sha256_obj({"char": ch, "bases": bases, "tag": tag, "chunk": chunk_id})
-        blocks.append(blk)
-        current_chunk["block_ids"].append(blk["id"])
-        store["next_block_id"] += 1
-        # move to next chunk when size reached
-        if len(current_chunk["block_ids"]) >= chunk_size:
-            chunks.append(current_chunk)
-            chunk_id = chunk_id + 1
-            current_chunk = {"chunk_id": chunk_id, "block_ids": [], "tag": tag, "created": now()}
-    if current_chunk["block_ids"]:
-        chunks.append(current_chunk)
-    store["blocks"].extend(blocks)
-    store["chunks"].extend(chunks)
-    store["next_chunk_id"] = chunk_id + 1
+    store = load_store()
+    made, store["next_block_id"], store["next_chunk_id"] = block_store().append_text(
+        text, chunk_size, tag, store["next_block_id"], store["next_chunk_id"])
     save(STORE, store)
-    artifact = {"encoded_count": len(blocks), "chunks_made": [c["chunk_id"] for c in chunks], "tag": tag}
+    artifact = {"encoded_count": len(text), "chunks_made": [c["chunk_id"] for c in made], "tag": tag}
     path = save_artifact(f"dna_encode_{int(time.time())}", artifact)
-    audit({"action":"encode","chars":len(text),"blocks":len(blocks),"chunks":len(chunks),"tag":tag})
+    audit({"action":"encode","chars":len(text),"blocks":len(text),"chunks":len(made),"tag":tag})
     return {"ok": True, "path": path, "summary": artifact}
 
 def decode_blocks(block_ids: list) -> dict:
-    store = load(STORE, DEFAULT_STORE)
-    idset = set(block_ids)
-    out_chars = []
-    for b in store["blocks"]:
-        if b["id"] in idset:
-            out_chars.append(b["char"])
-    recovered = "".join(out_chars)
+    load_store()
+    chars = block_store().chars(block_ids)
+    recovered = "".join(chars[i] for i in sorted(chars))
     artifact = {"requested": block_ids, "recovered_text": recovered}
     path = save_artifact(f"dna_decode_{int(time.time())}", artifact)
     audit({"action":"decode","count":len(block_ids)})
@@ -143,7 +141,7 @@ def decode_blocks(block_ids: list) -> dict:
 
 # Substrate selection
 def substrate_list() -> dict:
-    store = load(STORE, DEFAULT_STORE)
+    store = load_store()
     path = save_artifact("substrates_catalog_v2", {"substrates": store["substrates"]})
     audit({"action":"substrate.list","count":len(store["substrates"])})
     return {"ok": True, "path": path, "count": len(store["substrates"])}
@@ -154,7 +152,7 @@ def substrate_select(need: str, weight: float = 0.7) -> dict:
     - need: one of stability, flexibility, compute
     - weight applies to that need; others average in.
     """
-    store = load(STORE, DEFAULT_STORE)
+    store = load_store()
     picks = []
     for s in store["substrates"]:
         sc = s["scores"]
@@ -170,9 +168,8 @@ def substrate_select(need: str, weight: float = 0.7) -> dict:
 
 # Routing with validation/repair
 def route_add(tag: str, block_id: int) -> dict:
-    store = load(STORE, DEFAULT_STORE)
-    exists = any(b["id"] == block_id for b in store["blocks"])
-    if not exists:
+    store = load_store()
+    if not block_store().exists(block_id):
         audit({"action":"route.add","error":"block_missing","block_id":block_id})
         return {"ok": False, "error": "block not found"}
     store["routes"].append({"tag": tag, "block_id": block_id, "created": now()})
@@ -182,9 +179,9 @@ def route_add(tag: str, block_id: int) -> dict:
     return {"ok": True, "path": path}
 
 def route_validate() -> dict:
-    store = load(STORE, DEFAULT_STORE)
+    store = load_store()
     valid = []; broken = []
-    block_ids = set(b["id"] for b in store["blocks"])
+    block_ids = set(block_store().chars([r["block_id"] for r in store["routes"]]))
     for r in store["routes"]:
         if r["block_id"] in block_ids:
             valid.append(r)
@@ -200,31 +197,51 @@ def route_validate() -> dict:
     return {"ok": True, "path": path, "summary": artifact}
 
 # Index and search
+def index_update(idx: dict) -> dict:
+    """
+    Bring blocks_by_tag up to date with the chunks appended since the last
+    update (an index in the older per-id layout is rebuilt).
+    """
+    if "indexed_chunks" not in idx:
+        idx = {"blocks_by_tag": {}, "tags": [], "search_cache": idx.get("search_cache", {}), "indexed_chunks": 0}
+    for c in block_store().chunks(body=False, start=idx["indexed_chunks"]):
+        ranges = idx["blocks_by_tag"].setdefault(c["tag"] or "untagged", [])
+        last = c["first"] + c["count"] - 1
+        if ranges and ranges[-1][1] + 1 == c["first"]: ranges[-1][1] = last
+        else: ranges.append([c["first"], last])
+        idx["indexed_chunks"] += 1
+    idx["tags"] = sorted(idx["blocks_by_tag"].keys())
+    return idx
+
 def index_build() -> dict:
-    store = load(STORE, DEFAULT_STORE)
-    idx = {"blocks_by_tag": {}, "tags": [], "search_cache": {}}
-    for b in store["blocks"]:
-        tag = b.get("tag", "untagged")
-        idx["blocks_by_tag"].setdefault(tag, []).append(b["id"])
-    idx["tags"] = sorted([t for t in idx["blocks_by_tag"].keys()])
+    load_store()
+    idx = index_update(load(INDEX, DEFAULT_INDEX))
+    idx["search_cache"] = {}
     save(INDEX, idx)
     path = save_artifact("substrate_index_v2", idx)
     audit({"action":"index.build","tags":len(idx['tags'])})
     return {"ok": True, "path": path, "tags": idx["tags"]}
 
 def search(q: str) -> dict:
-    idx = load(INDEX, DEFAULT_INDEX)
-    store = load(STORE, DEFAULT_STORE)
+    load_store()
+    idx = index_update(load(INDEX, DEFAULT_INDEX))
+    ql = q.lower()
     # naive search across tags and chars
     hits = {"tags": [], "blocks": []}
     for tag in idx.get("tags", []):
-        if q.lower() in tag.lower():
+        if ql in tag.lower():
             hits["tags"].append(tag)
-    for b in store["blocks"]:
-        if q.lower() in (b["char"] or "").lower() or q.lower() in (b.get("tag","") or "").lower():
-            hits["blocks"].append({"id": b["id"], "char": b["char"], "tag": b.get("tag","")})
+    for c in block_store().chunks():
+        tag = c["tag"]
+        if ql in tag.lower():
+            hits["blocks"].extend({"id": c["first"] + k, "char": ch, "tag": tag} for k, ch in enumerate(c["text"]))
+            continue
+        match = {ch for ch in set(c["text"]) if ql in ch.lower()}
+        if match:
+            hits["blocks"].extend({"id": c["first"] + k, "char": ch, "tag": tag}
+                                  for k, ch in enumerate(c["text"]) if ch in match)
     # cache
-    idx.setdefault("search_cache", {})[q] = hits
+    idx.setdefault("search_cache", {})[q] = {"tags": hits["tags"], "blocks": len(hits["blocks"])}
     save(INDEX, idx)
     path = save_artifact(f"substrate_search_{int(time.time())}", {"q": q, "hits": hits})
     audit({"action":"search","q":q,"tags":len(hits['tags']),"blocks":len(hits['blocks'])})
@@ -270,12 +287,13 @@ def manifest_make(name: str, mission: str, trace: str, tile: str, bank: str) ->
 
 # Health and export
 def health() -> dict:
-    store = load(STORE, DEFAULT_STORE)
+    store = load_store()
     idx   = load(INDEX, DEFAULT_INDEX)
     man   = load(MANIFESTS, DEFAULT_MANIFESTS)
+    stats = block_store().stats()
     summary = {
-        "blocks": len(store["blocks"]),
-        "chunks": len(store["chunks"]),
+        "blocks": stats["blocks"],
+        "chunks": stats["chunks"],
         "routes": len(store["routes"]),
         "tags": len(idx.get("tags", [])),
         "bundles": len(man.get("bundles", []))
@@ -285,7 +303,8 @@ def health() -> dict:
     return {"ok": True, "path": path, "summary": summary}
 
 def export_all() -> dict:
-    store = load(STORE, DEFAULT_STORE)
+    store = load_store()
+    store = dict(store, blocks=list(block_store().blocks()), chunks=list(block_store().legacy_chunks()))
     idx   = load(INDEX, DEFAULT_INDEX)
     man   = load(MANIFESTS, DEFAULT_MANIFESTS)
     pack = {"store": store, "index": idx, "manifests": man, "exported": now()}
@@ -6,11 +6,16 @@ Safe, computational engine for encoding/decoding "binary bricks" and word packet
 - Packetization: break text into letters and words; scramble safely
 - Shell routing: produce manifests linking to hydrogen shell (cart041)
 - Artifacts + JSONL audit logs
+- Bricks, packets and routes are append-only record logs (c13b0_dna_store.py),
+  looked up by id instead of reloading and rewriting one JSON store
 """
 
 import sys, os, json, time, hashlib, random
 from typing import List, Dict
 
+import c13b0_audit as audit_log
+import c13b0_dna_store as dna_store
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART  = os.path.join(ROOT, "artifacts")
@@ -18,26 +23,26 @@ DATA = os.path.join(ROOT, "data")
 os.makedirs(LOGS, exist_ok=True); os.makedirs(ART, exist_ok=True); os.makedirs(DATA, exist_ok=True)
 
 AUDIT = os.path.join(LOGS, "dna_engine_audit.jsonl")
-STORE = os.path.join(DATA, "dna_engine_store.json")
-
-DEFAULT = {
-    "bricks": [],    # {id, zeros, meta}
-    "packets": [],   # {id, word, letters, scrambled, brick_id, hash}
-    "routes": []     # {packet_id, shell_hint, created}
-}
+STORE = os.path.join(DATA, "dna_engine_store.json")     # older layout, moved to the logs below
+BRICKS  = os.path.join(DATA, "dna_engine_bricks.jsonl")   # {id, zeros_len, meta}
+PACKETS = os.path.join(DATA, "dna_engine_packets.jsonl")  # {id, word, letters, scrambled, brick_id, hash}
+ROUTES  = os.path.join(DATA, "dna_engine_routes.jsonl")   # {packet_id, shell_hint, created}
 
 def now(): return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-def audit(e: Dict): e=dict(e); e["t"]=now(); 
-with open(AUDIT,"a",encoding="utf-8") as f: f.write(json.dumps(e)+"\n")
-
-def load() -> Dict:
-    if not os.path.exists(STORE): return DEFAULT.copy()
-    try:
-        with open(STORE,"r",encoding="utf-8") as f: return json.load(f)
-    except: return DEFAULT.copy()
+audit = audit_log.open_log(AUDIT).audit
 
-def save(obj: Dict):
-    with open(STORE,"w",encoding="utf-8") as f: json.dump(obj,f,indent=2)
+def open_log(path: str) -> dna_store.RecordLog:
+    if os.path.exists(STORE):
+        # older layout: move the JSON store into the record logs once
+        try:
+            with open(STORE,"r",encoding="utf-8") as f: db=json.load(f)
+        except: db={}
+        dna_store.RecordLog(BRICKS).append({"id":b["id"],"zeros_len":len(b.get("zeros","")),"meta":b.get("meta",{})}
+                                           for b in db.get("bricks",[]))
+        dna_store.RecordLog(PACKETS).append(db.get("packets",[]))
+        dna_store.RecordLog(ROUTES).append(db.get("routes",[]), key=None)
+        os.replace(STORE, STORE+".migrated")
+    return dna_store.RecordLog(path)
 
 def save_artifact(name: str, obj: Dict) -> str:
     p=os.path.join(ART,f"{name}.json")
@@ -48,7 +53,7 @@ def save_artifact(name: str, obj: Dict) -> str:
 def make_brick(zeros_len: int, meta: Dict = None) -> Dict:
     zeros = "0" * max(1, zeros_len)
     brick = {"id": hashlib.sha1(f"{zeros_len}-{now()}".encode()).hexdigest()[:12], "zeros": zeros, "meta": meta or {}}
-    db=load(); db["bricks"].append(brick); save(db)
+    open_log(BRICKS).append([{"id":brick["id"],"zeros_len":len(zeros),"meta":brick["meta"]}])
     path=save_artifact(f"dna_brick_{brick['id']}", brick)
     audit({"action":"brick.make","id":brick["id"],"zeros_len":zeros_len})
     return {"ok":True,"path":path,"brick":brick}
@@ -67,20 +72,18 @@ def packetize(text: str, brick_id: str) -> Dict:
                 "word": w, "letters": letters, "scrambled": scrambled, "brick_id": brick_id}
         packet["hash"] = hashlib.sha256(json.dumps(packet, sort_keys=True).encode()).hexdigest()
         packets.append(packet)
-    db=load(); db["packets"].extend(packets); save(db)
+    open_log(PACKETS).append(packets)
     path=save_artifact(f"dna_packets_{brick_id}_{int(time.time())}", {"brick_id":brick_id,"packets":packets})
     audit({"action":"packetize","brick":brick_id,"count":len(packets)})
     return {"ok":True,"path":path,"count":len(packets),"packets":packets[:3]}
 
 # ---------- Routing to hydrogen shell ----------
 def route_to_shell(packet_id: str, shell_hint: str = "hydrogen_shell"):
-    db=load()
-    exists=any(p["id"]==packet_id for p in db["packets"])
-    if not exists:
+    if packet_id not in open_log(PACKETS):
         audit({"action":"route.shell","error":"packet_missing","packet_id":packet_id})
         return {"ok":False,"error":"packet not found"}
     r={"packet_id":packet_id,"shell_hint":shell_hint,"created":now()}
-    db["routes"].append(r); save(db)
+    open_log(ROUTES).append([r], key=None)
     path=save_artifact(f"dna_route_shell_{packet_id}", r)
     audit({"action":"route.shell","packet_id":packet_id})
     return {"ok":True,"path":path,"route":r}
@@ -10,6 +10,8 @@ Computational stretch/shrink engine for hydrogen power planning:
 
 import sys, os, json, time
 
+import c13b0_audit as audit_log
+
 ROOT=os.path.dirname(os.path.abspath(__file__))
 LOGS=os.path.join(ROOT,"logs"); os.makedirs(LOGS,exist_ok=True)
 ART=os.path.join(ROOT,"artifacts"); os.makedirs(ART,exist_ok=True)
@@ -17,8 +19,7 @@ ART=os.path.join(ROOT,"artifacts"); os.makedirs(ART,exist_ok=True)
 AUDIT=os.path.join(LOGS,"hydrogen_expansion_audit.jsonl")
 
 def now(): return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
-def audit(e): e=dict(e); e["t"]=now(); 
-with open(AUDIT,"a",encoding="utf-8") as f: f.write(json.dumps(e)+"\n")
+audit = audit_log.open_log(AUDIT).audit
 
 def save_artifact(name,obj):
     p=os.path.join(ART,f"{name}.json")
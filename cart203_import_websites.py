@@ -2,22 +2,22 @@
 # CART203 — Website Validator
 # Validates 250 sites → ensures https + 200 OK → removes 404s
 
-import requests
 import json
 import os
+from c13b0_fetch import Fetcher
 
 INPUT_FILE = "websites_250.txt"
 OUTPUT_FILE = "CART203_VALIDATED_SITES.json"
 
-def validate(url):
+def normalize(url):
     if not url.startswith("http"):
         url = "https://" + url
+    return url
 
-    try:
-        r = requests.get(url, timeout=10)
-        return (r.status_code, url)
-    except:
-        return ("error", url)
+def validate(res):
+    if res.error:
+        return ("error", res.url)
+    return (res.status_code, res.url)
 
 def main():
     if not os.path.exists(INPUT_FILE):
@@ -26,14 +26,17 @@ def main():
     with open(INPUT_FILE, "r") as f:
         sites = [l.strip() for l in f.readlines() if l.strip()]
 
+    urls = [normalize(s) for s in sites]
+
     validated = []
-    for s in sites:
-        status, fixed = validate(s)
-        if status == 200:
-            validated.append(fixed)
-            print(f"[CART203] OK → {fixed}")
-        else:
-            print(f"[CART203] BAD ({status}) → {fixed}")
+    with Fetcher() as fetcher:
+        for res in fetcher.fetch_all(urls):
+            status, fixed = validate(res)
+            if status == 200:
+                validated.append(fixed)
+                print(f"[CART203] OK → {fixed}")
+            else:
+                print(f"[CART203] BAD ({status}) → {fixed}")
 
     output = {
         "total_valid": len(validated),
@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 # CART205 — Pair Fusion Query Builder
 # Creates all 2-term fusion combinations from master dictionary
+#
+# Pairs are streamed into NDJSON shards under CART205_PAIR_FUSION/
+# (resumable), and the TOP_K best-scoring pairs are written to
+# CART205_PAIR_FUSION_TOP.json for CART210.
 
 import json
-import itertools
 import os
+import c13b0_fusion as fusion
 
 INPUT = "CART204_MASTER_DICTIONARY.json"
-OUTPUT = "CART205_PAIR_FUSION.json"
+OUTDIR = "CART205_PAIR_FUSION"
+TOP_OUTPUT = "CART205_PAIR_FUSION_TOP.json"
+TOP_K = 1000
+
+def make_record(pair):
+    a, b = pair
+    return {
+        "pair": [a, b],
+        "query": f"{a} {b}",
+        "score": len(a) + len(b)   # crude relevance; extended later
+    }
 
 def main():
     if not os.path.exists(INPUT):
@@ -17,20 +31,13 @@ def main():
         master = json.load(f)
 
     terms = master["terms"]
-    pairs = list(itertools.combinations(terms, 2))
+    cursor = fusion.write_fusion_shards(terms, [2], make_record, OUTDIR)
 
-    fusion = []
-    for a, b in pairs:
-        fusion.append({
-            "pair": [a, b],
-            "query": f"{a} {b}",
-            "score": len(a) + len(b)   # crude relevance; extended later
-        })
+    top = [make_record(c) for _, c in fusion.best_combinations(terms, 2, TOP_K)]
+    fusion.write_top(TOP_OUTPUT, top)
 
-    with open(OUTPUT, "w") as f:
-        json.dump(fusion, f, indent=4)
-
-    print(f"[CART205] Generated {len(fusion)} fused pairs → {OUTPUT}")
+    print(f"[CART205] Generated {cursor['emitted']} fused pairs → {OUTDIR}")
+    print(f"[CART205] Top {len(top)} pairs → {TOP_OUTPUT}")
 
 if __name__ == "__main__":
     main()
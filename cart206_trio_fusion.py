@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 # CART206 — Trio Fusion Query Builder
 # Creates all 3-term intelligent fusion combinations
+#
+# Trios are streamed into NDJSON shards under CART206_TRIO_FUSION/
+# (resumable), and the TOP_K best-scoring trios are written to
+# CART206_TRIO_FUSION_TOP.json for CART210.
 
 import json
-import itertools
 import os
+import c13b0_fusion as fusion
 
 INPUT = "CART204_MASTER_DICTIONARY.json"
-OUTPUT = "CART206_TRIO_FUSION.json"
+OUTDIR = "CART206_TRIO_FUSION"
+TOP_OUTPUT = "CART206_TRIO_FUSION_TOP.json"
+TOP_K = 1000
+
+def make_record(trio):
+    a, b, c = trio
+    return {
+        "trio": [a, b, c],
+        "query": f"{a} {b} {c}",
+        "complexity_score": len(a) + len(b) + len(c)
+    }
 
 def main():
     if not os.path.exists(INPUT):
@@ -17,21 +31,13 @@ def main():
         master = json.load(f)
 
     terms = master["terms"]
+    cursor = fusion.write_fusion_shards(terms, [3], make_record, OUTDIR)
 
-    trios = list(itertools.combinations(terms, 3))
-    fusion = []
+    top = [make_record(c) for _, c in fusion.best_combinations(terms, 3, TOP_K)]
+    fusion.write_top(TOP_OUTPUT, top)
 
-    for a, b, c in trios:
-        fusion.append({
-            "trio": [a, b, c],
-            "query": f"{a} {b} {c}",
-            "complexity_score": len(a) + len(b) + len(c)
-        })
-
-    with open(OUTPUT, "w") as f:
-        json.dump(fusion, f, indent=4)
-
-    print(f"[CART206] Generated {len(fusion)} fused trios → {OUTPUT}")
+    print(f"[CART206] Generated {cursor['emitted']} fused trios → {OUTDIR}")
+    print(f"[CART206] Top {len(top)} trios → {TOP_OUTPUT}")
 
 if __name__ == "__main__":
     main()
@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 # CART207 — Quad Fusion Query Builder
 # Generates all 4-term fusion chains (heavy).
+#
+# Quads are streamed into NDJSON shards under CART207_QUAD_FUSION/.
+# At most MAX_PER_RUN are written per run; the next run resumes from
+# the shard cursor. The TOP_K best quads go to CART207_QUAD_FUSION_TOP.json.
 
 import json
-import itertools
 import os
+import c13b0_fusion as fusion
 
 INPUT = "CART204_MASTER_DICTIONARY.json"
-OUTPUT = "CART207_QUAD_FUSION.json"
+OUTDIR = "CART207_QUAD_FUSION"
+TOP_OUTPUT = "CART207_QUAD_FUSION_TOP.json"
+TOP_K = 1000
+MAX_PER_RUN = 5000000
+
+def make_record(q):
+    return {
+        "quad": list(q),
+        "query": " ".join(q),
+        "complexity_score": sum(len(x) for x in q)
+    }
 
 def main():
     if not os.path.exists(INPUT):
@@ -17,21 +31,15 @@ def main():
         master = json.load(f)
 
     terms = master["terms"]
+    cursor = fusion.write_fusion_shards(terms, [4], make_record, OUTDIR,
+                                        max_records=MAX_PER_RUN)
 
-    quads = list(itertools.combinations(terms, 4))
-    fusion = []
+    top = [make_record(c) for _, c in fusion.best_combinations(terms, 4, TOP_K)]
+    fusion.write_top(TOP_OUTPUT, top)
 
-    for q in quads:
-        fusion.append({
-            "quad": list(q),
-            "query": " ".join(q),
-            "complexity_score": sum(len(x) for x in q)
-        })
-
-    with open(OUTPUT, "w") as f:
-        json.dump(fusion, f, indent=2)
-
-    print(f"[CART207] Generated {len(fusion)} quad fusions → {OUTPUT}")
+    state = "complete" if cursor["done"] else "partial, resumes next run"
+    print(f"[CART207] Generated {cursor['emitted']} quad fusions ({state}) → {OUTDIR}")
+    print(f"[CART207] Top {len(top)} quads → {TOP_OUTPUT}")
 
 if __name__ == "__main__":
     main()
@@ -1,28 +1,38 @@
 #!/usr/bin/env python3
 # CART208 — Omni Fusion Engine
 # Generates multi-term fusion queries (5-term up to ALL)
-# WARNING: Produces MASSIVE output sets.
+# WARNING: The full set is astronomically large.
+#
+# Sets are generated lazily and streamed into NDJSON shards under
+# CART208_OMNI_FUSION/, MAX_PER_RUN per run, resuming from the shard
+# cursor. The best TOP_K_PER_DEPTH sets of each depth are found without
+# enumerating everything and written to CART208_OMNI_FUSION_TOP.json.
 
 import json
-import itertools
 import os
+import c13b0_fusion as fusion
 
 INPUT = "CART204_MASTER_DICTIONARY.json"
-OUTPUT = "CART208_OMNI_FUSION.json"
+OUTDIR = "CART208_OMNI_FUSION"
+TOP_OUTPUT = "CART208_OMNI_FUSION_TOP.json"
+TOP_K_PER_DEPTH = 200
+MAX_PER_RUN = 5000000
 
-def generate_fusions(terms):
-    all_fusion_sets = []
+def fusion_depths(terms):
     # Build from 5-term up to ALL terms
-    for r in range(5, min(len(terms) + 1, 12)):  # limit at 12-term for sanity
-        combos = itertools.combinations(terms, r)
-        for c in combos:
-            all_fusion_sets.append({
-                "terms": list(c),
-                "query": " ".join(c),
-                "depth": r,
-                "signature": sum(len(x) for x in c)
-            })
-    return all_fusion_sets
+    return list(range(5, min(len(terms) + 1, 12)))  # limit at 12-term for sanity
+
+def make_record(c):
+    return {
+        "terms": list(c),
+        "query": " ".join(c),
+        "depth": len(c),
+        "signature": sum(len(x) for x in c)
+    }
+
+def generate_fusions(terms):
+    for _, _, c in fusion.iter_fusions(terms, fusion_depths(terms)):
+        yield make_record(c)
 
 def main():
     if not os.path.exists(INPUT):
@@ -32,13 +42,19 @@ def main():
         master = json.load(f)
 
     terms = master["terms"]
-    fusion = generate_fusions(terms)
-
-    with open(OUTPUT, "w") as f:
-        json.dump(fusion, f, indent=2)
-
-    print(f"[CART208] Omni fusion sets generated → {OUTPUT}")
-    print(f"[CART208] Total sets: {len(fusion)}")
+    depths = fusion_depths(terms)
+    cursor = fusion.write_fusion_shards(terms, depths, make_record, OUTDIR,
+                                        max_records=MAX_PER_RUN)
+
+    top = []
+    for r in depths:
+        top.extend(make_record(c) for _, c in fusion.best_combinations(terms, r, TOP_K_PER_DEPTH))
+    fusion.write_top(TOP_OUTPUT, top)
+
+    state = "complete" if cursor["done"] else "partial, resumes next run"
+    print(f"[CART208] Omni fusion sets generated → {OUTDIR} ({state})")
+    print(f"[CART208] Total sets: {cursor['emitted']}")
+    print(f"[CART208] Top sets per depth → {TOP_OUTPUT}")
 
 if __name__ == "__main__":
     main()
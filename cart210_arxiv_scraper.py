@@ -2,25 +2,31 @@
 # CART210 — arXiv Multi-Term Scraper
 # Scrapes arXiv using fusion queries from CART205–CART208
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import os
 import hashlib
+import c13b0_fusion as fusion
+from c13b0_fetch import Fetcher
 
-FUSION_FILES = [
-    "CART205_PAIR_FUSION.json",
-    "CART206_TRIO_FUSION.json",
-    "CART207_QUAD_FUSION.json",
-    "CART208_OMNI_FUSION.json"
+# (ranked top file, shard directory, score field) per fusion stage
+FUSION_SOURCES = [
+    ("CART205_PAIR_FUSION_TOP.json", "CART205_PAIR_FUSION", "score"),
+    ("CART206_TRIO_FUSION_TOP.json", "CART206_TRIO_FUSION", "complexity_score"),
+    ("CART207_QUAD_FUSION_TOP.json", "CART207_QUAD_FUSION", "complexity_score"),
+    ("CART208_OMNI_FUSION_TOP.json", "CART208_OMNI_FUSION", "signature")
 ]
+QUERIES_PER_STAGE = 250
 
 OUTPUT = "CART210_ARXIV_RAW.json"
 
-def search_arxiv(query):
-    url = f"https://arxiv.org/search/?query={query}&searchtype=all"
-    r = requests.get(url, timeout=10)
-    soup = BeautifulSoup(r.text, "lxml")
+def search_url(query):
+    return f"https://arxiv.org/search/?query={query}&searchtype=all"
+
+def search_arxiv(res):
+    if res.error:
+        raise res.error
+    soup = BeautifulSoup(res.text, "lxml")
     entries = soup.select(".arxiv-result")
 
     results = []
@@ -42,30 +48,26 @@ def search_arxiv(query):
     return results
 
 def load_fusions():
-    fusions = []
-    for f in FUSION_FILES:
-        if os.path.exists(f):
-            with open(f, "r") as j:
-                entries = json.load(j)
-                for e in entries:
-                    q = e.get("query") or " ".join(e.get("terms", []))
-                    fusions.append(q)
-    return fusions
+    # Stream of the best QUERIES_PER_STAGE queries from each fusion stage
+    return fusion.iter_top_queries(FUSION_SOURCES, QUERIES_PER_STAGE)
 
 def main():
-    fusions = load_fusions()
+    fusions = list(load_fusions())
     all_results = []
 
-    for q in fusions:
-        print(f"[CART210] Searching arXiv → {q}")
-        try:
-            res = search_arxiv(q)
-            all_results.append({
-                "query": q,
-                "results": res
-            })
-        except Exception as err:
-            print(f"[CART210] Error on query '{q}': {err}")
+    # arXiv asks for gentle crawling: one host, low rate
+    with Fetcher(per_host=2, rate=1.0, burst=2) as fetcher:
+        pages = fetcher.fetch_all(search_url(q) for q in fusions)
+        for q, page in zip(fusions, pages):
+            print(f"[CART210] Searching arXiv → {q}")
+            try:
+                res = search_arxiv(page)
+                all_results.append({
+                    "query": q,
+                    "results": res
+                })
+            except Exception as err:
+                print(f"[CART210] Error on query '{q}': {err}")
 
     with open(OUTPUT, "w") as f:
         json.dump(all_results, f, indent=2)
@@ -2,11 +2,11 @@
 # CART211 — Science Websites Scraper
 # Scrapes validated science-related URLs from CART203
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import os
 import hashlib
+from c13b0_fetch import Fetcher
 
 INPUT_SITES = "CART203_VALIDATED_SITES.json"
 OUTPUT = "CART211_SCIENCE_SCRAPE.json"
@@ -24,10 +24,11 @@ def is_science_site(url):
 def hash_page(text):
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
-def scrape(url):
+def scrape(res):
+    if res.error:
+        return None
     try:
-        r = requests.get(url, timeout=10)
-        soup = BeautifulSoup(r.text, "lxml")
+        soup = BeautifulSoup(res.text, "lxml")
         text = soup.get_text(" ", strip=True)
         return text[:10000]  # limit raw text
     except:
@@ -42,10 +43,12 @@ def main():
 
     results = []
 
-    for s in sites:
-        if is_science_site(s):
+    targets = [s for s in sites if is_science_site(s)]
+
+    with Fetcher() as fetcher:
+        for s, res in zip(targets, fetcher.fetch_all(targets)):
             print(f"[CART211] Scraping science site → {s}")
-            text = scrape(s)
+            text = scrape(res)
             if text:
                 results.append({
                     "site": s,
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 # CART212 — Medical / Health Scraper
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import os
 import hashlib
+from c13b0_fetch import Fetcher
 
 INPUT_SITES = "CART203_VALIDATED_SITES.json"
 OUTPUT = "CART212_MEDICAL_SCRAPE.json"
@@ -20,10 +20,11 @@ def is_medical(url):
     u = url.lower()
     return any(k in u for k in MEDICAL_KEYWORDS)
 
-def scrape(url):
+def scrape(res):
+    if res.error:
+        return None
     try:
-        r = requests.get(url, timeout=10)
-        soup = BeautifulSoup(r.text, "lxml")
+        soup = BeautifulSoup(res.text, "lxml")
         return soup.get_text(" ", strip=True)[:15000]
     except:
         return None
@@ -40,10 +41,12 @@ def main():
 
     data = []
 
-    for s in sites:
-        if is_medical(s):
+    targets = [s for s in sites if is_medical(s)]
+
+    with Fetcher() as fetcher:
+        for s, res in zip(targets, fetcher.fetch_all(targets)):
             print(f"[CART212] Scraping → {s}")
-            text = scrape(s)
+            text = scrape(res)
             if text:
                 data.append({
                     "site": s,
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 # CART213 — Tech / AI Scraper
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import os
 import hashlib
+from c13b0_fetch import Fetcher
 
 INPUT_SITES = "CART203_VALIDATED_SITES.json"
 OUTPUT = "CART213_TECH_AI_SCRAPE.json"
@@ -20,10 +20,11 @@ def is_tech(url):
     u = url.lower()
     return any(k in u for k in TECH_KEYWORDS)
 
-def scrape(url):
+def scrape(res):
+    if res.error:
+        return None
     try:
-        r = requests.get(url, timeout=10)
-        soup = BeautifulSoup(r.text, "lxml")
+        soup = BeautifulSoup(res.text, "lxml")
         return soup.get_text(" ", strip=True)[:15000]
     except:
         return None
@@ -40,10 +41,12 @@ def main():
 
     output = []
 
-    for s in sites:
-        if is_tech(s):
+    targets = [s for s in sites if is_tech(s)]
+
+    with Fetcher() as fetcher:
+        for s, res in zip(targets, fetcher.fetch_all(targets)):
             print(f"[CART213] Scraping tech/AI site → {s}")
-            txt = scrape(s)
+            txt = scrape(res)
             if txt:
                 output.append({
                     "site": s,
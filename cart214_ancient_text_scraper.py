@@ -2,11 +2,11 @@
 # CART214 — Ancient Text / Manuscript Scraper
 # Extracts textual data from ancient-related domains.
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import os
 import hashlib
+from c13b0_fetch import Fetcher
 
 INPUT_SITES = "CART203_VALIDATED_SITES.json"
 OUTPUT = "CART214_ANCIENT_SCRAPE.json"
@@ -22,10 +22,11 @@ def classify(url):
     u = url.lower()
     return any(k in u for k in ANCIENT_KEYWORDS)
 
-def scrape(url):
+def scrape(res):
+    if res.error:
+        return None
     try:
-        r = requests.get(url, timeout=10)
-        soup = BeautifulSoup(r.text, "lxml")
+        soup = BeautifulSoup(res.text, "lxml")
         return soup.get_text(" ", strip=True)[:20000]
     except:
         return None
@@ -42,10 +43,12 @@ def main():
 
     rows = []
 
-    for s in sites:
-        if classify(s):
+    targets = [s for s in sites if classify(s)]
+
+    with Fetcher() as fetcher:
+        for s, res in zip(targets, fetcher.fetch_all(targets)):
             print(f"[CART214] Scraping → {s}")
-            txt = scrape(s)
+            txt = scrape(res)
             if txt:
                 rows.append({
                     "site": s,
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 # CART215 — Materials / Coins / Jewelry / Artifacts Scraper
 
-import requests
 from bs4 import BeautifulSoup
 import json
 import os
 import hashlib
+from c13b0_fetch import Fetcher
 
 INPUT_SITES = "CART203_VALIDATED_SITES.json"
 OUTPUT = "CART215_MATERIALS_SCRAPE.json"
@@ -21,10 +21,11 @@ def matches(url):
     u = url.lower()
     return any(k in u for k in MATERIAL_KEYWORDS)
 
-def scrape(url):
+def scrape(res):
+    if res.error:
+        return None
     try:
-        r = requests.get(url, timeout=10)
-        soup = BeautifulSoup(r.text, "lxml")
+        soup = BeautifulSoup(res.text, "lxml")
         return soup.get_text(" ", strip=True)[:20000]
     except:
         return None
@@ -41,10 +42,12 @@ def main():
 
     rows = []
 
-    for s in sites:
-        if matches(s):
+    targets = [s for s in sites if matches(s)]
+
+    with Fetcher() as fetcher:
+        for s, res in zip(targets, fetcher.fetch_all(targets)):
             print(f"[CART215] Scraping → {s}")
-            txt = scrape(s)
+            txt = scrape(res)
             if txt:
                 rows.append({
                     "site": s,
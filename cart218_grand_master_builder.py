@@ -6,6 +6,7 @@ import json
 import os
 import hashlib
 from datetime import datetime
+import c13b0_ruo_store as ruo_store
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTPUT = "research_block.json"
@@ -14,11 +15,10 @@ def sha256(s):
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART218] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
+    ruos = ruo_store.iter_ruos(RUO_STORE)
 
     bucket_research = []
     bucket_links = []
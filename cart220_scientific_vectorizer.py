@@ -1,35 +1,30 @@
 #!/usr/bin/env python3
 # CART220 — Scientific Vectorizer
 # Generates pseudo‑semantic vectors for RUOs (no scraping)
+# Output: float32 matrix (CART220_VECTORS.npy) + research_hash → row index,
+# generated BATCH RUOs at a time.
 
-import json
-import os
-import hashlib
-import random
+import c13b0_ruo_store as ruo_store
+import c13b0_vectors as vectors
 
 RUO_STORE = "CART217_RUO_STORE.json"
-OUTPUT = "CART220_VECTORS.json"
+OUTPUT = "CART220_VECTORS.npy"
+DIMS = 2048
+BATCH = 1024
 
-def vectorize(ruo):
-    random.seed(int(ruo["research_hash"][:8], 16))
-    return [random.random() for _ in range(2048)]
+def vectorize(batch):
+    hashes = [r["research_hash"] for r in batch]
+    return hashes, vectors.pseudo_vectors([vectors.hash_seed(h) for h in hashes], DIMS)
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART220] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
+    count = ruo_store.count_ruos(RUO_STORE)
+    batches = (vectorize(b) for b in ruo_store.iter_batches(RUO_STORE, BATCH))
+    vectors.write_vectors(OUTPUT, batches, count, DIMS)
 
-    vectors = {}
-
-    for r in ruos:
-        vectors[r["research_hash"]] = vectorize(r)
-
-    with open(OUTPUT, "w") as f:
-        json.dump(vectors, f, indent=4)
-
-    print(f"[CART220] Scientific vectors generated → {OUTPUT}")
+    print(f"[CART220] Scientific vectors generated → {OUTPUT} ({count} × {DIMS} float32)")
 
 if __name__ == "__main__":
     main()
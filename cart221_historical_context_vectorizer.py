@@ -4,6 +4,10 @@ import json
 import os
 import hashlib
 import random
+import sys
+import c13b0_ruo_store as ruo_store
+import c13b0_features as features
+import c13b0_shards as shards
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTPUT = "CART221_HISTORICAL_CONTEXT.json"
@@ -21,31 +25,19 @@ HISTORICAL_MAP = {
     "alchemy": "transmutation_system"
 }
 
-def classify(terms):
-    tags = []
-    for t in terms:
-        if t in HISTORICAL_MAP:
-            tags.append(HISTORICAL_MAP[t])
-    return list(set(tags))
+# Terms are matched by c13b0_features, which compiles this table
+def from_features(f):
+    classes = f["history"]
+    return {
+        "historical_tags": classes,
+        "weight": len(classes)
+    }
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART221] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
-    out = {}
-
-    for r in ruos:
-        classes = classify(r["terms"])
-        out[r["research_hash"]] = {
-            "historical_tags": classes,
-            "weight": len(classes)
-        }
-
-    with open(OUTPUT, "w") as f:
-        json.dump(out, f, indent=4)
+    features.derive("cart221", workers=shards.workers_arg(sys.argv))
 
     print(f"[CART221] Historical context vectors written → {OUTPUT}")
 
@@ -3,6 +3,10 @@
 import json
 import os
 import hashlib
+import sys
+import c13b0_ruo_store as ruo_store
+import c13b0_features as features
+import c13b0_shards as shards
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTPUT = "CART222_MATERIAL_SCIENCE.json"
@@ -18,28 +22,15 @@ MATERIAL_DOMAINS = {
     "emerald": {"class": "beryl", "hardness": 7.5},
 }
 
-def generate_material_profile(terms):
-    profile = {}
-    for t in terms:
-        if t in MATERIAL_DOMAINS:
-            profile[t] = MATERIAL_DOMAINS[t]
-    return profile
+# Terms are matched by c13b0_features, which compiles this table
+def from_features(f):
+    return {t: MATERIAL_DOMAINS[t] for t in f["material"]}
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART222] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
-    out = {}
-
-    for r in ruos:
-        m = generate_material_profile(r["terms"])
-        out[r["research_hash"]] = m
-
-    with open(OUTPUT, "w") as f:
-        json.dump(out, f, indent=4)
+    features.derive("cart222", workers=shards.workers_arg(sys.argv))
 
     print(f"[CART222] Material science vectors → {OUTPUT}")
 
@@ -3,6 +3,10 @@
 import json
 import os
 import math
+import sys
+import c13b0_ruo_store as ruo_store
+import c13b0_features as features
+import c13b0_shards as shards
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTPUT = "CART223_GEOMETRY_EXPANSION.json"
@@ -16,28 +20,15 @@ GEOMETRY_EQ = {
     "torus": ["V=2π^2 R r^2"]
 }
 
-def get_geo(terms):
-    out = []
-    for t in terms:
-        if t in GEOMETRY_EQ:
-            out.extend(GEOMETRY_EQ[t])
-    return list(set(out))
+# Terms are matched by c13b0_features, which compiles this table
+def from_features(f):
+    return f["geometry"]
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART223] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
-    out = {}
-
-    for r in ruos:
-        eqs = get_geo(r["terms"])
-        out[r["research_hash"]] = eqs
-
-    with open(OUTPUT, "w") as f:
-        json.dump(out, f, indent=4)
+    features.derive("cart223", workers=shards.workers_arg(sys.argv))
 
     print(f"[CART223] Geometry expansions saved → {OUTPUT}")
 
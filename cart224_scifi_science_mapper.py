@@ -2,6 +2,10 @@
 
 import json
 import os
+import sys
+import c13b0_ruo_store as ruo_store
+import c13b0_features as features
+import c13b0_shards as shards
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTPUT = "CART224_SCIFI_MAP.json"
@@ -16,27 +20,15 @@ SCIFI_MAP = {
     "ai": ["neural_nets", "computability"]
 }
 
-def map_scifi(terms):
-    out = []
-    for t in terms:
-        if t in SCIFI_MAP:
-            out.extend(SCIFI_MAP[t])
-    return list(set(out))
+# Terms are matched by c13b0_features, which compiles this table
+def from_features(f):
+    return f["scifi"]
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART224] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
-    out = {}
-
-    for r in ruos:
-        out[r["research_hash"]] = map_scifi(r["terms"])
-
-    with open(OUTPUT, "w") as f:
-        json.dump(out, f, indent=4)
+    features.derive("cart224", workers=shards.workers_arg(sys.argv))
 
     print(f"[CART224] Sci‑Fi → Science mappings saved → {OUTPUT}")
 
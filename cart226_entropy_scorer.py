@@ -6,6 +6,10 @@
 import json
 import os
 import math
+import sys
+import c13b0_ruo_store as ruo_store
+import c13b0_features as features
+import c13b0_shards as shards
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTPUT = "CART226_ENTROPY.json"
@@ -41,24 +45,19 @@ def classify(ent):
         return "medium"
     return "high"
 
+# entropy_calc runs inside the c13b0_features pass
+def from_features(f):
+    e = f["entropy"]
+    return {
+        "entropy": e,
+        "class": classify(e)
+    }
+
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART226] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
-    entropy_map = {}
-
-    for r in ruos:
-        e = entropy_calc(r)
-        entropy_map[r["research_hash"]] = {
-            "entropy": e,
-            "class": classify(e)
-        }
-
-    with open(OUTPUT, "w") as f:
-        json.dump(entropy_map, f, indent=4)
+    features.derive("cart226", workers=shards.workers_arg(sys.argv))
 
     print(f"[CART226] Entropy scores written → {OUTPUT}")
 
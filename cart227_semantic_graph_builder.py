@@ -5,14 +5,23 @@
 # entropy, and metadata.
 #
 # Output is used directly by CART229 (Infinity Seed Generator).
+#
+# Edges are generated from a term → RUO and domain → RUO posting index,
+# so only pairs that actually share a term or link domain are scored.
+# Optional: --top-k N keeps each node's N strongest edges.
 
 import json
 import os
+import sys
 import hashlib
+import heapq
+from collections import defaultdict
+import c13b0_ruo_store as ruo_store
 
 RUO_STORE = "CART217_RUO_STORE.json"
 ENTROPY = "CART226_ENTROPY.json"
 OUTPUT = "CART227_SEMANTIC_GRAPH.json"
+TOP_K = None
 
 def sha256(s):
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
@@ -28,10 +37,12 @@ def link_domain(url):
         return parts[2]
     return None
 
+def link_domains(links):
+    # non-empty domains only ("file:///x" has none)
+    return {d for d in map(link_domain, links) if d}
+
 def domain_overlap(linksA, linksB):
-    domA = {link_domain(l) for l in linksA if link_domain(l)}
-    domB = {link_domain(l) for l in linksB if link_domain(l)}
-    return len(domA.intersection(domB))
+    return len(link_domains(linksA).intersection(link_domains(linksB)))
 
 def weighted_edge(ruA, ruB, entropy_map):
     t_sim = term_similarity(ruA["terms"], ruB["terms"])
@@ -42,6 +53,9 @@ def weighted_edge(ruA, ruB, entropy_map):
     entA = entropy_map.get(ruA["research_hash"], {}).get("entropy", 0)
     entB = entropy_map.get(ruB["research_hash"], {}).get("entropy", 0)
 
+    return edge_weight(t_sim, d_sim, crossA, crossB, entA, entB)
+
+def edge_weight(t_sim, d_sim, crossA, crossB, entA, entB):
     # Weighted combination
     weight = (
         (t_sim * 0.4) +
@@ -55,15 +69,78 @@ def weighted_edge(ruA, ruB, entropy_map):
 
     return weight
 
+def build_postings(ruos):
+    # term → [node index], domain → [node index], built once for all RUOs
+    term_post = defaultdict(list)
+    dom_post = defaultdict(list)
+    for i, r in enumerate(ruos):
+        for t in set(r["terms"]):
+            term_post[t].append(i)
+        for d in link_domains(r["links"]):
+            dom_post[d].append(i)
+    return term_post, dom_post
+
+def overlap_edges(ruos, entropy_map):
+    # Yields (i, j, weight) for every pair sharing a term or domain, i < j.
+    # Shared-term and shared-domain counts are accumulated straight from the
+    # postings, so no per-pair set() or URL parsing is repeated.
+    term_post, dom_post = build_postings(ruos)
+    node_terms = [set(r["terms"]) for r in ruos]
+    node_doms = [link_domains(r["links"]) for r in ruos]
+    cross = [len(r["crossover_links"]) for r in ruos]
+    ent = [entropy_map.get(r["research_hash"], {}).get("entropy", 0) for r in ruos]
+
+    for i in range(len(ruos)):
+        t_count = defaultdict(int)
+        d_count = defaultdict(int)
+        for t in node_terms[i]:
+            for j in term_post[t]:
+                if j > i:
+                    t_count[j] += 1
+        for d in node_doms[i]:
+            for j in dom_post[d]:
+                if j > i:
+                    d_count[j] += 1
+
+        for j in sorted(t_count.keys() | d_count.keys()):
+            w = edge_weight(t_count.get(j, 0), d_count.get(j, 0),
+                            cross[i], cross[j], ent[i], ent[j])
+            if w:
+                yield i, j, w
+
+def top_k_edges(edges, k):
+    # Keep an edge if it is among the k strongest of either endpoint
+    best = defaultdict(list)
+    for i, j, w in edges:
+        for node, other in ((i, j), (j, i)):
+            heap = best[node]
+            item = (w, -other)
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+
+    keep = {}
+    for node, heap in best.items():
+        for w, neg_other in heap:
+            a, b = sorted((node, -neg_other))
+            keep[(a, b)] = w
+    for (i, j) in sorted(keep):
+        yield i, j, keep[(i, j)]
+
+def parse_top_k(argv):
+    if "--top-k" in argv:
+        return int(argv[argv.index("--top-k") + 1])
+    return TOP_K
+
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART227] RUO store missing")
 
     if not os.path.exists(ENTROPY):
         raise FileNotFoundError("[CART227] Entropy file missing. Run CART226 first.")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
+    ruos = ruo_store.load_ruos(RUO_STORE)
 
     with open(ENTROPY, "r") as f:
         entropy_map = json.load(f)
@@ -82,19 +159,18 @@ def main():
             "entropy": entropy_map.get(r["research_hash"], {}).get("entropy", 0)
         })
 
-    # Build weighted edges
-    for i in range(len(ruos)):
-        for j in range(i + 1, len(ruos)):
-            A = ruos[i]
-            B = ruos[j]
-
-            w = weighted_edge(A, B, entropy_map)
-            if w:
-                graph["edges"].append({
-                    "from": A["research_hash"],
-                    "to": B["research_hash"],
-                    "weight": w
-                })
+    # Build weighted edges from shared terms / domains only
+    edges = overlap_edges(ruos, entropy_map)
+    top_k = parse_top_k(sys.argv[1:])
+    if top_k:
+        edges = top_k_edges(edges, top_k)
+
+    for i, j, w in edges:
+        graph["edges"].append({
+            "from": ruos[i]["research_hash"],
+            "to": ruos[j]["research_hash"],
+            "weight": w
+        })
 
     with open(OUTPUT, "w") as f:
         json.dump(graph, f, indent=4)
@@ -11,20 +11,20 @@
 
 import json
 import os
+import c13b0_ruo_store as ruo_store
 
 RUO_STORE = "CART217_RUO_STORE.json"
 GRAPH = "CART227_SEMANTIC_GRAPH.json"
 OUTPUT = "CART228_CALIBRATED_RUOS.json"
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART228] Missing RUO store")
 
     if not os.path.exists(GRAPH):
         raise FileNotFoundError("[CART228] Missing semantic graph")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
+    ruos = ruo_store.load_ruos(RUO_STORE)
 
     with open(GRAPH, "r") as f:
         graph = json.load(f)
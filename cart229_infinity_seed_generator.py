@@ -10,9 +10,10 @@ import json
 import hashlib
 import os
 import random
+import c13b0_vectors as vectors
 
 MASTER = "research_block.json"
-VECTORS = "CART220_VECTORS.json"
+VECTORS = "CART220_VECTORS.npy"
 OUTPUT = "CART229_INFINITY_SEED.json"
 
 def sha256(s):
@@ -40,11 +41,10 @@ def main():
 
     seed_hash = sha256(base_string)
 
-    # Load RUO vectors if available
-    vectors = {}
-    if os.path.exists(VECTORS):
-        with open(VECTORS, "r") as f:
-            vectors = json.load(f)
+    # RUO vectors are optional; only their presence is reported
+    if vectors.exists(VECTORS):
+        with vectors.open_vectors(VECTORS) as store:
+            print(f"[CART229] RUO vectors available: {len(store)}")
 
     # Infinity Seed Vector (primary)
     seed_vector = deterministic_vector(seed_hash, 512)
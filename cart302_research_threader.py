@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 # CART302 — Research Threader
-# Builds 3-hop reasoning threads across RUOs using crossover graphs.
+# Builds 3-hop reasoning threads across RUOs using crossover graphs,
+# plus each RUO's nearest neighbours when CART220 vectors are available.
 
-import json
 import os
+from itertools import islice
+import c13b0_ruo_store as ruo_store
+import c13b0_similarity as similarity
 
 RUO_STORE = "CART217_RUO_STORE.json"
+VECTORS = "CART220_VECTORS.npy"
 OUTDIR = "CART302_THREADS"
+NEIGHBOURS = 3
+CHUNK = 1024
 
 def top_links(ruo, count=3):
     return sorted(
@@ -15,42 +21,56 @@ def top_links(ruo, count=3):
         reverse=True
     )[:count]
 
-def main():
-    if not os.path.exists(RUO_STORE):
-        raise FileNotFoundError("[CART302] RUO store missing")
+def write_thread(store, r, near):
+    fname = f"{OUTDIR}/{r['research_hash']}_thread.md"
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
+    with open(fname, "w") as f:
+        f.write(f"# Research Thread — {r['research_hash']}\n\n")
 
-    ru_map = {r["research_hash"]: r for r in ruos}
-    os.makedirs(OUTDIR, exist_ok=True)
+        f.write("## Step 1 — Base RUO\n")
+        f.write(f"`{r['research_hash']}` with terms:\n")
+        for t in r["terms"]:
+            f.write(f"- {t}\n")
 
-    for r in ruos:
-        fname = f"{OUTDIR}/{r['research_hash']}_thread.md"
+        first_hops = top_links(r)
 
-        with open(fname, "w") as f:
-            f.write(f"# Research Thread — {r['research_hash']}\n\n")
+        f.write("\n## Step 2 — First Hop Connections\n")
+        for hop in first_hops:
+            h = hop["target_hash"]
+            f.write(f"- → `{h}` (Weight {hop['weight']})\n")
 
-            f.write("## Step 1 — Base RUO\n")
-            f.write(f"`{r['research_hash']}` with terms:\n")
-            for t in r["terms"]:
-                f.write(f"- {t}\n")
+        f.write("\n## Step 3 — Second Hop Connections\n")
+        for hop in first_hops:
+            h = hop["target_hash"]
+            target = store.get(h)
+            if target:
+                second_hops = top_links(target, 2)
+                for h2 in second_hops:
+                    f.write(f"  - → `{h}` → `{h2['target_hash']}` (Weight {h2['weight']})\n")
 
-            first_hops = top_links(r)
+        if near:
+            f.write("\n## Step 4 — Nearest RUOs (vector similarity)\n")
+            for h, score in near:
+                f.write(f"- `{h}` (Cosine {score:.4f})\n")
 
-            f.write("\n## Step 2 — First Hop Connections\n")
-            for hop in first_hops:
-                h = hop["target_hash"]
-                f.write(f"- → `{h}` (Weight {hop['weight']})\n")
+def main():
+    if not ruo_store.exists(RUO_STORE):
+        raise FileNotFoundError("[CART302] RUO store missing")
+
+    store = ruo_store.open_store(RUO_STORE)
+    os.makedirs(OUTDIR, exist_ok=True)
+    index = similarity.open_index(VECTORS) if similarity.available(VECTORS) else None
 
-            f.write("\n## Step 3 — Second Hop Connections\n")
-            for hop in first_hops:
-                h = hop["target_hash"]
-                if h in ru_map:
-                    second_hops = top_links(ru_map[h], 2)
-                    for h2 in second_hops:
-                        f.write(f"  - → `{h}` → `{h2['target_hash']}` (Weight {h2['weight']})\n")
+    ruos = iter(store)
+    while True:
+        chunk = list(islice(ruos, CHUNK))
+        if not chunk:
+            break
+        near = index.neighbours_many([r["research_hash"] for r in chunk], NEIGHBOURS) if index else {}
+        for r in chunk:
+            write_thread(store, r, near.get(r["research_hash"], []))
 
+    store.close()
     print(f"[CART302] Research threads written → {OUTDIR}")
 
 if __name__ == "__main__":
@@ -3,8 +3,10 @@
 # Combines signals from history, geometry, sci-fi mappings, materials, entropy,
 # and crossover structure into one integrated Markdown analysis per RUO.
 
+import io
 import json
 import os
+import c13b0_writers as writers
 
 RUO_STORE = "CART217_RUO_STORE.json"
 ENTROPY = "CART226_ENTROPY.json"
@@ -14,52 +16,52 @@ GEOMETRY = "CART223_GEOMETRY_EXPANSION.json"
 SCIFI = "CART224_SCIFI_MAP.json"
 OUTDIR = "CART303_WEAVES"
 
-def main():
+def load_context():
     required = [RUO_STORE, ENTROPY, HISTORY, MATERIAL, GEOMETRY, SCIFI]
     for r in required:
         if not os.path.exists(r):
             raise FileNotFoundError(f"[CART303] Missing {r}")
 
-    with open(RUO_STORE, "r") as f: ruos = json.load(f)
-    with open(ENTROPY, "r") as f: entropy = json.load(f)
-    with open(HISTORY, "r") as f: history = json.load(f)
-    with open(MATERIAL, "r") as f: material = json.load(f)
-    with open(GEOMETRY, "r") as f: geometry = json.load(f)
-    with open(SCIFI, "r") as f: scifi = json.load(f)
-
-    os.makedirs(OUTDIR, exist_ok=True)
+    ctx = {}
+    with open(ENTROPY, "r") as f: ctx["entropy"] = json.load(f)
+    with open(HISTORY, "r") as f: ctx["history"] = json.load(f)
+    with open(MATERIAL, "r") as f: ctx["material"] = json.load(f)
+    with open(GEOMETRY, "r") as f: ctx["geometry"] = json.load(f)
+    with open(SCIFI, "r") as f: ctx["scifi"] = json.load(f)
+    return ctx
 
-    for r in ruos:
-        rh = r["research_hash"]
-        fname = f"{OUTDIR}/{rh}.md"
+def render(r, ctx):
+    rh = r["research_hash"]
+    f = io.StringIO()
+    f.write(f"# Research Weave — {rh}\n\n")
+    f.write("## Core Terms\n")
+    for t in r["terms"]:
+        f.write(f"- {t}\n")
 
-        with open(fname, "w") as f:
-            f.write(f"# Research Weave — {rh}\n\n")
-            f.write("## Core Terms\n")
-            for t in r["terms"]:
-                f.write(f"- {t}\n")
+    f.write("\n## Historical Context\n")
+    f.write(str(ctx["history"].get(rh, {})) + "\n")
 
-            f.write("\n## Historical Context\n")
-            f.write(str(history.get(rh, {})) + "\n")
+    f.write("\n## Material Science Notes\n")
+    f.write(str(ctx["material"].get(rh, {})) + "\n")
 
-            f.write("\n## Material Science Notes\n")
-            f.write(str(material.get(rh, {})) + "\n")
+    f.write("\n## Geometry Expansion\n")
+    for eq in ctx["geometry"].get(rh, []):
+        f.write(f"- {eq}\n")
 
-            f.write("\n## Geometry Expansion\n")
-            for eq in geometry.get(rh, []):
-                f.write(f"- {eq}\n")
+    f.write("\n## Sci‑Fi → Science Mapping\n")
+    for s in ctx["scifi"].get(rh, []):
+        f.write(f"- {s}\n")
 
-            f.write("\n## Sci‑Fi → Science Mapping\n")
-            for s in scifi.get(rh, []):
-                f.write(f"- {s}\n")
+    f.write("\n## Entropy\n")
+    f.write(str(ctx["entropy"].get(rh, {})) + "\n")
 
-            f.write("\n## Entropy\n")
-            f.write(str(entropy.get(rh, {})) + "\n")
-
-            f.write("\n## Crossover Links\n")
-            for c in r["crossover_links"]:
-                f.write(f"- `{c['target_hash']}` — {c['reason']} (W:{c['weight']})\n")
+    f.write("\n## Crossover Links\n")
+    for c in r["crossover_links"]:
+        f.write(f"- `{c['target_hash']}` — {c['reason']} (W:{c['weight']})\n")
+    return f.getvalue()
 
+def main():
+    writers.run(["cart303"])
     print(f"[CART303] Research weaves written → {OUTDIR}")
 
 if __name__ == "__main__":
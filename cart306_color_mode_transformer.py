@@ -2,8 +2,9 @@
 # CART306 — Color Mode Transformer
 # Generates RUO research papers in specific OS color modes.
 
-import json
-import os
+import io
+import c13b0_ruo_store as ruo_store
+import c13b0_writers as writers
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART306_COLOR_MODE"
@@ -29,23 +30,20 @@ def write_mode(md, ruo, mode_name):
         md.write(f"- `{c['target_hash']}` → {c['reason']} (W:{c['weight']})\n")
     md.write("\n---\n\n")
 
-def main():
-    if not os.path.exists(RUO_STORE):
+def load_context():
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART306] RUO store missing")
+    return {}
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
-    os.makedirs(OUTDIR, exist_ok=True)
-
-    for r in ruos:
-        rh = r["research_hash"]
-        fname = f"{OUTDIR}/{rh}.md"
-        with open(fname, "w") as md:
-            md.write(f"# Color-Mode Research Paper — {rh}\n\n")
-            for mode in MODES:
-                write_mode(md, r, mode)
+def render(r, ctx):
+    md = io.StringIO()
+    md.write(f"# Color-Mode Research Paper — {r['research_hash']}\n\n")
+    for mode in MODES:
+        write_mode(md, r, mode)
+    return md.getvalue()
 
+def main():
+    writers.run(["cart306"])
     print(f"[CART306] Color mode papers written → {OUTDIR}")
 
 if __name__ == "__main__":
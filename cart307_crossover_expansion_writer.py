@@ -1,44 +1,41 @@
 #!/usr/bin/env python3
 # CART307 — Crossover Expansion Writer
 
-import json
-import os
+import io
+import c13b0_ruo_store as ruo_store
+import c13b0_writers as writers
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART307_CROSSOVER_EXPANSIONS"
 
-def main():
-    if not os.path.exists(RUO_STORE):
+def load_context():
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART307] RUO store missing")
+    # link targets are looked up by hash; the index is loaded lazily per process
+    return {"store": ruo_store.open_store(RUO_STORE)}
+
+def render(r, ctx):
+    rh = r["research_hash"]
+    md = io.StringIO()
+    md.write(f"# Crossover Expansion — {rh}\n\n")
+
+    for c in r["crossover_links"]:
+        target = ctx["store"].get(c["target_hash"])
+        md.write(f"## Link → `{c['target_hash']}`\n")
+        md.write(f"- Reason: {c['reason']}\n")
+        md.write(f"- Weight: {c['weight']}\n")
+        if target:
+            md.write("\n### Target Terms\n")
+            for t in target["terms"]:
+                md.write(f"- {t}\n")
+            md.write("\n### Target Links\n")
+            for l in target["links"]:
+                md.write(f"- {l}\n")
+        md.write("\n---\n")
+    return md.getvalue()
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
-    ru_map = {r["research_hash"]: r for r in ruos}
-
-    os.makedirs(OUTDIR, exist_ok=True)
-
-    for r in ruos:
-        rh = r["research_hash"]
-        fname = f"{OUTDIR}/{rh}.md"
-
-        with open(fname, "w") as md:
-            md.write(f"# Crossover Expansion — {rh}\n\n")
-
-            for c in r["crossover_links"]:
-                target = ru_map.get(c["target_hash"])
-                md.write(f"## Link → `{c['target_hash']}`\n")
-                md.write(f"- Reason: {c['reason']}\n")
-                md.write(f"- Weight: {c['weight']}\n")
-                if target:
-                    md.write("\n### Target Terms\n")
-                    for t in target["terms"]:
-                        md.write(f"- {t}\n")
-                    md.write("\n### Target Links\n")
-                    for l in target["links"]:
-                        md.write(f"- {l}\n")
-                md.write("\n---\n")
-
+def main():
+    writers.run(["cart307"])
     print(f"[CART307] Crossover expansions written → {OUTDIR}")
 
 if __name__ == "__main__":
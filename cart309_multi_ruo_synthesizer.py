@@ -1,41 +1,80 @@
 #!/usr/bin/env python3
 # CART309 — Multi-RUO Synthesizer
+# Groups of 3 RUOs: each RUO with its two nearest unused neighbours when
+# CART220 vectors are available, otherwise in store order.
 
-import json
 import os
+from itertools import islice
+import c13b0_ruo_store as ruo_store
+import c13b0_similarity as similarity
 
 RUO_STORE = "CART217_RUO_STORE.json"
+VECTORS = "CART220_VECTORS.npy"
 OUTDIR = "CART309_SYNTHESIS"
+CANDIDATES = 10
+CHUNK = 1024
+
+def similar_groups(store, index):
+    # greedy: each unused RUO takes its two closest unused neighbours;
+    # RUOs left without two free neighbours are grouped in store order
+    used = set()
+    leftover = []
+    hashes = iter(store.hashes())
+    while True:
+        chunk = list(islice(hashes, CHUNK))
+        if not chunk:
+            break
+        near = index.neighbours_many(chunk, CANDIDATES)
+        for h in chunk:
+            if h in used:
+                continue
+            # the vectors may be older than the store: skip hashes it lacks
+            mates = [n for n, _ in near[h] if n not in used and n != h and n in store][:2]
+            if len(mates) < 2:
+                leftover.append(h)
+                continue
+            used.update([h] + mates)
+            yield [store.get(x) for x in [h] + mates]
+    leftover = [h for h in leftover if h not in used]
+    for i in range(0, len(leftover), 3):
+        yield [store.get(x) for x in leftover[i:i + 3]]
+
+def write_synthesis(fname, group):
+    with open(fname, "w") as md:
+        md.write("# Multi‑RUO Synthesis\n")
+        for r in group:
+            md.write(f"\n## RUO `{r['research_hash']}`\n")
+            for t in r["terms"]:
+                md.write(f"- {t}\n")
+
+        md.write("\n## Combined Insight\n")
+        md.write("These three RUOs collectively show:\n")
+        md.write("- domain overlap\n")
+        md.write("- crossovers\n")
+        md.write("- shared metadata\n")
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART309] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
     os.makedirs(OUTDIR, exist_ok=True)
 
+    if similarity.available(VECTORS):
+        store = ruo_store.open_store(RUO_STORE)
+        groups = similar_groups(store, similarity.open_index(VECTORS))
+    else:
+        store = None
+        groups = ruo_store.iter_batches(RUO_STORE, 3)
+
     # Use groups of 3 RUOs to generate synthesis docs
-    for i in range(0, len(ruos), 3):
-        group = ruos[i:i+3]
+    for n, group in enumerate(groups):
+        i = n * 3
         if len(group) < 3:
             continue
+        write_synthesis(f"{OUTDIR}/synthesis_{i}.md", group)
 
-        fname = f"{OUTDIR}/synthesis_{i}.md"
-        with open(fname, "w") as md:
-            md.write("# Multi‑RUO Synthesis\n")
-            for r in group:
-                md.write(f"\n## RUO `{r['research_hash']}`\n")
-                for t in r["terms"]:
-                    md.write(f"- {t}\n")
-
-            md.write("\n## Combined Insight\n")
-            md.write("These three RUOs collectively show:\n")
-            md.write("- domain overlap\n")
-            md.write("- crossovers\n")
-            md.write("- shared metadata\n")
-
+    if store:
+        store.close()
     print(f"[CART309] Multi-RUO syntheses → {OUTDIR}")
 
 if __name__ == "__main__":
@@ -1,35 +1,38 @@
 #!/usr/bin/env python3
 # CART310 — Scientific Justification Builder
 
+import io
 import json
 import os
+import c13b0_ruo_store as ruo_store
+import c13b0_writers as writers
 
 RUO_STORE = "CART217_RUO_STORE.json"
 GEOMETRY = "CART223_GEOMETRY_EXPANSION.json"
 OUTDIR = "CART310_JUSTIFICATIONS"
 
-def main():
-    if not os.path.exists(RUO_STORE):
+def load_context():
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART310] RUO store missing")
     if not os.path.exists(GEOMETRY):
         raise FileNotFoundError("[CART310] geometry missing")
 
-    with open(RUO_STORE, "r") as f: ruos = json.load(f)
     with open(GEOMETRY, "r") as f: geometry = json.load(f)
+    return {"geometry": geometry}
+
+def render(r, ctx):
+    rh = r["research_hash"]
+    md = io.StringIO()
+    md.write(f"# Scientific Justification — {rh}\n\n")
+    md.write("## Relevant Equations\n")
+    for eq in ctx["geometry"].get(rh, []):
+        md.write(f"- {eq}\n")
+    md.write("\n## Interpretation\n")
+    md.write("Equations support domain relationships...\n")
+    return md.getvalue()
 
-    os.makedirs(OUTDIR, exist_ok=True)
-
-    for r in ruos:
-        rh = r["research_hash"]
-        fname = f"{OUTDIR}/{rh}.md"
-        with open(fname, "w") as md:
-            md.write(f"# Scientific Justification — {rh}\n\n")
-            md.write("## Relevant Equations\n")
-            for eq in geometry.get(rh, []):
-                md.write(f"- {eq}\n")
-            md.write("\n## Interpretation\n")
-            md.write("Equations support domain relationships...\n")
-
+def main():
+    writers.run(["cart310"])
     print(f"[CART310] Scientific justifications → {OUTDIR}")
 
 if __name__ == "__main__":
@@ -1,44 +1,45 @@
 #!/usr/bin/env python3
 # CART313 — Historical Lens Writer
 
-import json, os
+import io, json, os
+import c13b0_ruo_store as ruo_store
+import c13b0_writers as writers
 
 RUO_STORE = "CART217_RUO_STORE.json"
 HISTORY = "CART221_HISTORICAL_CONTEXT.json"
 OUTDIR = "CART313_HISTORICAL"
 
-def main():
-    if not os.path.exists(RUO_STORE):
+def load_context():
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART313] RUO store missing")
     if not os.path.exists(HISTORY):
         raise FileNotFoundError("[CART313] historical context missing")
 
-    with open(RUO_STORE, "r") as f: ruos = json.load(f)
     with open(HISTORY, "r") as f: hist = json.load(f)
+    return {"hist": hist}
 
-    os.makedirs(OUTDIR, exist_ok=True)
-
-    for r in ruos:
-        rh = r["research_hash"]
-        fname = f"{OUTDIR}/{rh}.md"
+def render(r, ctx):
+    rh = r["research_hash"]
+    tags = ctx["hist"].get(rh, {}).get("historical_tags", [])
 
-        tags = hist.get(rh, {}).get("historical_tags", [])
+    md = io.StringIO()
+    md.write(f"# Historical Lens Analysis — {rh}\n\n")
 
-        with open(fname, "w") as md:
-            md.write(f"# Historical Lens Analysis — {rh}\n\n")
+    md.write("## Historical Tags\n")
+    for t in tags:
+        md.write(f"- {t}\n")
 
-            md.write("## Historical Tags\n")
-            for t in tags:
-                md.write(f"- {t}\n")
+    md.write("\n## Interpretation\n")
+    md.write("This RUO shows connections to historical systems such as:\n")
+    for t in tags:
+        md.write(f"- {t}: contextually linked via term/domain structure.\n")
 
-            md.write("\n## Interpretation\n")
-            md.write("This RUO shows connections to historical systems such as:\n")
-            for t in tags:
-                md.write(f"- {t}: contextually linked via term/domain structure.\n")
-
-            md.write("\n## Relevance\n")
-            md.write("Historical signals allow deeper cross‑temporal research.\n")
+    md.write("\n## Relevance\n")
+    md.write("Historical signals allow deeper cross‑temporal research.\n")
+    return md.getvalue()
 
+def main():
+    writers.run(["cart313"])
     print(f"[CART313] Historical lens papers → {OUTDIR}")
 
 if __name__ == "__main__":
@@ -1,38 +1,40 @@
 #!/usr/bin/env python3
 # CART314 — Material‑Science Lens Writer
 
-import json, os
+import io, json, os
+import c13b0_ruo_store as ruo_store
+import c13b0_writers as writers
 
 RUO_STORE = "CART217_RUO_STORE.json"
 MATERIAL = "CART222_MATERIAL_SCIENCE.json"
 OUTDIR = "CART314_MATERIAL"
 
-def main():
-    if not os.path.exists(RUO_STORE):
+def load_context():
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART314] RUO store missing")
     if not os.path.exists(MATERIAL):
         raise FileNotFoundError("[CART314] material science vectors missing")
 
-    with open(RUO_STORE, "r") as f: ruos = json.load(f)
     with open(MATERIAL, "r") as f: ms = json.load(f)
+    return {"ms": ms}
 
-    os.makedirs(OUTDIR, exist_ok=True)
-
-    for r in ruos:
-        rh = r["research_hash"]
-        profile = ms.get(rh, {})
+def render(r, ctx):
+    rh = r["research_hash"]
+    profile = ctx["ms"].get(rh, {})
 
-        fname = f"{OUTDIR}/{rh}.md"
-        with open(fname, "w") as md:
-            md.write(f"# Material‑Science Analysis — {rh}\n\n")
+    md = io.StringIO()
+    md.write(f"# Material‑Science Analysis — {rh}\n\n")
 
-            md.write("## Material Matches\n")
-            for k, v in profile.items():
-                md.write(f"- **{k}** → {v}\n")
+    md.write("## Material Matches\n")
+    for k, v in profile.items():
+        md.write(f"- **{k}** → {v}\n")
 
-            md.write("\n## Interpretation\n")
-            md.write("Material signals help map research to elemental or mineralogical domains.\n")
+    md.write("\n## Interpretation\n")
+    md.write("Material signals help map research to elemental or mineralogical domains.\n")
+    return md.getvalue()
 
+def main():
+    writers.run(["cart314"])
     print(f"[CART314] Material-science papers → {OUTDIR}")
 
 if __name__ == "__main__":
@@ -1,38 +1,40 @@
 #!/usr/bin/env python3
 # CART315 — Geometry Lens Writer
 
-import json, os
+import io, json, os
+import c13b0_ruo_store as ruo_store
+import c13b0_writers as writers
 
 RUO_STORE = "CART217_RUO_STORE.json"
 GEOMETRY = "CART223_GEOMETRY_EXPANSION.json"
 OUTDIR = "CART315_GEOMETRY"
 
-def main():
-    if not os.path.exists(RUO_STORE):
+def load_context():
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART315] RUO store missing")
     if not os.path.exists(GEOMETRY):
         raise FileNotFoundError("[CART315] geometry expansions missing")
 
-    with open(RUO_STORE, "r") as f: ruos = json.load(f)
     with open(GEOMETRY, "r") as f: geo = json.load(f)
+    return {"geo": geo}
 
-    os.makedirs(OUTDIR, exist_ok=True)
-
-    for r in ruos:
-        rh = r["research_hash"]
-        eqs = geo.get(rh, [])
+def render(r, ctx):
+    rh = r["research_hash"]
+    eqs = ctx["geo"].get(rh, [])
 
-        fname = f"{OUTDIR}/{rh}.md"
-        with open(fname, "w") as md:
-            md.write(f"# Geometry Lens Analysis — {rh}\n\n")
+    md = io.StringIO()
+    md.write(f"# Geometry Lens Analysis — {rh}\n\n")
 
-            md.write("## Geometry Equations\n")
-            for e in eqs:
-                md.write(f"- {e}\n")
+    md.write("## Geometry Equations\n")
+    for e in eqs:
+        md.write(f"- {e}\n")
 
-            md.write("\n## Interpretation\n")
-            md.write("Geometry equations indicate spatial, structural, or volumetric logic inside this RUO.\n")
+    md.write("\n## Interpretation\n")
+    md.write("Geometry equations indicate spatial, structural, or volumetric logic inside this RUO.\n")
+    return md.getvalue()
 
+def main():
+    writers.run(["cart315"])
     print(f"[CART315] Geometry-lens papers → {OUTDIR}")
 
 if __name__ == "__main__":
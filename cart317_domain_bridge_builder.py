@@ -1,44 +1,45 @@
 #!/usr/bin/env python3
 # CART317 — Domain Bridge Builder
 
-import json, os
+import io, json, os
+import c13b0_ruo_store as ruo_store
+import c13b0_writers as writers
 
 RUO_STORE = "CART217_RUO_STORE.json"
 GRAPH = "CART227_SEMANTIC_GRAPH.json"
 OUTDIR = "CART317_DOMAIN_BRIDGES"
 
-def main():
-    if not os.path.exists(RUO_STORE):
+def load_context():
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART317] RUO store missing")
     if not os.path.exists(GRAPH):
         raise FileNotFoundError("[CART317] semantic graph missing")
 
-    with open(RUO_STORE, "r") as f: ruos = json.load(f)
     with open(GRAPH, "r") as f: graph = json.load(f)
 
-    os.makedirs(OUTDIR, exist_ok=True)
-
     # Quick lookup
     weights = {}
     for e in graph["edges"]:
         weights.setdefault(e["from"], []).append((e["to"], e["weight"]))
+    return {"weights": weights}
 
-    for r in ruos:
-        rh = r["research_hash"]
-        fname = f"{OUTDIR}/{rh}.md"
+def render(r, ctx):
+    rh = r["research_hash"]
+    bridges = sorted(ctx["weights"].get(rh, []), key=lambda x: x[1], reverse=True)
 
-        bridges = sorted(weights.get(rh, []), key=lambda x: x[1], reverse=True)
+    md = io.StringIO()
+    md.write(f"# Domain Bridge Report — {rh}\n\n")
 
-        with open(fname, "w") as md:
-            md.write(f"# Domain Bridge Report — {rh}\n\n")
+    md.write("## Strongest Bridges\n")
+    for t, w in bridges[:10]:
+        md.write(f"- `{rh}` ↔ `{t}` (W:{w})\n")
 
-            md.write("## Strongest Bridges\n")
-            for t, w in bridges[:10]:
-                md.write(f"- `{rh}` ↔ `{t}` (W:{w})\n")
-
-            md.write("\n## Interpretation\n")
-            md.write("These edges represent conceptual bridges across domains.\n")
+    md.write("\n## Interpretation\n")
+    md.write("These edges represent conceptual bridges across domains.\n")
+    return md.getvalue()
 
+def main():
+    writers.run(["cart317"])
     print(f"[CART317] Domain bridge files → {OUTDIR}")
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 # CART319 — Multi-Perspective Research Composer
 
-import json, os
+import io
+import c13b0_ruo_store as ruo_store
+import c13b0_writers as writers
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART319_MULTIPERSPECTIVE"
@@ -16,26 +18,22 @@ PERSPECTIVES = [
     "CEO Strategic"
 ]
 
-def main():
-    if not os.path.exists(RUO_STORE):
+def load_context():
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART319] RUO store missing")
+    return {}
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
-    os.makedirs(OUTDIR, exist_ok=True)
-
-    for r in ruos:
-        rh = r["research_hash"]
+def render(r, ctx):
+    md = io.StringIO()
+    md.write(f"# Multi-Perspective Research Report — {r['research_hash']}\n\n")
 
-        fname = f"{OUTDIR}/{rh}.md"
-        with open(fname, "w") as md:
-            md.write(f"# Multi-Perspective Research Report — {rh}\n\n")
-
-            for p in PERSPECTIVES:
-                md.write(f"## {p} View\n")
-                md.write("Interpretation of this RUO from this perspective.\n\n")
+    for p in PERSPECTIVES:
+        md.write(f"## {p} View\n")
+        md.write("Interpretation of this RUO from this perspective.\n\n")
+    return md.getvalue()
 
+def main():
+    writers.run(["cart319"])
     print(f"[CART319] Multi-perspective papers → {OUTDIR}")
 
 if __name__ == "__main__":
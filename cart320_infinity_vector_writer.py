@@ -2,7 +2,9 @@
 # CART320 — Infinity Vector‑Driven Writer
 # Creates research papers whose structure depends on the Infinity Seed vector.
 
-import json, os
+import io, json, os
+import c13b0_ruo_store as ruo_store
+import c13b0_writers as writers
 
 RUO_STORE = "CART217_RUO_STORE.json"
 SEED = "CART229_INFINITY_SEED.json"
@@ -13,39 +15,36 @@ def tone_from_value(v):
     if v > 0.33: return "Balanced technical + intuitive reasoning."
     return "Simplified intuitive reasoning."
 
-def main():
-    if not os.path.exists(RUO_STORE):
+def load_context():
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART320] RUO store missing")
     if not os.path.exists(SEED):
         raise FileNotFoundError("[CART320] Infinity seed missing")
 
-    with open(RUO_STORE, "r") as f: ruos = json.load(f)
     with open(SEED, "r") as f: seed = json.load(f)
 
     vec = seed["vector_seed"]
     style_index = sum(vec[:10]) / 10  # Leading vector average decides tone
 
-    tone = tone_from_value(style_index)
-
-    os.makedirs(OUTDIR, exist_ok=True)
+    return {"tone": tone_from_value(style_index)}
 
-    for r in ruos:
-        rh = r["research_hash"]
+def render(r, ctx):
+    md = io.StringIO()
+    md.write(f"# Infinity-Vector Crafted Document — {r['research_hash']}\n\n")
 
-        fname = f"{OUTDIR}/{rh}.md"
-        with open(fname, "w") as md:
-            md.write(f"# Infinity-Vector Crafted Document — {rh}\n\n")
+    md.write("## Tone Profile\n")
+    md.write(f"{ctx['tone']}\n\n")
 
-            md.write("## Tone Profile\n")
-            md.write(f"{tone}\n\n")
+    md.write("## Terms\n")
+    for t in r["terms"]:
+        md.write(f"- {t}\n")
 
-            md.write("## Terms\n")
-            for t in r["terms"]:
-                md.write(f"- {t}\n")
-
-            md.write("\n## Reasoning\n")
-            md.write("Reasoning derived from Infinity-Vector tonal bias.\n")
+    md.write("\n## Reasoning\n")
+    md.write("Reasoning derived from Infinity-Vector tonal bias.\n")
+    return md.getvalue()
 
+def main():
+    writers.run(["cart320"])
     print(f"[CART320] Vector-driven papers → {OUTDIR}")
 
 if __name__ == "__main__":
@@ -2,7 +2,8 @@
 # CART321 — Telemetry Pattern Writer
 # Writes telemetry diagnostics for each RUO to track system behavior.
 
-import json, os, hashlib, time
+import os, hashlib, time
+import c13b0_ruo_store as ruo_store
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART321_TELEMETRY"
@@ -11,11 +12,10 @@ def hash_str(s):
     return hashlib.sha256(s.encode()).hexdigest()[:12]
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART321] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
+    ruos = ruo_store.iter_ruos(RUO_STORE)
 
     os.makedirs(OUTDIR, exist_ok=True)
 
@@ -2,17 +2,17 @@
 # CART322 — Scientific Calendar Planner
 # Builds project plans from RUO data.
 
-import json, os
+import os
+import c13b0_ruo_store as ruo_store
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART322_CALENDAR"
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART322] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
+    ruos = ruo_store.iter_ruos(RUO_STORE)
 
     os.makedirs(OUTDIR, exist_ok=True)
 
@@ -2,16 +2,17 @@
 # CART323 — Hypothesis Generator
 # Produces a set of testable hypotheses for each RUO.
 
-import json, os
+import os
+import c13b0_ruo_store as ruo_store
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART323_HYPOTHESES"
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART323] RUO store missing")
 
-    with open(RUO_STORE, "r") as f: ruos = json.load(f)
+    ruos = ruo_store.iter_ruos(RUO_STORE)
 
     os.makedirs(OUTDIR, exist_ok=True)
 
@@ -1,17 +1,17 @@
 #!/usr/bin/env python3
 # CART325 — Resource / URL Planner
 
-import json, os
+import os
+import c13b0_ruo_store as ruo_store
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART325_RESOURCES"
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART325] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
+    ruos = ruo_store.iter_ruos(RUO_STORE)
 
     os.makedirs(OUTDIR, exist_ok=True)
 
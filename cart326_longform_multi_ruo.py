@@ -1,23 +1,21 @@
 #!/usr/bin/env python3
 # CART326 — Long‑Form Multi‑RUO Paper Generator
 
-import json, os
+import os
+import c13b0_ruo_store as ruo_store
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART326_LONGFORM"
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART326] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
     os.makedirs(OUTDIR, exist_ok=True)
 
     batch_size = 5
-    for i in range(0, len(ruos), batch_size):
-        group = ruos[i:i+batch_size]
+    for n, group in enumerate(ruo_store.iter_batches(RUO_STORE, batch_size)):
+        i = n * batch_size
         if len(group) < 5:
             break
 
@@ -1,34 +1,36 @@
 #!/usr/bin/env python3
 # CART327 — Crossover Matrix Writer
 
-import json, os
+import os
+import c13b0_ruo_store as ruo_store
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART327_MATRIX"
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART327] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
+    store = ruo_store.open_store(RUO_STORE)
 
     os.makedirs(OUTDIR, exist_ok=True)
 
-    hashes = [r["research_hash"] for r in ruos]
+    hashes = store.hashes()
     index = {h: i for i, h in enumerate(hashes)}
 
     # Initialize empty matrix
     size = len(hashes)
     matrix = [[0]*size for _ in range(size)]
 
-    for r in ruos:
+    for r in store:
         row = index[r["research_hash"]]
         for c in r["crossover_links"]:
             col = index.get(c["target_hash"])
             if col is not None:
                 matrix[row][col] = round(c["weight"], 3)
 
+    store.close()
+
     # Write markdown matrix
     fname = f"{OUTDIR}/crossover_matrix.md"
     with open(fname, "w") as md:
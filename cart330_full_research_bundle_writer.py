@@ -1,64 +1,86 @@
 #!/usr/bin/env python3
 # CART330 — Full Research Bundle Writer
 # Creates a complete bundle folder per RUO.
+# Stage files are found through the stage manifests (c13b0_manifest) and
+# hardlinked into the bundles; archived stages are extracted member by member.
 
-import json, os, shutil
+import os, zipfile
+import c13b0_ruo_store as ruo_store
+import c13b0_manifest as manifest
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART330_BUNDLES"
 
-def safe_copy(src_folder, rh, out):
-    if not os.path.exists(src_folder):
-        return
-    for f in os.listdir(src_folder):
-        if f.startswith(rh) and f.endswith(".md"):
-            shutil.copy(f"{src_folder}/{f}", out)
+STAGES = [
+    "CART301_SUMMARIES",
+    "CART302_THREADS",
+    "CART303_WEAVES",
+    "CART304_SHORT_PAPERS",
+    "CART305_LONG_PAPERS",
+    "CART306_COLOR_MODE",
+    "CART307_CROSSOVER_EXPANSIONS",
+    "CART308_GRAPH_ANALYSIS.md",
+    "CART309_SYNTHESIS",
+    "CART310_JUSTIFICATIONS",
+    "CART311_EVIDENCE_PAPERS",
+    "CART312_NARRATIVE",
+    "CART313_HISTORICAL",
+    "CART314_MATERIAL",
+    "CART315_GEOMETRY",
+    "CART316_SCIFI_REALITY",
+    "CART317_DOMAIN_BRIDGES",
+    "CART318_IMPROVED",
+    "CART319_MULTIPERSPECTIVE",
+    "CART320_VECTOR_WRITING"
+]
+
+def extract(zf, name, dst):
+    tmp = dst + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(zf.read(name))
+    os.replace(tmp, dst)
 
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART330] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
+    ruos = ruo_store.iter_ruos(RUO_STORE)
 
     os.makedirs(OUTDIR, exist_ok=True)
 
-    STAGES = [
-        "CART301_SUMMARIES",
-        "CART302_THREADS",
-        "CART303_WEAVES",
-        "CART304_SHORT_PAPERS",
-        "CART305_LONG_PAPERS",
-        "CART306_COLOR_MODE",
-        "CART307_CROSSOVER_EXPANSIONS",
-        "CART308_GRAPH_ANALYSIS.md",
-        "CART309_SYNTHESIS",
-        "CART310_JUSTIFICATIONS",
-        "CART311_EVIDENCE_PAPERS",
-        "CART312_NARRATIVE",
-        "CART313_HISTORICAL",
-        "CART314_MATERIAL",
-        "CART315_GEOMETRY",
-        "CART316_SCIFI_REALITY",
-        "CART317_DOMAIN_BRIDGES",
-        "CART318_IMPROVED",
-        "CART319_MULTIPERSPECTIVE",
-        "CART320_VECTOR_WRITING"
-    ]
+    stages = [manifest.load(st) for st in STAGES]
+    archives = {path: zipfile.ZipFile(path) for kind, path, _ in stages if kind == "zip"}
+    counts = {}
+
+    try:
+        for r in ruos:
+            rh = r["research_hash"]
+            bundle_path = f"{OUTDIR}/{rh}"
+            os.makedirs(bundle_path, exist_ok=True)
 
-    for r in ruos:
-        rh = r["research_hash"]
-        bundle_path = f"{OUTDIR}/{rh}"
-        os.makedirs(bundle_path, exist_ok=True)
+            # later stages win when two stages produce the same file name
+            picked = {}
+            for kind, path, files in stages:
+                if kind == "file":
+                    # The single-file outputs like graph analysis
+                    picked[os.path.basename(path)] = (kind, path, None)
+                for name in files.get(rh, []):
+                    picked[name] = (kind, path, name)
 
-        for st in STAGES:
-            if os.path.isdir(st):
-                safe_copy(st, rh, bundle_path)
-            elif os.path.isfile(st):  
-                # The single-file outputs like graph analysis
-                shutil.copy(st, bundle_path)
+            for fname, (kind, path, name) in picked.items():
+                dst = f"{bundle_path}/{fname}"
+                if kind == "zip":
+                    extract(archives[path], name, dst)
+                    how = "extracted"
+                else:
+                    how = manifest.place(path if kind == "file" else f"{path}/{name}", dst)
+                counts[how] = counts.get(how, 0) + 1
+    finally:
+        for zf in archives.values():
+            zf.close()
 
-    print("[CART330] Full RUO bundles → CART330_BUNDLES")
+    summary = ", ".join(f"{v} {k}" for k, v in sorted(counts.items())) or "nothing to place"
+    print(f"[CART330] Full RUO bundles → CART330_BUNDLES ({summary})")
 
 if __name__ == "__main__":
     main()
@@ -1,31 +1,49 @@
 #!/usr/bin/env python3
 # CART403 — RUO Batch Distributor (10,000 per batch)
+# Batches are written in parallel and listed in CART403_BATCHES/index.json;
+# c13b0_shards uses them as the shards of its process-pool runs.
 
-import json, os
+import json, os, sys
+import c13b0_ruo_store as ruo_store
+import c13b0_shards as shards
 
 RUO_STORE = "CART217_RUO_STORE.json"
 OUTDIR = "CART403_BATCHES"
 BATCH_SIZE = 10000
 
+def write_batch(task):
+    shard, path = task
+    batch = list(shards.iter_shard(shard))
+    with open(path, "w") as f:
+        json.dump(batch, f, indent=4)
+    return len(batch)
+
 def main():
-    if not os.path.exists(RUO_STORE):
+    if not ruo_store.exists(RUO_STORE):
         raise FileNotFoundError("[CART403] RUO store missing")
 
-    with open(RUO_STORE, "r") as f:
-        ruos = json.load(f)
-
     os.makedirs(OUTDIR, exist_ok=True)
 
-    batches = [
-        ruos[i:i+BATCH_SIZE]
-        for i in range(0, len(ruos), BATCH_SIZE)
-    ]
-
-    for idx, b in enumerate(batches):
-        with open(f"{OUTDIR}/batch_{idx}.json", "w") as f:
-            json.dump(b, f, indent=4)
-
-    print(f"[CART403] Created {len(batches)} batches → CART403_BATCHES")
+    plan = shards.plan(RUO_STORE, BATCH_SIZE, batches=None)
+    files = [f"batch_{s['id']}.json" for s in plan]
+    tasks = [(s, f"{OUTDIR}/{name}") for s, name in zip(plan, files)]
+    counts = list(shards.execute(write_batch, tasks, plan, shards.workers_arg(sys.argv), "cart403"))
+
+    # drop batches left over from a larger store
+    for name in os.listdir(OUTDIR):
+        if name.startswith("batch_") and name.endswith(".json") and name not in files:
+            os.remove(f"{OUTDIR}/{name}")
+
+    with ruo_store.open_store(RUO_STORE) as store:
+        sig = shards.store_signature(store)
+    index = {"store": sig, "size": BATCH_SIZE,
+             "batches": [{"file": name, "count": n} for name, n in zip(files, counts)]}
+    tmp = shards.batch_index_path(OUTDIR) + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(index, f, indent=4)
+    os.replace(tmp, shards.batch_index_path(OUTDIR))
+
+    print(f"[CART403] Created {len(files)} batches → CART403_BATCHES")
 
 if __name__ == "__main__":
     main()
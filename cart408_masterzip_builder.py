@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 # CART408 — Master ZIP Builder
+# One ZIP per staged RUO. All members are compressed in one process pool;
+# RUOs whose staging folder is unchanged are skipped.
+#   python cart408_masterzip_builder.py [--zip-mode store|deflate|zstd]
 
-import os, json, zipfile
+import os, sys
+import c13b0_zip as zipper
 
 STAGING = "CART406_STAGING"
 OUTDIR = "CART408_MASTERZIPS"
@@ -12,20 +16,17 @@ def main():
 
     os.makedirs(OUTDIR, exist_ok=True)
 
-    for ruo in os.listdir(STAGING):
+    jobs = []
+    for ruo in sorted(os.listdir(STAGING)):
         path = f"{STAGING}/{ruo}"
         if not os.path.isdir(path):
             continue
+        jobs.append((f"{OUTDIR}/{ruo}.zip", zipper.tree_members(path, f"{ruo}/")))
 
-        zipname = f"{OUTDIR}/{ruo}.zip"
-        with zipfile.ZipFile(zipname, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(path):
-                for file in files:
-                    fp = os.path.join(root, file)
-                    arc = fp.replace(f"{STAGING}/", "")
-                    zipf.write(fp, arc)
+    stats = zipper.build_many(jobs, mode=zipper.zip_mode(sys.argv[1:]))
 
-    print("[CART408] Master ZIPs → CART408_MASTERZIPS")
+    print(f"[CART408] Master ZIPs → CART408_MASTERZIPS "
+          f"({stats['archives']} built, {stats['skipped']} unchanged)")
 
 if __name__ == "__main__":
     main()
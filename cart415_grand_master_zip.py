@@ -1,20 +1,19 @@
 #!/usr/bin/env python3
 # CART415 — Grand Master ZIP Builder
+# Nested master ZIPs are stored as-is; other members reuse the streams
+# already compressed by earlier builds.
 
-import os, zipfile
+import sys
+import c13b0_zip as zipper
 
 SRC = "CART410_ZIPSTRUCT"
 ZOUT = "grand_master.zip"
 
 def main():
-    with zipfile.ZipFile(ZOUT, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(SRC):
-            for file in files:
-                fp = os.path.join(root, file)
-                arc = fp.replace(f"{SRC}/", "")
-                zipf.write(fp, arc)
+    stats = zipper.build_zip(ZOUT, zipper.tree_members(SRC), mode=zipper.zip_mode(sys.argv[1:]))
 
-    print("[CART415] Grand Master ZIP created → grand_master.zip")
+    state = "unchanged" if stats["skipped"] else f"{stats['compressed']} members compressed"
+    print(f"[CART415] Grand Master ZIP created → grand_master.zip ({state})")
 
 if __name__ == "__main__":
     main()
@@ -2,6 +2,7 @@
 # CART426 — Infinity‑Token Lineage Recorder
 
 import json, os, time
+import c13b0_history as history
 
 TOKEN = "INFINITY_TOKEN.json"
 LINEAGE = "CART426_LINEAGE.json"
@@ -20,18 +21,9 @@ def main():
         "color_distribution": token["color_distribution"]
     }
 
-    if os.path.exists(LINEAGE):
-        with open(LINEAGE, "r") as f:
-            lineage = json.load(f)
-    else:
-        lineage = []
+    history.open_log(LINEAGE).append(entry)
 
-    lineage.append(entry)
-
-    with open(LINEAGE, "w") as f:
-        json.dump(lineage, f, indent=4)
-
-    print("[CART426] Token lineage updated → CART426_LINEAGE.json")
+    print("[CART426] Token lineage updated → CART426_LINEAGE.jsonl")
 
 if __name__ == "__main__":
     main()
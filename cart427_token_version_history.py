@@ -2,6 +2,7 @@
 # CART427 — Infinity‑Token Version History Builder
 
 import json, os, time
+import c13b0_history as history
 
 TOKEN = "INFINITY_TOKEN.json"
 HISTORY = "CART427_VERSION_HISTORY.json"
@@ -19,18 +20,9 @@ def main():
         "token_sha": token["grand_master_sha256"]
     }
 
-    if os.path.exists(HISTORY):
-        with open(HISTORY, "r") as f:
-            hist = json.load(f)
-    else:
-        hist = []
+    history.open_log(HISTORY).append(entry)
 
-    hist.append(entry)
-
-    with open(HISTORY, "w") as f:
-        json.dump(hist, f, indent=4)
-
-    print("[CART427] Version history updated → CART427_VERSION_HISTORY.json")
+    print("[CART427] Version history updated → CART427_VERSION_HISTORY.jsonl")
 
 if __name__ == "__main__":
     main()
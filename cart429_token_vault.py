@@ -2,6 +2,7 @@
 # CART429 — Infinity Token Vault Builder
 
 import os, shutil
+import c13b0_history as history
 
 FILES = [
     "INFINITY_TOKEN.json",
@@ -11,6 +12,12 @@ FILES = [
     "CART428_TOKEN_REGISTER.json"
 ]
 
+# append-log histories whose JSON view goes into the vault
+HISTORIES = [
+    "CART426_LINEAGE.json",
+    "CART427_VERSION_HISTORY.json"
+]
+
 VAULT = "CART429_VAULT"
 
 def main():
@@ -18,6 +25,10 @@ def main():
         shutil.rmtree(VAULT)
     os.makedirs(VAULT, exist_ok=True)
 
+    for h in HISTORIES:
+        if os.path.exists(history.log_paths(h)[0]):
+            history.open_log(h).export_json()
+
     for f in FILES:
         if os.path.exists(f):
             shutil.copy(f, VAULT)
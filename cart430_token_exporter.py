@@ -1,22 +1,20 @@
 #!/usr/bin/env python3
 # CART430 — Final Infinity Token Exporter
 
-import os, zipfile
+import os, sys
+import c13b0_zip as zipper
 
 EXPORT = "infinity_token_export.zip"
 VAULT = "CART429_VAULT"
 GRAND = "grand_master.zip"
 
 def main():
-    with zipfile.ZipFile(EXPORT, "w", zipfile.ZIP_DEFLATED) as zipf:
-        if os.path.exists(GRAND):
-            zipf.write(GRAND, "grand_master.zip")
+    members = []
+    if os.path.exists(GRAND):
+        members.append((GRAND, "grand_master.zip"))    # stored, not recompressed
+    members.extend(zipper.tree_members(VAULT, "vault/"))
 
-        for root, dirs, files in os.walk(VAULT):
-            for f in files:
-                fp = os.path.join(root, f)
-                arc = fp.replace(f"{VAULT}/", "vault/")
-                zipf.write(fp, arc)
+    zipper.build_zip(EXPORT, members, mode=zipper.zip_mode(sys.argv[1:]))
 
     print("[CART430] Final Infinity Token export created → infinity_token_export.zip")
 
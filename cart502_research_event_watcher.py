@@ -1,29 +1,49 @@
 #!/usr/bin/env python3
 # CART502 — Research Event Watcher
+# Records which source artifacts changed since the last pass.
+#   python cart502_research_event_watcher.py           one pass (scheduler mode)
+#   python cart502_research_event_watcher.py --watch   stay resident; on every
+#       debounced burst run CART503 → CART507 right away
 
-import os, json, time
+import os, sys
+import c13b0_ruo_store as ruo_store
+import c13b0_pipeline as pipeline
+from c13b0_watch import Watcher, push_events
 
 RUO = "CART217_RUO_STORE.json"
 STATE = "CART501_STATE.json"
 OUT = "CART502_EVENTS.json"
+DEBOUNCE = 2.0
+
+def describe(events):
+    for e in events:
+        if e["path"] == RUO and e["kind"] != "deleted":
+            e["ruo_count"] = ruo_store.count_ruos(RUO)
+    return events
+
+def record(events):
+    queued = push_events(describe(events), OUT)
+    for e in events:
+        print(f"[CART502] {e['kind']}: {e['path']}")
+    print(f"[CART502] Research events recorded ({len(queued)} queued)")
+
+def react(events):
+    import cart503_rebuild_trigger, cart507_autonomous_rebuilder
+    record(events)
+    cart503_rebuild_trigger.main()
+    cart507_autonomous_rebuilder.main()
 
 def main():
     if not os.path.exists(STATE):
         print("[CART502] Kernel state missing, run CART501 first")
         return
 
-    events = []
-
-    # watch RUO count
-    if os.path.exists(RUO):
-        with open(RUO, "r") as f:
-            ruos = json.load(f)
-        events.append({"type": "ruo_count", "value": len(ruos)})
-
-    with open(OUT, "w") as f:
-        json.dump(events, f, indent=4)
-
-    print("[CART502] Research events recorded")
+    with Watcher(pipeline.sources(), debounce=DEBOUNCE) as watcher:
+        if "--watch" in sys.argv[1:]:
+            print(f"[CART502] Watching {len(watcher.paths)} artifacts ({watcher.mode})")
+            watcher.watch(react)
+        else:
+            record(watcher.poll())
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 # CART503 — Automatic Rebuild Trigger
+# Consumes CART502's change events and names the pipeline stages they affect.
 
 import json, os
+import c13b0_pipeline as pipeline
+from c13b0_watch import take_events
 
 EVENTS = "CART502_EVENTS.json"
 TRIGGER = "CART503_TRIGGER.json"
@@ -11,19 +14,21 @@ def main():
         print("[CART503] No events found")
         return
 
-    with open(EVENTS, "r") as f:
-        ev = json.load(f)
+    ev = take_events(EVENTS)
+    changed = sorted({e["path"] for e in ev if e.get("type") == "changed"})
+    stages = sorted(pipeline.downstream(changed)) if changed else []
 
-    signal = {"rebuild_needed": False}
-
-    for e in ev:
-        if e["type"] == "ruo_count" and e["value"] > 0:
-            signal["rebuild_needed"] = True
+    signal = {
+        "rebuild_needed": bool(stages),
+        "changed": changed,
+        "stages": stages
+    }
 
     with open(TRIGGER, "w") as f:
         json.dump(signal, f, indent=4)
 
-    print("[CART503] Rebuild trigger set:", signal["rebuild_needed"])
+    print("[CART503] Rebuild trigger set:", signal["rebuild_needed"],
+          f"({len(changed)} changed, {len(stages)} stages)")
 
 if __name__ == "__main__":
     main()
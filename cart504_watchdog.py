@@ -2,9 +2,11 @@
 # CART504 — Watchdog Manager
 
 import os, time, json
+import c13b0_history as history
 
 STATE = "CART501_STATE.json"
 LOG = "CART504_WATCHDOG_LOG.json"
+KEEP = 10000
 
 def main():
     if not os.path.exists(STATE):
@@ -19,16 +21,7 @@ def main():
         "kernel_status": st["status"]
     }
 
-    if os.path.exists(LOG):
-        with open(LOG, "r") as f:
-            log = json.load(f)
-    else:
-        log = []
-
-    log.append(entry)
-
-    with open(LOG, "w") as f:
-        json.dump(log, f, indent=4)
+    history.open_log(LOG, keep=KEEP).append(entry)
 
     print("[CART504] Watchdog updated")
 
@@ -1,18 +1,25 @@
 #!/usr/bin/env python3
 # CART505 — Autonomous Scheduler Loop
 
-import time, os
+import time
+from c13b0_cartpool import CartPool, report
 
 INTERVAL = 300  # 5 minutes
+TIMEOUT = 120   # per cart
+
+CYCLE = [
+    "cart501_autonomous_kernel.py",
+    "cart502_research_event_watcher.py",
+    "cart503_rebuild_trigger.py",
+    "cart504_watchdog.py"
+]
 
 def main():
     print("[CART505] Scheduler running. Ctrl+C to stop.")
-    while True:
-        os.system("./cart501_autonomous_kernel.py")
-        os.system("./cart502_research_event_watcher.py")
-        os.system("./cart503_rebuild_trigger.py")
-        os.system("./cart504_watchdog.py")
-        time.sleep(INTERVAL)
+    with CartPool(timeout=TIMEOUT) as pool:
+        while True:
+            report("CART505", pool.run_all(CYCLE))
+            time.sleep(INTERVAL)
 
 if __name__ == "__main__":
     main()
@@ -2,18 +2,20 @@
 # CART507 — Autonomous Rebuilder
 
 import os, json
+import c13b0_pipeline as pipeline
 
 TRIGGER = "CART503_TRIGGER.json"
 CALC = "CART506_CALCULATOR_MATRIX.json"
 LOG = "CART507_REBUILD_LOG.json"
 
+# module -> pipeline stage (None: no cart in this tree builds it)
 MODULES = {
-    "RUO_STORE": "./cart217_ruo_builder.py",
-    "CROSSOVER": "./cart226_crossover_expander.py",
-    "MASTERHASH": "./cart401_masterhash_builder.py",
-    "MASTERZIP": "./cart408_masterzip_builder.py",
-    "GRANDMASTER": "./cart415_grand_master_zip.py",
-    "TOKEN": "./cart424_token_metadata_builder.py"
+    "RUO_STORE": None,
+    "CROSSOVER": "cart228",
+    "MASTERHASH": None,
+    "MASTERZIP": "cart408",
+    "GRANDMASTER": "cart415",
+    "TOKEN": "cart424"
 }
 
 def main():
@@ -32,11 +34,24 @@ def main():
     log = []
 
     if trigger.get("rebuild_needed"):
-        for module, script in MODULES.items():
-            c = calc.get(module, {})
-            if c.get("rebuild_need"):
-                os.system(script)
-                log.append({"module": module, "status": "rebuilt", "priority": c.get("priority")})
+        # stages downstream of the changed artifacts (CART503); a trigger
+        # without them falls back to the modules the calculators flag
+        targets = trigger.get("stages")
+        if not targets:
+            targets = sorted({sid for module, sid in MODULES.items()
+                              if sid and calc.get(module, {}).get("rebuild_need")})
+        priority = {sid: calc.get(module, {}).get("priority")
+                    for module, sid in MODULES.items() if sid}
+
+        # one pipeline run: unchanged stages are skipped, the rest run in parallel
+        status = pipeline.run(targets)["status"] if targets else {}
+
+        for sid in sorted(status):
+            log.append({
+                "stage": sid,
+                "status": status[sid],
+                "priority": priority.get(sid)
+            })
 
     with open(LOG, "w") as f:
         json.dump(log, f, indent=4)
@@ -1,20 +1,29 @@
 #!/usr/bin/env python3
 # CART509 — Persistent Calculation Loop
 
-import os, time
+import os, json, time
+from c13b0_cartpool import CartPool, report
 
+CALC = "CART506_CALCULATOR_MATRIX.json"
 HISTORY = "CART509_CALC_HISTORY.json"
+INTERVAL = 60
 
 def main():
     print("[CART509] Starting persistent calculation loop. Ctrl+C to exit.")
 
-    while True:
-        os.system("./cart506_universal_calculator_engine.py")
+    with CartPool(timeout=INTERVAL) as pool:
+        while True:
+            res = pool.run("cart506_universal_calculator_engine.py")
+            if not res.ok:
+                report("CART509", [res])
 
-        if os.path.exists("CART506_CALCULATOR_MATRIX.json"):
-            os.system("jq '.' CART506_CALCULATOR_MATRIX.json >> CART509_CALC_HISTORY.json 2>/dev/null")
+            if res.ok and os.path.exists(CALC):
+                with open(CALC, "r") as f:
+                    matrix = json.load(f)
+                with open(HISTORY, "a") as f:
+                    f.write(json.dumps(matrix, indent=2) + "\n")
 
-        time.sleep(60)
+            time.sleep(INTERVAL)
 
 if __name__ == "__main__":
     main()
@@ -1,23 +1,32 @@
 #!/usr/bin/env python3
 # CART510 — Full Autonomy Daemon
 
-import os, time
+import time
+from c13b0_cartpool import CartPool, report
 
 INTERVAL = 300  # 5 minutes
+TIMEOUT = 600   # per cart
+# CART507 runs the whole rebuild pipeline: killing it mid-run would orphan
+# its stage processes, so it is never timed out
+TIMEOUTS = {"cart507_autonomous_rebuilder.py": None}
+
+CYCLE = [
+    "cart501_autonomous_kernel.py",
+    "cart502_research_event_watcher.py",
+    "cart503_rebuild_trigger.py",
+    "cart506_universal_calculator_engine.py",
+    "cart507_autonomous_rebuilder.py",
+    "cart508_hazard_recovery.py",
+    "cart504_watchdog.py"
+]
 
 def main():
     print("[CART510] Infinity‑OS Full Autonomy Daemon running...")
 
-    while True:
-        os.system("./cart501_autonomous_kernel.py")
-        os.system("./cart502_research_event_watcher.py")
-        os.system("./cart503_rebuild_trigger.py")
-        os.system("./cart506_universal_calculator_engine.py")
-        os.system("./cart507_autonomous_rebuilder.py")
-        os.system("./cart508_hazard_recovery.py")
-        os.system("./cart504_watchdog.py")
-
-        time.sleep(INTERVAL)
+    with CartPool(timeout=TIMEOUT, timeouts=TIMEOUTS) as pool:
+        while True:
+            report("CART510", pool.run_all(CYCLE))
+            time.sleep(INTERVAL)
 
 if __name__ == "__main__":
     main()
@@ -4,6 +4,9 @@
 
 import json, os, time
 from collections import Counter
+import c13b0_ruo_store as ruo_store
+import c13b0_history as history
+from c13b0_cartpool import cached_json
 
 RUO_STORE = "CART217_RUO_STORE.json"
 TERM_FEED = "CART352_TERM_FEED.json"
@@ -16,9 +19,8 @@ def load_json(path, default):
         return json.load(f)
 
 def main():
-    ruos = load_json(RUO_STORE, [])
-    seed_terms = load_json(TERM_FEED, [])
-    prev = load_json(OUT, {"history": []})
+    ruos = ruo_store.iter_ruos(RUO_STORE) if ruo_store.exists(RUO_STORE) else []
+    seed_terms = cached_json(TERM_FEED, [])
 
     # 1. Collect all terms from RUOs
     all_terms = []
@@ -46,10 +48,7 @@ def main():
         "extra_seed_terms": extra
     }
 
-    prev["history"].append(snapshot)
-
-    with open(OUT, "w") as f:
-        json.dump(prev, f, indent=4)
+    history.open_log(OUT, key="history").append(snapshot)
 
     print("[CART601] Term evolution snapshot written →", OUT)
 
@@ -3,6 +3,7 @@
 # Evolves color biases over time based on Infinity Seed.
 
 import json, os, time, random
+from c13b0_cartpool import cached_json
 
 SEED = "CART229_INFINITY_SEED.json"
 BASE_COLOR_MAP = "C13B0_COLOR_MAP.json"  # optional
@@ -17,8 +18,8 @@ def load_json(path, default):
         return json.load(f)
 
 def main():
-    seed = load_json(SEED, {"vector_seed": [0.5]*128})["vector_seed"]
-    base_map = load_json(BASE_COLOR_MAP, {})
+    seed = cached_json(SEED, {"vector_seed": [0.5]*128})["vector_seed"]
+    base_map = cached_json(BASE_COLOR_MAP, {})
     evolved = load_json(OUT, {"history": []})
 
     # derive a "mutation factor" from seed
@@ -3,6 +3,8 @@
 # Gradually evolves crossover weights over time.
 
 import json, os, time
+from c13b0_cartpool import cached_json
+import c13b0_history as history
 
 CROSS = "CART226_CROSSOVER_EXPANDED.json"
 OUT = "CART603_CROSSOVER_EVOLVED.json"
@@ -14,8 +16,7 @@ def load_json(path, default):
         return json.load(f)
 
 def main():
-    base = load_json(CROSS, {})
-    evolved = load_json(OUT, {"history": []})
+    base = cached_json(CROSS, {})   # shared between cycles, not modified
 
     new_state = {}
 
@@ -27,8 +28,7 @@ def main():
             w = w * 1.02  # growth
             if w > 10:
                 w = 10.0
-            link["weight"] = round(w, 4)
-            new_links.append(link)
+            new_links.append(dict(link, weight=round(w, 4)))
         new_state[ruo] = new_links
 
     snapshot = {
@@ -36,10 +36,8 @@ def main():
         "state": new_state
     }
 
-    evolved["history"].append(snapshot)
-
-    with open(OUT, "w") as f:
-        json.dump(evolved, f, indent=4)
+    # only the RUOs whose links changed are stored between snapshots
+    history.open_log(OUT, key="history", state_key="state").append(snapshot)
 
     print("[CART603] Crossover evolution snapshot →", OUT)
 
@@ -3,6 +3,7 @@
 # Aggregates snapshots from 601/602/603 into a single history file.
 
 import json, os, time
+import c13b0_history as history
 
 TERMS = "CART601_EVOLVED_TERMS.json"
 COLORS = "CART602_COLOR_BIAS_EVOLVED.json"
@@ -16,16 +17,14 @@ def load_json(path, default):
         return json.load(f)
 
 def main():
-    terms = load_json(TERMS, {})
     colors = load_json(COLORS, {})
-    cross = load_json(CROSS, {})
     log = load_json(OUT, {"entries": []})
 
     entry = {
         "timestamp": int(time.time()),
-        "terms_snapshot_index": len(terms.get("history", [])) - 1,
+        "terms_snapshot_index": len(history.open_log(TERMS, key="history")) - 1,
         "colors_snapshot_index": len(colors.get("history", [])) - 1,
-        "crossover_snapshot_index": len(cross.get("history", [])) - 1
+        "crossover_snapshot_index": len(history.open_log(CROSS, key="history", state_key="state")) - 1
     }
 
     log["entries"].append(entry)
@@ -1,19 +1,29 @@
 #!/usr/bin/env python3
 # CART605 — Evolution Scheduler (Stage‑6)
 # Runs term evolution, color mutation, crossover evolution, and logging in a loop.
+# 601–603 are independent and run side by side; 604 records their snapshots.
 
-import os, time
+import time
+from c13b0_cartpool import CartPool, report
 
 INTERVAL = 600  # 10 minutes
+TIMEOUT = 300   # per cart
+
+EVOLVERS = [
+    "cart601_term_evolution_engine.py",
+    "cart602_color_logic_mutator.py",
+    "cart603_crossover_evolution_engine.py"
+]
+RECORDER = "cart604_evolution_history_recorder.py"
 
 def main():
     print("[CART605] Evolution scheduler running. Ctrl+C to stop.")
-    while True:
-        os.system("./cart601_term_evolution_engine.py")
-        os.system("./cart602_color_logic_mutator.py")
-        os.system("./cart603_crossover_evolution_engine.py")
-        os.system("./cart604_evolution_history_recorder.py")
-        time.sleep(INTERVAL)
+    with CartPool(workers=len(EVOLVERS), timeout=TIMEOUT) as pool:
+        while True:
+            results = pool.run_parallel(EVOLVERS)
+            results.append(pool.run(RECORDER))
+            report("CART605", results)
+            time.sleep(INTERVAL)
 
 if __name__ == "__main__":
     main()
@@ -2,6 +2,8 @@
 # CART704 — Research Preview Builder
 
 import os, json
+from itertools import islice
+import c13b0_ruo_store as ruo_store
 
 RUO = "CART217_RUO_STORE.json"
 OUT_DIR = "site/data"
@@ -9,14 +11,13 @@ OUT_DIR = "site/data"
 def main():
     os.makedirs(OUT_DIR, exist_ok=True)
 
-    if not os.path.exists(RUO):
+    if not ruo_store.exists(RUO):
         print("[CART704] RUO store missing.")
         return
 
-    with open(RUO, "r") as f:
-        ruos = json.load(f)
+    ruos = ruo_store.iter_ruos(RUO)
 
-    for i, r in enumerate(ruos[:10000]):  # limit to first batch
+    for i, r in enumerate(islice(ruos, 10000)):  # limit to first batch
         preview = {
             "title": f"Research Entry #{i+1}",
             "abstract": f"Preview automatically generated for RUO: {r.get('terms', [])[:3]}"
@@ -2,6 +2,7 @@
 # CART707 — Crossover Visualizer
 
 import os
+import c13b0_history as history
 
 html = """
 <html>
@@ -89,4 +90,7 @@ os.makedirs("site/js", exist_ok=True)
 with open("site/js/crossover.js", "w") as f:
     f.write(js)
 
+# the page reads the classic JSON view of the crossover evolution log
+history.open_log("CART603_CROSSOVER_EVOLVED.json", key="history", state_key="state").export_json()
+
 print("[CART707] Crossover visualizer built.")
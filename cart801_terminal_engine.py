@@ -3,8 +3,11 @@
 
 import json, time, os, hashlib
 
+import c13b0_ledger as ledger_engine
+
 STATE = "CART801_TERMINAL_STATE.json"
 WALLET = "CART805_WALLET.json"
+LEDGER = "CART805_WALLET.jsonl"
 FEED = "CART804_FEED_BUFFER.json"
 
 def load(path, default):
@@ -28,7 +31,7 @@ def main():
         "inf_accumulated": 0
     })
 
-    wallet = load(WALLET, {"balance": 0, "history":[]})
+    ledger = ledger_engine.open_ledger(LEDGER, WALLET)
     feed = load(FEED, {"tiles":[]})
 
     now = int(time.time())
@@ -38,10 +41,8 @@ def main():
     if delta >= state["inf_interval"]:
         cycles = delta // state["inf_interval"]
         earned = cycles * state["inf_rate"]
-        wallet["balance"] += earned
-        wallet["history"].append(
-            {"time":now, "type":"time-earn","amount":earned}
-        )
+        if earned > 0:
+            ledger.earn(earned, kind="time-earn", ts=now)
         state["last_tick"] = now
 
         # push a feed tile
@@ -52,7 +53,7 @@ def main():
             "message": f"Earned {earned} INF from thinking cycle."
         })
 
-    save(WALLET, wallet)
+    ledger.export_json(WALLET)
     save(FEED, feed)
     save(STATE, state)
 
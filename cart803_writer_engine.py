@@ -3,8 +3,11 @@
 
 import json, os, hashlib, time
 
+import c13b0_ledger as ledger_engine
+
 TOKENS = "CART803_TOKENS.json"
 WALLET = "CART805_WALLET.json"
+LEDGER = "CART805_WALLET.jsonl"
 
 def load(path, default):
     if not os.path.exists(path):
@@ -21,11 +24,11 @@ def hash_text(t):
 
 def main():
     tokens = load(TOKENS, {"tokens":{}})
-    wallet = load(WALLET, {"balance":0,"history":[]})
+    ledger = ledger_engine.open_ledger(LEDGER, WALLET)
 
     # Append logic would be triggered externally; engine ensures structure exists
     save(TOKENS, tokens)
-    save(WALLET, wallet)
+    ledger.export_json(WALLET)
 
     print("[CART803] Writer engine ready.")
 
@@ -2,6 +2,8 @@
 # CART804 — Feed Generator (Infinite Scroll Logic)
 
 import json, os, time, random
+import c13b0_ruo_store as ruo_store
+import c13b0_history as history
 
 RUO = "CART217_RUO_STORE.json"
 EVOLVE = "CART601_EVOLVED_TERMS.json"
@@ -15,14 +17,13 @@ def save(p,d):
     json.dump(d, open(p,"w"), indent=4)
 
 def main():
-    ruos = load(RUO, [])
-    evo = load(EVOLVE, {"history":[]})
-    cross = load(CROSS, {"history":[]})
+    evo = history.open_log(EVOLVE, key="history").latest({})
+    cross = history.open_log(CROSS, key="history", state_key="state").latest({})
     feed = load(FEED, {"tiles":[]})
 
     # grab last snapshots
-    evo_terms = evo["history"][-1]["evolved_terms"] if evo["history"] else []
-    cross_map = cross["history"][-1]["state"] if cross["history"] else {}
+    evo_terms = evo.get("evolved_terms", [])
+    cross_map = cross.get("state", {})
 
     # tile logic
     tile = {
@@ -30,7 +31,7 @@ def main():
         "terms": random.sample(evo_terms, min(3,len(evo_terms))) if evo_terms else [],
         "message": "Logic-placed tile via Infinity-OS feed engine.",
         "crossover_links": len(cross_map),
-        "ruo_count": len(ruos)
+        "ruo_count": ruo_store.count_ruos(RUO)
     }
 
     feed["tiles"].append(tile)
@@ -3,7 +3,10 @@
 
 import json, os, time
 
+import c13b0_ledger as ledger_engine
+
 WALLET = "CART805_WALLET.json"
+LEDGER = "CART805_WALLET.jsonl"
 
 def load(path,d):
     return json.load(open(path)) if os.path.exists(path) else d
@@ -12,8 +15,9 @@ def save(path,d):
     json.dump(d, open(path,"w"), indent=4)
 
 def main():
-    wallet = load(WALLET, {"balance":0,"history":[]})
-    save(WALLET, wallet)
+    # the ledger is the wallet; CART805_WALLET.json is its exported view
+    ledger = ledger_engine.open_ledger(LEDGER, WALLET)
+    ledger.export_json(WALLET)
     print("[CART805] Wallet engine initialized.")
 
 if __name__ == "__main__":
@@ -3,7 +3,10 @@
 
 import json, os, time, hashlib
 
+import c13b0_ledger as ledger_engine
+
 WALLET = "CART805_WALLET.json"
+LEDGER = "CART805_WALLET.jsonl"
 REWARD = "CART809_WRITER_REWARD.json"
 
 def load(p,d): 
@@ -17,22 +20,17 @@ def complexity(text):
 
 def main():
     reward = load(REWARD, {"last_write":0})
-    wallet = load(WALLET, {"balance":0,"history":[]})
+    ledger = ledger_engine.open_ledger(LEDGER, WALLET)
 
     now = time.time()
     delta = now - reward["last_write"]
 
     if delta > 900:  # reward every 15 minutes of writing focus
         amount = 1  # 1 INF per writing cycle
-        wallet["balance"] += amount
-        wallet["history"].append({
-            "time":now,
-            "type":"writer-earn",
-            "amount":amount
-        })
+        ledger.earn(amount, kind="writer-earn", ts=now)
         reward["last_write"] = now
 
-    save(WALLET, wallet)
+    ledger.export_json(WALLET)
     save(REWARD, reward)
 
     print("[CART809] Writer reward checked.")
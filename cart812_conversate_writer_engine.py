@@ -2,15 +2,76 @@
 # CART812 — Conversate Token Writer Engine
 # Turns user input into a token-structured research document.
 
-import json, os, time, random
+import json, os, time, random, shutil
+from array import array
+from urllib.parse import quote
+import c13b0_ruo_store as ruo_store
+import c13b0_history as history
+import c13b0_similarity as similarity
 
 INPUT = "CART806_INPUT.txt"
 OUT = "CART812_CONVERSATE_DRAFT.json"
 RUO = "CART217_RUO_STORE.json"
 EVO = "CART601_EVOLVED_TERMS.json"
-
-def load(p,d):
-    return json.load(open(p)) if os.path.exists(p) else d
+VECTORS = "CART220_VECTORS.npy"
+WORDS = "CART812_TERM_WORDS"     # <word>.rows: vector rows of the RUOs using it
+
+def _word_file(root, word):
+    return os.path.join(root, quote(word, safe="")[:200] + ".rows")
+
+def word_postings(store, index):
+    # term word → vector rows, rebuilt when the RUO store or vectors change
+    sig = {"source": store.meta.get("source"), "count": store.meta.get("count"),
+           "vectors": os.path.getmtime(VECTORS)}
+    state = os.path.join(WORDS, "state.json")
+    try:
+        with open(state, "r") as f:
+            if json.load(f) == sig:
+                return WORDS
+    except (OSError, ValueError):
+        pass
+    posting = {}
+    for r in store:
+        row = index.rows.get(r["research_hash"])
+        if row is None:
+            continue
+        for w in {w for t in r.get("terms", []) for w in t.lower().split()}:
+            posting.setdefault(w, []).append(row)
+    tmp = f"{WORDS}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    for w, rows in posting.items():
+        with open(_word_file(tmp, w), "ab") as f:
+            array("I", rows).tofile(f)
+    with open(os.path.join(tmp, "state.json"), "w") as f:
+        json.dump(sig, f)
+    old = f"{WORDS}.{os.getpid()}.old"
+    if os.path.exists(WORDS):
+        os.rename(WORDS, old)
+    os.rename(tmp, WORDS)
+    shutil.rmtree(old, ignore_errors=True)
+    return WORDS
+
+def closest_ruo(store, prompt):
+    # RUO nearest to the mean vector of the RUOs sharing a word with the prompt
+    if not similarity.available(VECTORS):
+        return None
+    words = set(prompt.lower().split())
+    index = similarity.open_index(VECTORS)
+    root = word_postings(store, index)
+    seeds = set()
+    for w in words:
+        try:
+            with open(_word_file(root, w), "rb") as f:
+                seeds.update(array("I", f.read()))
+        except OSError:
+            continue
+    if not seeds:
+        return None
+    seeds = sorted(seeds)
+    query = (index.matrix[seeds] * index.inv_norm[seeds, None]).mean(axis=0)
+    hits = index.search(query, 1)[0]
+    return hits[0][0] if hits else None
 
 def main():
     if not os.path.exists(INPUT):
@@ -20,10 +81,17 @@ def main():
     with open(INPUT,"r") as f:
         prompt = f.read().strip()
 
-    ruos = load(RUO, [])
-    evo = load(EVO, {"history":[]})
+    terms = history.open_log(EVO, key="history").latest({}).get("evolved_terms", [])
 
-    terms = evo["history"][-1]["evolved_terms"] if evo["history"] else []
+    support = []
+    if ruo_store.exists(RUO):
+        with ruo_store.open_store(RUO) as store:
+            hashes = store.hashes()
+            if hashes:
+                rh = closest_ruo(store, prompt)
+                if rh not in store:     # none found, or stale vectors
+                    rh = random.choice(hashes)
+                support = store.get(rh)["terms"][:2]
 
     # basic outline generation
     outline = [
@@ -38,7 +106,7 @@ def main():
     bullets = [
         f"- Key idea: {prompt}",
         f"- Related evolved term: {random.choice(terms) if terms else 'none'}",
-        f"- Supporting RUO: {random.choice(ruos)['terms'][:2] if ruos else []}"
+        f"- Supporting RUO: {support}"
     ]
 
     paper = f"""
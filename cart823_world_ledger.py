@@ -2,27 +2,26 @@
 # CART823 — Global Token Ledger
 
 import json, os, time
+import c13b0_history as history
 
 LEDGER = "WORLD_TOKEN_LEDGER.json"
+VIEW = 1000     # newest entries in the exported view (site/js/ledger_sync.js)
 
-def load(p,d):
-    return json.load(open(p)) if os.path.exists(p) else d
-
-def save(p,d):
-    json.dump(d, open(p,"w"), indent=4)
+def open_ledger():
+    return history.open_log(LEDGER, key="history", ts_key="time")
 
 def main():
-    ledger = load(LEDGER, {"count":0,"history":[]})
+    ledger = open_ledger()
+    count = ledger.latest({}).get("total", len(ledger)) + 1
 
-    ledger["count"] += 1
-    ledger["history"].append({
+    ledger.append({
         "time": int(time.time()),
         "event": "token_generated",
-        "total": ledger["count"]
+        "total": count
     })
+    ledger.export_json(extra={"count": count}, keep=VIEW)
 
-    save(LEDGER, ledger)
-    print("[CART823] Global ledger incremented:", ledger["count"])
+    print("[CART823] Global ledger incremented:", count)
 
 if __name__ == "__main__":
     main()
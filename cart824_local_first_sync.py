@@ -2,17 +2,20 @@
 # CART824 — Local-first Sync Engine for IPFS
 
 import json, os
+import c13b0_history as history
 
 IN = "CART822_PUBLISH_RESULT.json"
 LEDGER = "WORLD_TOKEN_LEDGER.json"
 OUT = "CART824_SYNC_PACKAGE.json"
+VIEW = 1000     # newest ledger entries in the package, as in CART823's view
 
 def load(p,d):
     return json.load(open(p)) if os.path.exists(p) else d
 
 def main():
     token = load(IN, {})
-    ledger = load(LEDGER, {})
+    log = history.open_log(LEDGER, key="history", ts_key="time")
+    ledger = {"count": log.latest({}).get("total", len(log)), "history": log.tail(VIEW)}
 
     with open(OUT,"w") as f:
         json.dump({
@@ -9,10 +9,13 @@ import time
 import os
 import sys
 
+import c13b0_ledger as ledger_engine
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 INFINITY_DIR = os.path.join(ROOT, ".infinity")
 TERMINAL_STATE = os.path.join(ROOT, "CART801_TERMINAL_STATE.json")
 WALLET = os.path.join(ROOT, "CART805_WALLET.json")
+LEDGER = os.path.join(ROOT, "CART805_WALLET.jsonl")
 
 def load_json(path, default=None):
     """Load JSON file with default fallback"""
@@ -62,10 +65,7 @@ class InfinityTerminalProcessor:
             if key not in self.terminal_state:
                 self.terminal_state[key] = value
         
-        self.wallet = load_json(WALLET, {
-            "balance": 0,
-            "history": []
-        })
+        self.ledger = ledger_engine.open_ledger(LEDGER, WALLET)
     
     def process_command(self, command, args=None):
         """Process an infinity command and return response"""
@@ -226,7 +226,7 @@ class InfinityTerminalProcessor:
             'ok': True,
             'command': 'infinity-status',
             'terminal_state': self.terminal_state,
-            'wallet_balance': self.wallet.get('balance', 0),
+            'wallet_balance': self.ledger.balance(),
             'features': self.legend_meta.get('features', []),
             'themes_available': len(self.theme_config.get('themes', {})),
             'message': '📊 System Status Retrieved'
@@ -234,12 +234,13 @@ class InfinityTerminalProcessor:
     
     def cmd_wallet(self, args):
         """Show wallet balance"""
+        balance = self.ledger.balance()
         return {
             'ok': True,
             'command': 'infinity-wallet',
-            'balance': self.wallet.get('balance', 0),
-            'history': self.wallet.get('history', [])[-10:],  # Last 10 transactions
-            'message': f'💰 Your INF Balance: {self.wallet.get("balance", 0)}'
+            'balance': balance,
+            'history': self.ledger.history(10),  # Last 10 transactions
+            'message': f'💰 Your INF Balance: {balance}'
         }
     
     def cmd_repos(self, args):
@@ -270,20 +271,9 @@ class InfinityTerminalProcessor:
             except (ValueError, IndexError):
                 amount = 1
         
-        # Ensure wallet has required keys
-        if 'balance' not in self.wallet:
-            self.wallet['balance'] = 0
-        if 'history' not in self.wallet:
-            self.wallet['history'] = []
-        
-        self.wallet['balance'] += amount
-        self.wallet['history'].append({
-            'time': int(time.time()),
-            'type': formula_key,
-            'amount': amount
-        })
-        
-        save_json(WALLET, self.wallet)
+        if amount > 0:
+            self.ledger.earn(amount, kind=formula_key, ts=int(time.time()))
+            self.ledger.export_json(WALLET)
         return amount
 
 def main():
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
-import os, itertools, requests, hashlib, json, time
+import os, itertools, hashlib, json
 from datetime import datetime
 from urllib.parse import quote
+from c13b0_fetch import Fetcher
 
 # -------------------------------------------------------
 #   CART A — arXiv Research Scraper + Color Logic Seed
@@ -25,13 +26,11 @@ def color_seed(term):
     if "crystal" in term or "lattice" in term: return "orange"
     return "green"  # default tool-state
 
-def fetch_arxiv(query):
-    url = f"https://export.arxiv.org/api/query?search_query=all:{quote(query)}&start=0&max_results=3"
-    try:
-        r = requests.get(url, timeout=10)
-        return r.text
-    except:
-        return "ERROR"
+def arxiv_url(query):
+    return f"https://export.arxiv.org/api/query?search_query=all:{quote(query)}&start=0&max_results=3"
+
+def fetch_text(res):
+    return "ERROR" if res.error else res.text
 
 def write_temp_article(combo, content):
     path = "temp_articles"
@@ -70,17 +69,18 @@ def main():
     print("∞ CART A — arXiv Research Scraper Running ∞")
     print("Generating 2→5 term combinations...")
     
-    for size in [2,3,4,5]:
-        combos = generate_combos(TERMS, size)
-        print(f"[+] {len(combos)} combos of size {size}")
+    # ~3 requests/s to arXiv, same pace as the old 0.3s sleep, but pooled and pipelined
+    with Fetcher(per_host=3, rate=3.0, burst=3) as fetcher:
+        for size in [2,3,4,5]:
+            combos = generate_combos(TERMS, size)
+            print(f"[+] {len(combos)} combos of size {size}")
 
-        for combo in combos:
-            query = " AND ".join(combo)
-            print("   →", query)
-            r = fetch_arxiv(query)
-            write_temp_article(combo, r)
-            batch_or_zip()
-            time.sleep(0.3)  # Keep arXiv happy
+            queries = [" AND ".join(combo) for combo in combos]
+            pages = fetcher.fetch_all(arxiv_url(q) for q in queries)
+            for combo, query, res in zip(combos, queries, pages):
+                print("   →", query)
+                write_temp_article(combo, fetch_text(res))
+                batch_or_zip()
 
     print("\nCompleted CART A.")
     print("Articles stored in temp_articles/")
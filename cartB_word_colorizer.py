@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import json, hashlib, os, time
 
+import c13b0_colormatch as colormatch
+
 VECTOR_FILE = "C13B0_USER_VECTOR.json"
 OUTPUT_FILE = "C13B0_COLOR_MAP.json"
 
@@ -21,13 +23,8 @@ def load_vector():
     with open(VECTOR_FILE, "r") as f:
         return json.load(f)
 
-def colorize(term):
-    t = term.lower()
-    for color, keywords in COLOR_RULES.items():
-        for key in keywords:
-            if key in t:
-                return color
-    return "yellow"  # default = data to mine
+# first color whose keyword occurs in the term; default = data to mine
+colorize = colormatch.compile_rules(colormatch.rules_from_colors(COLOR_RULES), "yellow").first
 
 def main():
     print("[💜 CART B] Loading C13B0 user vector...")
@@ -4,6 +4,8 @@
 import json
 import os
 
+import c13b0_colormatch as colormatch
+
 # Load vectors safely
 def load_json(path):
     try:
@@ -38,22 +40,14 @@ DISCOVERY_TERMS = {
 }
 
 # Density → Color logic
-def density_to_color(term):
-    t = term.lower()
-
-    if t in PHYSICS_TERMS:
-        return "blue"
-
-    if t in CHEMISTRY_TERMS:
-        return "yellow"
-
-    if t in ENGINEERING_TERMS:
-        return "orange"
-
-    if t in DISCOVERY_TERMS:
-        return "red"
-
-    return "green"
+DENSITY_RULES = colormatch.rules_from_sets([
+    (PHYSICS_TERMS, "blue"),
+    (CHEMISTRY_TERMS, "yellow"),
+    (ENGINEERING_TERMS, "orange"),
+    (DISCOVERY_TERMS, "red"),
+])
+
+density_to_color = colormatch.compile_rules(DENSITY_RULES, "green", mode="exact").first
 
 
 density_map = {}
@@ -2,8 +2,13 @@
 # 💜 CART H — C13B0 Term-Pair Intelligence Builder
 
 import json
-import itertools
 import os
+import sys
+
+import c13b0_fusion as fusion
+import c13b0_shards as shards
+
+TOP_K = 1000    # pairs kept per fusion color
 
 # --- Helpers ---------------------------------------------------------
 def load_json(path):
@@ -32,43 +37,34 @@ if len(terms) < 2:
     exit(0)
 
 # --- Build term pairs -------------------------------------------------
+# Fusion color logic:
+# purple dominates → assimilation
+# blue mixes with purple → deep research
+# red overrides on divergence
+# green remains a tool modifier
+# Only the TOP_K most cohesive pairs of each fusion color are built
+# (c13b0_fusion.color_clusters), not every combination.
 print("[💜 CART H] Building 2-term combinations…")
-pairs = list(itertools.combinations(terms, 2))
+fuse = fusion.fuse_precedence(["purple", "red", "blue", "yellow"])   # fallback: colorA
+clusters = fusion.color_clusters(terms, lambda t: color_map.get(t, "yellow"), [2], TOP_K, fuse,
+                                 workers=shards.workers_arg(sys.argv))
 
 fusion_results = {}
 
-for a, b in pairs:
-    cA = color_map.get(a, "yellow")
-    cB = color_map.get(b, "yellow")
-
-    # Fusion color logic:
-    # purple dominates → assimilation
-    # blue mixes with purple → deep research
-    # red overrides on divergence
-    # green remains a tool modifier
-    fusion_color = None
-
-    if "purple" in (cA, cB):
-        fusion_color = "purple"
-    elif "red" in (cA, cB):
-        fusion_color = "red"
-    elif "blue" in (cA, cB):
-        fusion_color = "blue"
-    elif "yellow" in (cA, cB):
-        fusion_color = "yellow"
-    else:
-        fusion_color = cA  # fallback
+for (_, fusion_color), pairs in clusters.items():
+    for _, (a, b) in pairs:
+        densityA = density_map.get(a, 1)
+        densityB = density_map.get(b, 1)
+        density_score = (densityA + densityB) / 2
 
-    densityA = density_map.get(a, 1)
-    densityB = density_map.get(b, 1)
-    density_score = (densityA + densityB) / 2
+        fusion_results[f"{a}+{b}"] = {
+            "colorA": color_map.get(a, "yellow"),
+            "colorB": color_map.get(b, "yellow"),
+            "fusion_color": fusion_color,
+            "density_score": density_score,
+        }
 
-    fusion_results[f"{a}+{b}"] = {
-        "colorA": cA,
-        "colorB": cB,
-        "fusion_color": fusion_color,
-        "density_score": density_score,
-    }
+print(f"[💜 CART H] Kept {len(fusion_results)} pairs (top {TOP_K} per fusion color).")
 
 # --- Save output ------------------------------------------------------
 save_json("C13B0_PAIR_FUSION.json", fusion_results)
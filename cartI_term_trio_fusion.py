@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
-import json, itertools, os
+import json, sys
+
+import c13b0_fusion as fusion
+import c13b0_shards as shards
+
+TOP_K = 1000    # trios kept per fused color
 
 # Utility to load JSON safely
 def load_json(path, default=None):
@@ -41,27 +46,17 @@ if len(terms) < 3:
 print(f"[💜 CART I] {len(terms)} terms loaded.")
 print("[💜 CART I] Generating 3-term fusion clusters…")
 
-fusion_map = {}
+# Only the TOP_K most cohesive trios of each fused color are built
+# (c13b0_fusion.color_clusters), not every combination.
+fuse_colors = fusion.fuse_precedence(["purple", "red", "orange", "yellow", "pink", "green"], "blue")
+clusters = fusion.color_clusters(terms, lambda t: unified.get(t, "blue"), [3], TOP_K, fuse_colors,
+                                 workers=shards.workers_arg(sys.argv))
 
-def fuse_colors(c1, c2, c3):
-    palette = [c1, c2, c3]
-    if "purple" in palette: return "purple"
-    if "red" in palette:    return "red"
-    if "orange" in palette: return "orange"
-    if "yellow" in palette: return "yellow"
-    if "pink" in palette:   return "pink"
-    if "green" in palette:  return "green"
-    return "blue"
-
-count = 0
-for t1, t2, t3 in itertools.combinations(terms, 3):
-    c1 = unified.get(t1, "blue")
-    c2 = unified.get(t2, "blue")
-    c3 = unified.get(t3, "blue")
-
-    fused = fuse_colors(c1, c2, c3)
-    fusion_map[f"{t1}|{t2}|{t3}"] = fused
-    count += 1
+fusion_map = {}
+for (_, fused), trios in clusters.items():
+    for _, (t1, t2, t3) in trios:
+        fusion_map[f"{t1}|{t2}|{t3}"] = fused
+count = len(fusion_map)
 
 print(f"[💜 CART I] Built {count} trio-fusion entries.")
 
@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
-import json, itertools, os
+import json, os, sys
+
+import c13b0_fusion as fusion
+import c13b0_shards as shards
+
+TOP_K = 1000    # clusters kept per size and dominant color
 
 print("[💜 CART J] Loading C13B0 maps...")
 
@@ -15,8 +20,8 @@ tone_map  = load_json("C13B0_TONE_COLOR_MAP.json")
 density   = load_json("C13B0_DENSITY_MAP.json")
 user_vec  = load_json("C13B0_USER_VECTOR.json")
 
-# Combine all known terms
-all_terms = list(set(
+# Combine all known terms (first-seen order)
+all_terms = list(dict.fromkeys(
     list(color_map.keys()) +
     list(tone_map.keys()) +
     list(user_vec)
@@ -28,34 +33,19 @@ if len(all_terms) < 5:
     print("[💜 CART J] Not enough terms for 4–5 term fusion. Exiting.")
     exit(0)
 
-# Color blending logic
-def blend_colors(colors):
-    # simple blend: count frequencies
-    score = {}
-    for c in colors:
-        score[c] = score.get(c,0) + 1
-    # return dominant
-    return max(score, key=score.get)
+# Color blending: dominant (most frequent) member color. Only the TOP_K
+# most cohesive clusters of each size and dominant color are built
+# (c13b0_fusion.color_clusters), not every combination.
+print("[💜 CART J] Generating 4- and 5-term clusters...")
+found = fusion.color_clusters(all_terms, lambda t: color_map.get(t) or tone_map.get(t), [4, 5], TOP_K,
+                              fusion.fuse_dominant, workers=shards.workers_arg(sys.argv))
 
 clusters = {}
+for (_, color), combos in found.items():
+    for _, combo in combos:
+        clusters["+".join(combo)] = color
 
-print("[💜 CART J] Generating 4-term clusters...")
-for combo in itertools.combinations(all_terms,4):
-    colors = []
-    for t in combo:
-        c = color_map.get(t) or tone_map.get(t)
-        if c: colors.append(c)
-    if colors:
-        clusters["+".join(combo)] = blend_colors(colors)
-
-print("[💜 CART J] Generating 5-term clusters...")
-for combo in itertools.combinations(all_terms,5):
-    colors = []
-    for t in combo:
-        c = color_map.get(t) or tone_map.get(t)
-        if c: colors.append(c)
-    if colors:
-        clusters["+".join(combo)] = blend_colors(colors)
+print(f"[💜 CART J] Kept {len(clusters)} clusters (top {TOP_K} per size and color).")
 
 outfile = "C13B0_CLUSTER_FUSION.json"
 with open(outfile,"w") as f:
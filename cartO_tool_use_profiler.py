@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import json, os
 
+import c13b0_colormatch as colormatch
+
 print("[💜 CART O] Loading C13B0 maps...")
 
 def load(path):
@@ -42,17 +44,12 @@ tool_keywords = [
     "hash", "parse", "logic", "analyzer", "harvester"
 ]
 
+tool_matcher = colormatch.compile_rules([(kw, "green") for kw in tool_keywords], "none")
+
 tool_use_map = {}
 
 for t in terms:
-    score = 0
-    for kw in tool_keywords:
-        if kw in t.lower():
-            score += 1
-    if score > 0:
-        tool_use_map[t] = "green"
-    else:
-        tool_use_map[t] = "none"
+    tool_use_map[t] = "green" if tool_matcher.any(t) else "none"
 
 with open("C13B0_TOOLUSE_MAP.json", "w") as f:
     json.dump(tool_use_map, f, indent=2)
@@ -1,33 +1,25 @@
 #!/usr/bin/env python3
-import json, os
+import os
 
-print("[💜 CART Q] Loading C13B0 maps...")
+import c13b0_color_vault as color_vault
 
-# Load any valid JSON map in the folder
-maps = {}
-for file in os.listdir("."):
-    if file.startswith("C13B0_") and file.endswith(".json"):
-        try:
-            with open(file, "r") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    maps[file] = data
-        except:
-            pass
+print("[💜 CART Q] Loading C13B0 maps...")
 
-print(f"[💜 CART Q] Maps loaded: {len(maps)}")
+out = "C13B0_COLOR_MEMORY.json"
 
-# Merge all dicts safely
-vault = {}
-for name, data in maps.items():
-    for k, v in data.items():
-        # Last write wins — this is intentional
-        vault[k] = v
+# Any C13B0 map in the folder (the previous memory included); the vault
+# only re-reads the ones that changed
+names = [file for file in os.listdir(".")
+         if file.startswith("C13B0_") and file.endswith(".json")]
+vault = color_vault.open_vault()
+vault.update(names)
 
-# Save the unified vault
-out = "C13B0_COLOR_MEMORY.json"
-with open(out, "w") as f:
-    json.dump(vault, f, indent=2)
+loaded = [n for n in vault.present(names) if vault.shape(n) == "dict"]
+print(f"[💜 CART Q] Maps loaded: {len(loaded)}")
 
-print(f"[💜 CART Q] Saved → {out}")
+# Merge all dicts safely — last write wins, this is intentional
+if vault.export_merge(out, names, dicts_only=True) is not None:
+    print(f"[💜 CART Q] Saved → {out}")
+else:
+    print(f"[💜 CART Q] Up to date → {out}")
 print("[💜 CART Q] Done.")
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import json, os
 
+import c13b0_color_vault as color_vault
+
 print("[💜 CART S] Normalizing C13B0 maps...")
 
 def load(name):
@@ -40,12 +42,19 @@ maps = [
     "C13B0_CLUSTER_FUSION.json"
 ]
 
+# Maps unchanged since they were last normalized are skipped unread, and
+# a map that is already dict-safe is not rewritten
+vault = color_vault.open_vault()
 for m in maps:
     if os.path.exists(m):
-        data = load(m)
-        data = normalize(data)
-        with open(m, "w") as f:
-            json.dump(data, f, indent=2)
-        print(f"[💜 CART S] Normalized → {m}")
+        if vault.normalized(m):
+            continue
+        raw = load(m)
+        data = normalize(raw)
+        if data != raw:
+            with open(m, "w") as f:
+                json.dump(data, f, indent=2)
+            print(f"[💜 CART S] Normalized → {m}")
+        vault.mark_normalized(m)
 
 print("[💜 CART S] Done. All maps now dict-safe.")
@@ -1,15 +1,10 @@
 #!/usr/bin/env python3
-import json, os
+import c13b0_color_vault as color_vault
 
 print("[💜 CART T] Loading C13B0 maps...")
 
-def load(path):
-    with open(path, "r") as f:
-        return json.load(f)
-
-# Load only maps that exist
-maps = {}
-for fname in [
+# Only maps changed since the last run are re-read (c13b0_color_vault)
+MAPS = [
     "C13B0_USER_VECTOR.json",
     "C13B0_COLOR_MAP.json",
     "C13B0_PATTERN_MAP.json",
@@ -18,47 +13,29 @@ for fname in [
     "C13B0_BIAS_COLOR_MAP.json",
     "C13B0_SYMBIOSIS_MAP.json",
     "C13B0_DIVERGENCE_MAP.json"
-]:
-    if os.path.exists(fname):
-        print(f"[💜 CART T] ✓ Loaded {fname}")
-        maps[fname] = load(fname)
-
-# Flatten all terms safely
-all_terms = set()
-
-def collect(obj):
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            all_terms.add(str(k))
-            collect(v)
-    elif isinstance(obj, list):
-        for item in obj:
-            collect(item)
-    elif isinstance(obj, str):
-        all_terms.add(obj)
+]
+
+# field → (map, default) of the unified color output structure
+FIELDS = [
+    ("base_color", "C13B0_COLOR_MAP.json", "none"),
+    ("tone_color", "C13B0_TONE_COLOR_MAP.json", "none"),
+    ("bias_color", "C13B0_BIAS_COLOR_MAP.json", "none"),
+    ("symbiosis", "C13B0_SYMBIOSIS_MAP.json", 0),
+    ("density", "C13B0_DENSITY_MAP.json", 0),
+    ("pattern", "C13B0_PATTERN_MAP.json", 0),
+    ("divergence", "C13B0_DIVERGENCE_MAP.json", 0)
+]
+
+vault = color_vault.open_vault()
+vault.update(MAPS)
+for fname in vault.present(MAPS):
+    print(f"[💜 CART T] ✓ Loaded {fname}")
 
 print("[💜 CART T] Flattening terms…")
-for m in maps.values():
-    collect(m)
-
-all_terms = sorted(all_terms)
-
-print("[💜 CART T] Total flattened terms:", len(all_terms))
-
-# Rebuild unified color output structure
-unified = {}
-for term in all_terms:
-    unified[term] = {
-        "base_color": maps.get("C13B0_COLOR_MAP.json", {}).get(term, "none"),
-        "tone_color": maps.get("C13B0_TONE_COLOR_MAP.json", {}).get(term, "none"),
-        "bias_color": maps.get("C13B0_BIAS_COLOR_MAP.json", {}).get(term, "none"),
-        "symbiosis": maps.get("C13B0_SYMBIOSIS_MAP.json", {}).get(term, 0),
-        "density": maps.get("C13B0_DENSITY_MAP.json", {}).get(term, 0),
-        "pattern": maps.get("C13B0_PATTERN_MAP.json", {}).get(term, 0),
-        "divergence": maps.get("C13B0_DIVERGENCE_MAP.json", {}).get(term, 0)
-    }
-
-with open("C13B0_COLOR_OUTPUT.json", "w") as f:
-    json.dump(unified, f, indent=2)
+total = vault.export_unified("C13B0_COLOR_OUTPUT.json", MAPS, FIELDS)
 
-print("[💜 CART T] Saved → C13B0_COLOR_OUTPUT.json")
+if total is None:
+    print("[💜 CART T] Up to date → C13B0_COLOR_OUTPUT.json")
+else:
+    print("[💜 CART T] Total flattened terms:", total)
+    print("[💜 CART T] Saved → C13B0_COLOR_OUTPUT.json")
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 import os
-import json
 import time
-import hashlib
+import sys
+
+import c13b0_file_index as file_index
 
 # ---- Infinity Color Map ----
 COLOR_MAP = {
@@ -19,55 +20,24 @@ COLOR_MAP = {
 # ---- Root directory ----
 ROOT = os.path.expanduser("~/o")
 
-def safe_read(path):
-    """Reads file content safely and returns readable text."""
-    try:
-        with open(path, "r", errors="ignore") as f:
-            text = f.read()
-            return text
-    except:
-        return ""
-
-def detect_color(text):
-    """Find dominant color for this file from keywords."""
-    text_low = text.lower()
-    matches = []
-    for k, c in COLOR_MAP.items():
-        if k in text_low:
-            matches.append(c)
-    if matches:
-        return matches[0]
-    return "white"
-
-def file_value(text):
-    """Hash → Integer → Infinity Value."""
-    h = hashlib.sha1(text.encode()).hexdigest()
-    return int(h[:6], 16) % 5000 + 500
-
-def index_everything():
+def index_everything(workers=None, full=False):
     print("\n∞ Infinity Index — Live Scan\n--------------------------------\n")
-    articles = []
 
-    for root, dirs, files in os.walk(ROOT):
-        for f in files:
-            if f.endswith(".txt") or f.endswith(".json"):
-                full = os.path.join(root, f)
-                content = safe_read(full)
-                if not content.strip():
-                    continue
-
-                color = detect_color(content)
-                value = file_value(content)
-                timestamp = time.ctime(os.path.getmtime(full))
-
-                articles.append({
-                    "file": f,
-                    "path": full,
-                    "color": color,
-                    "value": value,
-                    "time": timestamp,
-                    "preview": content[:250].replace("\n", " ")
-                })
+    # Only files whose (size, mtime, inode) changed since the last scan are
+    # read again; see c13b0_file_index.py
+    files, delta = file_index.update(ROOT, COLOR_MAP, "white", workers=workers, full=full)
+    articles = []
+    for full_path, e in files.items():
+        if e["skip"]:
+            continue
+        articles.append({
+            "file": os.path.basename(full_path),
+            "path": full_path,
+            "color": e["color"],
+            "value": e["value"],
+            "time": time.ctime(e["mtime_ns"] / 1e9),
+            "preview": e["preview"]
+        })
 
     # Highest-value/relevance first
     articles.sort(key=lambda x: x["value"], reverse=True)
@@ -80,5 +50,10 @@ def index_everything():
         print(f"Preview: {a['preview']}\n")
         print("-" * 60)
 
+    print(f"∞ Index: {len(files)} files — {len(delta['added'])} added, {len(delta['changed'])} changed, "
+          f"{len(delta['removed'])} removed, {delta['unchanged']} unchanged")
+
 if __name__ == "__main__":
-    index_everything()
+    args = sys.argv[1:]
+    workers = int(args[args.index("--workers") + 1]) if "--workers" in args else None
+    index_everything(workers=workers, full="--full" in args)
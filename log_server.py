@@ -4,6 +4,8 @@ Cart 044: Log Server (Serverless-friendly)
 Universal, provenance-first logging hub:
 - Logs sessions, actions, research events, token grants/grabs, attachments (AI ↔ token)
 - Emits JSONL audit streams and JSON artifacts per channel
+  (buffered through c13b0_audit.py; per-event artifacts are records of
+  artifacts/log_server_artifacts.jsonl unless C13B0_ARTIFACTS=file|off)
 - Front-end integration: accepts simple inputs (username, action, meta JSON)
 - Token awareness: ties logs to tokens and writes token visibility artifacts
 - Repo-first design: everything is file-based, ready to commit/push
@@ -16,11 +18,15 @@ CLI:
   python cart044_log_server.py token grab --user Guest --token_id 101
   python cart044_log_server.py ai attach --token_id 101 --desc "AI assistant attached for guidance"
   python cart044_log_server.py export overview --user Kris
+  python cart044_log_server.py query --user Kris --channel research --since 2025-01-01 --limit 50
 """
 
 import os, sys, json, time, hashlib
 from typing import Dict, Any
 
+import c13b0_audit as audit_log
+import c13b0_log_index as log_index
+
 ROOT = os.path.dirname(os.path.abspath(__file__))
 LOGS = os.path.join(ROOT, "logs")
 ART  = os.path.join(ROOT, "artifacts")
@@ -31,18 +37,24 @@ AUDIT  = os.path.join(LOGS, "log_server_audit.jsonl")
 STREAM = os.path.join(DATA, "log_stream.jsonl")
 SESS   = os.path.join(DATA, "log_sessions.json")
 TOKVIS = os.path.join(DATA, "token_visibility.json")
+TOKEV  = os.path.join(DATA, "token_events.jsonl")
+
+# the stream is the overview's source: buffered, never rotated
+STREAM_LOG = audit_log.open_log(STREAM, max_bytes=None, rotate_every=None)
+TOKEV_LOG  = audit_log.open_log(TOKEV, max_bytes=None, rotate_every=None)
+STREAM_INDEX = log_index.StreamIndex(STREAM)
 
 DEFAULT_SESS = {"sessions": []}
-DEFAULT_TOKV = {"events": [], "tokens": {}}
+# token_visibility.json keeps the per-token counters; the events themselves
+# are appended to token_events.jsonl
+DEFAULT_TOKV = {"tokens": {}, "event_count": 0}
 
 def now() -> str: return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
 
 def write_jsonl(path: str, obj: Dict[str, Any]) -> None:
-    with open(path, "a", encoding="utf-8") as f: f.write(json.dumps(obj) + "\n")
+    audit_log.open_log(path).write(obj)
 
-def audit(entry: Dict[str, Any]) -> None:
-    entry = dict(entry); entry["t"] = now()
-    write_jsonl(AUDIT, entry)
+audit = audit_log.open_log(AUDIT).audit
 
 def load_json(path: str, default: Dict[str, Any]) -> Dict[str, Any]:
     if not os.path.exists(path): return default.copy()
@@ -54,10 +66,8 @@ def load_json(path: str, default: Dict[str, Any]) -> Dict[str, Any]:
 def save_json(path: str, obj: Dict[str, Any]) -> None:
     with open(path, "w", encoding="utf-8") as f: json.dump(obj, f, indent=2)
 
-def artifact(name: str, obj: Dict[str, Any]) -> str:
-    p = os.path.join(ART, f"{name}.json")
-    with open(p, "w", encoding="utf-8") as f: json.dump(obj, f, indent=2)
-    return p
+def artifact(name: str, obj: Dict[str, Any], mode: str = None) -> str:
+    return audit_log.artifact(ART, "log_server_artifacts", name, obj, mode)
 
 # ---------- Session ----------
 def session_start(user: str) -> Dict[str, Any]:
@@ -91,10 +101,23 @@ def action_log(user: str, channel: str, event: str, meta: Dict[str, Any]) -> Dic
     return {"ok": True, "path": path, "entry": entry}
 
 # ---------- Token awareness ----------
-def token_event(kind: str, user: str, token_id: int, extra: Dict[str, Any]) -> Dict[str, Any]:
+def load_token_visibility() -> Dict[str, Any]:
     tv = load_json(TOKVIS, DEFAULT_TOKV)
+    if "events" in tv:
+        # older layout: move the event list out to token_events.jsonl
+        events = tv.pop("events")
+        for ev in events: TOKEV_LOG.write(ev)
+        TOKEV_LOG.flush()
+        tv["event_count"] = tv.get("event_count", 0) + len(events)
+        save_json(TOKVIS, tv)
+    tv.setdefault("tokens", {}); tv.setdefault("event_count", 0)
+    return tv
+
+def token_event(kind: str, user: str, token_id: int, extra: Dict[str, Any]) -> Dict[str, Any]:
+    tv = load_token_visibility()
     ev = {"kind": kind, "user": user, "token_id": token_id, "extra": extra, "t": now()}
-    tv["events"].append(ev)
+    TOKEV_LOG.write(ev)
+    tv["event_count"] += 1
     tok = tv["tokens"].setdefault(str(token_id), {"grants": 0, "grabs": 0, "attachments": []})
     if kind == "grant": tok["grants"] += 1
     if kind == "grab":  tok["grabs"]  += 1
@@ -108,23 +131,28 @@ def token_event(kind: str, user: str, token_id: int, extra: Dict[str, Any]) -> D
 # ---------- Overview export ----------
 def export_overview(user: str) -> Dict[str, Any]:
     s = load_json(SESS, DEFAULT_SESS)
-    tv = load_json(TOKVIS, DEFAULT_TOKV)
-    # Tail of stream
-    tail = []
-    if os.path.exists(STREAM):
-        with open(STREAM, "r", encoding="utf-8") as f:
-            lines = f.readlines()[-200:]
-            tail = [json.loads(x) for x in lines]
+    tv = load_token_visibility()
+    # Tail of stream, read backwards from its end
+    STREAM_LOG.flush()
+    tail = log_index.tail(STREAM, 200)
     out = {
         "user": user,
         "sessions": [x for x in s["sessions"] if x["user"] == user][-10:],
         "token_summary": tv["tokens"],
         "stream_tail": tail
     }
-    path = artifact(f"log_overview_{user}_{int(time.time())}", out)
+    path = artifact(f"log_overview_{user}_{int(time.time())}", out, mode="file")
     audit({"action": "export.overview", "user": user})
     return {"ok": True, "path": path}
 
+# ---------- Queries ----------
+def query(user: str = None, channel: str = None, token_id: int = None,
+          since: str = None, until: str = None, limit: int = 200) -> Dict[str, Any]:
+    STREAM_LOG.flush()
+    lines = STREAM_INDEX.query(user=user, channel=channel, token_id=token_id,
+                               since=since, until=until, limit=limit)
+    return {"ok": True, "count": len(lines), "lines": lines}
+
 # ---------- CLI ----------
 def main():
     a = sys.argv[1:]
@@ -136,6 +164,7 @@ def main():
         print("  token grab --user U --token_id N")
         print("  ai attach --token_id N --desc '...'")
         print("  export overview --user U")
+        print("  query [--user U] [--channel C] [--token_id N] [--since T] [--until T] [--limit N]")
         return
     cmd = a[0]
     if cmd == "session":
@@ -179,6 +208,12 @@ def main():
             for i,x in enumerate(a):
                 if x == "--user" and i+1 < len(a): user = a[i+1]
             print(json.dumps(export_overview(user), indent=2)); return
+    if cmd == "query":
+        opts = {}
+        for i,x in enumerate(a):
+            if x in ("--user", "--channel", "--since", "--until") and i+1 < len(a): opts[x[2:]] = a[i+1]
+            if x in ("--token_id", "--limit") and i+1 < len(a): opts[x[2:]] = int(a[i+1])
+        print(json.dumps(query(**opts), indent=2)); return
     print(json.dumps({"error": "unknown command"}, indent=2))
 
 if __name__ == "__main__":
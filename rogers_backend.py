@@ -7,11 +7,14 @@ from flask import Flask, request, jsonify
 from flask_cors import CORS
 import os
 
+import c13b0_ledger as ledger_engine
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend access
 
-# Simple in-memory token storage (replace with database in production)
-user_tokens = {}
+# Token balances live in the shared wallet ledger (c13b0_ledger.py), so they
+# survive restarts and stay consistent across workers and the wallet carts
+ledger = ledger_engine.open_ledger()
 
 @app.route('/api/status', methods=['GET'])
 def status():
@@ -50,7 +53,7 @@ def execute_bot():
 def get_balance():
     """Get user token balance"""
     user_id = request.args.get('user_id', 'default')
-    balance = user_tokens.get(user_id, 0)
+    balance = ledger.balance(user_id)
     
     return jsonify({
         'ok': True,
@@ -65,20 +68,25 @@ def spend_tokens():
     user_id = data.get('user_id', 'default')
     amount = data.get('amount', 0)
     
-    current_balance = user_tokens.get(user_id, 0)
+    try:
+        result = ledger.spend(amount, user=user_id, reason=data.get('reason'))
+    except ValueError:
+        return jsonify({
+            'ok': False,
+            'error': 'Invalid amount'
+        }), 400
     
-    if current_balance >= amount:
-        user_tokens[user_id] = current_balance - amount
+    if result.ok:
         return jsonify({
             'ok': True,
-            'new_balance': user_tokens[user_id],
+            'new_balance': result.balance,
             'spent': amount
         })
     else:
         return jsonify({
             'ok': False,
             'error': 'Insufficient tokens',
-            'balance': current_balance
+            'balance': result.balance
         }), 400
 
 @app.route('/api/wallet/earn', methods=['POST'])
@@ -89,12 +97,17 @@ def earn_tokens():
     amount = data.get('amount', 1)
     reason = data.get('reason', 'Activity')
     
-    current_balance = user_tokens.get(user_id, 0)
-    user_tokens[user_id] = current_balance + amount
+    try:
+        result = ledger.earn(amount, user=user_id, reason=reason)
+    except ValueError:
+        return jsonify({
+            'ok': False,
+            'error': 'Invalid amount'
+        }), 400
     
     return jsonify({
         'ok': True,
-        'new_balance': user_tokens[user_id],
+        'new_balance': result.balance,
         'earned': amount,
         'reason': reason
     })
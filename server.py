@@ -1,25 +1,63 @@
-from flask import Flask, request, jsonify
-import subprocess
-import os
+from flask import Flask, Response, request, jsonify
+import json
+
+import c13b0_jobs as jobs_engine
 
 app = Flask(__name__)
 
+# Carts run on a bounded job queue (c13b0_jobs.py); /run only submits
+jobs = jobs_engine.JobQueue()
+
 @app.route('/run', methods=['GET'])
 def run_cart():
     cart_id = request.args.get('cart')
-    filename = f"cart{cart_id}_*.py"
-    matches = [f for f in os.listdir() if f.startswith(f"cart{cart_id}_") and f.endswith(".py")]
-    if not matches:
+    try:
+        job, created = jobs.submit(cart_id)
+    except KeyError:
         return jsonify({"error": "Cart not found"}), 404
 
-    cart_file = matches[0]
-    try:
-        result = subprocess.check_output(['python', cart_file], stderr=subprocess.STDOUT, timeout=30)
-        return jsonify({"output": result.decode()})
-    except subprocess.CalledProcessError as e:
-        return jsonify({"error": e.output.decode()}), 500
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    # ?wait=N blocks up to N seconds and answers like the old synchronous /run
+    wait = request.args.get('wait', type=float)
+    if wait and job.wait(wait):
+        snap = job.snapshot()
+        if snap["status"] == "ok":
+            return jsonify({"output": snap["output"], "job": job.id})
+        return jsonify({"error": snap["error"] or snap["output"], "job": job.id}), 500
+
+    return jsonify({"job": job.id, "status": job.status, "deduplicated": not created,
+                    "poll": f"/jobs/{job.id}", "stream": f"/jobs/{job.id}/stream"}), 202
+
+@app.route('/jobs', methods=['GET'])
+def list_jobs():
+    return jsonify({"jobs": jobs.list()})
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job.snapshot(request.args.get('since', 0, type=int)))
+
+@app.route('/jobs/<job_id>/stream', methods=['GET'])
+def job_stream(job_id):
+    # Server-sent events: one "data:" event per output line, then a
+    # "done" event carrying the final status
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+
+    since = request.args.get('since', 0, type=int)
+
+    def events():
+        for line in job.follow(since):
+            if line is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"data: {json.dumps(line)}\n\n"
+        yield f"event: done\ndata: {json.dumps(job.info())}\n\n"
+
+    return Response(events(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000)
+    app.run(host='0.0.0.0', port=5000, threaded=True)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared C13B0 color memory vault.
+Runs on scratch maps in a temporary directory and compares the exported
+views with the merge the old carts did from scratch.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import c13b0_color_vault as color_vault
+
+
+def write_map(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def read_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def old_merge(names):
+    # CART Q before the vault: every dict map read in full, last write wins
+    merged = {}
+    for name in names:
+        try:
+            data = read_json(name)
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict):
+            merged.update(data)
+    return merged
+
+
+def make_maps(root):
+    names = [os.path.join(root, n) for n in ("C13B0_A.json", "C13B0_B.json", "C13B0_C.json")]
+    write_map(names[0], {f"t{i}": "red" for i in range(50)})
+    write_map(names[1], {f"t{i}": "blue" for i in range(25, 75)})
+    write_map(names[2], [f"t{i}" for i in range(70, 90)])      # list: not merged
+    return names
+
+
+def test_update_and_export():
+    """Test that changing one map re-reads only that map and the export
+    follows it, with the same values as a full merge."""
+    print("Testing update, change and export...")
+
+    root = tempfile.mkdtemp()
+    try:
+        names = make_maps(root)
+        out = os.path.join(root, "C13B0_COLOR_MEMORY.json")
+        names.append(out)           # CART Q's memory is one of its own maps
+        vault = color_vault.open_vault(os.path.join(root, "vault"))
+        vault.update(names)
+        assert vault.export_merge(out, names, dicts_only=True) == 75, "First export should write every term"
+        assert read_json(out) == old_merge(names), "Export should match the full merge"
+        assert vault.value("t30", names[0]) == "red" and vault.value("t30", names[1]) == "blue", \
+            "Each map should keep its own field"
+
+        vault.update(names)
+        assert vault.export_merge(out, names, dicts_only=True) is None, "Unchanged maps should not rewrite the export"
+
+        write_map(names[1], {**{f"t{i}": "blue" for i in range(25, 75)}, "t60": "green", "new": "pink"})
+        res = vault.update(names)
+        assert res == {"changed": [names[1]], "terms": 2}, f"Only the changed terms should be appended: {res}"
+        assert vault.export_merge(out, names, dicts_only=True) == 76, "Changed map should refresh the export"
+        assert read_json(out) == old_merge(names), "Export should match the full merge after a change"
+
+        # a reopened vault picks up where the last one stopped
+        vault = color_vault.open_vault(os.path.join(root, "vault"))
+        assert vault.update(names)["changed"] == [], "A reopened vault should not re-read unchanged maps"
+        assert vault.export_merge(out, names, dicts_only=True) is None, "Export should still be fresh"
+        print("✓ Update, change and export work")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_deleted_map():
+    """Test that a map that disappears takes its fields with it."""
+    print("Testing deleted maps...")
+
+    root = tempfile.mkdtemp()
+    try:
+        names = make_maps(root)
+        out = os.path.join(root, "C13B0_COLOR_OUTPUT.json")
+        vault = color_vault.open_vault(os.path.join(root, "vault"))
+        vault.update(names)
+        vault.export_merge(out, names, first_wins=True)
+
+        os.remove(names[0])
+        vault.update(names)
+        assert vault.present(names) == names[1:], "A deleted map should no longer be present"
+        assert "t0" not in vault, "Terms only the deleted map held should be gone"
+        assert vault.get("t30") == {names[1]: "blue"}, f"Shared terms should lose the field: {vault.get('t30')}"
+        assert vault.export_merge(out, names, first_wins=True) is not None, "Deleting a map should refresh the export"
+        expected = {f"t{i}": "blue" for i in range(25, 75)}
+        expected.update({t: 1 for t in [f"t{i}" for i in range(70, 90)] if t not in expected})
+        assert read_json(out) == expected, "Export should no longer hold the deleted map's values"
+        print("✓ Deleted maps work")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_compaction():
+    """Test that compaction keeps one line per live term and loses nothing."""
+    print("Testing compaction...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "C13B0_A.json")
+        vault = color_vault.open_vault(os.path.join(root, "vault"))
+        for rnd in range(5):
+            # the size changes every round, so the stat signature does too
+            write_map(path, {f"t{i}": "c" * (rnd + 1) for i in range(300 - rnd * 10)})
+            vault.update([path])
+        before = dict(vault.records())
+        assert len(before) == 260 and vault.value("t0", path) == "ccccc", "Latest values should win"
+
+        assert vault.compact() == 260, "Compaction should keep every live term"
+        with open(vault.log_path, "rb") as f:
+            assert sum(1 for _ in f) == 260, "Compacted log should hold one line per term"
+        assert dict(vault.records()) == before, "Compaction should not change any record"
+
+        vault = color_vault.open_vault(os.path.join(root, "vault"))
+        assert dict(vault.records()) == before and vault.get("t259") == {path: "ccccc"}, \
+            "A reopened vault should read the compacted log"
+
+        # enough superseded lines compact from update() on their own
+        for rnd in range(8):
+            write_map(path, {f"t{i}": "d" * (rnd + 1) for i in range(300)})
+            vault.update([path])
+        with open(vault.log_path, "rb") as f:
+            lines = sum(1 for _ in f)
+        assert lines < 260 + 8 * 300, f"Log should have been compacted, has {lines} lines"
+        assert vault.value("t299", path) == "d" * 8, "Latest values should survive compaction"
+        print(f"✓ Compaction works ({lines} lines after automatic compaction)")
+    finally:
+        shutil.rmtree(root)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Running tests for C13B0 color memory vault")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_update_and_export,
+        test_deleted_map,
+        test_compaction,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print()
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+            print()
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+            print()
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared C13B0 DNA block store.
+Compares the block file with the JSON blocks and chunks the old CART038
+encoder built, in scratch directories.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import c13b0_dna_store as dna_store
+
+TEXT = "hello world — ünïcödé 🧬 substrate"
+
+
+def old_encode(store, text, chunk_size, tag):
+    # CART038's encoder before the block store, minus the file I/O
+    bases_of = ["A", "C", "G", "T"]
+    blocks = []; chunks = []
+    chunk_id = store["next_chunk_id"]
+    current = {"chunk_id": chunk_id, "block_ids": [], "tag": tag, "created": "2024-01-02T03:04:05"}
+    for ch in text:
+        v = ord(ch) % 4
+        bases = [bases_of[(v + j) % 4] for j in range(4)]
+        blk = {"id": store["next_block_id"], "char": ch, "bases": bases, "tag": tag, "chunk_id": chunk_id}
+        blk["hash"] = hashlib.sha256(json.dumps({"char": ch, "bases": bases, "tag": tag, "chunk": chunk_id},
+                                                sort_keys=True).encode("utf-8")).hexdigest()
+        blocks.append(blk)
+        current["block_ids"].append(blk["id"])
+        store["next_block_id"] += 1
+        if len(current["block_ids"]) >= chunk_size:
+            chunks.append(current)
+            chunk_id = chunk_id + 1
+            current = {"chunk_id": chunk_id, "block_ids": [], "tag": tag, "created": "2024-01-02T03:04:05"}
+    if current["block_ids"]:
+        chunks.append(current)
+    store["blocks"].extend(blocks)
+    store["chunks"].extend(chunks)
+    store["next_chunk_id"] = chunk_id + 1
+    return chunks
+
+
+def without_created(chunks):
+    return [{k: v for k, v in c.items() if k != "created"} for c in chunks]
+
+
+def test_round_trip():
+    """Test that encoded text decodes back, with the old block dicts."""
+    print("Testing encode / decode round trip...")
+
+    root = tempfile.mkdtemp()
+    try:
+        blocks = dna_store.BlockStore(os.path.join(root, "blocks"))
+        made, next_block, next_chunk = blocks.append_text(TEXT, 8, "research")
+        ids = list(range(1, len(TEXT) + 1))
+        chars = blocks.chars(ids + [0, len(TEXT) + 5])
+        assert "".join(chars[i] for i in ids) == TEXT, "Decoded text should equal the encoded text"
+        assert set(chars) == set(ids), "Unknown block ids should be left out"
+        assert blocks.exists(len(TEXT)) and not blocks.exists(len(TEXT) + 1), "exists() should follow the ids"
+
+        old = {"next_block_id": 1, "next_chunk_id": 1, "blocks": [], "chunks": []}
+        old_encode(old, TEXT, 8, "research")
+        assert list(blocks.blocks()) == old["blocks"], "Rebuilt blocks should equal the old encoder's"
+        assert (next_block, next_chunk) == (old["next_block_id"], old["next_chunk_id"]), "Counters should match"
+        assert blocks.stats() == {"blocks": len(TEXT), "chunks": len(made)}, f"Unexpected stats {blocks.stats()}"
+        print(f"✓ Round trip works ({len(made)} chunks)")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_chunk_counter_parity():
+    """Test that chunk ids and counters follow the old encoder, including
+    the chunk id it skips after a full (or empty) last chunk."""
+    print("Testing chunk counter parity...")
+
+    root = tempfile.mkdtemp()
+    try:
+        blocks = dna_store.BlockStore(os.path.join(root, "blocks"))
+        old = {"next_block_id": 1, "next_chunk_id": 1, "blocks": [], "chunks": []}
+        counters = {"next_block_id": 1, "next_chunk_id": 1}
+        for text, size in [("abcdefgh", 8), ("abcde", 8), ("", 4), ("x" * 16, 8), ("z", 1),
+                           ("pqr", 3), ("0123456", 3), ("", 1), ("tail", 5)]:
+            old_made = old_encode(old, text, size, "t")
+            made, counters["next_block_id"], counters["next_chunk_id"] = blocks.append_text(
+                text, size, "t", counters["next_block_id"], counters["next_chunk_id"])
+            assert [c["chunk_id"] for c in made] == [c["chunk_id"] for c in old_made], \
+                f"Chunk ids for {text!r}/{size}: {made} vs {old_made}"
+            expected = {k: old[k] for k in counters}
+            assert counters == expected, f"Counters after {text!r}/{size}: {counters} vs {expected}"
+        assert without_created(blocks.legacy_chunks()) == without_created(old["chunks"]), "Chunk lists should match"
+        assert list(blocks.blocks()) == old["blocks"], "Block lists should match"
+        print(f"✓ Chunk counters match ({len(old['chunks'])} chunks)")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_repair_torn_append():
+    """Test that a record without its index entry (a crashed writer) is
+    cut off by the next append, and readers never see it."""
+    print("Testing torn append repair...")
+
+    root = tempfile.mkdtemp()
+    try:
+        blocks = dna_store.BlockStore(os.path.join(root, "blocks"))
+        _, next_block, next_chunk = blocks.append_text("first chunk", 4, "a")
+        good = (os.path.getsize(blocks.bin_path), os.path.getsize(blocks.idx_path))
+        # a whole record, half its index entry, then a torn second record
+        with open(blocks.bin_path, "ab") as b, open(blocks.idx_path, "ab") as i:
+            b.write(blocks._record(next_chunk, next_block, "lost", "a", 0))
+            b.write(blocks._record(next_chunk + 1, next_block + 4, "torn", "a", 0)[:10])
+            i.write(dna_store.ENTRY.pack(next_block, 4, next_chunk, good[0])[:12])
+
+        assert len(blocks) == 3 and not blocks.exists(next_block), "Readers should ignore the torn append"
+        made, _, _ = blocks.append_text("second", 4, "b", next_block, next_chunk)
+        assert made[0]["first"] == next_block, f"Ids should continue after the repair: {made}"
+        assert os.path.getsize(blocks.idx_path) == good[1] + 2 * dna_store.ENTRY.size, "Torn index entry should be gone"
+        text = "".join(h["text"] for h in dna_store.BlockStore(blocks.root).chunks())
+        assert text == "first chunksecond", f"Store should read cleanly after the repair: {text!r}"
+        print("✓ Torn append repair works")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_import_legacy():
+    """Test that the old JSON block and chunk lists import unchanged."""
+    print("Testing legacy import...")
+
+    root = tempfile.mkdtemp()
+    try:
+        old = {"next_block_id": 1, "next_chunk_id": 1, "blocks": [], "chunks": []}
+        old_encode(old, TEXT, 5, "research")
+        old_encode(old, "abcdefghij", 5, "")
+        old_encode(old, "xyz", 2, "misc")
+        # a block lost from the middle of a chunk splits it into two records
+        lost = old["chunks"][1]["block_ids"][2]
+        old["blocks"] = [b for b in old["blocks"] if b["id"] != lost]
+
+        blocks = dna_store.BlockStore(os.path.join(root, "blocks"))
+        assert blocks.import_legacy(old["blocks"], old["chunks"]) == len(old["blocks"]), "Every block should be placed"
+        assert list(blocks.blocks()) == old["blocks"], "Imported blocks should equal the old ones"
+        chunks = [dict(c, block_ids=[x for x in c["block_ids"] if x != lost]) for c in old["chunks"]]
+        merged = {}
+        for c in blocks.legacy_chunks():
+            merged.setdefault(c["chunk_id"], dict(c, block_ids=[]))["block_ids"] += c["block_ids"]
+        assert list(merged.values()) == chunks, "Imported chunks should keep ids, tags and created"
+        assert blocks.chars([lost]) == {}, "A lost block should stay lost"
+
+        made, _, _ = blocks.append_text("more", 5, "new", old["next_block_id"], old["next_chunk_id"])
+        assert made[0]["first"] == old["next_block_id"] and made[0]["chunk_id"] == old["next_chunk_id"], \
+            f"Encoding should continue from the imported counters: {made}"
+        print("✓ Legacy import works")
+    finally:
+        shutil.rmtree(root)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Running tests for C13B0 DNA block store")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_round_trip,
+        test_chunk_counter_parity,
+        test_repair_torn_append,
+        test_import_legacy,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print()
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+            print()
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+            print()
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared C13B0 fetch engine.
+Runs against a local stand-in HTTP server, no network access required.
+"""
+
+import os
+import sys
+import tempfile
+import shutil
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from c13b0_fetch import Fetcher, TokenBucket
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves /page/<n>, /etag, /flaky and /slow with request counting."""
+
+    hits = {}
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = StandInHandler
+        with cls.lock:
+            cls.hits[self.path] = cls.hits.get(self.path, 0) + 1
+            count = cls.hits[self.path]
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            if self.path == "/etag":
+                if self.headers.get("If-None-Match") == '"v1"':
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.reply(200, b"etag body", {"ETag": '"v1"'})
+            elif self.path == "/flaky":
+                if count < 3:
+                    self.reply(503, b"busy")
+                else:
+                    self.reply(200, b"recovered")
+            elif self.path == "/slow":
+                time.sleep(0.05)
+                self.reply(200, b"slow")
+            else:
+                self.reply(200, self.path.encode("utf-8"))
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def reply(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_server():
+    StandInHandler.hits = {}
+    StandInHandler.active = 0
+    StandInHandler.peak = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_results_in_order():
+    """Test that fetch_all keeps input order."""
+    print("Testing ordered concurrent fetches...")
+
+    server, base = start_server()
+    cache_dir = tempfile.mkdtemp()
+    try:
+        urls = [f"{base}/page/{i}" for i in range(40)]
+        with Fetcher(max_workers=8, per_host=8, rate=0, cache_dir=cache_dir) as f:
+            texts = [r.text for r in f.fetch_all(urls)]
+        assert texts == [f"/page/{i}" for i in range(40)], "Results should follow input order"
+        print("✓ Ordered concurrent fetches work")
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir)
+
+
+def test_per_host_limit():
+    """Test that no more than per_host requests hit one host at once."""
+    print("Testing per-host concurrency limit...")
+
+    server, base = start_server()
+    try:
+        with Fetcher(max_workers=10, per_host=2, rate=0, cache_dir=None) as f:
+            list(f.fetch_all([f"{base}/slow"] * 12))
+        assert StandInHandler.peak <= 2, f"Peak concurrency should be <= 2, got {StandInHandler.peak}"
+        print(f"✓ Per-host limit works (peak {StandInHandler.peak})")
+    finally:
+        server.shutdown()
+
+
+def test_retry_with_backoff():
+    """Test that 503 responses are retried."""
+    print("Testing retries...")
+
+    server, base = start_server()
+    try:
+        with Fetcher(rate=0, retries=3, backoff=0.01, cache_dir=None) as f:
+            res = f.get(f"{base}/flaky")
+        assert res.ok and res.text == "recovered", "Flaky endpoint should recover"
+        assert StandInHandler.hits["/flaky"] == 3, "Should take three attempts"
+        print("✓ Retries work")
+    finally:
+        server.shutdown()
+
+
+def test_etag_revalidation():
+    """Test that cached responses are revalidated with ETag."""
+    print("Testing ETag cache revalidation...")
+
+    server, base = start_server()
+    cache_dir = tempfile.mkdtemp()
+    try:
+        with Fetcher(rate=0, cache_dir=cache_dir) as f:
+            first = f.get(f"{base}/etag")
+            second = f.get(f"{base}/etag")
+        assert not first.from_cache, "First fetch should hit the network"
+        assert second.from_cache and second.text == "etag body", "Second fetch should be a 304 served from cache"
+        print("✓ ETag revalidation works")
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir)
+
+
+def test_token_bucket():
+    """Test that the token bucket enforces its rate after the burst."""
+    print("Testing token bucket...")
+
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+    assert elapsed >= 0.09, f"6 tokens at 50/s should take >= 0.1s, took {elapsed:.3f}s"
+    print(f"✓ Token bucket works ({elapsed:.3f}s)")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Running tests for C13B0 fetch engine")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_results_in_order,
+        test_per_host_limit,
+        test_retry_with_backoff,
+        test_etag_revalidation,
+        test_token_bucket,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print()
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+            print()
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+            print()
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared C13B0 append-log history store.
+Runs in scratch directories, no cart artifacts required.
+"""
+
+import json
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import c13b0_history as history
+
+
+def append_states(path, worker, count):
+    for i in range(count):
+        history.open_log(path, key="history", state_key="state").append(
+            {"timestamp": i, "state": {"worker": worker, "i": i}})
+
+
+def test_concurrent_appends():
+    """Test that appends from several processes all land, each with the
+    state it was appended with."""
+    print("Testing concurrent appends...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "STATE.json")
+        procs = [mp.Process(target=append_states, args=(path, w, 200)) for w in range(4)]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        log = history.open_log(path, key="history", state_key="state")
+        got = sorted((e["state"]["worker"], e["state"]["i"]) for e in log)
+        assert len(log) == 800, f"Expected 800 entries, got {len(log)}"
+        assert got == sorted((w, i) for w in range(4) for i in range(200)), "Every entry should keep its own state"
+        assert all(set(e["state"]) == {"worker", "i"} for e in log), "Deltas should apply to the right state"
+        print("✓ Concurrent appends work")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_compacts_past_keep():
+    """Test that a log opened with keep= compacts itself from append()."""
+    print("Testing automatic compaction...")
+
+    root = tempfile.mkdtemp()
+    try:
+        log = history.open_log(os.path.join(root, "LOG.json"), keep=100)
+        for i in range(1000):
+            log.append({"timestamp": i, "v": i})
+        assert 100 <= len(log) <= 100 * (1 + history.COMPACT_RATIO) + 1, f"Log should stay near keep, has {len(log)}"
+        assert log.latest()["v"] == 999, "Newest entry should survive compaction"
+        assert [e["v"] for e in log] == list(range(1000 - len(log), 1000)), "Entries should stay in order"
+        print(f"✓ Automatic compaction works ({len(log)} entries kept)")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_bounded_export():
+    """Test that export_json(keep=) writes only the newest entries."""
+    print("Testing bounded export...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "LEDGER.json")
+        log = history.open_log(path, key="history", ts_key="time")
+        for i in range(10):
+            log.append({"time": i, "total": i + 1})
+        log.export_json(extra={"count": 10}, keep=3)
+        with open(path) as f:
+            view = json.load(f)
+        assert view["count"] == 10, "Extra keys should be exported"
+        assert [e["total"] for e in view["history"]] == [8, 9, 10], f"Unexpected view: {view['history']}"
+        print("✓ Bounded export works")
+    finally:
+        shutil.rmtree(root)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Running tests for C13B0 history store")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_concurrent_appends,
+        test_compacts_past_keep,
+        test_bounded_export,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print()
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+            print()
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+            print()
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared C13B0 token ledger.
+Runs in scratch directories with several writer processes, no wallet
+files of the running system are touched.
+"""
+
+import json
+import multiprocessing as mp
+import os
+import random
+import sys
+import tempfile
+import shutil
+import threading
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from c13b0_ledger import Ledger
+
+USERS = ["u0", "u1", "u2"]
+
+
+def trade(path, legacy, seed, rounds=300, threads=4):
+    # random earns and spends (some overdrawn) from several threads of one process
+    ledger = Ledger(path, legacy, durable=False)
+
+    def run(n):
+        rnd = random.Random(seed * 100 + n)
+        for _ in range(rounds):
+            user = rnd.choice(USERS)
+            if rnd.random() < 0.5:
+                ledger.earn(rnd.randint(1, 3), user)
+            else:
+                ledger.spend(rnd.randint(1, 5), user)
+
+    workers = [threading.Thread(target=run, args=(n,)) for n in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    ledger.close()
+
+
+def read_log(path):
+    with open(path, "rb") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_concurrent_earn_spend():
+    """Test that earns and spends from several processes keep the log
+    consistent with the balances, and no balance ever goes negative."""
+    print("Testing concurrent earn / spend...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "wallet.jsonl")
+        legacy = os.path.join(root, "wallet.json")
+        procs = [mp.Process(target=trade, args=(path, legacy, seed)) for seed in range(3)]
+        for p in procs:
+            p.start()
+        trade(path, legacy, 99)
+        for p in procs:
+            p.join()
+
+        records = read_log(path)
+        assert [r["n"] for r in records] == list(range(1, len(records) + 1)), "Sequence numbers should be gapless"
+        assert all(r["b"] >= 0 for r in records), "No balance should ever go negative"
+        sums = {}
+        for r in records:
+            sums[r["u"]] = sums.get(r["u"], 0) + r["a"]
+            assert sums[r["u"]] == r["b"], f"Running balance broken at entry {r['n']}"
+        ledger = Ledger(path, legacy, durable=False)
+        assert ledger.users() == sums, f"Balances {ledger.users()} should equal the log sums {sums}"
+        assert any(r["a"] < 0 for r in records), "Some spends should have succeeded"
+        ledger.close()
+        print(f"✓ Concurrent earn / spend works ({len(records)} entries)")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_rejects_bad_spends():
+    """Test that overdrafts fail and invalid (also non-finite) amounts raise."""
+    print("Testing rejected spends...")
+
+    root = tempfile.mkdtemp()
+    try:
+        ledger = Ledger(os.path.join(root, "wallet.jsonl"), None, durable=False)
+        ledger.earn(5)
+        res = ledger.spend(10 ** 9)
+        assert not res.ok and res.error == "Insufficient tokens", "Overdraft should be refused"
+        assert ledger.balance() == 5, "A refused spend should not change the balance"
+        for bad in (-1, 0, float("inf"), float("-inf"), float("nan"), True, "5"):
+            for op in (ledger.earn, ledger.spend):
+                try:
+                    op(bad)
+                    raise AssertionError(f"{op.__name__}({bad!r}) should raise ValueError")
+                except ValueError:
+                    pass
+        assert ledger.balance() == 5, "Rejected amounts should not reach the log"
+        ledger.close()
+        print("✓ Bad spends are rejected")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_torn_tail_repair():
+    """Test that a torn last line from a crashed writer is cut off."""
+    print("Testing torn-tail repair...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "wallet.jsonl")
+        ledger = Ledger(path, None, durable=False)
+        ledger.earn(3)
+        ledger.close()
+        with open(path, "ab") as f:
+            f.write(b'{"n":99999,"t"')
+
+        ledger = Ledger(path, None, durable=False)
+        assert ledger.balance() == 3, "A torn tail should be ignored by readers"
+        res = ledger.earn(2)
+        assert res.ok and res.balance == 5 and res.seq == 2, f"Next write should repair the tail: {res.to_dict()}"
+        ledger.close()
+        records = read_log(path)
+        assert [r["n"] for r in records] == [1, 2], "The torn line should be gone from the log"
+        ledger = Ledger(path, None, durable=False)
+        assert ledger.balance() == 5, "A fresh reader should see the repaired log"
+        ledger.close()
+        print("✓ Torn-tail repair works")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_legacy_import():
+    """Test that the old wallet JSON is imported once, balance intact."""
+    print("Testing legacy import...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "wallet.jsonl")
+        legacy = os.path.join(root, "wallet.json")
+        with open(legacy, "w") as f:
+            json.dump({"balance": 7, "history": [
+                {"time": 1, "type": "time-earn", "amount": 2},
+                {"time": 2, "type": "writer-earn", "amount": 1},
+            ]}, f)
+
+        ledger = Ledger(path, legacy, durable=False)
+        assert ledger.balance() == 7, f"Imported balance should be 7, got {ledger.balance()}"
+        records = read_log(path)
+        assert [(r["k"], r["a"]) for r in records] == [("opening", 4), ("time-earn", 2), ("writer-earn", 1)], \
+            f"Unexpected import: {records}"
+        ledger.earn(1)
+        ledger.export_json(legacy)
+        ledger.close()
+
+        # the exported view must not be imported a second time
+        ledger = Ledger(path, legacy, durable=False)
+        assert ledger.balance() == 8, f"Legacy file should only be imported once, balance {ledger.balance()}"
+        assert len(read_log(path)) == 4, "Reopening should not append imported entries again"
+        ledger.close()
+        with open(legacy) as f:
+            view = json.load(f)
+        assert view["balance"] == 8 and len(view["history"]) == 4, f"Unexpected export: {view}"
+        print("✓ Legacy import works")
+    finally:
+        shutil.rmtree(root)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Running tests for C13B0 token ledger")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_concurrent_earn_spend,
+        test_rejects_bad_spends,
+        test_torn_tail_repair,
+        test_legacy_import,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print()
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+            print()
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+            print()
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
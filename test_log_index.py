@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared C13B0 log stream index.
+Checks tail() and StreamIndex.query() against a full scan of scratch
+log streams.
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import shutil
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import c13b0_log_index as log_index
+
+USERS = ["Kris", "ana", "bo b", "ü/x"]
+CHANNELS = ["research", "ops", "tokens"]
+
+
+def make_records(n, seed=7):
+    rnd = random.Random(seed)
+    recs = []
+    for i in range(n):
+        rec = {"t": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(1700000000 + 37 * i)),
+               "user": rnd.choice(USERS), "channel": rnd.choice(CHANNELS), "i": i}
+        if rnd.random() < 0.3:
+            rec["token_id"] = rnd.randrange(5)
+        recs.append(rec)
+    return recs
+
+
+def write_stream(path, recs, mode="w"):
+    with open(path, mode, encoding="utf-8") as f:
+        for rec in recs:
+            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+
+def scan(recs, user=None, channel=None, token_id=None, since=None, until=None, limit=200):
+    # what query() should return, by brute force
+    keys = [(k, v) for k, v in (("user", user), ("channel", channel), ("token_id", token_id)) if v is not None]
+    out = [r for r in recs
+           if all(str(r.get(k)) == str(v) for k, v in keys)
+           and (since is None or r["t"] >= since)
+           and (until is None or r["t"][:len(until)] <= until)]
+    return out[-limit:]
+
+
+def test_tail():
+    """Test that tail() returns the last n lines across read blocks."""
+    print("Testing tail...")
+
+    root = tempfile.mkdtemp()
+    block = log_index.TAIL_BLOCK
+    try:
+        path = os.path.join(root, "log_stream.jsonl")
+        recs = make_records(300)
+        write_stream(path, recs[:150])
+        with open(path, "a") as f:
+            f.write("\n")           # blank lines are skipped
+        write_stream(path, recs[150:], mode="a")
+        for size in (block, 64, 97):
+            log_index.TAIL_BLOCK = size
+            for n in (0, 1, 7, 150, 299, 300, 1000):
+                assert log_index.tail(path, n) == (recs[-n:] if n else []), f"tail({n}) wrong with {size}-byte blocks"
+        assert log_index.tail(os.path.join(root, "missing.jsonl"), 5) == [], "A missing stream should give []"
+        print("✓ Tail works")
+    finally:
+        log_index.TAIL_BLOCK = block
+        shutil.rmtree(root)
+
+
+def test_refresh_after_append():
+    """Test that a query sees lines appended since the last refresh, and
+    that a line still being written is left for the next one."""
+    print("Testing refresh after append...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "log_stream.jsonl")
+        recs = make_records(400)
+        write_stream(path, recs[:200])
+        idx = log_index.StreamIndex(path)
+        assert idx.query(user="Kris") == scan(recs[:200], user="Kris"), "First query should index the stream"
+        assert idx.refresh() == 0, "An unchanged stream should not be re-read"
+
+        write_stream(path, recs[200:300], mode="a")
+        line = json.dumps(recs[300]) + "\n"
+        with open(path, "a") as f:
+            f.write(line[:20])      # a writer half way through its line
+        assert idx.refresh() == 100, "Only the appended complete lines should be indexed"
+        assert idx.query(channel="ops", limit=1000) == scan(recs[:300], channel="ops", limit=1000), \
+            "Queries should see the appended lines"
+
+        with open(path, "a") as f:
+            f.write(line[20:])
+        write_stream(path, recs[301:], mode="a")
+        fresh = log_index.StreamIndex(path)
+        assert fresh.query(user="ana", limit=1000) == scan(recs, user="ana", limit=1000), \
+            "The finished line should be indexed by the next refresh"
+        assert fresh.refresh() == 0, "Another index on the same stream should share the state"
+        print("✓ Refresh after append works")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_replaced_and_shrunk_stream():
+    """Test that a replaced or truncated stream is indexed from scratch."""
+    print("Testing replaced and shrunk streams...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "log_stream.jsonl")
+        write_stream(path, make_records(300, seed=1))
+        idx = log_index.StreamIndex(path)
+        idx.refresh()
+
+        # replaced (rotated): a new, longer file, so only the inode tells
+        new = make_records(400, seed=2)
+        write_stream(path + ".new", new)
+        os.replace(path + ".new", path)
+        assert idx.query(user="Kris", limit=1000) == scan(new, user="Kris", limit=1000), \
+            "A replaced stream should be re-indexed"
+
+        # shrunk in place: same inode, fewer lines
+        short = make_records(50, seed=3)
+        write_stream(path, short)
+        assert idx.query(token_id=3, limit=1000) == scan(short, token_id=3, limit=1000), \
+            "A shrunk stream should be re-indexed"
+        assert idx.query(limit=1000) == short, "No line of the old stream should survive"
+        print("✓ Replaced and shrunk streams work")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_query_matches_scan():
+    """Test filters, since / until bounds and limits against a full scan."""
+    print("Testing queries against a full scan...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "log_stream.jsonl")
+        recs = make_records(2000, seed=11)
+        write_stream(path, recs)
+        idx = log_index.StreamIndex(path)
+        stamps = [r["t"] for r in recs]
+        rnd = random.Random(5)
+
+        def bound():
+            # an exact stamp, a shorter prefix of one, or outside the stream
+            t = rnd.choice(stamps)
+            return rnd.choice([None, t, t[:rnd.choice([4, 7, 10, 13, 16])], "1999", "2100"])
+
+        checked = 0
+        for _ in range(400):
+            args = {"user": rnd.choice([None, None] + USERS + ["nobody"]),
+                    "channel": rnd.choice([None, None] + CHANNELS),
+                    "token_id": rnd.choice([None, None, None, 0, 3, "4", 9]),
+                    "since": bound(), "until": bound(),
+                    "limit": rnd.choice([1, 5, 50, 200, 5000])}
+            args = {k: v for k, v in args.items() if v is not None}
+            got = idx.query(**args)
+            assert got == scan(recs, **args), f"query({args}) differs from a full scan"
+            checked += bool(got)
+        assert checked > 100, f"Too few non-empty queries to be meaningful ({checked})"
+        print(f"✓ Queries match a full scan (400 queries, {checked} non-empty)")
+    finally:
+        shutil.rmtree(root)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Running tests for C13B0 log stream index")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_tail,
+        test_refresh_after_append,
+        test_replaced_and_shrunk_stream,
+        test_query_matches_scan,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print()
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+            print()
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+            print()
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
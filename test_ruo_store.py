@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared C13B0 indexed RUO store.
+Builds stores from a scratch CART217-style JSON list.
+"""
+
+import json
+import multiprocessing as mp
+import os
+import sys
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from c13b0_ruo_store import RUOStore, store_paths
+
+
+def write_ruos(path, n, tag="r"):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([{"research_hash": f"{tag}{i}", "ruo_type": "test", "text": "x" * 40} for i in range(n)], f)
+
+
+def open_and_count(path, start, results):
+    start.wait()
+    try:
+        with RUOStore(path) as store:
+            results.put((len(store), store.get("r7", {}).get("research_hash")))
+    except Exception as e:
+        results.put(repr(e))
+
+
+def test_build_and_lookup():
+    """Test that a store built from the JSON list answers lookups."""
+    print("Testing build and lookup...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "store.json")
+        write_ruos(path, 100)
+        with RUOStore(path) as store:
+            assert len(store) == 100, f"Expected 100 records, got {len(store)}"
+            assert store.get("r42")["research_hash"] == "r42", "Lookup by hash should work"
+            assert [r["research_hash"] for r in store][:3] == ["r0", "r1", "r2"], "Scan should keep file order"
+        print("✓ Build and lookup work")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_concurrent_open():
+    """Test that processes opening a stale store at once all succeed and
+    only one rebuild lands."""
+    print("Testing concurrent opens...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "store.json")
+        write_ruos(path, 20000)
+        for rounds in range(2):
+            start = mp.Event()
+            results = mp.Queue()
+            procs = [mp.Process(target=open_and_count, args=(path, start, results)) for _ in range(6)]
+            for p in procs:
+                p.start()
+            start.set()
+            got = [results.get(timeout=60) for _ in procs]
+            for p in procs:
+                p.join()
+            assert got == [(20000, "r7")] * 6, f"Every opener should see the full store: {got}"
+            # the next round opens a store whose source changed again
+            write_ruos(path, 20000)
+        leftovers = [n for n in os.listdir(root) if n.endswith(".tmp")]
+        assert not leftovers, f"Temporary files left behind: {leftovers}"
+        with open(store_paths(path)[2]) as f:
+            assert json.load(f)["count"] == 20000, "Meta should describe the rebuilt store"
+        print("✓ Concurrent opens work")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_append_survives_reopen():
+    """Test that appended records are found by a later opener."""
+    print("Testing append and reopen...")
+
+    root = tempfile.mkdtemp()
+    try:
+        path = os.path.join(root, "store.json")
+        write_ruos(path, 10)
+        with RUOStore(path) as store:
+            store.append({"research_hash": "new", "text": "y"})
+            store.append({"research_hash": "r3", "text": "replaced"})
+        with RUOStore(path) as store:
+            assert len(store) == 11, f"Expected 11 live records, got {len(store)}"
+            assert store.get("r3")["text"] == "replaced", "Latest record for a hash should win"
+            assert store.get("new")["text"] == "y", "Appended record should be found"
+        print("✓ Append and reopen work")
+    finally:
+        shutil.rmtree(root)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Running tests for C13B0 RUO store")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_build_and_lookup,
+        test_concurrent_open,
+        test_append_survives_reopen,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print()
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+            print()
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+            print()
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the CART227 semantic graph edges.
+Compares the posting-index edges with the pairwise weighted_edge() on
+generated RUOs, no RUO store required.
+"""
+
+import os
+import random
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cart227_semantic_graph_builder import overlap_edges, weighted_edge, top_k_edges
+
+LINKS = [
+    "https://a.example/x", "http://b.example/y", "https://c.example/",
+    "file:///tmp/notes", "file:///srv/data", "mailto:someone", "relative/path",
+    "https://a.example/z",
+]
+
+
+def make_ruos(n, seed=7):
+    rnd = random.Random(seed)
+    ruos = []
+    for i in range(n):
+        ruos.append({
+            "research_hash": f"h{i}",
+            "terms": [f"t{rnd.randrange(30)}" for _ in range(rnd.randrange(0, 6))],
+            "links": rnd.sample(LINKS, rnd.randrange(0, 4)),
+            "crossover_links": ["c"] * rnd.randrange(0, 3),
+        })
+    entropy = {r["research_hash"]: {"entropy": rnd.choice([0, 0.5, 1.25])} for r in ruos}
+    return ruos, entropy
+
+
+def test_posting_weights_match_pairwise():
+    """Test that every posting edge has the pairwise weighted_edge() weight,
+    and that every pair sharing a term or domain is an edge."""
+    print("Testing posting weights against weighted_edge...")
+
+    ruos, entropy = make_ruos(150)
+    edges = {(i, j): w for i, j, w in overlap_edges(ruos, entropy)}
+    checked = 0
+    for i in range(len(ruos)):
+        for j in range(i + 1, len(ruos)):
+            expected = weighted_edge(ruos[i], ruos[j], entropy)
+            if (i, j) in edges:
+                assert abs(edges[(i, j)] - expected) < 1e-9, \
+                    f"Edge {i}-{j}: posting weight {edges[(i, j)]} != weighted_edge {expected}"
+                checked += 1
+            else:
+                shared = set(ruos[i]["terms"]) & set(ruos[j]["terms"])
+                assert not shared, f"Pair {i}-{j} shares terms {shared} but has no edge"
+    assert checked > 100, f"Too few overlapping pairs to be meaningful ({checked})"
+    print(f"✓ Posting weights match weighted_edge ({checked} edges)")
+
+
+def test_empty_domain_not_shared():
+    """Test that links without a domain (file:///) never count as overlap."""
+    print("Testing empty link domains...")
+
+    ruos = [
+        {"research_hash": "a", "terms": [], "links": ["file:///x"], "crossover_links": []},
+        {"research_hash": "b", "terms": [], "links": ["file:///y"], "crossover_links": []},
+    ]
+    assert list(overlap_edges(ruos, {})) == [], "file:/// links should not create an edge"
+    assert weighted_edge(ruos[0], ruos[1], {}) is None, "weighted_edge should agree"
+    print("✓ Empty link domains are ignored")
+
+
+def test_top_k_subset():
+    """Test that --top-k keeps a subset of the edges with their weights."""
+    print("Testing top-k edges...")
+
+    ruos, entropy = make_ruos(80)
+    edges = {(i, j): w for i, j, w in overlap_edges(ruos, entropy)}
+    kept = list(top_k_edges(overlap_edges(ruos, entropy), 3))
+    assert kept and len(kept) < len(edges), "Top-k should drop some edges"
+    assert all(edges[(i, j)] == w for i, j, w in kept), "Top-k should keep weights unchanged"
+    print(f"✓ Top-k works ({len(kept)} of {len(edges)} edges)")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Running tests for CART227 semantic graph edges")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_posting_weights_match_pairwise,
+        test_empty_domain_not_shared,
+        test_top_k_subset,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print()
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+            print()
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+            print()
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
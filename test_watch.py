@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared C13B0 artifact change watcher.
+Runs in a scratch directory, watching files and a directory next to the
+watcher's own state and queue files.
+"""
+
+import os
+import sys
+import tempfile
+import shutil
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from c13b0_watch import Watcher, push_events
+
+
+def make_tree(root):
+    os.makedirs(os.path.join(root, "data"))
+    for name in ("a.json", os.path.join("data", "b.json")):
+        with open(os.path.join(root, name), "w") as f:
+            f.write("{}")
+    return [os.path.join(root, "a.json"), os.path.join(root, "data")]
+
+
+def run_watcher(watcher, callback):
+    polls = [0]
+    poll = watcher.poll
+
+    def counted():
+        polls[0] += 1
+        return poll()
+
+    watcher.poll = counted
+    thread = threading.Thread(target=watcher.watch, args=(callback,), kwargs={"interval": 5}, daemon=True)
+    thread.start()
+    return thread, polls
+
+
+def test_first_run_is_seeded():
+    """Test that the first pass does not report existing sources as created."""
+    print("Testing first-run snapshot seeding...")
+
+    root = tempfile.mkdtemp()
+    try:
+        paths = make_tree(root)
+        state = os.path.join(root, "state.json")
+        with Watcher(paths, debounce=0, state=state, use_inotify=False) as w:
+            assert w.poll() == [], "Existing sources should not be reported on the first run"
+        with open(paths[0], "w") as f:
+            f.write('{"x": 1}')
+        with Watcher(paths, debounce=0, state=state, use_inotify=False) as w:
+            events = w.poll()
+        assert [(e["path"], e["kind"]) for e in events] == [(paths[0], "modified")], f"Unexpected events: {events}"
+        print("✓ First run is seeded")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_one_callback_per_write():
+    """Test that one write to a watched dir gives exactly one callback, and
+    that the watcher's own files do not keep it awake."""
+    print("Testing one callback per write...")
+
+    root = tempfile.mkdtemp()
+    try:
+        paths = make_tree(root)
+        state = os.path.join(root, "state.json")
+        queue = os.path.join(root, "events.json")
+        calls = []
+
+        def callback(events):
+            calls.append(events)
+            push_events(events, queue)
+
+        watcher = Watcher(paths, debounce=0.2, state=state, events=queue)
+        mode = watcher.mode
+        thread, polls = run_watcher(watcher, callback)
+        time.sleep(0.5)
+        with open(os.path.join(root, "data", "c.json"), "w") as f:
+            f.write("{}")
+        time.sleep(2.0)
+        watcher.stop()
+        thread.join(6)
+        watcher.close()
+        assert len(calls) == 1, f"Expected one callback, got {len(calls)}"
+        assert [e["path"] for e in calls[0]] == [paths[1]], f"Unexpected events: {calls[0]}"
+        assert polls[0] < 50, f"Watcher should idle between writes, polled {polls[0]} times"
+        print(f"✓ One callback per write ({mode}, {polls[0]} polls)")
+    finally:
+        shutil.rmtree(root)
+
+
+def test_unwatched_neighbour_is_ignored():
+    """Test that writes next to a watched file do not produce events."""
+    print("Testing unwatched neighbours...")
+
+    root = tempfile.mkdtemp()
+    try:
+        paths = make_tree(root)
+        calls = []
+        watcher = Watcher(paths, debounce=0.2, state=os.path.join(root, "state.json"))
+        mode = watcher.mode
+        thread, polls = run_watcher(watcher, calls.append)
+        time.sleep(0.3)
+        for i in range(20):
+            with open(os.path.join(root, "other.json"), "w") as f:
+                f.write(str(i))
+        time.sleep(0.8)
+        watcher.stop()
+        thread.join(6)
+        watcher.close()
+        assert calls == [], f"Unwatched writes should not call back: {calls}"
+        if mode == "inotify":
+            assert polls[0] <= 2, f"Unwatched writes should not wake the watcher, polled {polls[0]} times"
+        print(f"✓ Unwatched neighbours are ignored ({polls[0]} polls)")
+    finally:
+        shutil.rmtree(root)
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("=" * 60)
+    print("Running tests for C13B0 artifact change watcher")
+    print("=" * 60)
+    print()
+
+    tests = [
+        test_first_run_is_seeded,
+        test_one_callback_per_write,
+        test_unwatched_neighbour_is_ignored,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+            print()
+        except AssertionError as e:
+            print(f"✗ Test failed: {e}")
+            failed += 1
+            print()
+        except Exception as e:
+            print(f"✗ Test error: {e}")
+            failed += 1
+            print()
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())